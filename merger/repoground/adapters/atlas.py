@@ -1,29 +1,35 @@
+import io
 import os
 import logging
 import time
 import json
 import hashlib
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Pattern, Union, Tuple, Callable
 from datetime import datetime, timezone
+import bisect
 import fnmatch
 import re
 import mimetypes
 
+from ..atlas.columnar import ColumnarInventoryWriter
+
 # Attempt to import is_probably_text from core to avoid duplication
 try:
-    from ..core.merge import is_probably_text
+    from ..core.merge import TEXT_DETECTION_MAX_BYTES, TEXT_EXTENSIONS, is_probably_text
 except ImportError:
     # Fallback implementation if core is not accessible
     # Configurable text detection limit (aligned with core's 20MB)
     TEXT_DETECTION_MAX_BYTES = 20 * 1024 * 1024
+    TEXT_EXTENSIONS = {
+        ".md", ".txt", ".py", ".rs", ".ts", ".js", ".json", ".yml", ".yaml",
+        ".sh", ".html", ".css", ".xml", ".csv", ".log", ".lock", ".gitignore",
+        ".toml", ".ini", ".conf", ".dockerfile", "dockerfile", ".bat", ".cmd"
+    }
 
     def is_probably_text(path: Path, size: int) -> bool:
-        TEXT_EXTENSIONS = {
-            ".md", ".txt", ".py", ".rs", ".ts", ".js", ".json", ".yml", ".yaml",
-            ".sh", ".html", ".css", ".xml", ".csv", ".log", ".lock", ".gitignore",
-            ".toml", ".ini", ".conf", ".dockerfile", "dockerfile", ".bat", ".cmd"
-        }
         if path.suffix.lower() in TEXT_EXTENSIONS or path.name.lower() in TEXT_EXTENSIONS:
             return True
         if size > TEXT_DETECTION_MAX_BYTES:
@@ -56,43 +62,45 @@ def detect_mime_type(path: Path) -> Optional[str]:
         try:
             with path.open('rb') as f:
                 head = f.read(512)
-
-            if not head:
-                return "inode/x-empty"
-
-            # Basic magic byte signatures
-            if head.startswith(b'%PDF-'):
-                return 'application/pdf'
-            elif head.startswith(b'\x89PNG\r\n\x1a\n'):
-                return 'image/png'
-            elif head.startswith(b'\xff\xd8\xff'):
-                return 'image/jpeg'
-            elif head.startswith(b'GIF87a') or head.startswith(b'GIF89a'):
-                return 'image/gif'
-            elif head.startswith(b'PK\x03\x04'):
-                return 'application/zip'
-            elif head.startswith(b'\x1f\x8b\x08'):
-                return 'application/gzip'
-            elif head.startswith(b'Rar!\x1a\x07\x00') or head.startswith(b'Rar!\x1a\x07\x01\x00'):
-                return 'application/x-rar-compressed'
-            elif head.startswith(b'\x00\x00\x00\x18ftyp') or head.startswith(b'\x00\x00\x00 ftyp'):
-                return 'video/mp4'
-            elif b'ftypmp42' in head[:16] or b'ftypisom' in head[:16]:
-                return 'video/mp4'
-            elif head.startswith(b'\x1aE\xdf\xa3'):
-                return 'video/webm'
-
-            # If we still don't know, use the null byte heuristic for text vs binary
-            if b'\x00' in head:
-                return 'application/octet-stream'
-            else:
-                return 'text/plain'
         except OSError:
             return None
+        return _sniff_mime_type(head)
 
     return mime_type
 
 
+# Basic magic byte signatures, checked in order
+_MAGIC_PREFIXES: Tuple[Tuple[Tuple[bytes, ...], str], ...] = (
+    ((b'%PDF-',), 'application/pdf'),
+    ((b'\x89PNG\r\n\x1a\n',), 'image/png'),
+    ((b'\xff\xd8\xff',), 'image/jpeg'),
+    ((b'GIF87a', b'GIF89a'), 'image/gif'),
+    ((b'PK\x03\x04',), 'application/zip'),
+    ((b'\x1f\x8b\x08',), 'application/gzip'),
+    ((b'Rar!\x1a\x07\x00', b'Rar!\x1a\x07\x01\x00'), 'application/x-rar-compressed'),
+    ((b'\x00\x00\x00\x18ftyp', b'\x00\x00\x00 ftyp'), 'video/mp4'),
+)
+
+
+def _sniff_mime_type(head: bytes) -> str:
+    """Classify the first bytes of a file by magic signature, then null bytes."""
+    if not head:
+        return "inode/x-empty"
+
+    for prefixes, mime_type in _MAGIC_PREFIXES:
+        if head.startswith(prefixes):
+            return mime_type
+    if b'ftypmp42' in head[:16] or b'ftypisom' in head[:16]:
+        return 'video/mp4'
+    if head.startswith(b'\x1aE\xdf\xa3'):
+        return 'video/webm'
+
+    # If we still don't know, use the null byte heuristic for text vs binary
+    if b'\x00' in head:
+        return 'application/octet-stream'
+    return 'text/plain'
+
+
 TEXT_MIME_ALLOWLIST = {
     "application/json",
     "application/xml",
@@ -131,21 +139,284 @@ def detect_encoding(path: Path) -> Optional[str]:
     try:
         with path.open("rb") as f:
             chunk = f.read(4096)
+    except OSError:
+        return None
+    return _guess_encoding(chunk)
+
+
+def _guess_encoding(chunk: bytes) -> Optional[str]:
+    if not chunk:
+        return "utf-8"  # Empty files are technically valid utf-8
+
+    # Try a few common encodings in order of likelihood
+    for enc in ["utf-8", "utf-16", "windows-1252", "iso-8859-1"]:
+        try:
+            chunk.decode(enc)
+            return enc
+        except UnicodeDecodeError:
+            continue
+
+    return None  # Couldn't reliably detect
+
+
+LINE_COUNT_MAX_BYTES = 20 * 1024 * 1024
+QUICK_HASH_MAX_BYTES = 1024 * 1024
+_PROBE_WINDOW_BYTES = 4096
 
-        if not chunk:
-            return "utf-8"  # Empty files are technically valid utf-8
 
-        # Try a few common encodings in order of likelihood
-        for enc in ["utf-8", "utf-16", "windows-1252", "iso-8859-1"]:
+class FileProbe:
+    """
+    Single-open content probe for one file.
+
+    The file is opened on first use and its first and last 4 KiB are read
+    once. MIME type, text/binary, encoding, line count and ``quick_hash`` are
+    all derived from those buffers, with the same results as the standalone
+    helpers above. Only line counting of files larger than both windows
+    streams the remainder, from the already open handle.
+
+    ``counters`` accumulates ``files_opened``, ``read_calls``, ``bytes_read``
+    and ``files_streamed`` across probes.
+    """
+
+    def __init__(self, path: Path, size: int, counters: Dict[str, int]):
+        self.path = path
+        self.size = size
+        self.counters = counters
+        self._handle = None
+        self._failed = False
+        self._head: Optional[bytes] = None
+        self._tail: Optional[bytes] = None
+
+    def __enter__(self) -> "FileProbe":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _read(self, n: int) -> bytes:
+        data = self._handle.read(n)
+        self.counters["read_calls"] += 1
+        self.counters["bytes_read"] += len(data)
+        return data
+
+    def head(self) -> Optional[bytes]:
+        """Return the first 4 KiB, or ``None`` if the file cannot be read."""
+        if self._head is None and not self._failed:
             try:
-                chunk.decode(enc)
-                return enc
-            except UnicodeDecodeError:
-                continue
+                self._handle = self.path.open("rb")
+                self.counters["files_opened"] += 1
+                self._head = self._read(_PROBE_WINDOW_BYTES)
+            except OSError:
+                self._failed = True
+                self.close()
+        return self._head
+
+    def tail(self) -> Optional[bytes]:
+        """Return the last 4 KiB not already covered by :meth:`head`."""
+        if self._tail is None and self.head() is not None:
+            if self.size <= _PROBE_WINDOW_BYTES:
+                self._tail = b""
+            else:
+                try:
+                    self._handle.seek(-min(_PROBE_WINDOW_BYTES, self.size - _PROBE_WINDOW_BYTES), 2)
+                    self._tail = self._read(_PROBE_WINDOW_BYTES)
+                except OSError:
+                    self._failed = True
+                    self.close()
+        return self._tail
+
+    def quick_hash(self) -> Optional[str]:
+        head = self.head()
+        tail = self.tail()
+        if head is None or tail is None:
+            return None
+        return hashlib.md5(head + tail, usedforsecurity=False).hexdigest() # nosec B303
+
+    def mime_type(self) -> Optional[str]:
+        mime_type, _ = mimetypes.guess_type(str(self.path))
+        if mime_type and mime_type != 'application/octet-stream':
+            return mime_type
+        head = self.head()
+        return None if head is None else _sniff_mime_type(head[:512])
+
+    def is_text(self) -> bool:
+        name = self.path.name.lower()
+        if os.path.splitext(name)[1] in TEXT_EXTENSIONS or name in TEXT_EXTENSIONS:
+            return True
+        if self.size > TEXT_DETECTION_MAX_BYTES:
+            return False
+        head = self.head()
+        return head is not None and b"\x00" not in head
+
+    def encoding(self) -> Optional[str]:
+        head = self.head()
+        return None if head is None else _guess_encoding(head)
 
-        return None  # Couldn't reliably detect
+    def line_count(self, encoding: Optional[str] = None) -> Optional[int]:
+        if self.size > LINE_COUNT_MAX_BYTES:
+            return None
+        head = self.head()
+        tail = self.tail()
+        if head is None or tail is None:
+            return None
+        enc = encoding if encoding else "utf-8"
+        if len(head) + len(tail) == self.size <= 2 * _PROBE_WINDOW_BYTES:
+            # Both windows cover the whole file.
+            stream = io.TextIOWrapper(io.BytesIO(head + tail), encoding=enc, errors="replace")
+        else:
+            try:
+                self._handle.seek(0)
+            except OSError:
+                return None
+            self.counters["files_streamed"] += 1
+            self.counters["bytes_read"] += self.size
+            stream = io.TextIOWrapper(self._handle, encoding=enc, errors="replace")
+            # The wrapper now owns the handle and closes it with the probe.
+            self._handle = stream
+        try:
+            return sum(1 for _ in stream)
+        except OSError:
+            return None
+
+
+def new_probe_counters() -> Dict[str, int]:
+    return {"files_opened": 0, "read_calls": 0, "bytes_read": 0, "files_streamed": 0}
+
+
+def _list_directory(path: str) -> Optional[Tuple[List[str], List[str], set, Optional[os.stat_result]]]:
+    """
+    One ``os.walk`` step: split ``path`` into sub-directories and files.
+
+    Mirrors ``os.walk(followlinks=False)`` classification: symlinks to
+    directories are listed in ``dirs`` but reported in the returned set so
+    the walker does not descend into them. Returns ``None`` if the directory
+    cannot be read, in which case ``os.walk`` skips it silently as well.
+    """
+    dirs: List[str] = []
+    files: List[str] = []
+    links = set()
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry.name)
+                    continue
+                dirs.append(entry.name)
+                try:
+                    if entry.is_symlink():
+                        links.add(entry.name)
+                except OSError:
+                    pass
     except OSError:
         return None
+    try:
+        dir_stat = os.stat(path)
+    except OSError:
+        dir_stat = None
+    return dirs, files, links, dir_stat
+
+
+def _parallel_walk(top: Path, executor: Executor, window: int,
+                   should_prefetch: Callable[[str], bool]):
+    """
+    ``os.walk(top, topdown=True, followlinks=False)`` with listings fetched
+    on ``executor``.
+
+    Yields ``(root, dirs, files, root_stat)`` in exactly the order os.walk
+    would, and honours in-place pruning of ``dirs`` by the caller. While the
+    caller works on one directory, up to ``window`` listings of directories
+    accepted by ``should_prefetch`` are fetched ahead; listings of
+    directories the caller then prunes are discarded.
+    """
+    top_str = os.fspath(top)
+    pending: Dict[str, Future] = {top_str: executor.submit(_list_directory, top_str)}
+    stack = [top_str]
+    try:
+        while stack:
+            path = stack.pop()
+            future = pending.pop(path, None) or executor.submit(_list_directory, path)
+            listing = future.result()
+            if listing is None:
+                continue
+            dirs, files, links, dir_stat = listing
+
+            for name in dirs:
+                child = os.path.join(path, name)
+                if len(pending) >= window:
+                    break
+                if name not in links and child not in pending and should_prefetch(child):
+                    pending[child] = executor.submit(_list_directory, child)
+
+            yield path, dirs, files, dir_stat
+
+            children = [os.path.join(path, name) for name in dirs if name not in links]
+            kept = set(children)
+            # Drop prefetched listings of directories the caller pruned.
+            for child in [c for c in pending if os.path.dirname(c) == path and c not in kept]:
+                pending.pop(child).cancel()
+            stack.extend(reversed(children))
+    finally:
+        for future in pending.values():
+            future.cancel()
+
+
+def _parent_rel_path(rel_path: str) -> str:
+    parent = rel_path.rpartition("/")[0]
+    return parent or "."
+
+
+def _subtree_rows_complete(root_row: Dict[str, Any], dir_rows: List[Dict[str, Any]], file_rows: List[Dict[str, Any]]) -> bool:
+    """
+    Whether previous rows describe a subtree completely.
+
+    Every directory's recorded child counts must match the rows held for it,
+    which rules out truncated scans, depth-limited branches and unreadable
+    entries.
+    """
+    if root_row.get("subtree_file_count") != len(file_rows) or root_row.get("subtree_dir_count") != len(dir_rows):
+        return False
+    n_dirs: Dict[str, int] = {}
+    n_files: Dict[str, int] = {}
+    for row in dir_rows:
+        parent = _parent_rel_path(row["rel_path"])
+        n_dirs[parent] = n_dirs.get(parent, 0) + 1
+    for row in file_rows:
+        if not isinstance(row.get("size_bytes"), int):
+            return False
+        parent = _parent_rel_path(row["rel_path"])
+        n_files[parent] = n_files.get(parent, 0) + 1
+    for row in [root_row] + dir_rows:
+        # Rows from scans predating workspace_signals cannot restore workspaces.
+        if not isinstance(row.get("workspace_signals"), list):
+            return False
+        if row.get("n_dirs") != n_dirs.get(row["rel_path"], 0) or row.get("n_files") != n_files.get(row["rel_path"], 0):
+            return False
+    return True
+
+
+def _ordered_map(executor: Executor, fn: Callable[..., Any], items: List[Tuple[Any, ...]], window: int):
+    """Like ``executor.map(fn, *zip(*items))``, with at most ``window`` calls in flight."""
+    queue: deque = deque()
+    remaining = iter(items)
+    for args in remaining:
+        queue.append(executor.submit(fn, *args))
+        if len(queue) >= window:
+            break
+    while queue:
+        result = queue.popleft().result()
+        for args in remaining:
+            queue.append(executor.submit(fn, *args))
+            break
+        yield result
 
 
 logger = logging.getLogger(__name__)
@@ -234,7 +505,11 @@ class AtlasScanner:
                  incremental_inventory: Optional[Union[Dict[str, Any], Path]] = None,
                  incremental_dirs_inventory: Optional[Union[Dict[str, Any], Path]] = None,
                  previous_scan_config_hash: Optional[str] = None,
-                 current_scan_config_hash: Optional[str] = None):
+                 current_scan_config_hash: Optional[str] = None,
+                 workers: int = 1,
+                 subtree_skip: bool = False,
+                 subtree_verify_sample: int = 0,
+                 columnar_inventory: bool = False):
         self.root = root
         self.max_depth = max_depth
         self.max_entries = max_entries
@@ -243,6 +518,14 @@ class AtlasScanner:
         if max_file_size is not None and max_file_size <= 0:
             raise ValueError("max_file_size must be a positive integer or None.")
         self.max_file_size = max_file_size
+        if workers < 1:
+            raise ValueError("workers must be a positive integer.")
+        # Threads used to list directories and stat/probe files. Output is
+        # identical for any value; more workers help on high-latency mounts.
+        self.workers = workers
+        # Also write the memory-mappable inventory.cols sidecar (atlas.columnar)
+        # next to inventory.jsonl; search and diff prefer it when present.
+        self.columnar_inventory = columnar_inventory
         self.snapshot_id = snapshot_id
         self.compare_to_snapshot_id = compare_to_snapshot_id
         self.enable_content_stats = enable_content_stats
@@ -258,6 +541,21 @@ class AtlasScanner:
         self.incremental_inventory = self._load_jsonl_inventory_map(incremental_inventory, "incremental inventory", "incremental inventory")
         self.incremental_dirs_inventory = self._load_jsonl_inventory_map(incremental_dirs_inventory, "incremental dirs inventory", "incremental dirs")
 
+        # Heuristic, opt-in: directory mtime is blind to edits of existing
+        # files and to changes below the direct children, so a skipped
+        # subtree may miss them. Requires both config hashes to match.
+        if subtree_verify_sample < 0:
+            raise ValueError("subtree_verify_sample must be a non-negative integer.")
+        self.subtree_skip = bool(
+            subtree_skip
+            and self.previous_scan_config_hash
+            and self.previous_scan_config_hash == self.current_scan_config_hash
+        )
+        self.subtree_verify_sample = subtree_verify_sample
+        self._sorted_previous_dirs: Optional[List[str]] = None
+        self._sorted_previous_files: Optional[List[str]] = None
+        self._checked_dirs: Dict[str, bool] = {}
+
         if self.inventory_strict:
             # Minimal excludes for strict inventory: git directories, venv directories, and
             # .claude/worktrees (agent runtime checkouts). Runtime checkouts are never canonical
@@ -302,8 +600,16 @@ class AtlasScanner:
             "incremental": {
                 "reused_files_count": 0,
                 "skipped_analysis_count": 0,
-                "heuristic_subtree_matches": 0
+                "heuristic_subtree_matches": 0,
+                "subtree_skips": 0,
+                "subtree_reused_dirs": 0,
+                "subtree_reused_files": 0,
+                "subtree_dirs_checked": 0,
+                "subtree_verified_files": 0,
+                "subtree_verify_failures": 0
             },
+            # File content I/O performed by FileProbe during the scan.
+            "probe": new_probe_counters(),
             "active_excludes": self.exclude_globs,
             "truncated": {
                 "max_entries": self.max_entries,
@@ -407,6 +713,256 @@ class AtlasScanner:
             return True
         return False
 
+    @staticmethod
+    def _recursive_dir_hash(current_agg: Dict[str, Any]) -> str:
+        dir_hash_components = []
+
+
+        # A) Direct file signatures (sorted for stability)
+        sorted_files = sorted(current_agg["direct_file_signatures"])
+        for fsig in sorted_files:
+            dir_hash_components.append(f"F:{fsig}")
+
+        # B) Child directory hashes (sorted for stability)
+        sorted_child_hashes = sorted(current_agg["child_dir_hashes"])
+        for dsig in sorted_child_hashes:
+            dir_hash_components.append(f"D:{dsig}")
+
+        # C) Direct properties of this directory (optional, but good for tracking structural identity)
+        dir_hash_components.append(f"R:{current_agg['rel_path']}")
+        if current_agg["direct_children_fingerprint"]:
+            dir_hash_components.append(f"FP:{current_agg['direct_children_fingerprint']}")
+
+        # Produce hash
+        hash_input = json.dumps(dir_hash_components, ensure_ascii=False, separators=(",", ":")).encode("utf-8", errors="surrogateescape")
+        recursive_hash = hashlib.md5(hash_input, usedforsecurity=False).hexdigest() # nosec B303
+
+        return recursive_hash
+
+    def _previous_rows_under(self, inventory: Dict[str, Any], sorted_paths: List[str], rel_path_str: str) -> List[Dict[str, Any]]:
+        """Rows of ``inventory`` strictly below ``rel_path_str``, in path order."""
+        prefix = "" if rel_path_str == "." else rel_path_str + "/"
+        rows = []
+        for path in sorted_paths[bisect.bisect_left(sorted_paths, prefix):]:
+            if not path.startswith(prefix):
+                break
+            if path != rel_path_str and path != ".":
+                rows.append(inventory[path])
+        return rows
+
+    def _reusable_subtree(self, rel_path_str: str, budget: int) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Previous-snapshot rows for the subtree at ``rel_path_str``, or ``None``.
+
+        Only called for directories whose own mtime, counts and fingerprint
+        match. Reuse additionally requires the previous inventories to
+        describe the subtree completely (every directory's recorded child
+        counts match the rows held for it, which rules out truncated scans,
+        depth-limited branches and unreadable entries), every recorded
+        descendant directory to keep its mtime, and the rows to fit into the
+        remaining ``max_entries`` budget. In-place edits of existing files do
+        not touch directory mtimes; with
+        ``subtree_verify_sample`` set, that many evenly spaced files are
+        re-stat'ed and any size/mtime drift vetoes the skip.
+        """
+        if self._sorted_previous_dirs is None:
+            self._sorted_previous_dirs = sorted(self.incremental_dirs_inventory)
+            self._sorted_previous_files = sorted(self.incremental_inventory)
+        root_row = self.incremental_dirs_inventory[rel_path_str]
+        dir_rows = self._previous_rows_under(self.incremental_dirs_inventory, self._sorted_previous_dirs, rel_path_str)
+        file_rows = self._previous_rows_under(self.incremental_inventory, self._sorted_previous_files, rel_path_str)
+
+        if len(file_rows) > budget or not _subtree_rows_complete(root_row, dir_rows, file_rows):
+            return None
+
+        # Adding, removing or renaming an entry anywhere below bumps that
+        # directory's mtime, so one stat per recorded directory (no listing,
+        # no file stats) confirms the tree shape is unchanged.
+        if not all(self._directory_unchanged(row) for row in dir_rows):
+            return None
+        if self.subtree_verify_sample and file_rows and not self._sample_files_unchanged(file_rows):
+            return None
+        return dir_rows, file_rows
+
+    def _sample_files_unchanged(self, file_rows: List[Dict[str, Any]]) -> bool:
+        """Re-stat ``subtree_verify_sample`` evenly spaced files; any size/mtime drift fails."""
+        k = min(self.subtree_verify_sample, len(file_rows))
+        for i in range(k):
+            row = file_rows[i * len(file_rows) // k]
+            self.stats["incremental"]["subtree_verified_files"] += 1
+            try:
+                st = (self.root / row["rel_path"]).stat()
+            except OSError:
+                st = None
+            if (st is None or st.st_size != row["size_bytes"] or
+                    datetime.fromtimestamp(st.st_mtime, timezone.utc).isoformat().replace('+00:00', 'Z') != row.get("mtime")):
+                self.stats["incremental"]["subtree_verify_failures"] += 1
+                return False
+        return True
+
+    def _directory_unchanged(self, row: Dict[str, Any]) -> bool:
+        rel_path_str = row["rel_path"]
+        unchanged = self._checked_dirs.get(rel_path_str)
+        if unchanged is None:
+            self.stats["incremental"]["subtree_dirs_checked"] += 1
+            try:
+                mtime = (self.root / rel_path_str).stat().st_mtime
+                unchanged = datetime.fromtimestamp(mtime, timezone.utc).isoformat().replace('+00:00', 'Z') == row.get("mtime")
+            except OSError:
+                unchanged = False
+            self._checked_dirs[rel_path_str] = unchanged
+        return unchanged
+
+    def _register_workspace(self, rel_path_str: str, workspace_signals: List[str]) -> None:
+        if ".git" in workspace_signals:
+            workspace_kind = "git_repo"
+        elif "package.json" in workspace_signals:
+            workspace_kind = "node_project"
+        elif "pyproject.toml" in workspace_signals or "requirements.txt" in workspace_signals:
+            workspace_kind = "python_project"
+        elif "compose.yml" in workspace_signals or "docker-compose.yml" in workspace_signals:
+            workspace_kind = "compose_stack"
+        elif len(workspace_signals) == 1 and workspace_signals[0] == "README.md":
+            workspace_kind = "docs_space"
+        else:
+            workspace_kind = "mixed_workspace"
+
+        # confidence heuristic: more signals = higher confidence
+        confidence = min(len(workspace_signals) * 0.25, 1.0)
+        if ".git" in workspace_signals or ".ai-context.yml" in workspace_signals:
+            confidence = max(confidence, 0.9)
+
+        # Simple hash for deterministic ID
+        try:
+            h = hashlib.md5(rel_path_str.encode('utf-8'), usedforsecurity=False).hexdigest()[:8]
+        except TypeError:
+            h = hashlib.md5(rel_path_str.encode('utf-8')).hexdigest()[:8]  # nosec B303
+        workspace_id = f"ws_{h}"
+        self.stats["workspaces"].append({
+            "workspace_id": workspace_id,
+            "root_path": rel_path_str,
+            "workspace_kind": workspace_kind,
+            "signals": workspace_signals,
+            "confidence": round(confidence, 2),
+            "tags": [workspace_kind]
+        })
+
+    def _inspect_file(self, f_path: Path, f_rel: str) -> Optional[Dict[str, Any]]:
+        """
+        Stat and content-probe one file without touching scan state.
+
+        Returns ``None`` if the file cannot be stat'ed. Safe to run on walker
+        threads: ``scan()`` folds the returned facts into stats, directory
+        aggregates and the inventory in walk order.
+        """
+        facts = self._stat_file(f_path)
+        if facts is None:
+            return None
+        counters = new_probe_counters()
+        prev_entry = self.incremental_inventory.get(f_rel)
+
+        # Opened lazily, at most once, by whichever check needs bytes first.
+        with FileProbe(f_path, facts["size"], counters) as probe:
+            if prev_entry and prev_entry.get("size_bytes") == facts["size"]:
+                self._reuse_previous_record(prev_entry, facts, probe)
+            if self.enable_content_stats and not facts["is_huge"]:
+                self._probe_content(probe, facts)
+
+            # Conditionally generate quick_hash for small files if not reused and not yet computed
+            if (not facts["is_huge"] and not facts["quick_hash"]
+                    and 0 < facts["size"] < QUICK_HASH_MAX_BYTES and not facts["is_symlink"]):
+                facts["quick_hash"] = probe.quick_hash()
+
+        facts["previous_quick_hash"] = prev_entry.get("quick_hash") if prev_entry else None
+        facts["probe"] = counters
+        return facts
+
+    def _stat_file(self, f_path: Path) -> Optional[Dict[str, Any]]:
+        """File facts from one ``stat``, with the content facts still unset."""
+        try:
+            stat = f_path.stat()
+            is_sym = f_path.is_symlink()
+        except OSError:
+            return None
+
+        size = stat.st_size
+        allocated_size = allocated_bytes_from_stat(stat)
+        return {
+            "size": size,
+            "allocated_size": allocated_size,
+            "is_sparse": size > allocated_size,
+            "is_huge": self.max_file_size is not None and size > self.max_file_size,
+            "mtime_iso": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat().replace('+00:00', 'Z'),
+            "ext": f_path.suffix.lower(),
+            "is_symlink": is_sym,
+            "inode": stat.st_ino,
+            "device": stat.st_dev,
+            "is_text": None,
+            "mime_type": None,
+            "encoding": None,
+            "line_count": None,
+            "quick_hash": None,
+            "previous_quick_hash": None,
+            "reused": False,
+            "skipped_analysis": False,
+        }
+
+    def _reuse_previous_record(self, prev_entry: Dict[str, Any], facts: Dict[str, Any], probe: FileProbe) -> None:
+        """
+        Incremental reuse heuristic for a previous row of the same size.
+
+        A matching mtime counts as unchanged; otherwise small files are
+        disambiguated by ``quick_hash`` (first and last 4 KiB), since a touched
+        file keeps its content. Reused rows carry their content facts over.
+        """
+        is_huge = facts["is_huge"]
+        if prev_entry.get("mtime") == facts["mtime_iso"]:
+            facts["reused"] = True
+        elif not is_huge and facts["size"] < QUICK_HASH_MAX_BYTES and "quick_hash" in prev_entry:
+            facts["quick_hash"] = probe.quick_hash()
+            facts["reused"] = bool(facts["quick_hash"]) and facts["quick_hash"] == prev_entry["quick_hash"]
+        if not facts["reused"]:
+            return
+
+        if not self.config_changed:
+            if "is_text" in prev_entry:
+                facts["is_text"] = prev_entry["is_text"]
+                facts["skipped_analysis"] = True
+            if self.enable_content_stats and not is_huge:
+                for key in ("mime_type", "encoding", "line_count"):
+                    if key in prev_entry:
+                        facts[key] = prev_entry[key]
+        if not is_huge and "quick_hash" in prev_entry and not facts["quick_hash"]:
+            facts["quick_hash"] = prev_entry["quick_hash"]
+
+    def _probe_content(self, probe: FileProbe, facts: Dict[str, Any]) -> None:
+        """Fill MIME type, text flag, encoding and line count not carried over."""
+        refresh = not facts["reused"] or self.config_changed
+        if refresh or facts["mime_type"] is None:
+            facts["mime_type"] = probe.mime_type()
+        if refresh or facts["is_text"] is None:
+            facts["is_text"] = probe.is_text()
+
+        # Restrict text properties based on MIME
+        mime_type = facts["mime_type"]
+        if mime_type and not (mime_type.startswith("text/") or mime_type in TEXT_MIME_ALLOWLIST):
+            facts.update(is_text=False, encoding=None, line_count=None)
+
+        if facts["is_text"]:
+            # Encoding and line count only apply to text
+            if refresh or facts["encoding"] is None:
+                facts["encoding"] = probe.encoding()
+            if refresh or facts["line_count"] is None:
+                facts["line_count"] = probe.line_count(facts["encoding"])
+
+    @staticmethod
+    def _write_inventory_entry(inv_f, inv_cols: Optional[ColumnarInventoryWriter], entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, ensure_ascii=True, sort_keys=True) + "\n"
+        inv_f.write(line)
+        if inv_cols is not None:
+            # ensure_ascii: one byte per character, so len() is the byte length.
+            inv_cols.add(entry, len(line))
+
     def scan(self, inventory_file: Optional[Path] = None, dirs_inventory_file: Optional[Path] = None, previous_inventory_file: Optional[Path] = None, on_progress: Optional[Callable[[int, int, int], None]] = None) -> Dict[str, Any]:
         """
         Scans the directory structure.
@@ -438,10 +994,12 @@ class AtlasScanner:
 
         # Prepare inventory writers
         inv_f = None
+        inv_cols = None
         dirs_inv_f = None
         try:
             if inventory_file:
                 inv_f = inventory_file.open("w", encoding="utf-8")
+                inv_cols = ColumnarInventoryWriter() if self.columnar_inventory else None
             if dirs_inventory_file:
                 dirs_inv_f = dirs_inventory_file.open("w", encoding="utf-8")
         except OSError as e:
@@ -462,12 +1020,30 @@ class AtlasScanner:
         # Directory aggregates for directory rollup statistics
         # path -> { 'n_files': int, 'n_dirs': int, 'bytes': int, 'max_descendant_mtime': str, 'mtime': str }
         # Only collect if we actually need them (writing dirs file).
-        # Note: These aggregates are strictly for producing the dirs.jsonl artifact, NOT for performing subtree skipping yet.
+        # Note: These aggregates produce the dirs.jsonl artifact; the next scan's opt-in subtree skip reads them back.
         collect_dir_aggregates = bool(dirs_inventory_file)
         dir_aggregates: Dict[str, Dict[str, Any]] = {} if collect_dir_aggregates else None
+        # Descendant rows of skipped subtrees; emitted verbatim, never re-aggregated.
+        reused_dir_aggregates: Dict[str, Dict[str, Any]] = {}
+
+        executor = None
+        prefetch_window = 4 * self.workers
+        if self.workers > 1:
+            executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="atlas-scan")
+            root_str = os.fspath(self.root)
+
+            def should_prefetch(path: str) -> bool:
+                rel = os.path.relpath(path, root_str).replace(os.sep, "/")
+                # Directories one level past max_depth are still listed so the
+                # depth-limit hit is detected, exactly as with os.walk.
+                return rel.count("/") <= self.max_depth and not self._is_excluded(rel)
+
+            walk = _parallel_walk(self.root, executor, prefetch_window, should_prefetch)
+        else:
+            walk = ((root, dirs, files, None) for root, dirs, files in os.walk(self.root, topdown=True, followlinks=False))
 
         try:
-            for root, dirs, files in os.walk(self.root, topdown=True, followlinks=False):
+            for root, dirs, files, root_stat in walk:
                 current_root = Path(root)
 
                 # Calculate relative path string once
@@ -502,7 +1078,6 @@ class AtlasScanner:
 
                 # Detect workspace signals
                 workspace_signals = []
-                workspace_kind = "unknown"
 
                 if has_git:
                     workspace_signals.append(".git")
@@ -516,38 +1091,7 @@ class AtlasScanner:
                     workspace_signals.append(".wgx")
 
                 if workspace_signals:
-                    if ".git" in workspace_signals:
-                        workspace_kind = "git_repo"
-                    elif "package.json" in workspace_signals:
-                        workspace_kind = "node_project"
-                    elif "pyproject.toml" in workspace_signals or "requirements.txt" in workspace_signals:
-                        workspace_kind = "python_project"
-                    elif "compose.yml" in workspace_signals or "docker-compose.yml" in workspace_signals:
-                        workspace_kind = "compose_stack"
-                    elif len(workspace_signals) == 1 and workspace_signals[0] == "README.md":
-                        workspace_kind = "docs_space"
-                    else:
-                        workspace_kind = "mixed_workspace"
-
-                    # confidence heuristic: more signals = higher confidence
-                    confidence = min(len(workspace_signals) * 0.25, 1.0)
-                    if ".git" in workspace_signals or ".ai-context.yml" in workspace_signals:
-                        confidence = max(confidence, 0.9)
-
-                    # Simple hash for deterministic ID
-                    try:
-                        h = hashlib.md5(rel_path_str.encode('utf-8'), usedforsecurity=False).hexdigest()[:8]
-                    except TypeError:
-                        h = hashlib.md5(rel_path_str.encode('utf-8')).hexdigest()[:8]  # nosec B303
-                    workspace_id = f"ws_{h}"
-                    self.stats["workspaces"].append({
-                        "workspace_id": workspace_id,
-                        "root_path": rel_path_str,
-                        "workspace_kind": workspace_kind,
-                        "signals": workspace_signals,
-                        "confidence": round(confidence, 2),
-                        "tags": [workspace_kind]
-                    })
+                    self._register_workspace(rel_path_str, workspace_signals)
 
                 # Pre-calculate prefix for children
                 prefix = "" if rel_path_str == "." else rel_path_str + "/"
@@ -577,10 +1121,11 @@ class AtlasScanner:
                     if not self._is_excluded(f_rel):
                         kept_files.append((f, f_rel))
 
-                dir_mtime = datetime.fromtimestamp(current_root.stat().st_mtime, timezone.utc).isoformat().replace('+00:00', 'Z')
+                if root_stat is None:
+                    root_stat = current_root.stat()
+                dir_mtime = datetime.fromtimestamp(root_stat.st_mtime, timezone.utc).isoformat().replace('+00:00', 'Z')
 
-                # Note: Subtree skipping based on mtime/counts is currently disabled.
-                # It is not robust enough against silent descendant changes without a stronger tree hash.
+                # Note: Subtree skipping is opt-in (subtree_skip=True); see _reusable_subtree for its guarantees.
 
                 # Track for topology
                 topology_nodes[rel_path_str] = {
@@ -615,10 +1160,11 @@ class AtlasScanner:
                     direct_children_fingerprint = hashlib.md5(fingerprint_data, usedforsecurity=False).hexdigest() # nosec B303
 
                 # Heuristic subtree candidate detection.
-                # We intentionally DO NOT prune traversal (no `dirs[:] = []`) here.
-                # mtime + counts + direct_children_fingerprint cannot guarantee
-                # that deeper descendants have not changed (POSIX directory mtime is recursively blind).
-                # This is purely for diagnostic and analytical purposes.
+                # mtime + counts + direct_children_fingerprint alone cannot guarantee
+                # that deeper descendants have not changed (POSIX directory mtime is recursively blind),
+                # so traversal is only pruned in subtree_skip mode after _reusable_subtree has
+                # re-checked every recorded descendant directory.
+                reused_subtree = None
                 if self.incremental_dirs_inventory and not self.config_changed and direct_children_fingerprint is not None:
                     prev_dir = self.incremental_dirs_inventory.get(rel_path_str)
                     if prev_dir:
@@ -628,8 +1174,85 @@ class AtlasScanner:
                             prev_dir.get("direct_children_fingerprint") == direct_children_fingerprint):
 
                             self.stats["incremental"]["heuristic_subtree_matches"] += 1
+                            if self.subtree_skip:
+                                reused_subtree = self._reusable_subtree(rel_path_str, self.max_entries - current_entries)
+
+                # Opt-in subtree skip: take this directory's files and all
+                # descendants from the previous snapshot instead of walking them.
+                dir_bytes_by_path: Dict[str, int] = {}
+                dir_allocated_by_path: Dict[str, int] = {}
+                if reused_subtree is not None:
+                    reused_dir_rows, reused_file_rows = reused_subtree
+                    dirs[:] = []
+                    kept_files = []
+                    self.stats["incremental"]["subtree_skips"] += 1
+                    self.stats["incremental"]["subtree_reused_dirs"] += len(reused_dir_rows)
+                    self.stats["incremental"]["subtree_reused_files"] += len(reused_file_rows)
+
+                    for row in reused_file_rows:
+                        current_entries += 1
+                        size = row["size_bytes"]
+                        allocated_size = row.get("allocated_size_bytes", size)
+                        ext = row.get("ext", "")
+                        self.stats["total_files"] += 1
+                        self.stats["total_bytes"] += size
+                        self.stats["total_allocated_bytes"] += allocated_size
+                        if row.get("is_sparse"):
+                            self.stats["sparse_files_count"] += 1
+                            self.stats["sparse_apparent_bytes"] += size
+                            self.stats["sparse_allocated_bytes"] += allocated_size
+                        self.stats["extensions"][ext] = self.stats["extensions"].get(ext, 0) + 1
+                        parent = _parent_rel_path(row["rel_path"])
+                        dir_bytes_by_path[parent] = dir_bytes_by_path.get(parent, 0) + size
+                        dir_allocated_by_path[parent] = dir_allocated_by_path.get(parent, 0) + allocated_size
 
-                if collect_dir_aggregates:
+                        if self.enable_content_stats and not row.get("is_huge"):
+                            if row.get("is_text"):
+                                text_files_count += 1
+                            else:
+                                binary_files_count += 1
+                            if size > 10 * 1024 * 1024: # 10MB
+                                large_files.append({"path": row["rel_path"], "size": size})
+
+                        if inv_f:
+                            entry = dict(row)
+                            if self.snapshot_id:
+                                entry["snapshot_id"] = self.snapshot_id
+                            else:
+                                entry.pop("snapshot_id", None)
+                            self._write_inventory_entry(inv_f, inv_cols, entry)
+                    self.stats["truncated"]["files_seen"] = current_entries
+
+                    child_dirs: Dict[str, List[str]] = {}
+                    for row in reused_dir_rows:
+                        child_dirs.setdefault(_parent_rel_path(row["rel_path"]), []).append(row["rel_path"])
+                    for row in reused_dir_rows:
+                        p = row["rel_path"]
+                        signals = row["workspace_signals"]
+                        if ".git" in signals:
+                            self.stats["repo_nodes"].append(p)
+                        if signals:
+                            self._register_workspace(p, list(signals))
+                        topology_nodes[p] = {"path": p, "depth": row["depth"], "dirs": child_dirs.get(p, [])}
+                        dir_file_counts[p] = row["n_files"]
+                        dir_depths[p] = row["depth"]
+                        dir_signal_counts[p] = len(signals)
+                        dir_sizes[p] = dir_bytes_by_path.get(p, 0)
+                        dir_allocated_sizes[p] = dir_allocated_by_path.get(p, 0)
+                        if collect_dir_aggregates:
+                            reused_dir_aggregates[p] = dict(row)
+                    self.stats["total_dirs"] += len(reused_dir_rows)
+                    self.stats["truncated"]["dirs_seen"] += len(reused_dir_rows)
+
+                if collect_dir_aggregates and reused_subtree is not None:
+                    # Sealed: subtree totals and recursive_hash come from the
+                    # previous snapshot and are only bubbled up to the parent.
+                    dir_aggregates[rel_path_str] = dict(
+                        self.incremental_dirs_inventory[rel_path_str],
+                        direct_file_signatures=None,
+                        child_dir_hashes=[],
+                    )
+                elif collect_dir_aggregates:
                     dir_aggregates[rel_path_str] = {
                         "rel_path": rel_path_str,
                         "depth": depth,
@@ -644,13 +1267,20 @@ class AtlasScanner:
                         "direct_children_fingerprint": direct_children_fingerprint,
                         "direct_file_signatures": [], # Will hold stable file signatures for hashing
                         "child_dir_hashes": [], # Will accumulate child dir recursive hashes
+                        "workspace_signals": workspace_signals,
                         "recursive_hash": None # Will be computed bottom-up
                     }
 
                 self.stats["truncated"]["dirs_seen"] += 1
 
+                # Files past the max_entries budget are never stat'ed.
+                budget = max(0, self.max_entries - current_entries)
+                if executor is not None:
+                    records = _ordered_map(executor, self._inspect_file, [(current_root / f, f_rel) for f, f_rel in kept_files[:budget]], prefetch_window)
+                else:
+                    records = (self._inspect_file(current_root / f, f_rel) for f, f_rel in kept_files[:budget])
+
                 for f, f_rel in kept_files:
-                    f_path = current_root / f
                     # Exclusion check already done
 
                     current_entries += 1
@@ -663,26 +1293,25 @@ class AtlasScanner:
                         self.stats["truncated"]["files_seen"] = self.max_entries
                         break
 
+                    record = next(records)
+                    if record is None:
+                        continue
                     try:
-                        stat = f_path.stat()
-                        size = stat.st_size
-                        allocated_size = allocated_bytes_from_stat(stat)
-                        is_sparse = size > allocated_size
-
-                        is_huge = self.max_file_size is not None and size > self.max_file_size
-
-                        mtime = stat.st_mtime
-                        ext = f_path.suffix.lower()
-                        is_sym = f_path.is_symlink()
-                        inode = stat.st_ino
-                        device = stat.st_dev
+                        size = record["size"]
+                        allocated_size = record["allocated_size"]
+                        is_huge = record["is_huge"]
+                        mtime_iso = record["mtime_iso"]
+                        ext = record["ext"]
+                        is_txt = record["is_text"]
+                        file_hash = record["quick_hash"]
 
-                        mtime_iso = datetime.fromtimestamp(mtime, timezone.utc).isoformat().replace('+00:00', 'Z')
+                        for counter, value in record["probe"].items():
+                            self.stats["probe"][counter] += value
 
                         self.stats["total_files"] += 1
                         self.stats["total_bytes"] += size
                         self.stats["total_allocated_bytes"] += allocated_size
-                        if is_sparse:
+                        if record["is_sparse"]:
                             self.stats["sparse_files_count"] += 1
                             self.stats["sparse_apparent_bytes"] += size
                             self.stats["sparse_allocated_bytes"] += allocated_size
@@ -695,102 +1324,20 @@ class AtlasScanner:
                         if collect_dir_aggregates and mtime_iso > dir_aggregates[rel_path_str]["max_descendant_mtime"]:
                             dir_aggregates[rel_path_str]["max_descendant_mtime"] = mtime_iso
 
-                        is_txt = None
-                        mime_type = None
-                        encoding = None
-                        line_count = None
-
-                        # Incremental reuse heuristic
-                        prev_entry = self.incremental_inventory.get(f_rel)
-                        is_reused = False
-                        file_hash = None
-                        if prev_entry and prev_entry.get("size_bytes") == size:
-                            # If size matches but mtime changed, or we just want to be sure, we can selectively hash
-                            # Here, if mtime matches, we assume reuse.
-                            if prev_entry.get("mtime") == mtime_iso:
-                                is_reused = True
-                            else:
-                                # Selective Hash for disambiguation (if size matches but mtime changed, maybe it was just touched)
-                                # Only hash if file is < 1MB to avoid heavy IO
-                                if not is_huge and size < 1024 * 1024 and "quick_hash" in prev_entry:
-                                    try:
-                                        with f_path.open("rb") as hf:
-                                            # Read first and last 4KB
-                                            hf.seek(0)
-                                            head = hf.read(4096)
-                                            if size > 4096:
-                                                hf.seek(-min(4096, size - 4096), 2)
-                                                tail = hf.read(4096)
-                                            else:
-                                                tail = b""
-                                            file_hash = hashlib.md5(head + tail, usedforsecurity=False).hexdigest() # nosec B303
-                                        if file_hash == prev_entry["quick_hash"]:
-                                            is_reused = True
-                                    except OSError:
-                                        pass
-
-                            if is_reused:
-                                self.stats["incremental"]["reused_files_count"] += 1
-                                if not self.config_changed:
-                                    if "is_text" in prev_entry:
-                                        is_txt = prev_entry["is_text"]
-                                        self.stats["incremental"]["skipped_analysis_count"] += 1
-                                    if self.enable_content_stats and not is_huge:
-                                        if "mime_type" in prev_entry:
-                                            mime_type = prev_entry["mime_type"]
-                                        if "encoding" in prev_entry:
-                                            encoding = prev_entry["encoding"]
-                                        if "line_count" in prev_entry:
-                                            line_count = prev_entry["line_count"]
-                                if not is_huge and "quick_hash" in prev_entry and not file_hash:
-                                    file_hash = prev_entry["quick_hash"]
+                        if record["reused"]:
+                            self.stats["incremental"]["reused_files_count"] += 1
+                        if record["skipped_analysis"]:
+                            self.stats["incremental"]["skipped_analysis_count"] += 1
 
                         if self.enable_content_stats and not is_huge:
-                            # 1. Determine or reuse MIME type
-                            if not is_reused or mime_type is None or self.config_changed:
-                                mime_type = detect_mime_type(f_path)
-
-                            # 2. Determine or reuse is_text
-                            if not is_reused or is_txt is None or self.config_changed:
-                                is_txt = is_probably_text(f_path, size)
-
-                            # 3. Restrict text properties based on MIME
-                            if mime_type:
-                                is_text_mime = mime_type.startswith("text/") or mime_type in TEXT_MIME_ALLOWLIST
-                                if not is_text_mime:
-                                    is_txt = False
-                                    encoding = None
-                                    line_count = None
-
                             if is_txt:
                                 text_files_count += 1
-                                # 4. Detect encoding only if it's considered text
-                                if not is_reused or encoding is None or self.config_changed:
-                                    encoding = detect_encoding(f_path)
-                                # 5. Detect line count only if it's considered text
-                                if not is_reused or line_count is None or self.config_changed:
-                                    line_count = count_lines(f_path, size, encoding=encoding)
                             else:
                                 binary_files_count += 1
 
                             if size > 10 * 1024 * 1024: # 10MB
                                 large_files.append({"path": f_rel, "size": size})
 
-                        # Conditionally generate quick_hash for small files if not reused and not yet computed
-                        if not is_huge and not file_hash and size < 1024 * 1024 and size > 0 and not is_sym:
-                            try:
-                                with f_path.open("rb") as hf:
-                                    hf.seek(0)
-                                    head = hf.read(4096)
-                                    if size > 4096:
-                                        hf.seek(-min(4096, size - 4096), 2)
-                                        tail = hf.read(4096)
-                                    else:
-                                        tail = b""
-                                    file_hash = hashlib.md5(head + tail, usedforsecurity=False).hexdigest() # nosec B303
-                            except OSError:
-                                pass
-
                         # Update parent dir aggregate with file signature
                         if collect_dir_aggregates:
                             # Use canonical JSON serialization for stable file signatures
@@ -800,10 +1347,7 @@ class AtlasScanner:
                                 "mtime": mtime_iso
                             }
 
-                            h = file_hash
-                            if not h and prev_entry and "quick_hash" in prev_entry:
-                                h = prev_entry["quick_hash"]
-
+                            h = file_hash or record["previous_quick_hash"]
                             if h:
                                 sig_dict["quick_hash"] = h
 
@@ -819,11 +1363,11 @@ class AtlasScanner:
                                 "ext": ext,
                                 "size_bytes": size,
                                 "allocated_size_bytes": allocated_size,
-                                "is_sparse": is_sparse,
+                                "is_sparse": record["is_sparse"],
                                 "mtime": mtime_iso,
-                                "is_symlink": is_sym,
-                                "inode": inode,
-                                "device": device
+                                "is_symlink": record["is_symlink"],
+                                "inode": record["inode"],
+                                "device": record["device"]
                             }
 
                             if file_hash:
@@ -836,13 +1380,13 @@ class AtlasScanner:
                             if self.enable_content_stats and not is_huge:
                                 if is_txt is not None:
                                     entry["is_text"] = is_txt
-                                if mime_type is not None:
-                                    entry["mime_type"] = mime_type
-                                if encoding is not None:
-                                    entry["encoding"] = encoding
-                                if line_count is not None:
-                                    entry["line_count"] = line_count
-                            inv_f.write(json.dumps(entry, ensure_ascii=True, sort_keys=True) + "\n")
+                                if record["mime_type"] is not None:
+                                    entry["mime_type"] = record["mime_type"]
+                                if record["encoding"] is not None:
+                                    entry["encoding"] = record["encoding"]
+                                if record["line_count"] is not None:
+                                    entry["line_count"] = record["line_count"]
+                            self._write_inventory_entry(inv_f, inv_cols, entry)
 
                     except OSError:
                         continue
@@ -850,10 +1394,14 @@ class AtlasScanner:
                 if self.stats["truncated"]["hit"]:
                     break
 
+                if reused_subtree is not None:
+                    dir_bytes = dir_bytes_by_path.get(rel_path_str, 0)
+                    dir_allocated_bytes = dir_allocated_by_path.get(rel_path_str, 0)
+
                 self.stats["total_dirs"] += 1
                 dir_sizes[rel_path_str] = dir_bytes
                 dir_allocated_sizes[rel_path_str] = dir_allocated_bytes
-                if collect_dir_aggregates:
+                if collect_dir_aggregates and reused_subtree is None:
                     dir_aggregates[rel_path_str]["subtree_total_bytes"] += dir_bytes
                     dir_aggregates[rel_path_str]["subtree_allocated_bytes"] += dir_allocated_bytes
 
@@ -878,6 +1426,9 @@ class AtlasScanner:
                             pass  # never let progress callback abort the scan
 
         finally:
+            walk.close()
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
             if inv_f:
                 inv_f.close()
 
@@ -890,26 +1441,11 @@ class AtlasScanner:
                     current_agg = dir_aggregates[p]
 
                     # 1. Compute bottom-up recursive_hash for THIS directory
-                    dir_hash_components = []
-
-                    # A) Direct file signatures (sorted for stability)
-                    sorted_files = sorted(current_agg["direct_file_signatures"])
-                    for fsig in sorted_files:
-                        dir_hash_components.append(f"F:{fsig}")
-
-                    # B) Child directory hashes (sorted for stability)
-                    sorted_child_hashes = sorted(current_agg["child_dir_hashes"])
-                    for dsig in sorted_child_hashes:
-                        dir_hash_components.append(f"D:{dsig}")
-
-                    # C) Direct properties of this directory (optional, but good for tracking structural identity)
-                    dir_hash_components.append(f"R:{current_agg['rel_path']}")
-                    if current_agg["direct_children_fingerprint"]:
-                        dir_hash_components.append(f"FP:{current_agg['direct_children_fingerprint']}")
-
-                    # Produce hash
-                    hash_input = json.dumps(dir_hash_components, ensure_ascii=False, separators=(",", ":")).encode("utf-8", errors="surrogateescape")
-                    recursive_hash = hashlib.md5(hash_input, usedforsecurity=False).hexdigest() # nosec B303
+                    if current_agg["direct_file_signatures"] is None:
+                        # Sealed root of a skipped subtree
+                        recursive_hash = current_agg["recursive_hash"]
+                    else:
+                        recursive_hash = self._recursive_dir_hash(current_agg)
 
                     current_agg["recursive_hash"] = recursive_hash
 
@@ -948,11 +1484,22 @@ class AtlasScanner:
             # Write dir inventory if requested
             if dirs_inv_f:
                 try:
-                    for p in sorted(dir_aggregates.keys()):
-                        dirs_inv_f.write(json.dumps(dir_aggregates[p], ensure_ascii=True, sort_keys=True) + "\n")
+                    all_dir_rows = dict(reused_dir_aggregates)
+                    all_dir_rows.update(dir_aggregates or {})
+                    for p in sorted(all_dir_rows.keys()):
+                        dirs_inv_f.write(json.dumps(all_dir_rows[p], ensure_ascii=True, sort_keys=True) + "\n")
                 finally:
                     dirs_inv_f.close()
 
+        if inv_cols is not None:
+            try:
+                sidecar = inv_cols.finish(inventory_file)
+            except OSError as e:
+                logger.warning("Failed to write columnar inventory sidecar: %s", e)
+                sidecar = None
+            if sidecar is not None:
+                self.stats["columnar_inventory_file"] = str(sidecar.resolve())
+
         # Update stats
         if depth_limit_hit:
              self.stats["truncated"]["depth_limit_hit"] = True
@@ -0,0 +1,179 @@
+"""Persistent per-file cache of Python analyzer facts.
+
+Between two dumps of the same repository almost every Python file is
+unchanged, yet the symbol index, call graph and import graph would re-parse
+and re-visit all of them. ``AstFactsCache`` stores what each analyzer
+extracted from one file, keyed by the file's content SHA-256, its
+repository-relative path (symbol ids and module names derive from it), the
+analyzer name and a version string. :func:`run_python_analysis` only parses a
+file when some analyzer misses.
+
+Cross-file work is never cached: the call graph resolver and import edge
+resolution always run over the complete, current set of per-file facts.
+
+The cache is one SQLite database, by default below the hub in
+``.gewebe/cache/``. Writes are buffered and committed by :meth:`flush` in one
+transaction. Entries not used by recent runs are pruned once the cache holds
+more than ``max_entries`` rows. Any SQLite error disables the cache for the
+rest of the run instead of failing the build.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache layout or the fact encoding shared by all analyzers changes.
+AST_FACTS_CACHE_VERSION = 1
+DEFAULT_AST_FACTS_MAX_ENTRIES = 200_000
+AST_FACTS_CACHE_RELPATH = Path(".gewebe") / "cache" / "python-ast-facts.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS facts (
+    analyzer TEXT NOT NULL,
+    version TEXT NOT NULL,
+    rel_path TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    used_ns INTEGER NOT NULL,
+    PRIMARY KEY (analyzer, version, rel_path, sha256)
+)
+"""
+
+
+def hub_ast_facts_cache_path(hub: Path) -> Path:
+    return Path(hub) / AST_FACTS_CACHE_RELPATH
+
+
+class AstFactsCache:
+    """SQLite-backed ``(sha256, path, analyzer, version) -> facts`` store."""
+
+    def __init__(self, path: Path, *, max_entries: int = DEFAULT_AST_FACTS_MAX_ENTRIES) -> None:
+        self.path = Path(path)
+        self.max_entries = max(0, int(max_entries))
+        self.counters: dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "pruned": 0}
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        self._pending: dict[tuple[str, str, str, str], str] = {}
+        self._touched: set[tuple[str, str, str, str]] = set()
+
+    def _version(self, analyzer_version: int) -> str:
+        python = f"{sys.version_info[0]}.{sys.version_info[1]}"
+        return f"{AST_FACTS_CACHE_VERSION}:{python}:{analyzer_version}"
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._disabled:
+            return None
+        if self._conn is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=30)
+                conn.execute(_SCHEMA)
+                conn.commit()
+            except (OSError, sqlite3.Error) as exc:
+                self._disable(exc)
+                return None
+            self._conn = conn
+        return self._conn
+
+    def _disable(self, exc: BaseException) -> None:
+        logger.warning("Disabling AST facts cache %s: %s", self.path, exc)
+        self._disabled = True
+        self._pending.clear()
+        self._touched.clear()
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def get(self, analyzer: str, analyzer_version: int, rel_path: str, sha256: str) -> Any | None:
+        key = (analyzer, self._version(analyzer_version), rel_path, sha256)
+        payload = self._pending.get(key)
+        if payload is None:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT payload FROM facts"
+                    " WHERE analyzer = ? AND version = ? AND rel_path = ? AND sha256 = ?",
+                    key,
+                ).fetchone()
+            except sqlite3.Error as exc:
+                self._disable(exc)
+                return None
+            if row is None:
+                self.counters["misses"] += 1
+                return None
+            payload = row[0]
+            self._touched.add(key)
+        try:
+            facts = json.loads(payload)
+        except ValueError:
+            self.counters["misses"] += 1
+            return None
+        self.counters["hits"] += 1
+        return facts
+
+    def put(
+        self, analyzer: str, analyzer_version: int, rel_path: str, sha256: str, facts: Any
+    ) -> None:
+        if self._disabled:
+            return
+        key = (analyzer, self._version(analyzer_version), rel_path, sha256)
+        self._pending[key] = json.dumps(facts, separators=(",", ":"))
+
+    def flush(self) -> None:
+        """Commit buffered entries and usage marks, then prune to ``max_entries``."""
+        if not self._pending and not self._touched:
+            return
+        conn = self._connect()
+        if conn is None:
+            return
+        now = time.time_ns()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO facts VALUES (?, ?, ?, ?, ?, ?)",
+                    [(*key, payload, now) for key, payload in self._pending.items()],
+                )
+                conn.executemany(
+                    "UPDATE facts SET used_ns = ?"
+                    " WHERE analyzer = ? AND version = ? AND rel_path = ? AND sha256 = ?",
+                    [(now, *key) for key in self._touched],
+                )
+                (count,) = conn.execute("SELECT COUNT(*) FROM facts").fetchone()
+                excess = count - self.max_entries
+                if excess > 0:
+                    conn.execute(
+                        "DELETE FROM facts WHERE rowid IN"
+                        " (SELECT rowid FROM facts ORDER BY used_ns LIMIT ?)",
+                        (excess,),
+                    )
+        except sqlite3.Error as exc:
+            self._disable(exc)
+            return
+        self.counters["stores"] += len(self._pending)
+        self.counters["pruned"] += max(0, excess)
+        self._pending.clear()
+        self._touched.clear()
+
+    def close(self) -> None:
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "AstFactsCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from .ast_facts_cache import AstFactsCache
 from .entrypoints import generate_entrypoints_document
 from .import_graph import generate_import_graph_document
 
@@ -174,6 +175,7 @@ def ensure_bundle_graph_sources(
     canonical_dump_index_sha256: str,
     generated_at: str,
     source_roots: Sequence[str] | None = None,
+    facts_cache: AstFactsCache | None = None,
 ) -> BundleGraphSources:
     """Create a coherent source pair from the bundle retrieval surface.
 
@@ -236,6 +238,7 @@ def ensure_bundle_graph_sources(
                 run_id,
                 canonical_dump_index_sha256,
                 source_roots=explicit_source_roots,
+                facts_cache=facts_cache,
             )
             entrypoints = generate_entrypoints_document(
                 selected_root,
@@ -7,7 +7,6 @@ lexical bindings. Everything else remains explicit S0 navigation evidence.
 from __future__ import annotations
 
 import ast
-import os
 from operator import attrgetter
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -17,8 +16,12 @@ from merger.repoground.architecture.call_graph_contract import (
     MAX_SKIPPED_ERRORS,
     PRODUCER_NONCLAIMS,
 )
+from merger.repoground.architecture.python_analysis import (
+    PythonAnalysisReport,
+    PythonSource,
+    run_python_analysis,
+)
 from merger.repoground.architecture.symbol_index import (
-    EXCLUDED_DIRS,
     _module_name,
     _range_ref,
     _symbol_id,
@@ -69,6 +72,91 @@ class _ModuleState:
     def add_symbol(self, symbol_id: str, kind: str) -> None:
         self.symbol_kinds[symbol_id] = kind
 
+    def to_facts(self) -> dict[str, Any]:
+        """Return JSON data; scope frames shared by calls are stored once."""
+        frames: list[_ScopeFrame] = []
+        frame_index: dict[int, int] = {}
+        calls = []
+        for raw_call in self.calls:
+            indexes = []
+            for frame in raw_call["stack"]:
+                if id(frame) not in frame_index:
+                    frame_index[id(frame)] = len(frames)
+                    frames.append(frame)
+                indexes.append(frame_index[id(frame)])
+            calls.append({**raw_call, "stack": indexes})
+        return {
+            "path": self.path,
+            "module": self.module,
+            "functions": self.functions,
+            "classes": self.classes,
+            "methods": [[*key, targets] for key, targets in self.methods.items()],
+            "symbol_kinds": self.symbol_kinds,
+            "from_imports": {local: list(target) for local, target in self.from_imports.items()},
+            "module_aliases": self.module_aliases,
+            "imported_module_names": sorted(self.imported_module_names),
+            "binding_sources": {
+                name: sorted(sources) for name, sources in self.binding_sources.items()
+            },
+            "frames": [
+                [
+                    frame.name,
+                    frame.kind,
+                    sorted(frame.local_bindings),
+                    sorted(frame.global_names),
+                    sorted(frame.nonlocal_names),
+                    frame.start_line,
+                    frame.end_line,
+                    frame.receiver_name,
+                ]
+                for frame in frames
+            ],
+            "calls": calls,
+        }
+
+    @classmethod
+    def from_facts(cls, facts: dict[str, Any]) -> "_ModuleState":
+        state = cls(facts["path"], facts["module"])
+        state.functions = facts["functions"]
+        state.classes = facts["classes"]
+        state.methods = {(owner, name): targets for owner, name, targets in facts["methods"]}
+        state.symbol_kinds = facts["symbol_kinds"]
+        state.from_imports = {
+            local: (module, name) for local, (module, name) in facts["from_imports"].items()
+        }
+        state.module_aliases = facts["module_aliases"]
+        state.imported_module_names = set(facts["imported_module_names"])
+        state.binding_sources = {
+            name: set(sources) for name, sources in facts["binding_sources"].items()
+        }
+        frames = [
+            _ScopeFrame(
+                name=name,
+                kind=kind,
+                local_bindings=frozenset(local_bindings),
+                global_names=frozenset(global_names),
+                nonlocal_names=frozenset(nonlocal_names),
+                start_line=start_line,
+                end_line=end_line,
+                receiver_name=receiver_name,
+            )
+            for (
+                name,
+                kind,
+                local_bindings,
+                global_names,
+                nonlocal_names,
+                start_line,
+                end_line,
+                receiver_name,
+            ) in facts["frames"]
+        ]
+        state.calls = [
+            {**raw_call, "stack": tuple(frames[index] for index in raw_call["stack"])}
+            for raw_call in facts["calls"]
+        ]
+        return state
+
 
 def _relative_import_base(module: str, is_package: bool, level: int) -> str | None:
     parts = module.split(".") if module else []
@@ -435,7 +523,7 @@ class _CallGraphVisitor(ast.NodeVisitor):
                     "start_col": start_col,
                     "end_line": end_line,
                     "end_col": end_col,
-                    "func": node.func,
+                    "callee": _callee_facts(node.func),
                     # The stack list changes while traversing; its frozen frames do not.
                     "stack": tuple(self.stack),
                 }
@@ -444,6 +532,16 @@ class _CallGraphVisitor(ast.NodeVisitor):
         return None
 
 
+def _callee_facts(func: ast.expr) -> dict[str, Any]:
+    """Keep only what resolution needs from a callee so states stay picklable."""
+    return {
+        "expression": ast.unparse(func),
+        "name": func.id if isinstance(func, ast.Name) else None,
+        "parts": None if isinstance(func, ast.Name) else _dotted_parts(func),
+        "attr": func.attr if isinstance(func, ast.Attribute) else None,
+    }
+
+
 def _dotted_parts(node: ast.expr) -> list[str] | None:
     parts: list[str] = []
     current: ast.expr = node
@@ -747,18 +845,18 @@ class _Resolver:
         return self._resolve_module_dotted(state, parts, stack)
 
     def resolve(self, state: _ModuleState, raw_call: dict[str, Any]) -> dict[str, Any]:
-        func = raw_call["func"]
+        callee = raw_call["callee"]
         stack = raw_call["stack"]
-        if isinstance(func, ast.Name):
-            simple_name: str | None = func.id
-            verdict = self._resolve_name(state, func.id, stack)
+        if callee["name"] is not None:
+            simple_name: str | None = callee["name"]
+            verdict = self._resolve_name(state, callee["name"], stack)
         else:
-            parts = _dotted_parts(func)
+            parts = callee["parts"]
             if parts is not None:
                 simple_name = parts[-1]
                 verdict = self._resolve_dotted(state, parts, stack)
             else:
-                simple_name = func.attr if isinstance(func, ast.Attribute) else None
+                simple_name = callee["attr"]
                 verdict = _verdict("unresolved", "dynamic_callee_expression")
         record = {
             "path": state.path,
@@ -767,7 +865,7 @@ class _Resolver:
             "end_line": raw_call["end_line"],
             "end_col": raw_call["end_col"],
             "range_ref": _range_ref(state.path, raw_call["start_line"], raw_call["end_line"]),
-            "callee_expression": ast.unparse(func),
+            "callee_expression": callee["expression"],
             "simple_name": simple_name,
         }
         record.update(_caller_fields(state.path, stack))
@@ -775,54 +873,84 @@ class _Resolver:
         return record
 
 
-def extract_python_calls(repo_root: Path) -> tuple[list[dict[str, Any]], int, list[str]]:
-    """Return deterministic call records plus bounded parse diagnostics."""
-    modules: dict[str, list[_ModuleState]] = {}
-    skipped_files_count = 0
-    skipped_errors: list[str] = []
-    for root, dirs, files in os.walk(repo_root, topdown=True):
-        dirs[:] = sorted(directory for directory in dirs if directory not in EXCLUDED_DIRS)
-        for file_name in sorted(files):
-            if not file_name.endswith(".py"):
-                continue
-            path = Path(root) / file_name
-            rel_path = path.relative_to(repo_root).as_posix()
-            try:
-                tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-            except (OSError, SyntaxError, UnicodeDecodeError) as exc:
-                skipped_files_count += 1
-                if len(skipped_errors) < MAX_SKIPPED_ERRORS:
-                    skipped_errors.append(
-                        f"Failed to parse {rel_path}: {type(exc).__name__} - {exc}"
-                    )
-                continue
-            visitor = _CallGraphVisitor(rel_path, is_package=file_name == "__init__.py")
-            visitor.visit(tree)
-            modules.setdefault(visitor.state.module, []).append(visitor.state)
-
-    resolver = _Resolver(modules)
-    calls = [
-        resolver.resolve(state, raw_call)
-        for module in sorted(modules)
-        for state in sorted(modules[module], key=lambda item: item.path)
-        for raw_call in state.calls
-    ]
-    calls.sort(
-        key=lambda item: (
-            item["path"],
-            item["start_line"],
-            item["start_col"],
-            item["callee_expression"],
-            item["caller_symbol_id"] or "",
+class CallGraphAnalyzer:
+    """Collect and resolve call records for :func:`run_python_analysis`."""
+
+    name = "call_graph"
+    version = 1
+
+    def __init__(self) -> None:
+        self._modules: dict[str, list[_ModuleState]] = {}
+        self.calls: list[dict[str, Any]] = []
+
+    def extract(self, source: PythonSource, tree: ast.Module) -> _ModuleState:
+        visitor = _CallGraphVisitor(source.rel_path, is_package=source.is_package)
+        visitor.visit(tree)
+        return visitor.state
+
+    def add(self, source: PythonSource, facts: _ModuleState) -> None:
+        self._modules.setdefault(facts.module, []).append(facts)
+
+    def dump(self, facts: _ModuleState) -> dict[str, Any]:
+        return facts.to_facts()
+
+    def load(self, data: dict[str, Any]) -> _ModuleState:
+        return _ModuleState.from_facts(data)
+
+    def finish(self) -> None:
+        modules = self._modules
+        resolver = _Resolver(modules)
+        calls = [
+            resolver.resolve(state, raw_call)
+            for module in sorted(modules)
+            for state in sorted(modules[module], key=lambda item: item.path)
+            for raw_call in state.calls
+        ]
+        calls.sort(
+            key=lambda item: (
+                item["path"],
+                item["start_line"],
+                item["start_col"],
+                item["callee_expression"],
+                item["caller_symbol_id"] or "",
+            )
         )
+        self.calls = calls
+
+
+def extract_python_calls(
+    repo_root: Path, *, max_workers: int | None = None
+) -> tuple[list[dict[str, Any]], int, list[str]]:
+    """Return deterministic call records plus bounded parse diagnostics.
+
+    ``max_workers > 1`` parses in a process pool with identical output.
+    """
+    analyzer = CallGraphAnalyzer()
+    report = run_python_analysis(
+        repo_root, [analyzer], max_skipped_errors=MAX_SKIPPED_ERRORS, max_workers=max_workers
     )
-    return calls, skipped_files_count, skipped_errors
+    return analyzer.calls, report.skipped_files_count, report.skipped_errors
 
 
 def generate_call_graph_document(
-    repo_root: Path, run_id: str, canonical_sha256: str
+    repo_root: Path, run_id: str, canonical_sha256: str, *, max_workers: int | None = None
+) -> dict[str, Any]:
+    analyzer = CallGraphAnalyzer()
+    report = run_python_analysis(
+        repo_root, [analyzer], max_skipped_errors=MAX_SKIPPED_ERRORS, max_workers=max_workers
+    )
+    return call_graph_document(analyzer, report, run_id, canonical_sha256)
+
+
+def call_graph_document(
+    analyzer: CallGraphAnalyzer,
+    report: PythonAnalysisReport,
+    run_id: str,
+    canonical_sha256: str,
 ) -> dict[str, Any]:
-    calls, skipped_count, skipped_errors = extract_python_calls(repo_root)
+    calls = analyzer.calls
+    skipped_count = report.skipped_files_count
+    skipped_errors = report.skipped_errors
     resolution_counts = {status: 0 for status in RESOLUTION_STATUSES}
     evidence_counts = {level: 0 for level in EVIDENCE_LEVELS}
     relation_counts = {relation: 0 for relation in RELATION_TYPES}
@@ -1,8 +1,12 @@
 import hashlib
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 try:
     import jsonschema
@@ -25,12 +29,178 @@ _GRAPH_INDEX_SCHEMA_PATH = (
 )
 
 
+GRAPH_INDEX_CACHE_MAX_ENTRIES = 8
+GRAPH_INDEX_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+ProximityScore = Tuple[int, float, float]
+
+
+def graph_proximity_scores(graph: Dict[str, Any]) -> Dict[str, ProximityScore]:
+    """Map each graph node to ``(distance, graph_proximity, entrypoint_boost)``.
+
+    Entrypoints (distance 0) score 1.0 on both components, reachable nodes
+    ``1 / (distance + 1)`` proximity, unreachable nodes nothing.
+    """
+    scores: Dict[str, ProximityScore] = {}
+    for node_id, distance in (graph.get("distances") or {}).items():
+        if distance == 0:
+            scores[node_id] = (distance, 1.0, 1.0)
+        elif distance > 0:
+            scores[node_id] = (distance, 1.0 / (distance + 1.0), 0.0)
+        else:
+            scores[node_id] = (distance, 0.0, 0.0)
+    return scores
+
+
+@dataclass(frozen=True)
+class _CachedGraphIndex:
+    identity: Tuple[Any, ...]
+    graph: Dict[str, Any]
+    proximity_scores: Dict[str, ProximityScore]
+    approx_bytes: int
+
+
+class _GraphIndexCache:
+    """LRU of parsed, schema-validated graph indexes.
+
+    Entries are keyed by resolved path and bound to the file identity
+    ``(device, inode, mtime_ns, size)`` plus the schema path they were
+    validated against; a rewritten file or another schema misses. Memory is
+    accounted by on-disk JSON size, which bounds the parsed footprint up to a
+    constant factor. Cached graphs are shared and must be treated as
+    read-only.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _CachedGraphIndex]" = OrderedDict()
+        self._bytes = 0
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: str, identity: Tuple[Any, ...]) -> Optional[_CachedGraphIndex]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.identity == identity:
+                self._entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return entry
+            self.counters["misses"] += 1
+            return None
+
+    def put(self, key: str, entry: _CachedGraphIndex) -> None:
+        if entry.approx_bytes > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.approx_bytes
+            self._entries[key] = entry
+            self._bytes += entry.approx_bytes
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.approx_bytes
+                self.counters["evictions"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters, entries=len(self._entries), approx_bytes=self._bytes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_GRAPH_INDEX_CACHE = _GraphIndexCache(GRAPH_INDEX_CACHE_MAX_ENTRIES, GRAPH_INDEX_CACHE_MAX_BYTES)
+_VALIDATORS: Dict[Tuple[str, Tuple[Any, ...]], Any] = {}
+
+
+def graph_index_cache_stats() -> Dict[str, int]:
+    """Hit/miss/eviction counters and memory accounting of the graph cache."""
+    return _GRAPH_INDEX_CACHE.stats()
+
+
+def clear_graph_index_cache() -> None:
+    _GRAPH_INDEX_CACHE.clear()
+    _VALIDATORS.clear()
+
+
+def _file_identity(path: Path) -> Optional[Tuple[Any, ...]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _graph_index_validator() -> Any:
+    """Return a checked Draft 7 validator for the graph index schema."""
+    schema_path = _GRAPH_INDEX_SCHEMA_PATH
+    key = (str(schema_path), _file_identity(schema_path))
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        with schema_path.open(encoding="utf-8") as handle:
+            schema = json.load(handle)
+        jsonschema.Draft7Validator.check_schema(schema)
+        validator = jsonschema.Draft7Validator(schema)
+        _VALIDATORS[key] = validator
+    return validator
+
+
+def _graph_index_result(
+    entry: _CachedGraphIndex,
+    expected_sha256: Optional[str],
+    cache_hit: bool,
+) -> Dict[str, Any]:
+    data = entry.graph
+    status = "ok"
+    if expected_sha256:
+        graph_sha = data.get("canonical_dump_index_sha256")
+        if not graph_sha or graph_sha != expected_sha256:
+            status = "stale_or_mismatched"
+    return {
+        "status": status,
+        "graph": data,
+        "proximity_scores": entry.proximity_scores,
+        "cache_hit": cache_hit,
+    }
+
+
+def _read_graph_index(path: Path) -> Dict[str, Any]:
+    """Parse and schema-validate ``path``; a non-``ok`` status is returned as is."""
+    try:
+        with path.open(encoding="utf-8") as handle:  # lgtm[py/path-injection] codeql-boundary:graph-index-file
+            data = json.load(handle)
+    except json.JSONDecodeError:
+        return {"status": "invalid_json", "graph": None}
+    except OSError as exc:
+        logger.warning("Graph index file unreadable: %s", exc)
+        return {"status": "unreadable", "graph": None}
+
+    try:
+        _graph_index_validator().validate(data)
+    except jsonschema.ValidationError as exc:
+        logger.warning("Graph index schema validation failed: %s", exc)
+        return {"status": "invalid_schema", "graph": None}
+    except (OSError, json.JSONDecodeError, jsonschema.SchemaError) as exc:
+        logger.error("Graph index schema validation unavailable: %s", exc)
+        return {"status": "validation_unavailable", "graph": None}
+    return {"status": "ok", "graph": data}
+
+
 def load_graph_index(
     root: Path,
     relative_path: str,
     expected_sha256: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Load a graph index through a root-bounded relative path."""
+    """Load a graph index through a root-bounded relative path.
+
+    Validated graphs are served from a process-wide LRU cache while the file
+    is unchanged. Successful results also carry precomputed
+    ``proximity_scores`` (see ``graph_proximity_scores``) and ``cache_hit``.
+    """
 
     try:
         path = resolve_secure_path(root, relative_path)
@@ -40,14 +210,6 @@ def load_graph_index(
 
     if not path.exists():  # lgtm[py/path-injection] codeql-boundary:graph-index-file
         return {"status": "not_found", "graph": None}
-    try:
-        with path.open(encoding="utf-8") as handle:  # lgtm[py/path-injection] codeql-boundary:graph-index-file
-            data = json.load(handle)
-    except json.JSONDecodeError:
-        return {"status": "invalid_json", "graph": None}
-    except OSError as exc:
-        logger.warning("Graph index file unreadable: %s", exc)
-        return {"status": "unreadable", "graph": None}
 
     if jsonschema is None:
         logger.warning(
@@ -55,24 +217,29 @@ def load_graph_index(
         )
         return {"status": "validation_unavailable", "graph": None}
 
-    try:
-        with _GRAPH_INDEX_SCHEMA_PATH.open(encoding="utf-8") as handle:
-            schema = json.load(handle)
-        jsonschema.Draft7Validator.check_schema(schema)
-        validator = jsonschema.Draft7Validator(schema)
-        validator.validate(data)
-    except jsonschema.ValidationError as exc:
-        logger.warning("Graph index schema validation failed: %s", exc)
-        return {"status": "invalid_schema", "graph": None}
-    except (OSError, json.JSONDecodeError, jsonschema.SchemaError) as exc:
-        logger.error("Graph index schema validation unavailable: %s", exc)
-        return {"status": "validation_unavailable", "graph": None}
-
-    if expected_sha256:
-        graph_sha = data.get("canonical_dump_index_sha256")
-        if not graph_sha or graph_sha != expected_sha256:
-            return {"status": "stale_or_mismatched", "graph": data}
-    return {"status": "ok", "graph": data}
+    identity = _file_identity(path)
+    cache_key = str(path)
+    if identity is not None:
+        cache_identity = identity + (str(_GRAPH_INDEX_SCHEMA_PATH),)
+        cached = _GRAPH_INDEX_CACHE.get(cache_key, cache_identity)
+        if cached is not None:
+            return _graph_index_result(cached, expected_sha256, cache_hit=True)
+
+    loaded = _read_graph_index(path)
+    if loaded["status"] != "ok":
+        return loaded
+    data = loaded["graph"]
+
+    entry = _CachedGraphIndex(
+        identity=(identity or ()) + (str(_GRAPH_INDEX_SCHEMA_PATH),),
+        graph=data,
+        proximity_scores=graph_proximity_scores(data),
+        approx_bytes=identity[3] if identity is not None else 0,
+    )
+    # Only cache when the file did not change while it was being read.
+    if identity is not None and _file_identity(path) == identity:
+        _GRAPH_INDEX_CACHE.put(cache_key, entry)
+    return _graph_index_result(entry, expected_sha256, cache_hit=False)
 
 
 def _sibling_dump_index(
@@ -227,6 +394,9 @@ def compile_graph_index(
 
 __all__ = [
     "GraphIndexCompilationError",
+    "clear_graph_index_cache",
     "compile_graph_index",
+    "graph_index_cache_stats",
+    "graph_proximity_scores",
     "load_graph_index",
 ]
@@ -19,15 +19,22 @@ from __future__ import annotations
 import ast
 import logging
 import os
-from collections.abc import Iterator, Sequence
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal, TypedDict
+from typing import TYPE_CHECKING, Literal, TypedDict
 
 from merger.repoground.architecture.path_classification import (
     infer_architecture_layer,
     is_test_path,
 )
+from merger.repoground.architecture.python_analysis import (
+    PythonSource,
+    run_python_analysis,
+)
+
+if TYPE_CHECKING:
+    from merger.repoground.architecture.ast_facts_cache import AstFactsCache
 
 logger = logging.getLogger(__name__)
 
@@ -210,21 +217,6 @@ def _bounded_graph_source_files(
     }
 
 
-def _iter_parsed_python_files(
-    repo_root: Path,
-    python_files: list[Path],
-) -> Iterator[tuple[Path, str, ast.AST]]:
-    for file_path in python_files:
-        relative_path = file_path.relative_to(repo_root).as_posix()
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(content, filename=relative_path)
-        except Exception as exc:
-            logger.warning("Could not parse AST for %s: %s", relative_path, exc)
-            continue
-        yield file_path, relative_path, tree
-
-
 def _inventory_file_node(repo_root: Path, file_path: Path) -> Node | None:
     relative_path = file_path.relative_to(repo_root).as_posix()
     try:
@@ -370,39 +362,59 @@ def _relative_base_module(source_path: str, level: int, module: str | None) -> s
     return ".".join(package_parts) or None
 
 
+def _import_facts(tree: ast.AST) -> list[list]:
+    """Import statements in ``ast.walk`` order, as JSON-serializable rows."""
+    facts: list[list] = []
+    for syntax_node in ast.walk(tree):
+        if isinstance(syntax_node, ast.Import):
+            level, module = None, None
+        elif isinstance(syntax_node, ast.ImportFrom):
+            level, module = syntax_node.level, syntax_node.module
+        else:
+            continue
+        start_line = getattr(syntax_node, "lineno", None)
+        end_line = getattr(syntax_node, "end_lineno", start_line) if start_line is not None else None
+        facts.append(
+            [level, module, [alias.name for alias in syntax_node.names], start_line, end_line]
+        )
+    return facts
+
+
 def _import_destinations(
-    node: ast.Import,
+    names: list[str],
     module_index: dict[str, str],
 ) -> list[str]:
     destinations: list[str] = []
-    for alias in node.names:
-        local_id = _local_file_id(alias.name, module_index)
-        destinations.append(local_id or f"module:{alias.name}")
+    for name in names:
+        local_id = _local_file_id(name, module_index)
+        destinations.append(local_id or f"module:{name}")
     return destinations
 
 
 def _import_from_destinations(
-    node: ast.ImportFrom,
+    level: int,
+    module: str | None,
+    names: list[str],
     source_path: str,
     module_index: dict[str, str],
 ) -> list[str]:
-    if node.level:
-        base_module = _relative_base_module(source_path, node.level, node.module)
-        unresolved_base = f"{'.' * node.level}{node.module or ''}"
+    if level:
+        base_module = _relative_base_module(source_path, level, module)
+        unresolved_base = f"{'.' * level}{module or ''}"
     else:
-        base_module = node.module
-        unresolved_base = node.module or ""
+        base_module = module
+        unresolved_base = module or ""
 
     destinations: list[str] = []
     local_base = _local_file_id(base_module, module_index)
-    if local_base is not None and (node.module is not None or node.level == 0):
+    if local_base is not None and (module is not None or level == 0):
         destinations.append(local_base)
 
     local_children: list[str] = []
-    for alias in node.names:
-        if alias.name == "*":
+    for name in names:
+        if name == "*":
             continue
-        child_module = f"{base_module}.{alias.name}" if base_module else alias.name
+        child_module = f"{base_module}.{name}" if base_module else name
         local_child = _local_file_id(child_module, module_index)
         if local_child is not None:
             local_children.append(local_child)
@@ -413,22 +425,21 @@ def _import_from_destinations(
 
     if unresolved_base:
         destinations.append(f"module:{unresolved_base}")
-    for alias in node.names:
-        if alias.name == "*":
+    for name in names:
+        if name == "*":
             continue
         unresolved_child = (
-            f"{unresolved_base}.{alias.name}" if unresolved_base else alias.name
+            f"{unresolved_base}.{name}" if unresolved_base else name
         )
         destinations.append(f"module:{unresolved_child}")
     return destinations
 
 
-def _evidence(node: ast.AST, source_path: str) -> Evidence:
+def _evidence(start_line: int | None, end_line: int | None, source_path: str) -> Evidence:
     evidence: Evidence = {"source_path": source_path}
-    line_number = getattr(node, "lineno", None)
-    if line_number is not None:
-        evidence["start_line"] = line_number
-        evidence["end_line"] = getattr(node, "end_lineno", line_number)
+    if start_line is not None:
+        evidence["start_line"] = start_line
+        evidence["end_line"] = end_line
     return evidence
 
 
@@ -460,6 +471,74 @@ def _ensure_destination_node(nodes: dict[str, Node], destination: str) -> None:
     }
 
 
+class _ImportEdgeAnalyzer:
+    """Add file nodes and static import edges for each parsed module."""
+
+    name = "import_graph"
+    version = 1
+
+    def __init__(
+        self,
+        nodes: dict[str, Node],
+        edges: list[Edge],
+        module_index: dict[str, str],
+    ) -> None:
+        self.nodes = nodes
+        self.edges = edges
+        self.module_index = module_index
+
+    def extract(self, source: PythonSource, tree: ast.Module) -> list[list]:
+        return _import_facts(tree)
+
+    def add(self, source: PythonSource, facts: list[list]) -> None:
+        relative_path = source.rel_path
+        node_id = f"file:{relative_path}"
+        self.nodes[node_id] = {
+            "node_id": node_id,
+            "kind": "file",
+            "path": relative_path,
+            "repo": "",
+            "language": "python",
+            "layer": _infer_layer(relative_path),
+            "is_test": _is_test_file(relative_path),
+            "size_bytes": source.path.stat().st_size,
+        }
+
+        for level, module, names, start_line, end_line in facts:
+            if level is None:
+                destinations = _import_destinations(names, self.module_index)
+            else:
+                destinations = _import_from_destinations(
+                    level,
+                    module,
+                    names,
+                    relative_path,
+                    self.module_index,
+                )
+
+            evidence = _evidence(start_line, end_line, relative_path)
+            for destination in destinations:
+                _ensure_destination_node(self.nodes, destination)
+                self.edges.append(
+                    {
+                        "src": node_id,
+                        "dst": destination,
+                        "edge_type": "import",
+                        "evidence_level": "S1",
+                        "evidence": evidence,
+                    }
+                )
+
+    def finish(self) -> None:
+        pass
+
+    def dump(self, facts: list[list]) -> list[list]:
+        return facts
+
+    def load(self, data: list[list]) -> list[list]:
+        return data
+
+
 def generate_import_graph_document(
     repo_root: Path,
     run_id: str,
@@ -468,12 +547,16 @@ def generate_import_graph_document(
     source_roots: Sequence[str] = (),
     max_graph_files: int = _DEFAULT_MAX_GRAPH_FILES,
     max_graph_source_bytes: int = _DEFAULT_MAX_GRAPH_SOURCE_BYTES,
+    facts_cache: AstFactsCache | None = None,
 ) -> GraphDocument:
-    """Build a deterministic repository file graph with static Python import edges."""
+    """Build a deterministic repository file graph with static Python import edges.
+
+    ``facts_cache`` serves the import statements of unchanged files; edges
+    are always resolved against the current module index.
+    """
 
     nodes: dict[str, Node] = {}
     edges: list[Edge] = []
-    files_parsed = 0
     normalized_source_roots = _normalize_source_roots(repo_root, source_roots)
     scanned_python_files, scanned_inventory_files = _scan_graph_source_files(repo_root)
     python_files, inventory_files, source_coverage = _bounded_graph_source_files(
@@ -491,47 +574,20 @@ def generate_import_graph_document(
 
     _add_inventory_file_nodes(nodes, repo_root, inventory_files)
 
-    for file_path, relative_path, tree in _iter_parsed_python_files(
+    analyzer = _ImportEdgeAnalyzer(nodes, edges, module_index)
+    report = run_python_analysis(
         repo_root,
-        python_files,
-    ):
-        files_parsed += 1
-        node_id = f"file:{relative_path}"
-        nodes[node_id] = {
-            "node_id": node_id,
-            "kind": "file",
-            "path": relative_path,
-            "repo": "",
-            "language": "python",
-            "layer": _infer_layer(relative_path),
-            "is_test": _is_test_file(relative_path),
-            "size_bytes": file_path.stat().st_size,
-        }
-
-        for syntax_node in ast.walk(tree):
-            if isinstance(syntax_node, ast.Import):
-                destinations = _import_destinations(syntax_node, module_index)
-            elif isinstance(syntax_node, ast.ImportFrom):
-                destinations = _import_from_destinations(
-                    syntax_node,
-                    relative_path,
-                    module_index,
-                )
-            else:
-                continue
-
-            evidence = _evidence(syntax_node, relative_path)
-            for destination in destinations:
-                _ensure_destination_node(nodes, destination)
-                edges.append(
-                    {
-                        "src": node_id,
-                        "dst": destination,
-                        "edge_type": "import",
-                        "evidence_level": "S1",
-                        "evidence": evidence,
-                    }
-                )
+        [analyzer],
+        sources=[
+            PythonSource(file_path, file_path.relative_to(repo_root).as_posix())
+            for file_path in python_files
+        ],
+        max_skipped_errors=len(python_files),
+        facts_cache=facts_cache,
+    )
+    for message in report.skipped_errors:
+        logger.warning("Could not parse AST: %s", message)
+    files_parsed = report.files_parsed + report.files_cached
 
     sorted_nodes = sorted(nodes.values(), key=lambda item: item["node_id"])
     unique_edges: dict[tuple[str, str, int], Edge] = {}
@@ -316,11 +316,15 @@ def _is_runtime_surface(relative_path: str, suffix: str) -> bool:
     return suffix in _RUNTIME_SUFFIXES or (not suffix and in_runtime_directory)
 
 
+_TOKEN_CHARS = r"[\w./-]"
+_TOKEN_RUN = re.compile(rf"{_TOKEN_CHARS}+")
+
+
 @functools.lru_cache(maxsize=2048)
 def _token_pattern(needle: str) -> re.Pattern[str]:
     """Match ``needle`` only as a whole dotted name or path."""
 
-    return re.compile(rf"(?<![\w./-]){re.escape(needle)}(?![\w./-])")
+    return re.compile(rf"(?<!{_TOKEN_CHARS}){re.escape(needle)}(?!{_TOKEN_CHARS})")
 
 
 class _Corpus:
@@ -329,25 +333,38 @@ class _Corpus:
     Matching is token-exact: ``merger`` must not be credited for a mention of
     ``merger.repoground.core``. Over-claiming reachability would turn an unused
     module into a silent pass, so partial matches are rejected.
+
+    A needle made only of name and path characters matches exactly when it
+    equals a maximal run of such characters in the text, so the corpus is
+    tokenized into that set once and each lookup is a set membership test.
+    Other needles fall back to a bounded regex search of the joined text.
     """
 
     def __init__(self) -> None:
         self._chunks: list[str] = []
         self._joined: str | None = None
+        self._tokens: frozenset[str] | None = None
 
     def add(self, text: str) -> None:
         self._chunks.append(text)
         self._joined = None
+        self._tokens = None
 
-    def contains(self, *needles: str) -> bool:
+    def _text(self) -> str:
         if self._joined is None:
             self._joined = "\n".join(self._chunks)
-        return any(
-            # The cheap substring test keeps the regex off the whole corpus for
-            # the overwhelming majority of module names.
-            needle in self._joined and _token_pattern(needle).search(self._joined)
-            for needle in needles
-        )
+        return self._joined
+
+    def contains(self, *needles: str) -> bool:
+        if self._tokens is None:
+            self._tokens = frozenset(_TOKEN_RUN.findall(self._text()))
+        for needle in needles:
+            if _TOKEN_RUN.fullmatch(needle):
+                if needle in self._tokens:
+                    return True
+            elif needle in self._text() and _token_pattern(needle).search(self._text()):
+                return True
+        return False
 
 
 def _collect_source_evidence(
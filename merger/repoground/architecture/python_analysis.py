@@ -0,0 +1,330 @@
+"""Single-parse Python analysis pass shared by the architecture artifacts.
+
+The symbol index, call graph and import graph all derive from the same Python
+ASTs. Each used to walk the repository and ``ast.parse`` every file on its own,
+so one bundle parsed the same sources several times. This module walks and
+parses each file once and hands the tree to every registered analyzer in turn.
+
+An analyzer extracts per-file facts with ``extract(source, tree)``, must treat
+the shared tree as read-only, and folds facts into its result with
+``add(source, facts)``; cross-file work belongs in ``finish()``. ``dump`` and
+``load`` convert facts to and from JSON data so an optional
+:class:`~merger.repoground.architecture.ast_facts_cache.AstFactsCache` can
+serve unchanged files without parsing them. Bump an analyzer's ``version``
+whenever its facts change.
+
+The pass records wall-clock time for the walk, the parse and each analyzer so
+callers can surface where a bundle spends its analysis time.
+"""
+from __future__ import annotations
+
+import ast
+import concurrent.futures
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Protocol, Sequence
+
+if TYPE_CHECKING:
+    from merger.repoground.architecture.ast_facts_cache import AstFactsCache
+
+logger = logging.getLogger(__name__)
+
+EXCLUDED_DIRS = frozenset({
+    ".git",
+    ".grabowski",
+    ".claude",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".tox",
+    "venv",
+    ".venv",
+    "__pycache__",
+    "node_modules",
+    "build",
+    "dist",
+})
+MAX_SKIPPED_ERRORS = 20
+
+# UnicodeDecodeError is a ValueError, as is the null-byte error ast.parse
+# raises on Python < 3.12.
+_PARSE_ERRORS = (OSError, SyntaxError, ValueError, RecursionError)
+
+
+@dataclass(frozen=True, slots=True)
+class PythonSource:
+    path: Path
+    rel_path: str
+
+    @property
+    def is_package(self) -> bool:
+        return self.path.name == "__init__.py"
+
+
+class PythonAnalyzer(Protocol):
+    name: str
+    version: int
+
+    def extract(self, source: PythonSource, tree: ast.Module) -> Any: ...
+
+    def add(self, source: PythonSource, facts: Any) -> None: ...
+
+    def finish(self) -> None: ...
+
+    def dump(self, facts: Any) -> Any: ...
+
+    def load(self, data: Any) -> Any: ...
+
+
+@dataclass
+class PythonAnalysisReport:
+    files_seen: int = 0
+    files_parsed: int = 0
+    files_cached: int = 0
+    skipped_files_count: int = 0
+    skipped_errors: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def timings_ms(self) -> dict[str, float]:
+        return {name: round(seconds * 1000, 3) for name, seconds in self.timings.items()}
+
+
+def iter_python_sources(
+    repo_root: Path, excluded_dirs: Iterable[str] = EXCLUDED_DIRS
+) -> Iterator[PythonSource]:
+    """Yield ``*.py`` files below ``repo_root`` in deterministic order."""
+    excluded = frozenset(excluded_dirs)
+    # Keep os.walk lazy and top-down: wrapping it in sorted(...) consumes the
+    # whole tree before dirs[:] can prune excluded subdirectories. Sorting
+    # dirs and files here preserves deterministic traversal order.
+    for root, dirs, files in os.walk(repo_root, topdown=True):
+        dirs[:] = sorted(directory for directory in dirs if directory not in excluded)
+        for file_name in sorted(files):
+            if file_name.endswith(".py"):
+                path = Path(root) / file_name
+                yield PythonSource(path, path.relative_to(repo_root).as_posix())
+
+
+def _decode_source(raw: bytes) -> str:
+    # Same text Path.read_text(encoding="utf-8") yields: universal newlines.
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+# Per-file outcome: facts per analyzer (None if unparseable), error text, and
+# seconds spent parsing and in each analyzer's ``extract``.
+_Extraction = tuple[Any, Any, list[float]]
+
+
+def _extract_source(
+    analyzers: Sequence[PythonAnalyzer], source: PythonSource, raw: bytes | None = None
+) -> _Extraction:
+    started = time.perf_counter()
+    try:
+        if raw is None:
+            raw = source.path.read_bytes()
+        tree = ast.parse(_decode_source(raw), filename=str(source.path))
+    except _PARSE_ERRORS as exc:
+        return None, f"{type(exc).__name__} - {exc}", [time.perf_counter() - started]
+    durations = [time.perf_counter() - started]
+    facts = []
+    for analyzer in analyzers:
+        started = time.perf_counter()
+        facts.append(analyzer.extract(source, tree))
+        durations.append(time.perf_counter() - started)
+    return facts, None, durations
+
+
+_PENDING = object()
+_worker_analyzers: Sequence[PythonAnalyzer] = ()
+
+# A source still to be extracted, with its bytes if the cache probe read them.
+_PendingSource = tuple[PythonSource, bytes | None]
+
+
+def _init_worker(analyzers: Sequence[PythonAnalyzer]) -> None:
+    global _worker_analyzers
+    _worker_analyzers = analyzers
+
+
+def _extract_in_worker(pending: _PendingSource) -> _Extraction:
+    source, raw = pending
+    return _extract_source(_worker_analyzers, source, raw)
+
+
+def _extract_in_pool(
+    analyzers: Sequence[PythonAnalyzer], pending: list[_PendingSource], max_workers: int
+) -> Iterator[_Extraction]:
+    """Extract ``pending`` sources in a process pool, yielding results in input order.
+
+    Where process pools are unavailable (e.g. Pythonista on iOS) the work runs
+    in-process; the result is the same either way.
+    """
+    if len(pending) > 1:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(analyzers,),
+            ) as pool:
+                chunksize = max(1, len(pending) // (max_workers * 4))
+                results = list(pool.map(_extract_in_worker, pending, chunksize=chunksize))
+        except (ImportError, NotImplementedError, OSError, concurrent.futures.BrokenExecutor) as exc:
+            logger.warning("Process pool unavailable (%s); parsing Python files serially.", exc)
+        else:
+            yield from results
+            return
+    for source, raw in pending:
+        yield _extract_source(analyzers, source, raw)
+
+
+def _probe_facts_cache(
+    analyzers: Sequence[PythonAnalyzer], facts_cache: AstFactsCache, source: PythonSource
+) -> tuple[str, list[Any], bytes | None, Any]:
+    """Hash ``source`` and collect the cached facts of the leading analyzers.
+
+    Returns the digest, the cached facts, the raw bytes (kept only if the file
+    still has to be parsed) and the outcome: ``None`` when every analyzer is
+    served from the cache, an error extraction when the file cannot be read,
+    ``_PENDING`` otherwise.
+    """
+    try:
+        raw = source.path.read_bytes()
+    except OSError as exc:
+        return "", [], None, (None, f"{type(exc).__name__} - {exc}", [0.0])
+    digest = hashlib.sha256(raw).hexdigest()
+    cached: list[Any] = []
+    for analyzer in analyzers:
+        data = facts_cache.get(analyzer.name, analyzer.version, source.rel_path, digest)
+        if data is None:
+            return digest, cached, raw, _PENDING
+        cached.append(data)
+    return digest, cached, None, None
+
+
+@dataclass
+class _FactsFold:
+    """Folds per-file outcomes into the analyzers, the report and the cache."""
+
+    analyzers: Sequence[PythonAnalyzer]
+    report: PythonAnalysisReport
+    timings: dict[str, float]
+    facts_cache: AstFactsCache | None
+    max_skipped_errors: int
+
+    def add(self, source: PythonSource, digest: str, cached: list[Any], extraction: _Extraction | None) -> None:
+        report = self.report
+        if extraction is None:
+            report.files_cached += 1
+            facts, durations = None, []
+        else:
+            facts, error, durations = extraction
+            self.timings["parse"] += durations[0]
+            if facts is None:
+                report.skipped_files_count += 1
+                if len(report.skipped_errors) < self.max_skipped_errors:
+                    report.skipped_errors.append(f"Failed to parse {source.rel_path}: {error}")
+                return
+            report.files_parsed += 1
+        for index, analyzer in enumerate(self.analyzers):
+            started = time.perf_counter()
+            if facts is None:
+                item = analyzer.load(cached[index])
+            else:
+                item = facts[index]
+                if self.facts_cache is not None and index >= len(cached):
+                    self.facts_cache.put(
+                        analyzer.name, analyzer.version, source.rel_path, digest, analyzer.dump(item)
+                    )
+            analyzer.add(source, item)
+            self.timings[analyzer.name] += time.perf_counter() - started
+            if facts is not None:
+                self.timings[analyzer.name] += durations[index + 1]
+
+    def add_from_pool(
+        self, planned: list[tuple[PythonSource, str, list[Any], bytes | None, Any]], max_workers: int
+    ) -> None:
+        """Extract the ``_PENDING`` entries of ``planned`` in a pool and add all in order."""
+        pending = [(source, raw) for source, _, _, raw, extraction in planned if extraction is _PENDING]
+        extracted = _extract_in_pool(self.analyzers, pending, max_workers)
+        for source, digest, cached, _, extraction in planned:
+            if extraction is _PENDING:
+                extraction = next(extracted)
+            self.add(source, digest, cached, extraction)
+
+
+def run_python_analysis(
+    repo_root: Path,
+    analyzers: Sequence[PythonAnalyzer],
+    *,
+    sources: Iterable[PythonSource] | None = None,
+    max_skipped_errors: int = MAX_SKIPPED_ERRORS,
+    facts_cache: AstFactsCache | None = None,
+    max_workers: int | None = None,
+) -> PythonAnalysisReport:
+    """Parse each source once and run every analyzer over the shared tree.
+
+    ``sources`` defaults to :func:`iter_python_sources` for ``repo_root``.
+    Unparseable files are counted and the first ``max_skipped_errors``
+    messages kept; analyzers never see them. With ``facts_cache`` a file is
+    only parsed when at least one analyzer has no cached facts for its
+    content.
+
+    ``max_workers > 1`` parses and extracts in a process pool. Analyzers are
+    sent to each worker once, so they must be picklable; bytes already read
+    for the cache probe travel with the source, so no file is read twice.
+    Facts are added back in source order, so the result matches the serial
+    run. Parse and extract timings are then summed across workers.
+    """
+    report = PythonAnalysisReport()
+    timings = {"walk": 0.0, "parse": 0.0}
+    timings.update((analyzer.name, 0.0) for analyzer in analyzers)
+    fold = _FactsFold(analyzers, report, timings, facts_cache, max_skipped_errors)
+
+    parallel = max_workers is not None and max_workers > 1
+    # Parallel mode defers everything not served by the cache to the pool;
+    # _PENDING marks those entries, the rest already carry their outcome.
+    planned: list[tuple[PythonSource, str, list[Any], bytes | None, Any]] = []
+    iterator = iter(iter_python_sources(repo_root) if sources is None else sources)
+    while True:
+        started = time.perf_counter()
+        source = next(iterator, None)
+        timings["walk"] += time.perf_counter() - started
+        if source is None:
+            break
+        report.files_seen += 1
+        digest, cached, raw, extraction = "", [], None, _PENDING
+        if facts_cache is not None:
+            started = time.perf_counter()
+            digest, cached, raw, extraction = _probe_facts_cache(analyzers, facts_cache, source)
+            timings["parse"] += time.perf_counter() - started
+        if parallel:
+            planned.append((source, digest, cached, raw, extraction))
+            continue
+        if extraction is _PENDING:
+            extraction = _extract_source(analyzers, source, raw)
+        fold.add(source, digest, cached, extraction)
+
+    if planned:
+        fold.add_from_pool(planned, max_workers or 1)
+
+    for analyzer in analyzers:
+        started = time.perf_counter()
+        analyzer.finish()
+        timings[analyzer.name] += time.perf_counter() - started
+    if facts_cache is not None:
+        started = time.perf_counter()
+        facts_cache.flush()
+        timings["facts_cache"] = time.perf_counter() - started
+    report.timings = timings
+    logger.debug(
+        "Python analysis of %s: %d files parsed, %d from cache, timings %s",
+        repo_root,
+        report.files_parsed,
+        report.files_cached,
+        report.timings_ms(),
+    )
+    return report
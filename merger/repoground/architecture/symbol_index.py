@@ -1,25 +1,16 @@
 from __future__ import annotations
 
 import ast
-import os
 from pathlib import Path, PurePosixPath
 from typing import Any
 
-EXCLUDED_DIRS = frozenset({
-    ".git",
-    ".grabowski",
-    ".claude",
-    ".mypy_cache",
-    ".pytest_cache",
-    ".ruff_cache",
-    ".tox",
-    "venv",
-    ".venv",
-    "__pycache__",
-    "node_modules",
-    "build",
-    "dist",
-})
+from merger.repoground.architecture.python_analysis import (
+    EXCLUDED_DIRS as EXCLUDED_DIRS,
+    PythonAnalysisReport,
+    PythonSource,
+    run_python_analysis,
+)
+
 SYMBOL_KINDS = ("class", "function", "async_function")
 DOES_NOT_ESTABLISH = (
     "call_graph_completeness",
@@ -114,37 +105,47 @@ def _decorator_names(decorators: list[ast.expr]) -> list[str]:
     return sorted(set(names))
 
 
-def extract_python_symbols(repo_root: Path) -> tuple[list[dict[str, Any]], int, list[str]]:
-    symbols: list[dict[str, Any]] = []
-    skipped_files_count = 0
-    skipped_errors: list[str] = []
-
-    # Keep os.walk lazy and top-down: wrapping it in sorted(...) consumes the
-    # whole tree before dirs[:] can prune excluded subdirectories. Sorting
-    # dirs and files here preserves deterministic traversal order.
-    for root, dirs, files in os.walk(repo_root, topdown=True):
-        dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS)
-        for file_name in sorted(files):
-            if not file_name.endswith(".py"):
-                continue
-            path = Path(root) / file_name
-            rel_path = path.relative_to(repo_root).as_posix()
-            try:
-                tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-            except (OSError, SyntaxError, UnicodeDecodeError) as exc:
-                skipped_files_count += 1
-                if len(skipped_errors) < 20:
-                    skipped_errors.append(f"Failed to parse {rel_path}: {type(exc).__name__} - {exc}")
-                continue
-            visitor = _SymbolVisitor(rel_path)
-            visitor.visit(tree)
-            symbols.extend(visitor.symbols)
-
-    return sorted(symbols, key=lambda item: (item["path"], item["start_line"], item["qualified_name"], item["kind"])), skipped_files_count, skipped_errors
-
-
-def generate_symbol_index_document(repo_root: Path, run_id: str, canonical_sha256: str) -> dict[str, Any]:
-    symbols, skipped_count, skipped_errors = extract_python_symbols(repo_root)
+class SymbolIndexAnalyzer:
+    """Collect symbols for :func:`run_python_analysis`."""
+
+    name = "symbol_index"
+    version = 1
+
+    def __init__(self) -> None:
+        self.symbols: list[dict[str, Any]] = []
+
+    def extract(self, source: PythonSource, tree: ast.Module) -> list[dict[str, Any]]:
+        visitor = _SymbolVisitor(source.rel_path)
+        visitor.visit(tree)
+        return visitor.symbols
+
+    def add(self, source: PythonSource, facts: list[dict[str, Any]]) -> None:
+        self.symbols.extend(facts)
+
+    def finish(self) -> None:
+        self.symbols.sort(key=lambda item: (item["path"], item["start_line"], item["qualified_name"], item["kind"]))
+
+    def dump(self, facts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return facts
+
+    def load(self, data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return data
+
+
+def extract_python_symbols(
+    repo_root: Path, *, max_workers: int | None = None
+) -> tuple[list[dict[str, Any]], int, list[str]]:
+    analyzer = SymbolIndexAnalyzer()
+    report = run_python_analysis(repo_root, [analyzer], max_workers=max_workers)
+    return analyzer.symbols, report.skipped_files_count, report.skipped_errors
+
+
+def symbol_index_document(
+    analyzer: SymbolIndexAnalyzer,
+    report: PythonAnalysisReport,
+    run_id: str,
+    canonical_sha256: str,
+) -> dict[str, Any]:
     return {
         "kind": "lenskit.python_symbol_index",
         "version": "1.0",
@@ -152,8 +153,16 @@ def generate_symbol_index_document(repo_root: Path, run_id: str, canonical_sha25
         "canonical_dump_index_sha256": canonical_sha256,
         "language": "python",
         "symbol_kinds": list(SYMBOL_KINDS),
-        "symbols": symbols,
-        "skipped_files_count": skipped_count,
-        "skipped_errors": skipped_errors,
+        "symbols": analyzer.symbols,
+        "skipped_files_count": report.skipped_files_count,
+        "skipped_errors": report.skipped_errors,
         "does_not_establish": list(DOES_NOT_ESTABLISH),
     }
+
+
+def generate_symbol_index_document(
+    repo_root: Path, run_id: str, canonical_sha256: str, *, max_workers: int | None = None
+) -> dict[str, Any]:
+    analyzer = SymbolIndexAnalyzer()
+    report = run_python_analysis(repo_root, [analyzer], max_workers=max_workers)
+    return symbol_index_document(analyzer, report, run_id, canonical_sha256)
@@ -0,0 +1,387 @@
+"""
+Columnar inventory sidecar for Atlas snapshots.
+
+``inventory.jsonl`` stays the canonical artifact (atlas-inventory.v1). For
+large roots the scanner can additionally emit ``inventory.cols`` next to it: a
+memory-mappable file holding the few fields that search and diff filter on as
+fixed-width arrays, plus a path dictionary and each row's byte offset into the
+JSONL. Readers filter on size/ext/mtime and compare snapshots without calling
+``json.loads`` per line, and materialize full records only for surviving rows.
+
+Layout (all integers in the writer's native byte order, recorded in the
+header; every section starts 8-byte aligned)::
+
+    magic          8 bytes   b"ATLCOL01"
+    header_len     uint32
+    header         JSON: rows, byteorder, jsonl_size, jsonl_mtime_ns,
+                   exts (extension dictionary), sections {name: [offset, bytes]}
+    size           int64[rows]    size_bytes
+    mtime_us       int64[rows]    mtime as UTC microseconds, MTIME_MISSING if absent
+    line_offset    uint64[rows]   byte offset of the row's JSONL line
+    path_offset    uint64[rows+1] offsets into ``paths``
+    ext            uint32[rows]   index into header ``exts``
+    flags          uint8[rows]    is_symlink / is_text tri-states
+    paths          UTF-8 rel_path blob
+
+The sidecar is a derivation: it is only trusted while the JSONL still has the
+size and mtime recorded in its header, and a writer that meets a record it
+cannot represent exactly (non-canonical mtime, non-bool flags, ...) emits no
+sidecar at all, so readers never see a lossy copy.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+COLUMNAR_MAGIC = b"ATLCOL01"
+COLUMNAR_SUFFIX = ".cols"
+
+MTIME_MISSING = -(2 ** 63)
+
+# Tri-state encoding for optional booleans: absent/None, False, True.
+_TRI_NONE, _TRI_FALSE, _TRI_TRUE = 0, 1, 2
+_SYMLINK_SHIFT = 0
+_TEXT_SHIFT = 2
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("size", "q"),
+    ("mtime_us", "q"),
+    ("line_offset", "Q"),
+    ("path_offset", "Q"),
+    ("ext", "I"),
+    ("flags", "B"),
+)
+
+
+def columnar_sidecar_path(inventory_path: Path) -> Path:
+    """Return the sidecar path for an inventory (``inventory.jsonl`` -> ``inventory.cols``)."""
+    return inventory_path.with_suffix(COLUMNAR_SUFFIX)
+
+
+def format_mtime_us(mtime_us: int) -> str:
+    """Render microseconds since the epoch the way the scanner writes ``mtime``."""
+    return (_EPOCH + mtime_us * _MICROSECOND).isoformat().replace("+00:00", "Z")
+
+
+def parse_mtime_us(mtime: str) -> Optional[int]:
+    """Microseconds since the epoch for an inventory ``mtime``, or None if the
+    string is not in the scanner's canonical form (so it cannot round-trip)."""
+    try:
+        value = datetime.fromisoformat(mtime[:-1] + "+00:00" if mtime.endswith("Z") else mtime)
+    except (ValueError, TypeError):
+        return None
+    if value.tzinfo is None:
+        return None
+    mtime_us = (value - _EPOCH) // _MICROSECOND
+    return mtime_us if format_mtime_us(mtime_us) == mtime else None
+
+
+def datetime_to_us(value: datetime) -> Optional[int]:
+    """Microseconds since the epoch for an aware datetime; None for naive ones."""
+    if value.tzinfo is None:
+        return None
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _tri_state(value: Any) -> Optional[int]:
+    if value is None:
+        return _TRI_NONE
+    if value is True:
+        return _TRI_TRUE
+    if value is False:
+        return _TRI_FALSE
+    return None
+
+
+def _tri_value(code: int) -> Optional[bool]:
+    return None if code == _TRI_NONE else code == _TRI_TRUE
+
+
+def _in_bounds(value: int, low: Optional[int], high: Optional[int]) -> bool:
+    return (low is None or value >= low) and (high is None or value <= high)
+
+
+class ColumnarInventoryWriter:
+    """Accumulates inventory rows in column arrays while the JSONL is written.
+
+    Call :meth:`add` with every record in the order it is written and the byte
+    length of its JSONL line, then :meth:`finish` once the JSONL is closed.
+    """
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, array] = {name: array(code) for name, code in _SECTIONS}
+        self._columns["path_offset"].append(0)
+        self._paths = bytearray()
+        self._ext_ids: Dict[str, int] = {}
+        self._offset = 0
+        self.valid = True
+
+    @property
+    def rows(self) -> int:
+        return len(self._columns["size"])
+
+    def add(self, entry: Dict[str, Any], line_bytes: int) -> None:
+        line_offset = self._offset
+        self._offset += line_bytes
+        if not self.valid:
+            return
+
+        rel_path = entry.get("rel_path")
+        size = entry.get("size_bytes")
+        ext = entry.get("ext", "")
+        mtime = entry.get("mtime")
+        symlink_code = _tri_state(entry.get("is_symlink"))
+        text_code = _tri_state(entry.get("is_text"))
+        mtime_us = MTIME_MISSING if mtime is None else (
+            parse_mtime_us(mtime) if isinstance(mtime, str) else None
+        )
+        if (
+            not isinstance(rel_path, str)
+            or not rel_path
+            or type(size) is not int
+            or not isinstance(ext, str)
+            or mtime_us is None
+            or symlink_code is None
+            or text_code is None
+        ):
+            # Not exactly representable: emit no sidecar rather than a lossy one.
+            self.valid = False
+            return
+
+        ext_id = self._ext_ids.setdefault(ext, len(self._ext_ids))
+        columns = self._columns
+        columns["size"].append(size)
+        columns["mtime_us"].append(mtime_us)
+        columns["line_offset"].append(line_offset)
+        self._paths += rel_path.encode("utf-8", "surrogatepass")
+        columns["path_offset"].append(len(self._paths))
+        columns["ext"].append(ext_id)
+        columns["flags"].append((symlink_code << _SYMLINK_SHIFT) | (text_code << _TEXT_SHIFT))
+
+    def finish(self, inventory_path: Path) -> Optional[Path]:
+        """Write the sidecar for the (closed) JSONL at ``inventory_path``.
+
+        Returns the sidecar path, or None when no sidecar was written; a stale
+        sidecar from an earlier run is removed in that case.
+        """
+        sidecar = columnar_sidecar_path(inventory_path)
+        try:
+            st = os.stat(inventory_path)
+        except OSError:
+            st = None
+        if not self.valid or st is None or st.st_size != self._offset:
+            _unlink_quietly(sidecar)
+            return None
+
+        blobs: List[Tuple[str, bytes]] = [(name, self._columns[name].tobytes()) for name, _ in _SECTIONS]
+        blobs.append(("paths", bytes(self._paths)))
+        header: Dict[str, Any] = {
+            "rows": self.rows,
+            "byteorder": sys.byteorder,
+            "jsonl_size": st.st_size,
+            "jsonl_mtime_ns": st.st_mtime_ns,
+            "exts": sorted(self._ext_ids, key=self._ext_ids.__getitem__),
+            "sections": {},
+        }
+        # Section offsets depend on the header length, which depends on the
+        # offsets' digits; settle it by iterating until the layout is stable.
+        header_bytes = b""
+        while True:
+            position = _align(len(COLUMNAR_MAGIC) + 4 + len(header_bytes))
+            sections = {}
+            for name, blob in blobs:
+                sections[name] = [position, len(blob)]
+                position = _align(position + len(blob))
+            header["sections"] = sections
+            encoded = json.dumps(header, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            settled = len(encoded) == len(header_bytes)
+            header_bytes = encoded
+            if settled:
+                break
+
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(sidecar.parent), prefix=f".tmp_{sidecar.name}")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(COLUMNAR_MAGIC)
+                f.write(struct.pack("<I", len(header_bytes)))
+                f.write(header_bytes)
+                for name, blob in blobs:
+                    _pad_to(f, sections[name][0])
+                    f.write(blob)
+            os.replace(temp_path, sidecar)
+        except Exception:
+            _unlink_quietly(Path(temp_path))
+            raise
+        return sidecar
+
+
+class ColumnarInventory:
+    """Read-only, memory-mapped view of an inventory sidecar.
+
+    Use :meth:`open` — it returns None whenever the sidecar is missing,
+    malformed, from another byte order, or no longer matches its JSONL, and
+    callers then read the JSONL as before.
+    """
+
+    def __init__(self, inventory_path: Path, handle: BinaryIO, mapped: mmap.mmap, header: Dict[str, Any]) -> None:
+        self.inventory_path = inventory_path
+        self.rows: int = header["rows"]
+        self.exts: List[str] = header["exts"]
+        self._handle = handle
+        self._mmap = mapped
+        self._views: Dict[str, memoryview] = {}
+        sections = header["sections"]
+        whole = memoryview(mapped)
+        for name, code in _SECTIONS:
+            start, length = sections[name]
+            self._views[name] = whole[start:start + length].cast(code)
+        start, length = sections["paths"]
+        self._paths = whole[start:start + length]
+        whole.release()
+
+        self.size = self._views["size"]
+        self.mtime_us = self._views["mtime_us"]
+        self.line_offset = self._views["line_offset"]
+        self.ext = self._views["ext"]
+        self.flags = self._views["flags"]
+        self._path_offset = self._views["path_offset"]
+
+    @classmethod
+    def open(cls, inventory_path: Path) -> Optional["ColumnarInventory"]:
+        sidecar = columnar_sidecar_path(inventory_path)
+        try:
+            handle = open(sidecar, "rb")
+        except OSError:
+            return None
+        mapped = None
+        try:
+            if handle.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+                raise ValueError("bad magic")
+            (header_len,) = struct.unpack("<I", handle.read(4))
+            header = json.loads(handle.read(header_len).decode("utf-8"))
+            st = os.stat(inventory_path)
+            if (
+                header.get("byteorder") != sys.byteorder
+                or header.get("jsonl_size") != st.st_size
+                or header.get("jsonl_mtime_ns") != st.st_mtime_ns
+            ):
+                raise ValueError("stale sidecar")
+            rows = header["rows"]
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            inv = cls(inventory_path, handle, mapped, header)
+            expected = {"size": rows, "mtime_us": rows, "line_offset": rows,
+                        "path_offset": rows + 1, "ext": rows, "flags": rows}
+            if any(len(inv._views[name]) != count for name, count in expected.items()):
+                inv.close()
+                return None
+            return inv
+        except (OSError, ValueError, KeyError, TypeError, struct.error):
+            if mapped is not None:
+                mapped.close()
+            handle.close()
+            return None
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self._paths.release()
+        self._mmap.close()
+        self._handle.close()
+
+    def __enter__(self) -> "ColumnarInventory":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def rel_path(self, row: int) -> str:
+        start, end = self._path_offset[row], self._path_offset[row + 1]
+        return str(self._paths[start:end], "utf-8", "surrogatepass")
+
+    def is_symlink(self, row: int) -> Optional[bool]:
+        return _tri_value((self.flags[row] >> _SYMLINK_SHIFT) & 3)
+
+    def is_text(self, row: int) -> Optional[bool]:
+        return _tri_value((self.flags[row] >> _TEXT_SHIFT) & 3)
+
+    def select(
+        self,
+        ext: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        after_us: Optional[int] = None,
+        before_us: Optional[int] = None,
+    ) -> Iterator[int]:
+        """Yield row numbers passing the filters, in inventory order.
+
+        Rows without an mtime never pass a date bound, as in the linear search.
+        """
+        ext_id = None
+        if ext:
+            if ext not in self.exts:
+                return
+            ext_id = self.exts.index(ext)
+        sizes, mtimes, exts = self.size, self.mtime_us, self.ext
+        check_dates = after_us is not None or before_us is not None
+        for row in range(self.rows):
+            if ext_id is not None and exts[row] != ext_id:
+                continue
+            if not _in_bounds(sizes[row], min_size, max_size):
+                continue
+            if check_dates and (mtimes[row] == MTIME_MISSING or not _in_bounds(mtimes[row], after_us, before_us)):
+                continue
+            yield row
+
+    def iter_records(self, rows: Iterator[int]) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+        """Yield ``(row, record)`` by reading only the given rows' JSONL lines.
+
+        ``record`` is None when the line is not a JSON object.
+        """
+        offsets = self.line_offset
+        with open(self.inventory_path, "rb") as f:
+            for row in rows:
+                f.seek(offsets[row])
+                try:
+                    item = json.loads(f.readline())
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    item = None
+                yield row, item if isinstance(item, dict) else None
+
+    def iter_signatures(self) -> Iterator[Tuple[str, Tuple[int, int, Optional[bool]]]]:
+        """Yield ``(rel_path, (size, mtime_us, is_symlink))`` in inventory order for diffing."""
+        sizes, mtimes, flags = self.size, self.mtime_us, self.flags
+        for row in range(self.rows):
+            yield self.rel_path(row), (
+                sizes[row],
+                mtimes[row],
+                _tri_value((flags[row] >> _SYMLINK_SHIFT) & 3),
+            )
+
+
+def _align(position: int) -> int:
+    return (position + 7) & ~7
+
+
+def _pad_to(f: BinaryIO, position: int) -> None:
+    current = f.tell()
+    if position > current:
+        f.write(b"\0" * (position - current))
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
@@ -1,11 +1,20 @@
+import heapq
 import json
+import os
+import tempfile
 import uuid
 import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
 
+from merger.repoground.atlas.columnar import ColumnarInventory
 from merger.repoground.atlas.paths import resolve_atlas_base_dir, resolve_artifact_ref, resolve_snapshot_dir
 
+# Rows sorted in memory per run before spilling to disk; bounds diff memory.
+DIFF_SORT_CHUNK_ROWS = 200_000
+# Paths per list kept in memory for callers that do not materialize the delta.
+DELTA_PREVIEW_LIMIT = 10
+
 
 def _load_inventory_index(inv_path: Path) -> Dict[str, Dict[str, Any]]:
     """
@@ -30,36 +39,215 @@ def _load_inventory_index(inv_path: Path) -> Dict[str, Dict[str, Any]]:
     return files
 
 
-def _compare_file_sets(from_files: Dict[str, Dict[str, Any]], to_files: Dict[str, Dict[str, Any]]) -> Tuple[List[str], List[str], List[str]]:
+def _change_signature(item: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    return item.get("size_bytes"), item.get("mtime"), item.get("is_symlink")
+
+
+def _iter_inventory_signatures(inv_path: Path) -> Iterator[Tuple[str, Tuple[Any, Any, Any]]]:
     """
-    Compares two file sets (keyed by path) and returns sorted lists of new, removed, and changed file paths.
+    Streams `(rel_path, change signature)` in file order, skipping the same
+    records `_load_inventory_index` skips.
     """
-    new_files = []
-    removed_files = []
-    changed_files = []
+    with open(inv_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(item, dict):
+                continue
+            rel_path = item.get("rel_path")
+            if not rel_path or not isinstance(rel_path, str):
+                continue
+            yield rel_path, _change_signature(item)
+
+
+def _spill_run(chunk: List[Tuple[str, int, Tuple]], spool_dir: Path) -> Path:
+    chunk.sort()
+    fd, run_path = tempfile.mkstemp(dir=str(spool_dir), prefix="run_", suffix=".jsonl")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for rel_path, seq, signature in chunk:
+            f.write(json.dumps([rel_path, seq, list(signature)]) + "\n")
+    return Path(run_path)
+
 
-    for path in to_files:
-        if path not in from_files:
-            new_files.append(path)
+def _read_run(run_path: Path) -> Iterator[Tuple[str, int, Tuple]]:
+    with open(run_path, "r", encoding="utf-8") as f:
+        for line in f:
+            rel_path, seq, signature = json.loads(line)
+            yield rel_path, seq, tuple(signature)
+
+
+def _sorted_signatures(records: Iterable[Tuple[str, Tuple]], spool_dir: Path, chunk_rows: int) -> Iterator[Tuple[str, Tuple]]:
+    """
+    Yields `(rel_path, signature)` ordered by `rel_path`, keeping the last
+    record per path like `_load_inventory_index`. Inputs larger than
+    `chunk_rows` are sorted externally: sorted runs are spilled to `spool_dir`
+    and merged, so memory stays bounded by one chunk.
+    """
+    runs: List[Path] = []
+    chunk: List[Tuple[str, int, Tuple]] = []
+    for seq, (rel_path, signature) in enumerate(records):
+        chunk.append((rel_path, seq, signature))
+        if len(chunk) >= chunk_rows:
+            runs.append(_spill_run(chunk, spool_dir))
+            chunk = []
+    chunk.sort()
+    # seq is unique, so ordering never falls through to the signatures.
+    merged = heapq.merge(*(_read_run(r) for r in runs), iter(chunk)) if runs else iter(chunk)
+
+    previous: Optional[Tuple[str, Tuple]] = None
+    for rel_path, _, signature in merged:
+        if previous is not None and previous[0] != rel_path:
+            yield previous
+        previous = (rel_path, signature)
+    if previous is not None:
+        yield previous
+
+
+def _merge_join(from_records: Iterator[Tuple[str, Tuple]], to_records: Iterator[Tuple[str, Tuple]]) -> Iterator[Tuple[str, str]]:
+    """
+    Joins two `rel_path`-sorted, duplicate-free signature streams and yields
+    `(kind, rel_path)` with kind in `new_files`/`removed_files`/`changed_files`.
+    """
+    old = next(from_records, None)
+    new = next(to_records, None)
+    while old is not None or new is not None:
+        if new is None or (old is not None and old[0] < new[0]):
+            yield "removed_files", old[0]
+            old = next(from_records, None)
+        elif old is None or new[0] < old[0]:
+            yield "new_files", new[0]
+            new = next(to_records, None)
         else:
-            old_item = from_files[path]
-            new_item = to_files[path]
+            if old[1] != new[1]:
+                yield "changed_files", old[0]
+            old = next(from_records, None)
+            new = next(to_records, None)
 
-            if old_item.get("size_bytes") != new_item.get("size_bytes") or old_item.get("mtime") != new_item.get("mtime") or old_item.get("is_symlink") != new_item.get("is_symlink"):
-                changed_files.append(path)
 
-    for path in from_files:
-        if path not in to_files:
-            removed_files.append(path)
+class _DeltaSpool:
+    """
+    Disk-backed, path-ordered lists of new/removed/changed paths produced by
+    the merge-join, with counts and a short in-memory preview per kind.
+    """
 
-    new_files.sort()
-    removed_files.sort()
-    changed_files.sort()
+    KINDS = ("new_files", "removed_files", "changed_files")
 
-    return new_files, removed_files, changed_files
+    def __init__(self, spool_dir: Path):
+        self._files = {
+            kind: open(spool_dir / f"{kind}.jsonl", "w+", encoding="utf-8") for kind in self.KINDS
+        }
+        self.counts = {kind: 0 for kind in self.KINDS}
+        self.preview: Dict[str, List[str]] = {kind: [] for kind in self.KINDS}
+
+    def add(self, kind: str, rel_path: str) -> None:
+        self._files[kind].write(json.dumps(rel_path) + "\n")
+        self.counts[kind] += 1
+        if len(self.preview[kind]) < DELTA_PREVIEW_LIMIT:
+            self.preview[kind].append(rel_path)
+
+    def paths(self, kind: str) -> Iterator[str]:
+        f = self._files[kind]
+        f.flush()
+        f.seek(0)
+        for line in f:
+            yield json.loads(line)
 
+    def summary(self) -> Dict[str, int]:
+        return {
+            "new_count": self.counts["new_files"],
+            "removed_count": self.counts["removed_files"],
+            "changed_count": self.counts["changed_files"],
+        }
 
-def compute_snapshot_delta(registry, from_snap_id: str, to_snap_id: str) -> Dict[str, Any]:
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+
+
+def _diff_inventories(from_inv_path: Path, to_inv_path: Path, spool_dir: Path, chunk_rows: int = DIFF_SORT_CHUNK_ROWS) -> _DeltaSpool:
+    """
+    Streams the diff of two inventories into a `_DeltaSpool` under `spool_dir`.
+
+    Both inventories are sorted by `rel_path` (externally, in chunks) and
+    merge-joined, so neither is ever held in memory as a whole. Columnar
+    sidecars are read instead of the JSONL when both snapshots have one; their
+    signatures carry mtime as microseconds, so the two kinds are never mixed.
+    The caller owns (and must close) the returned spool.
+    """
+    from_cols = ColumnarInventory.open(from_inv_path)
+    to_cols = ColumnarInventory.open(to_inv_path) if from_cols is not None else None
+    if from_cols is not None and to_cols is None:
+        from_cols.close()
+        from_cols = None
+
+    spool = None
+    try:
+        spool = _DeltaSpool(spool_dir)
+        if from_cols is not None:
+            from_records = from_cols.iter_signatures()
+            to_records = to_cols.iter_signatures()
+        else:
+            from_records = _iter_inventory_signatures(from_inv_path)
+            to_records = _iter_inventory_signatures(to_inv_path)
+        for kind, rel_path in _merge_join(
+            _sorted_signatures(from_records, spool_dir, chunk_rows),
+            _sorted_signatures(to_records, spool_dir, chunk_rows),
+        ):
+            spool.add(kind, rel_path)
+    except BaseException:
+        if spool is not None:
+            spool.close()
+        raise
+    finally:
+        if from_cols is not None:
+            from_cols.close()
+            to_cols.close()
+    return spool
+
+
+def _write_delta_json(f: TextIO, delta_fields: Dict[str, Any], spool: _DeltaSpool) -> None:
+    """
+    Streams the delta artifact in exactly the layout `json.dump(delta, f, indent=2)`
+    produces, with the path lists copied from the spool.
+    """
+    f.write("{\n")
+    for key, value in delta_fields.items():
+        f.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+    for kind in _DeltaSpool.KINDS:
+        f.write(f"  {json.dumps(kind)}: ")
+        if not spool.counts[kind]:
+            f.write("[]")
+        else:
+            f.write("[")
+            separator = "\n"
+            for rel_path in spool.paths(kind):
+                f.write(f"{separator}    {json.dumps(rel_path)}")
+                separator = ",\n"
+            f.write("\n  ]")
+        f.write(",\n")
+    summary = json.dumps(spool.summary(), indent=2).replace("\n", "\n  ")
+    f.write(f'  "summary": {summary}\n}}')
+
+
+def _snapshot_inventory_path(atlas_base: Path, snap: Dict[str, Any], snap_id: str) -> Path:
+    inv_path = resolve_artifact_ref(atlas_base, snap["inventory_ref"]) if snap["inventory_ref"] else None
+    if not inv_path or not inv_path.exists():
+        raise FileNotFoundError(f"Inventory missing for snapshot {snap_id}")
+    return inv_path
+
+
+def compute_snapshot_delta(registry, from_snap_id: str, to_snap_id: str, include_lists: bool = True) -> Dict[str, Any]:
+    """
+    Computes and persists the delta between two snapshots of the same root.
+
+    The delta artifact is streamed to disk. With `include_lists=False` the
+    returned dict carries no full path lists (constant memory); instead it has
+    `preview` with up to `DELTA_PREVIEW_LIMIT` paths per list and `delta_ref`.
+    """
     from_snap = registry.get_snapshot(from_snap_id)
     to_snap = registry.get_snapshot(to_snap_id)
 
@@ -81,39 +269,16 @@ def compute_snapshot_delta(registry, from_snap_id: str, to_snap_id: str) -> Dict
         raise ValueError("Cannot compute snapshot delta without a canonical registry db_path.")
     atlas_base = resolve_atlas_base_dir(registry.db_path)
 
-    from_inv_path = None
-    if from_snap["inventory_ref"]:
-        from_inv_path = resolve_artifact_ref(atlas_base, from_snap["inventory_ref"])
-    to_inv_path = None
-    if to_snap["inventory_ref"]:
-        to_inv_path = resolve_artifact_ref(atlas_base, to_snap["inventory_ref"])
-
-    if not from_inv_path or not from_inv_path.exists():
-        raise FileNotFoundError(f"Inventory missing for snapshot {from_snap_id}")
-    if not to_inv_path or not to_inv_path.exists():
-        raise FileNotFoundError(f"Inventory missing for snapshot {to_snap_id}")
-
-    from_files = _load_inventory_index(from_inv_path)
-    to_files = _load_inventory_index(to_inv_path)
-
-    new_files, removed_files, changed_files = _compare_file_sets(from_files, to_files)
+    from_inv_path = _snapshot_inventory_path(atlas_base, from_snap, from_snap_id)
+    to_inv_path = _snapshot_inventory_path(atlas_base, to_snap, to_snap_id)
 
     delta_id = f"delta_{uuid.uuid4().hex[:8]}"
     created_at = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat()
-
-    delta = {
+    delta_fields = {
         "delta_id": delta_id,
         "from_snapshot_id": from_snap_id,
         "to_snapshot_id": to_snap_id,
         "created_at": created_at,
-        "new_files": new_files,
-        "removed_files": removed_files,
-        "changed_files": changed_files,
-        "summary": {
-            "new_count": len(new_files),
-            "removed_count": len(removed_files),
-            "changed_count": len(changed_files)
-        }
     }
 
     # Store in the to_snapshot directory as per convention: snapshots/<snapshot_id>/
@@ -123,8 +288,25 @@ def compute_snapshot_delta(registry, from_snap_id: str, to_snap_id: str) -> Dict
     delta_filename = f"{delta_id}.json"
     delta_path = snapshot_dir / delta_filename
 
-    with open(delta_path, "w", encoding="utf-8") as f:
-        json.dump(delta, f, indent=2)
+    # Sort runs and path spools live next to the artifact (same filesystem,
+    # sized like the inventories), not in the system temp dir.
+    with tempfile.TemporaryDirectory(dir=str(snapshot_dir), prefix=".delta_spool_") as spool_dir:
+        spool = _diff_inventories(from_inv_path, to_inv_path, Path(spool_dir))
+        try:
+            tmp_path = delta_path.with_name(f".tmp_{delta_filename}")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                _write_delta_json(f, delta_fields, spool)
+            os.replace(tmp_path, delta_path)
+
+            delta = dict(delta_fields)
+            if include_lists:
+                for kind in _DeltaSpool.KINDS:
+                    delta[kind] = list(spool.paths(kind))
+            else:
+                delta["preview"] = {kind: list(paths) for kind, paths in spool.preview.items()}
+            delta["summary"] = spool.summary()
+        finally:
+            spool.close()
 
     try:
         delta_ref = delta_path.relative_to(atlas_base).as_posix()
@@ -133,10 +315,12 @@ def compute_snapshot_delta(registry, from_snap_id: str, to_snap_id: str) -> Dict
 
     registry.register_delta(delta_id, from_snap_id, to_snap_id, delta_ref, created_at)
 
+    if not include_lists:
+        delta["delta_ref"] = delta_ref
     return delta
 
 # Drift Note: The `compute_snapshot_comparison` function shares the inventory parsing
-# and file comparison loops with `compute_snapshot_delta` via internal helpers.
+# and file comparison loops with `compute_snapshot_delta` via `_diff_inventories`.
 # This maintains robustness across both modes while keeping strict semantic separation
 # between temporal deltas (same root, persisted) and structural comparisons (cross-root, diagnostic).
 def compute_snapshot_comparison(registry, from_snap_id: str, to_snap_id: str) -> Dict[str, Any]:
@@ -158,22 +342,17 @@ def compute_snapshot_comparison(registry, from_snap_id: str, to_snap_id: str) ->
         raise ValueError("Cannot compute snapshot comparison without a canonical registry db_path.")
     atlas_base = resolve_atlas_base_dir(registry.db_path)
 
-    from_inv_path = None
-    if from_snap["inventory_ref"]:
-        from_inv_path = resolve_artifact_ref(atlas_base, from_snap["inventory_ref"])
-    to_inv_path = None
-    if to_snap["inventory_ref"]:
-        to_inv_path = resolve_artifact_ref(atlas_base, to_snap["inventory_ref"])
-
-    if not from_inv_path or not from_inv_path.exists():
-        raise FileNotFoundError(f"Inventory missing for snapshot {from_snap_id}")
-    if not to_inv_path or not to_inv_path.exists():
-        raise FileNotFoundError(f"Inventory missing for snapshot {to_snap_id}")
-
-    from_files = _load_inventory_index(from_inv_path)
-    to_files = _load_inventory_index(to_inv_path)
-
-    new_files, removed_files, changed_files = _compare_file_sets(from_files, to_files)
+    from_inv_path = _snapshot_inventory_path(atlas_base, from_snap, from_snap_id)
+    to_inv_path = _snapshot_inventory_path(atlas_base, to_snap, to_snap_id)
+
+    with tempfile.TemporaryDirectory(prefix="atlas_compare_") as spool_dir:
+        spool = _diff_inventories(from_inv_path, to_inv_path, Path(spool_dir))
+        try:
+            new_files = list(spool.paths("new_files"))
+            removed_files = list(spool.paths("removed_files"))
+            changed_files = list(spool.paths("changed_files"))
+        finally:
+            spool.close()
 
     is_cross_root = (from_snap["machine_id"] != to_snap["machine_id"]) or (from_snap["root_id"] != to_snap["root_id"])
     mode = "cross-root-comparison" if is_cross_root else "same-root-delta"
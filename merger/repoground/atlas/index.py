@@ -29,29 +29,36 @@ Content search note: the FTS ``content`` column is populated opportunistically
 from **live files at index time** (not from snapshot artifacts). It is therefore
 a live-at-index-time cache, not a snapshot-canonical derivation: re-running
 ``atlas index rebuild`` reads current live content, not the historical content
-at snapshot creation. This column is **not used as a filter** in the active
-search path. Content queries use only SQLite metadata filtering (``ext``,
-``size_bytes``, ``mtime_epoch``, scope) and then always reach ``_content_match``
-for live-file confirmation. This avoids false negatives from freshness gaps
-(live files mutated after indexing). Future activation of ``fts_content_candidates``
-as a narrowing gate would require an immutable content source (e.g. stored in
-the snapshot artifact) or an explicit freshness guard.
+at snapshot creation. Alongside the content the index records the live
+``(size, mtime_ns)`` observed while reading it (``content_size`` /
+``content_mtime_ns``). The search layer trusts the stored content — for
+``fts_content_candidates`` narrowing and for line matching — only while the
+live file still carries exactly that stat; any other candidate goes through
+the live ``_content_match`` confirmation, so a mutated file can never become a
+false negative.
 """
 
 import json
 import re
+import os
 import sqlite3
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from merger.repoground.atlas.paths import resolve_artifact_ref
 
-INDEX_SCHEMA_VERSION = "atlas-fts-v1"
+INDEX_SCHEMA_VERSION = "atlas-fts-v2"
 
 # Mirror of the content read budget used by search/content enrichment.
 TEXT_DETECTION_MAX_BYTES = 20 * 1024 * 1024
 
+# A file modified this close to the moment its content was read may be written
+# again within the same mtime tick without its stat changing ("racy" entry, as
+# in git's index). Such content is stored but never stat-validated.
+CONTENT_RACY_WINDOW_NS = 2_000_000_000
+
 
 def _ascii_path_tokens(text: str) -> str:
     """Whitespace-join the ASCII alphanumeric runs of `text` for the auxiliary
@@ -157,7 +164,9 @@ class AtlasFTSIndex:
                     mtime_epoch REAL,
                     is_symlink INTEGER,
                     is_text INTEGER,
-                    raw_json TEXT NOT NULL
+                    raw_json TEXT NOT NULL,
+                    content_size INTEGER,
+                    content_mtime_ns INTEGER
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_files_snapshot ON files(snapshot_id);
@@ -173,6 +182,12 @@ class AtlasFTSIndex:
                 );
                 """
             )
+            # Indexes created before content freshness was recorded lack the
+            # stat columns; their rows keep NULL and are always live-scanned.
+            columns = {r["name"] for r in self.conn.execute("PRAGMA table_info(files)")}
+            for column in ("content_size", "content_mtime_ns"):
+                if column not in columns:
+                    self.conn.execute(f"ALTER TABLE files ADD COLUMN {column} INTEGER")
             self.conn.execute(
                 "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('schema_version', ?)",
                 (INDEX_SCHEMA_VERSION,),
@@ -272,8 +287,9 @@ class AtlasFTSIndex:
                 self.conn.executemany(
                     """INSERT INTO files
                        (file_uid, snapshot_id, machine_id, root_id, rel_path, name, ext,
-                        size_bytes, mtime, mtime_epoch, is_symlink, is_text, raw_json)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        size_bytes, mtime, mtime_epoch, is_symlink, is_text, raw_json,
+                        content_size, content_mtime_ns)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                     file_batch,
                 )
             if fts_batch:
@@ -318,6 +334,20 @@ class AtlasFTSIndex:
                         uid = next_uid
                         next_uid += 1
 
+                        content_text = ""
+                        content_stat: Optional[Tuple[int, int]] = None
+                        if (
+                            index_content
+                            and root_path is not None
+                            and item.get("is_text") is not False
+                            and not item.get("is_symlink")
+                            and size_bytes <= TEXT_DETECTION_MAX_BYTES
+                        ):
+                            content_text, content_stat = _read_text_safely(root_path, rel_path, size_bytes)
+                            if content_text:
+                                any_content = True
+                                stats["content_indexed"] += 1
+
                         file_batch.append(
                             (
                                 uid,
@@ -333,22 +363,11 @@ class AtlasFTSIndex:
                                 is_symlink,
                                 is_text,
                                 json.dumps(item, ensure_ascii=False),
+                                content_stat[0] if content_stat else None,
+                                content_stat[1] if content_stat else None,
                             )
                         )
 
-                        content_text = ""
-                        if (
-                            index_content
-                            and root_path is not None
-                            and item.get("is_text") is not False
-                            and not item.get("is_symlink")
-                            and size_bytes <= TEXT_DETECTION_MAX_BYTES
-                        ):
-                            content_text = _read_text_safely(root_path, rel_path, size_bytes)
-                            if content_text:
-                                any_content = True
-                                stats["content_indexed"] += 1
-
                         fts_batch.append(
                             (uid, content_text, _ascii_path_tokens(rel_path))
                         )
@@ -484,23 +503,23 @@ class AtlasFTSIndex:
     def fts_content_candidates(self, snapshot_ids: Iterable[str], content_query: str) -> Optional[List[int]]:
         """Conservatively narrow content-search candidates via FTS.
 
-        CURRENTLY UNUSED by AtlasSearch because live-file freshness can diverge
-        from indexed content (files mutate after indexing). Kept as a primitive
-        for potential future immutable-snapshot or write-once-mode work where
-        content staleness cannot occur.
+        Used by ``AtlasSearch`` only for candidates whose live stat still
+        equals the recorded ``content_size``/``content_mtime_ns``: for those
+        the stored content is the live content, so a uid missing from the
+        result is a proven non-match. Stat-changed candidates are always
+        live-scanned regardless of this result.
 
         Return semantics (informational — see ADR-009):
 
         * ``None``  -> the query cannot be safely narrowed (subtoken substrings
           like ``oob`` ⊂ ``foobar``, Unicode queries, punctuation/operator-like
-          queries). If this primitive were used, the caller would need to
-          live-scan all candidates.
+          queries). The caller must match every candidate.
         * ``[]``    -> the query *is* safely narrowable and no document contains
           the required prefix tokens.
         * ``[uid…]``-> a conservative superset of the true matches.
 
-        The live confirmation in ``_content_match`` would always be the truth
-        source if this primitive were used as a filter gate.
+        A uid in the result still needs an exact line match; see
+        ``stored_content``.
         """
         snapshot_ids = list(snapshot_ids)
         if not snapshot_ids:
@@ -528,6 +547,13 @@ class AtlasFTSIndex:
             return None
         return [r["file_uid"] for r in rows]
 
+    def stored_content(self, file_uid: int) -> Optional[str]:
+        """Return the content stored for ``file_uid`` at index time, if any."""
+        row = self.conn.execute(
+            "SELECT content FROM files_fts WHERE rowid = ?", (file_uid,)
+        ).fetchone()
+        return None if row is None else row["content"]
+
     def query_metadata(
         self,
         snapshot_ids: List[str],
@@ -626,19 +652,34 @@ def _safe_epoch(mtime: Optional[str]) -> Optional[float]:
         return None
 
 
-def _read_text_safely(root_path: Path, rel_path: str, size_bytes: int) -> str:
-    """Read a text file under root_path with traversal/symlink guards. Best-effort."""
+def _read_text_safely(
+    root_path: Path, rel_path: str, size_bytes: int
+) -> Tuple[str, Optional[Tuple[int, int]]]:
+    """Read a text file under root_path with traversal/symlink guards. Best-effort.
+
+    Returns ``(text, stat_key)``. ``stat_key`` is the ``(size, mtime_ns)`` the
+    file carried for the whole read, or ``None`` when the file changed while
+    being read, was modified too recently to be trusted, or could not be read.
+    """
     candidate = root_path / rel_path
     try:
         if candidate.is_symlink():
-            return ""
+            return "", None
         full = candidate.resolve(strict=False)
         full.relative_to(root_path)
         if not full.is_file() or full.is_symlink():
-            return ""
+            return "", None
         if full.stat().st_size > TEXT_DETECTION_MAX_BYTES:
-            return ""
+            return "", None
         with open(full, "r", encoding="utf-8", errors="replace") as fh:
-            return fh.read()
+            before = os.fstat(fh.fileno())
+            text = fh.read()
+            after = os.stat(full)
     except (OSError, ValueError, RuntimeError):
-        return ""
+        return "", None
+    stat_key = (before.st_size, before.st_mtime_ns)
+    if (after.st_size, after.st_mtime_ns) != stat_key:
+        return text, None
+    if time.time_ns() - before.st_mtime_ns < CONTENT_RACY_WINDOW_NS:
+        return text, None
+    return text, stat_key
@@ -1,7 +1,10 @@
+import io
 import json
+import os
+import sqlite3
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 import fnmatch
 
@@ -16,72 +19,153 @@ def parse_iso_datetime(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
-def _content_match(root_value: str, item: Dict[str, Any], content_query_lower: str) -> Tuple[bool, Optional[str]]:
-    """Confirm a content-query substring match against the live file and build a snippet.
-
-    Returns (matched, snippet). This preserves the exact semantics of the
-    original best-effort live-filesystem content search (case-insensitive
-    substring on a single line, first match wins, snippet trimmed to 200 chars)
-    while being reusable by both the legacy and index-backed search paths.
-    """
-    if not root_value:
-        return False, None
-
-    # Guard 1: skip declared symlinks
-    if item.get('is_symlink'):
-        return False, None
-
-    root_path = Path(root_value).resolve()
-    rel_path = item.get('rel_path', '')
+def _contained_regular_file(root_path: Path, rel_path: str) -> Optional[Path]:
+    """``root_path / rel_path`` if it is a regular, non-symlink file inside ``root_path``."""
     candidate_path = root_path / rel_path
 
     try:
         if candidate_path.is_symlink():
-            return False, None
+            return None
     except OSError:
-        return False, None
+        return None
 
     try:
         full_path = candidate_path.resolve(strict=False)
         full_path.relative_to(root_path)
     except (ValueError, OSError, RuntimeError):
-        return False, None
+        return None
 
     try:
         if not full_path.is_file() or full_path.is_symlink():
-            return False, None
+            return None
     except OSError:
-        return False, None
+        return None
+    return full_path
+
+
+def _content_target(root_value: str, item: Dict[str, Any]) -> Optional[Path]:
+    """Resolve the live file a content query may read, or None if guarded off.
+
+    Applies the symlink, traversal, regular-file, size and text guards shared
+    by the live and the index-verified content match.
+    """
+    if not root_value:
+        return None
+
+    # Guard 1: skip declared symlinks
+    if item.get('is_symlink'):
+        return None
+
+    full_path = _contained_regular_file(Path(root_value).resolve(), item.get('rel_path', ''))
+    if full_path is None:
+        return None
 
     size = item.get('size_bytes', 0)
     if size > TEXT_DETECTION_MAX_BYTES:
-        return False, None
+        return None
 
     is_text_flag = item.get('is_text')
     if is_text_flag is False:
-        return False, None
+        return None
     if is_text_flag is None:
         from merger.repoground.adapters.atlas import is_probably_text
         if not is_probably_text(full_path, size):
-            return False, None
+            return None
+
+    return full_path
+
+
+def _match_lines(lines: Iterable[str], content_query_lower: str) -> Tuple[bool, Optional[str]]:
+    for line in lines:
+        if content_query_lower in line.lower():
+            snippet = line.strip()
+            if len(snippet) > 200:
+                snippet = snippet[:197] + "..."
+            return True, snippet
+    return False, None
+
+
+def _content_match(root_value: str, item: Dict[str, Any], content_query_lower: str) -> Tuple[bool, Optional[str]]:
+    """Confirm a content-query substring match against the live file and build a snippet.
+
+    Returns (matched, snippet). This preserves the exact semantics of the
+    original best-effort live-filesystem content search (case-insensitive
+    substring on a single line, first match wins, snippet trimmed to 200 chars)
+    while being reusable by both the legacy and index-backed search paths.
+    """
+    full_path = _content_target(root_value, item)
+    if full_path is None:
+        return False, None
 
     try:
         with open(full_path, 'r', encoding='utf-8', errors='replace') as f_content:
-            for line in f_content:
-                if content_query_lower in line.lower():
-                    snippet = line.strip()
-                    if len(snippet) > 200:
-                        snippet = snippet[:197] + "..."
-                    return True, snippet
+            return _match_lines(f_content, content_query_lower)
     except Exception:
         return False, None
 
-    return False, None
+
+def _indexed_content_match(idx, row, root_value: str, item: Dict[str, Any],
+                           content_query_lower: str, narrowed: Optional[Set[int]],
+                           counters: Dict[str, int]) -> Tuple[bool, Optional[str]]:
+    """Content match that trusts the index only for stat-unchanged files.
+
+    When the live file still has the ``(size, mtime_ns)`` recorded while its
+    content was indexed, the stored content is the live content: a file outside
+    the FTS-narrowed set is a proven miss and a file inside it is matched
+    against the stored text, without opening the live file. Every other
+    candidate is confirmed by a live ``_content_match``.
+    """
+    counters['candidates'] += 1
+    full_path = _content_target(root_value, item)
+    if full_path is None:
+        return False, None
+
+    recorded = (row['content_size'], row['content_mtime_ns'])
+    if recorded[0] is not None and recorded[1] is not None:
+        try:
+            st = os.stat(full_path)
+            fresh = (st.st_size, st.st_mtime_ns) == recorded
+        except OSError:
+            fresh = False
+        if fresh:
+            if narrowed is not None and row['file_uid'] not in narrowed:
+                counters['index_pruned'] += 1
+                return False, None
+            try:
+                stored = idx.stored_content(row['file_uid'])
+            except sqlite3.Error:
+                stored = None
+            if stored is not None:
+                counters['index_verified'] += 1
+                return _match_lines(io.StringIO(stored), content_query_lower)
+
+    counters['live_scanned'] += 1
+    return _content_match(root_value, item, content_query_lower)
+
+
+def _mtime_in_range(item: Dict[str, Any], after_dt: Optional[datetime], before_dt: Optional[datetime], where: str) -> bool:
+    mtime = item.get('mtime', '')
+    if not mtime:
+        return False
+    try:
+        mtime_dt = parse_iso_datetime(mtime)
+    except Exception:
+        print(f"[atlas-search] warning: invalid timestamp format '{mtime}' in {where}", file=sys.stderr)
+        return False
+
+    if after_dt and mtime_dt < after_dt:
+        return False
+    if before_dt and mtime_dt > before_dt:
+        return False
+    return True
 
 
 class AtlasSearch:
     def __init__(self, registry_db_path: Path):
         self.registry_db_path = registry_db_path
+        # Per-search breakdown of how index-backed content candidates were
+        # answered; None when the last search did not take that path.
+        self.last_content_stats: Optional[Dict[str, int]] = None
 
     def search(self,
                query: Optional[str] = None,
@@ -137,6 +221,7 @@ class AtlasSearch:
             ext = f".{ext}"
 
         content_query_lower = content_query.lower() if content_query else None
+        self.last_content_stats = None
 
         # Prefer the FTS index when it exists and covers every candidate snapshot.
         if use_index:
@@ -168,7 +253,13 @@ class AtlasSearch:
         snap_by_id = {s['snapshot_id']: s for s in snapshots}
 
         try:
-            with AtlasFTSIndex(index_path) as idx:
+            idx = AtlasFTSIndex(index_path)
+        except Exception as e:
+            print(f"[atlas-search] warning: index search failed, falling back to linear scan: {e}", file=sys.stderr)
+            return None
+
+        with idx:
+            try:
                 # The index can only answer authoritatively if it fully and
                 # consistently covers all candidate snapshots; otherwise defer to
                 # the linear fallback.
@@ -178,51 +269,65 @@ class AtlasSearch:
                 after_epoch = after_dt.timestamp() if after_dt else None
                 before_epoch = before_dt.timestamp() if before_dt else None
 
-                # For content queries, never restrict via FTS content candidates:
-                # the FTS content column is frozen at index time and can be
-                # stale if the live file mutates after indexing.  Using it as a
-                # hard pre-filter would produce false negatives (the live
-                # _content_match confirmation is never reached for excluded files).
-                # Instead, all metadata-filtered candidates are live-scanned by
-                # _content_match below, keeping FTS content as prepared structure
-                # only (potential future accelerator, not a gate).
+                # FTS content candidates are NOT a hard pre-filter: indexed
+                # content can be stale. They only prune files whose live stat
+                # still matches the one recorded at index time (see
+                # _indexed_content_match); everything else is live-scanned.
                 rows = idx.query_metadata(
                     snapshot_ids, ext=ext, min_size=min_size, max_size=max_size,
                     after_epoch=after_epoch, before_epoch=before_epoch,
                 )
-        except Exception as e:
-            print(f"[atlas-search] warning: index search failed, falling back to linear scan: {e}", file=sys.stderr)
-            return None
+                narrowed: Optional[Set[int]] = None
+                if content_query:
+                    uids = idx.fts_content_candidates(snapshot_ids, content_query)
+                    narrowed = None if uids is None else set(uids)
+            except Exception as e:
+                print(f"[atlas-search] warning: index search failed, falling back to linear scan: {e}", file=sys.stderr)
+                return None
+
+            counters = {'candidates': 0, 'index_verified': 0, 'index_pruned': 0, 'live_scanned': 0}
+            results: List[Dict[str, Any]] = []
+            for row in rows:
+                result_item = self._match_index_row(
+                    idx, row, snap_by_id, roots_cache, query, path_pattern, name_pattern,
+                    content_query, content_query_lower, narrowed, counters,
+                )
+                if result_item is not None:
+                    results.append(result_item)
 
-        results: List[Dict[str, Any]] = []
-        for row in rows:
-            try:
-                item = json.loads(row['raw_json'])
-            except (json.JSONDecodeError, TypeError):
-                continue
+        if content_query:
+            self.last_content_stats = counters
+        return results
 
-            if not self._passes_name_filters(item, query, path_pattern, name_pattern):
-                continue
+    def _match_index_row(self, idx, row, snap_by_id, roots_cache, query, path_pattern, name_pattern,
+                         content_query, content_query_lower, narrowed, counters) -> Optional[Dict[str, Any]]:
+        try:
+            item = json.loads(row['raw_json'])
+        except (json.JSONDecodeError, TypeError):
+            return None
 
-            if content_query:
-                snap = snap_by_id.get(row['snapshot_id'])
-                root = roots_cache.get(snap['root_id']) if snap else None
-                root_val = root.get('root_value') if root else None
-                if not root_val:
-                    continue
-                matched, snippet = _content_match(root_val, item, content_query_lower)
-                if not matched:
-                    continue
-                if snippet:
-                    item['content_snippet'] = snippet
+        if not self._passes_name_filters(item, query, path_pattern, name_pattern):
+            return None
 
-            result_item = dict(item)
-            result_item['machine_id'] = row['machine_id']
-            result_item['root_id'] = row['root_id']
-            result_item['snapshot_id'] = row['snapshot_id']
-            results.append(result_item)
+        if content_query:
+            snap = snap_by_id.get(row['snapshot_id'])
+            root = roots_cache.get(snap['root_id']) if snap else None
+            root_val = root.get('root_value') if root else None
+            if not root_val:
+                return None
+            matched, snippet = _indexed_content_match(
+                idx, row, root_val, item, content_query_lower, narrowed, counters,
+            )
+            if not matched:
+                return None
+            if snippet:
+                item['content_snippet'] = snippet
 
-        return results
+        result_item = dict(item)
+        result_item['machine_id'] = row['machine_id']
+        result_item['root_id'] = row['root_id']
+        result_item['snapshot_id'] = row['snapshot_id']
+        return result_item
 
     @staticmethod
     def _passes_name_filters(item, query, path_pattern, name_pattern) -> bool:
@@ -244,8 +349,12 @@ class AtlasSearch:
     def _search_linear(self, snapshots, roots_cache, query, path_pattern, name_pattern,
                        ext, min_size, max_size, after_dt, before_dt,
                        content_query, content_query_lower) -> List[Dict[str, Any]]:
+        from merger.repoground.atlas.columnar import ColumnarInventory
+
         atlas_base = resolve_atlas_base_dir(self.registry_db_path)
         results: List[Dict[str, Any]] = []
+        filters = (roots_cache, query, path_pattern, name_pattern, ext, min_size, max_size,
+                   after_dt, before_dt, content_query, content_query_lower)
 
         for snap in snapshots:
             inv_ref = snap.get("inventory_ref")
@@ -257,6 +366,12 @@ class AtlasSearch:
                 print(f"[atlas-search] warning: inventory reference not found: {inv_path}", file=sys.stderr)
                 continue
 
+            columns = ColumnarInventory.open(inv_path)
+            if columns is not None:
+                with columns:
+                    self._search_columnar(columns, snap, filters, results)
+                continue
+
             try:
                 with open(inv_path, 'r', encoding='utf-8') as f:
                     for line_idx, line in enumerate(f, start=1):
@@ -265,57 +380,82 @@ class AtlasSearch:
 
                         try:
                             item = json.loads(line)
-
-                            if not self._passes_name_filters(item, query, path_pattern, name_pattern):
-                                continue
-
-                            if ext and item.get('ext', '') != ext:
-                                continue
-
-                            size = item.get('size_bytes', 0)
-                            if min_size is not None and size < min_size:
-                                continue
-                            if max_size is not None and size > max_size:
-                                continue
-
-                            if after_dt or before_dt:
-                                mtime = item.get('mtime', '')
-                                if not mtime:
-                                    continue
-                                try:
-                                    mtime_dt = parse_iso_datetime(mtime)
-                                except Exception:
-                                    print(f"[atlas-search] warning: invalid timestamp format '{mtime}' in {inv_path}:{line_idx}", file=sys.stderr)
-                                    continue
-
-                                if after_dt and mtime_dt < after_dt:
-                                    continue
-                                if before_dt and mtime_dt > before_dt:
-                                    continue
-
-                            if content_query:
-                                root = roots_cache.get(snap['root_id'])
-                                if not root:
-                                    continue
-                                root_val = root.get('root_value')
-                                if not root_val:
-                                    continue
-                                matched, snippet = _content_match(root_val, item, content_query_lower)
-                                if not matched:
-                                    continue
-                                if snippet:
-                                    item['content_snippet'] = snippet
-
-                            result_item = dict(item)
-                            result_item['machine_id'] = snap['machine_id']
-                            result_item['root_id'] = snap['root_id']
-                            result_item['snapshot_id'] = snap['snapshot_id']
-
-                            results.append(result_item)
-
+                            result_item = self._match_inventory_item(item, snap, filters, f"{inv_path}:{line_idx}")
+                            if result_item is not None:
+                                results.append(result_item)
                         except (json.JSONDecodeError, KeyError, TypeError) as e:
                             print(f"[atlas-search] warning: invalid inventory record in {inv_path} at line {line_idx}: {e}", file=sys.stderr)
             except (OSError, UnicodeDecodeError) as e:
                 print(f"[atlas-search] warning: failed to read inventory {inv_path}: {e}", file=sys.stderr)
 
         return results
+
+    def _search_columnar(self, columns, snap, filters, results: List[Dict[str, Any]]) -> None:
+        """Linear search over an inventory's columnar sidecar.
+
+        Size/ext/mtime are filtered on the mapped columns; only surviving rows
+        are read from the JSONL and then pass the same per-record checks as the
+        plain JSONL path, so results are identical.
+        """
+        from merger.repoground.atlas.columnar import datetime_to_us
+
+        _, _, _, _, ext, min_size, max_size, after_dt, before_dt, _, _ = filters
+        after_us = datetime_to_us(after_dt) if after_dt else None
+        before_us = datetime_to_us(before_dt) if before_dt else None
+        if (after_dt and after_us is None) or (before_dt and before_us is None):
+            # Naive bounds compare differently than column microseconds; leave
+            # them to the per-record check.
+            after_us = before_us = None
+
+        rows = columns.select(ext=ext, min_size=min_size, max_size=max_size,
+                              after_us=after_us, before_us=before_us)
+        try:
+            for row, item in columns.iter_records(rows):
+                where = f"{columns.inventory_path} row {row}"
+                if item is None:
+                    print(f"[atlas-search] warning: invalid inventory record in {where}", file=sys.stderr)
+                    continue
+                try:
+                    result_item = self._match_inventory_item(item, snap, filters, where)
+                except (KeyError, TypeError) as e:
+                    print(f"[atlas-search] warning: invalid inventory record in {where}: {e}", file=sys.stderr)
+                    continue
+                if result_item is not None:
+                    results.append(result_item)
+        except OSError as e:
+            print(f"[atlas-search] warning: failed to read inventory {columns.inventory_path}: {e}", file=sys.stderr)
+
+    def _match_inventory_item(self, item, snap, filters, where) -> Optional[Dict[str, Any]]:
+        (roots_cache, query, path_pattern, name_pattern, ext, min_size, max_size,
+         after_dt, before_dt, content_query, content_query_lower) = filters
+
+        if not self._passes_name_filters(item, query, path_pattern, name_pattern):
+            return None
+
+        if ext and item.get('ext', '') != ext:
+            return None
+
+        size = item.get('size_bytes', 0)
+        if min_size is not None and size < min_size:
+            return None
+        if max_size is not None and size > max_size:
+            return None
+
+        if (after_dt or before_dt) and not _mtime_in_range(item, after_dt, before_dt, where):
+            return None
+
+        if content_query:
+            root_val = (roots_cache.get(snap['root_id']) or {}).get('root_value')
+            if not root_val:
+                return None
+            matched, snippet = _content_match(root_val, item, content_query_lower)
+            if not matched:
+                return None
+            if snippet:
+                item['content_snippet'] = snippet
+
+        result_item = dict(item)
+        result_item['machine_id'] = snap['machine_id']
+        result_item['root_id'] = snap['root_id']
+        result_item['snapshot_id'] = snap['snapshot_id']
+        return result_item
@@ -192,7 +192,7 @@ def run_atlas_diff(args: argparse.Namespace) -> int:
                 raise ValueError(f"Snapshot not found: {to_snap_id}")
 
             if from_snap["machine_id"] == to_snap["machine_id"] and from_snap["root_id"] == to_snap["root_id"]:
-                delta = compute_snapshot_delta(registry, from_snap_id, to_snap_id)
+                delta = compute_snapshot_delta(registry, from_snap_id, to_snap_id, include_lists=False)
                 print(f"Delta: {delta['delta_id']} ({delta['from_snapshot_id']} -> {delta['to_snapshot_id']})")
                 print("Mode: same-root-delta")
             else:
@@ -205,23 +205,19 @@ def run_atlas_diff(args: argparse.Namespace) -> int:
                 print(f"To:   {to_desc}")
 
         print(f"Summary: {json.dumps(delta['summary'], indent=2)}")
-        print(f"\nNew files: {len(delta['new_files'])}")
-        for f in delta['new_files'][:10]:
-            print(f"  + {f}")
-        if len(delta['new_files']) > 10:
-            print(f"  ... and {len(delta['new_files']) - 10} more")
-
-        print(f"\nRemoved files: {len(delta['removed_files'])}")
-        for f in delta['removed_files'][:10]:
-            print(f"  - {f}")
-        if len(delta['removed_files']) > 10:
-            print(f"  ... and {len(delta['removed_files']) - 10} more")
-
-        print(f"\nChanged files: {len(delta['changed_files'])}")
-        for f in delta['changed_files'][:10]:
-            print(f"  ~ {f}")
-        if len(delta['changed_files']) > 10:
-            print(f"  ... and {len(delta['changed_files']) - 10} more")
+        # Same-root deltas only carry a preview; the full lists are in the artifact.
+        preview = delta.get("preview", delta)
+        for title, key, count_key, marker in (
+            ("New files", "new_files", "new_count", "+"),
+            ("Removed files", "removed_files", "removed_count", "-"),
+            ("Changed files", "changed_files", "changed_count", "~"),
+        ):
+            count = delta["summary"][count_key]
+            print(f"\n{title}: {count}")
+            for f in preview[key][:10]:
+                print(f"  {marker} {f}")
+            if count > 10:
+                print(f"  ... and {count - 10} more")
 
         return 0
     except Exception as e:
@@ -790,7 +786,11 @@ def run_atlas_scan(args: argparse.Namespace) -> int:
             incremental_inventory=incremental_inventory,
             incremental_dirs_inventory=incremental_dirs_inventory,
             previous_scan_config_hash=previous_scan_config_hash,
-            current_scan_config_hash=short_hash
+            current_scan_config_hash=short_hash,
+            workers=args.workers,
+            subtree_skip=args.skip_unchanged_subtrees,
+            subtree_verify_sample=args.verify_sample,
+            columnar_inventory=args.columnar_inventory
         )
 
 
@@ -1211,6 +1211,10 @@ def register_atlas_commands(subparsers) -> None:
     atlas_scan_parser.add_argument("--root-label", help="Explicit root label for the registry")
     atlas_scan_parser.add_argument("--incremental", action="store_true", help="Perform an incremental scan based on the latest snapshot")
     atlas_scan_parser.add_argument("--no-index", action="store_true", help="Skip updating the global FTS search index after the scan")
+    atlas_scan_parser.add_argument("--skip-unchanged-subtrees", action="store_true", help="With --incremental: reuse previous inventory rows for directory subtrees whose structure is unchanged instead of walking them (misses in-place file edits)")
+    atlas_scan_parser.add_argument("--verify-sample", type=int, default=0, help="With --skip-unchanged-subtrees: re-stat up to N files per reused subtree and rescan it on drift")
+    atlas_scan_parser.add_argument("--workers", type=int, default=1, help="Threads used to list directories and stat files (helps on network mounts; output is unchanged)")
+    atlas_scan_parser.add_argument("--columnar-inventory", action="store_true", help="Also write a memory-mappable inventory.cols sidecar that search and diff read instead of re-parsing the JSONL")
 
     atlas_subparsers.add_parser("machine-health", help="List registered machines with health status and last seen info")
     atlas_subparsers.add_parser("machines", help="List registered machines")
@@ -45,6 +45,8 @@ def register_federation_commands(subparsers) -> None:
     query_parser.add_argument("-q", "--query", required=True, help="Query string")
     query_parser.add_argument("-k", type=int, default=10, help="Number of final results to return (top-k across all bundles)")
     query_parser.add_argument("--repo", type=str, help="Filter by repository ID (currently the only supported filter)")
+    query_parser.add_argument("--max-concurrency", type=int, default=8, help="Maximum number of bundles queried in parallel (default: 8)")
+    query_parser.add_argument("--bundle-deadline", type=float, default=None, help="Per-bundle time budget in seconds; slower bundles are reported as deadline_exceeded")
     query_parser.add_argument("--trace", action="store_true", help="Include diagnostic trace and generate federation_trace.json (and federation_conflicts.json if applicable) in CWD")
 
 
@@ -132,7 +134,9 @@ def handle_federation_command(args: argparse.Namespace) -> int:
                     query_text=args.query,
                     k=args.k,
                     filters=filters,
-                    trace=args.trace
+                    trace=args.trace,
+                    max_concurrency=args.max_concurrency,
+                    bundle_deadline_s=args.bundle_deadline,
                 )
             else:
                 res = execute_federated_query_from_bundles(
@@ -143,6 +147,8 @@ def handle_federation_command(args: argparse.Namespace) -> int:
                     trace=args.trace,
                     federation_id=args.federation_id,
                     base_path=Path.cwd(),
+                    max_concurrency=args.max_concurrency,
+                    bundle_deadline_s=args.bundle_deadline,
                 )
             print(json.dumps(res, indent=2))
 
@@ -30,11 +30,13 @@ def run_index(args: argparse.Namespace) -> int:
             return 1
 
     if out_path.exists() and not args.rebuild:
-        if index_db.verify_index(out_path, dump_path, chunk_path):
+        if index_db.verify_index(
+            out_path, dump_path, chunk_path, code_tokens=args.code_tokens, trigram=args.trigram
+        ):
             print(f"Index {out_path} is already up-to-date. Use --rebuild to force.")
             return 0
         else:
-            print(f"Index {out_path} is stale. Rebuilding...")
+            print(f"Index {out_path} is stale or was built with other FTS options. Rebuilding...")
 
     print(f"Building index from {chunk_path.name}...")
     try:
@@ -52,7 +54,14 @@ def run_index(args: argparse.Namespace) -> int:
             except Exception:
                 pass
 
-        index_db.build_index(dump_path, chunk_path, out_path, config_payload=config_payload)
+        index_db.build_index(
+            dump_path,
+            chunk_path,
+            out_path,
+            config_payload=config_payload,
+            code_tokens=args.code_tokens,
+            trigram=args.trigram,
+        )
         print(f"✅ Index built successfully: {out_path}")
         return 0
     except Exception as e:
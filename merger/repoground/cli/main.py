@@ -93,6 +93,8 @@ def main(args: Optional[List[str]] = None) -> int:
     index_parser.add_argument("--out", help="Output path for SQLite index")
     index_parser.add_argument("--rebuild", action="store_true", help="Force rebuild of index")
     index_parser.add_argument("--verify", action="store_true", help="Verify existing index freshness")
+    index_parser.add_argument("--code-tokens", action="store_true", help="Also index camelCase identifier subwords")
+    index_parser.add_argument("--trigram", action="store_true", help="Add a trigram side-index for substring queries")
 
     # Query command
     query_parser = subparsers.add_parser("query", help="Query the retrieval index")
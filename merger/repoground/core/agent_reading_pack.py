@@ -35,6 +35,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .artifact_io import sha256_file
 from .citation_map import byte_range_to_line_range, normalize_canonical_range
 from .claim_evidence_diagnostics import (
     claim_absence_reason_detail,
@@ -42,6 +43,7 @@ from .claim_evidence_diagnostics import (
 )
 from .check_view import compact_check_projection
 from .constants import ArtifactRole
+from .line_index import LineIndex
 from .path_security import resolve_secure_path
 
 PRODUCED_BY = "agent_reading_pack_producer/v1"
@@ -104,11 +106,7 @@ def _normalize_relative_path(raw: str, label: str) -> str:
 
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for buf in iter(lambda: f.read(65536), b""):
-            h.update(buf)
-    return h.hexdigest()
+    return sha256_file(path)
 
 
 def _sha256_bytes(data: bytes) -> str:
@@ -320,9 +318,10 @@ def compute_top_files(
                 entry["end"] = max(entry["end"], end_byte)
 
     top: List[TopFile] = []
+    line_index = LineIndex(canonical_md_bytes) if agg else None
     for entry in agg.values():
         start_line, end_line = byte_range_to_line_range(
-            canonical_md_bytes, entry["start"], entry["end"]
+            canonical_md_bytes, entry["start"], entry["end"], line_index
         )
         top.append(
             TopFile(
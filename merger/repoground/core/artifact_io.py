@@ -7,35 +7,168 @@ it without creating import cycles.
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import hashlib
 import json
 import os
 import tempfile
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 
 _SHA256_READ_CHUNK_BYTES = 65536
 
+FileIdentity = Tuple[str, int, int, int]
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class DigestRegistry:
+    """SHA-256 digests of files written or hashed during one bundle run.
+
+    Entries are keyed by ``(path, inode, mtime_ns, size)``. A file that is
+    replaced or rewritten after its digest was recorded no longer matches its
+    key, so a stale digest is never returned; the file is simply hashed again.
+    """
+
+    def __init__(self) -> None:
+        self._digests: Dict[FileIdentity, str] = {}
+        self.counters: Dict[str, int] = {"recorded": 0, "hits": 0, "misses": 0}
+
+    @staticmethod
+    def identity(path: Path) -> Optional[FileIdentity]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return os.path.abspath(path), st.st_ino, st.st_mtime_ns, st.st_size
+
+    def record(self, identity: Optional[FileIdentity], sha256: str) -> None:
+        if identity is None:
+            return
+        self._digests[identity] = sha256
+        self.counters["recorded"] += 1
+
+    def lookup(self, identity: Optional[FileIdentity]) -> Optional[str]:
+        digest = self._digests.get(identity) if identity is not None else None
+        self.counters["hits" if digest is not None else "misses"] += 1
+        return digest
+
+
+_ACTIVE_DIGEST_REGISTRY: ContextVar[Optional[DigestRegistry]] = ContextVar(
+    "repoground_digest_registry", default=None
+)
+
+
+def active_digest_registry() -> Optional[DigestRegistry]:
+    """Return the registry of the enclosing ``digest_registry_scope``, if any."""
+
+    return _ACTIVE_DIGEST_REGISTRY.get()
+
+
+@contextlib.contextmanager
+def digest_registry_scope() -> Iterator[DigestRegistry]:
+    """Activate a digest registry; nested scopes share the outer registry."""
+
+    registry = _ACTIVE_DIGEST_REGISTRY.get()
+    if registry is not None:
+        yield registry
+        return
+    registry = DigestRegistry()
+    token = _ACTIVE_DIGEST_REGISTRY.set(registry)
+    try:
+        yield registry
+    finally:
+        _ACTIVE_DIGEST_REGISTRY.reset(token)
+
+
+def with_digest_registry(func: _F) -> _F:
+    """Run ``func`` inside a ``digest_registry_scope``."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with digest_registry_scope():
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class HashingWriter:
+    """Binary file writer that hashes bytes while they are written.
+
+    ``str`` input is encoded as UTF-8 without newline translation. Closing
+    the writer records the digest in the active digest registry, so later
+    ``compute_file_sha256`` calls for the same file skip re-reading it. A
+    writer closed by an exception records nothing.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._handle = path.open("wb")
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    def write(self, data: Union[str, bytes]) -> int:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._handle.write(data)
+        self._hash.update(data)
+        self.size += len(data)
+        return len(data)
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        self._handle.close()
+        registry = _ACTIVE_DIGEST_REGISTRY.get()
+        if registry is not None:
+            registry.record(registry.identity(self.path), self.sha256)
+
+    def __enter__(self) -> "HashingWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is not None:
+            self._handle.close()
+            return
+        self.close()
+
+
+def write_text_hashed(path: Path, text: str) -> str:
+    """Write ``text`` as UTF-8 to ``path`` and return its SHA-256."""
+
+    with HashingWriter(path) as writer:
+        writer.write(text)
+    return writer.sha256
+
 
 def write_text_atomic(path: Path, text: str) -> None:
     """Write ``text`` to ``path`` via a same-directory temporary file."""
 
     path.parent.mkdir(parents=True, exist_ok=True)
+    data = text.encode("utf-8")
     tmp_path: Optional[Path] = None
     try:
         with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
+            mode="wb",
             delete=False,
             dir=str(path.parent),
             prefix=f".{path.name}.",
             suffix=".tmp",
         ) as tmp_file:
-            tmp_file.write(text)
+            tmp_file.write(data)
             tmp_file.flush()
             os.fsync(tmp_file.fileno())
             tmp_path = Path(tmp_file.name)
         os.replace(tmp_path, path)
+        registry = _ACTIVE_DIGEST_REGISTRY.get()
+        if registry is not None:
+            registry.record(registry.identity(path), hashlib.sha256(data).hexdigest())
     finally:
         if tmp_path is not None and tmp_path.exists():
             try:
@@ -44,18 +177,39 @@ def write_text_atomic(path: Path, text: str) -> None:
                 pass
 
 
+def sha256_file(path: Path) -> str:
+    """Return the SHA-256 of ``path``; raise ``OSError`` if it cannot be read.
+
+    Inside a ``digest_registry_scope`` a digest recorded for the same file
+    identity is returned without reading the file, and fresh digests are
+    recorded for later callers.
+    """
+
+    registry = _ACTIVE_DIGEST_REGISTRY.get()
+    identity = registry.identity(path) if registry is not None else None
+    if registry is not None:
+        cached = registry.lookup(identity)
+        if cached is not None:
+            return cached
+
+    sha256 = hashlib.sha256()
+    with path.open("rb") as f:
+        while True:
+            chunk = f.read(_SHA256_READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            sha256.update(chunk)
+    digest = sha256.hexdigest()
+    if registry is not None and registry.identity(path) == identity:
+        registry.record(identity, digest)
+    return digest
+
+
 def compute_file_sha256(path: Path) -> str:
     """Compute SHA256 hash of a file using chunked reading for memory efficiency."""
 
-    sha256 = hashlib.sha256()
     try:
-        with path.open("rb") as f:
-            while True:
-                chunk = f.read(_SHA256_READ_CHUNK_BYTES)
-                if not chunk:
-                    break
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return sha256_file(path)
     except OSError:
         return "ERROR"
 
@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .artifact_io import (
     compute_file_sha256,
@@ -122,6 +122,57 @@ def write_python_call_graph_json(
     )
 
 
+def write_python_analysis_sidecars(
+    *,
+    base_manifest_path: Path,
+    repo_summaries: List[Dict[str, Any]],
+    final_dump_index: Optional[Path],
+    run_id: str,
+    facts_cache: Any = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[Optional[Path], Optional[Path], Optional[Dict[str, float]]]:
+    """Emit the Python Symbol Index and Call Graph from one parse of the repo.
+
+    ``facts_cache`` is an optional ``AstFactsCache`` serving unchanged files;
+    ``max_workers > 1`` parses the rest in a process pool.
+    Returns both sidecar paths and the per-analyzer timings in milliseconds,
+    or ``(None, None, None)`` when the bundle has no single repository root.
+    """
+
+    repo_root = _single_repo_root(repo_summaries, final_dump_index)
+    if repo_root is None:
+        return None, None, None
+    canonical_sha = compute_file_sha256(final_dump_index)
+    if not is_sha256_digest(canonical_sha):
+        return None, None, None
+    from merger.repoground.architecture.call_graph import (
+        CallGraphAnalyzer,
+        call_graph_document,
+    )
+    from merger.repoground.architecture.python_analysis import run_python_analysis
+    from merger.repoground.architecture.symbol_index import (
+        SymbolIndexAnalyzer,
+        symbol_index_document,
+    )
+
+    symbols = SymbolIndexAnalyzer()
+    calls = CallGraphAnalyzer()
+    report = run_python_analysis(
+        repo_root, [symbols, calls], facts_cache=facts_cache, max_workers=max_workers
+    )
+    symbol_index_path = _write_provenance_document(
+        base_manifest_path=base_manifest_path,
+        suffix=".python_symbol_index.json",
+        document=symbol_index_document(symbols, report, run_id, canonical_sha),
+    )
+    call_graph_path = _write_provenance_document(
+        base_manifest_path=base_manifest_path,
+        suffix=".python_call_graph.json",
+        document=call_graph_document(calls, report, run_id, canonical_sha),
+    )
+    return symbol_index_path, call_graph_path, report.timings_ms()
+
+
 def write_lens_cards_jsonl(
     *,
     base_manifest_path: Path,
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from merger.repoground.core.citation_id import make_citation_id
+from merger.repoground.core.line_index import LineIndex
 from merger.repoground.core.path_security import resolve_secure_path
 
 
@@ -425,20 +426,22 @@ def byte_range_to_line_range(
     canonical_md_bytes: bytes,
     start_byte: int,
     end_byte: int,
+    line_index: Optional[LineIndex] = None,
 ) -> Tuple[int, int]:
     """
     Compute 1-based global line numbers for [start_byte, end_byte) within canonical_md.
 
-    Counts b'\\n' bytes directly without decoding; does not allocate slices.
+    Looks newline offsets up in ``line_index`` (built from canonical_md_bytes
+    when not supplied); callers resolving many ranges should build it once.
     Assumes 0 <= start_byte < end_byte <= len(canonical_md_bytes).
 
     start_line: line containing the byte at start_byte.
     end_line:   line containing the last included byte (end_byte - 1).
     A b'\\n' byte belongs to the line it terminates.
     """
-    start_line = 1 + canonical_md_bytes.count(b"\n", 0, start_byte)
-    end_line = 1 + canonical_md_bytes.count(b"\n", 0, end_byte - 1)
-    return start_line, end_line
+    if line_index is None:
+        line_index = LineIndex(canonical_md_bytes)
+    return line_index.line_range(start_byte, end_byte)
 
 
 def verify_byte_range_hash(
@@ -506,6 +509,7 @@ def iter_chunk_results(
         "canonical_md_path": canonical_md_rel,
         "canonical_md_sha256": canonical_md_sha256,
     }
+    line_index = LineIndex(canonical_md_bytes)
 
     with chunk_index_path.open("r", encoding="utf-8") as f:
         for lineno, raw_line in enumerate(f, start=1):
@@ -607,7 +611,7 @@ def iter_chunk_results(
             # Input start_line/end_line are ignored: they are source-file-local
             # from the generator. Output line numbers are always canonical_md-global.
             start_line, end_line = byte_range_to_line_range(
-                canonical_md_bytes, start_byte, end_byte
+                canonical_md_bytes, start_byte, end_byte, line_index
             )
 
             # --- derive citation_id ---
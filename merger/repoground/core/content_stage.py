@@ -0,0 +1,264 @@
+"""Per-run content stage shared by the bundle emitters.
+
+``write_reports_v2`` renders the canonical Markdown, the chunk index and the
+JSON sidecar from the same set of included files. Each emitter used to read,
+decode, redact and hash every file on its own. The stage does that work once
+per file and hands the result to every consumer of the run.
+
+Resident text is bounded by a memory budget. Entries that would exceed it are
+spilled as UTF-8 into an anonymous temporary file and read back through
+``mmap``, so a large tree costs one source read per file instead of one per
+emitter, without holding the whole tree in memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import tempfile
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Dict, Optional, Tuple
+
+DEFAULT_CONTENT_STAGE_BUDGET_BYTES = 256 * 1024 * 1024
+
+ContentReader = Callable[[Any, int], Tuple[str, bool, str]]
+
+
+@dataclass(frozen=True)
+class StagedContent:
+    """One file's decoded content plus the digests the emitters need.
+
+    ``text`` is the decoded source text. ``redacted`` is the text emitted into
+    redacting artifacts; it is ``text`` itself when redaction is disabled or
+    matched nothing. Digests and byte counts cover the UTF-8 encoding.
+    """
+
+    text: str
+    redacted: str
+    truncated: bool
+    trunc_msg: str
+    was_redacted: bool
+    text_sha256: str
+    text_bytes: int
+    redacted_sha256: str
+    redacted_bytes: int
+
+
+@dataclass(frozen=True)
+class _SpilledContent:
+    truncated: bool
+    trunc_msg: str
+    was_redacted: bool
+    text_sha256: str
+    text_bytes: int
+    redacted_sha256: str
+    redacted_bytes: int
+    text_span: Tuple[int, int]
+    redacted_span: Optional[Tuple[int, int]]
+
+
+class ContentStage:
+    """Read, decode, redact and hash each included file exactly once per run.
+
+    ``reader`` has the ``read_smart_content`` signature. ``redactor`` is any
+    object with a ``redact(text) -> (text, modified)`` method; the stage's
+    redaction setting applies to every consumer that asks for redacted text.
+    With ``retain=False`` the stage computes entries without caching them,
+    which keeps standalone emitter calls at their historic memory profile.
+    """
+
+    def __init__(
+        self,
+        reader: ContentReader,
+        *,
+        redactor: Optional[Any] = None,
+        memory_budget_bytes: int = DEFAULT_CONTENT_STAGE_BUDGET_BYTES,
+        retain: bool = True,
+    ) -> None:
+        self._reader = reader
+        self._redactor = redactor
+        self._budget = max(0, int(memory_budget_bytes))
+        self._retain = retain
+        self._entries: Dict[Tuple[str, int], Any] = {}
+        self._resident_bytes = 0
+        self._spill: Optional[BinaryIO] = None
+        self._spill_size = 0
+        self._map: Optional[mmap.mmap] = None
+        self.counters: Dict[str, int] = {
+            "source_reads": 0,
+            "cache_hits": 0,
+            "cached_entries": 0,
+            "spilled_entries": 0,
+            "spilled_bytes": 0,
+            "spill_reads": 0,
+        }
+
+    @property
+    def redacts(self) -> bool:
+        return self._redactor is not None
+
+    @property
+    def resident_bytes(self) -> int:
+        return self._resident_bytes
+
+    def contains(self, fi: Any, max_file_bytes: int) -> bool:
+        return self._key(fi, max_file_bytes) in self._entries
+
+    def put(
+        self, fi: Any, max_file_bytes: int, staged: StagedContent, *, from_cache: bool = False
+    ) -> None:
+        """Record content staged elsewhere, e.g. by a worker process.
+
+        The worker's read is counted as a source read of this stage; content
+        taken from an earlier build's cache (``from_cache``) was never read
+        and is counted as a cached entry instead.
+        """
+        key = self._key(fi, max_file_bytes)
+        if key in self._entries:
+            return
+        self.counters["cached_entries" if from_cache else "source_reads"] += 1
+        if self._retain:
+            self._store(key, staged)
+
+    def get(self, fi: Any, max_file_bytes: int) -> StagedContent:
+        """Return the staged content for ``fi``, reading it on first use."""
+        key = self._key(fi, max_file_bytes)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self.counters["cache_hits"] += 1
+            if isinstance(cached, _SpilledContent):
+                return self._load_spilled(cached)
+            return cached
+
+        staged = self._read(fi, max_file_bytes)
+        if self._retain:
+            self._store(key, staged)
+        return staged
+
+    def close(self) -> None:
+        """Release resident entries and the spill file."""
+        self._entries.clear()
+        self._resident_bytes = 0
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        self._spill_size = 0
+
+    def __enter__(self) -> "ContentStage":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def _key(fi: Any, max_file_bytes: int) -> Tuple[str, int]:
+        return str(fi.abs_path), int(max_file_bytes or 0)
+
+    def _read(self, fi: Any, max_file_bytes: int) -> StagedContent:
+        self.counters["source_reads"] += 1
+        text, truncated, trunc_msg = self._reader(fi, max_file_bytes)
+        text_bytes = text.encode("utf-8")
+        text_sha256 = hashlib.sha256(text_bytes).hexdigest()
+
+        redacted = text
+        was_redacted = False
+        if self._redactor is not None:
+            redacted, was_redacted = self._redactor.redact(text)
+            was_redacted = bool(was_redacted)
+
+        if was_redacted:
+            redacted_bytes = redacted.encode("utf-8")
+            redacted_sha256 = hashlib.sha256(redacted_bytes).hexdigest()
+            redacted_len = len(redacted_bytes)
+        else:
+            redacted = text
+            redacted_sha256 = text_sha256
+            redacted_len = len(text_bytes)
+
+        return StagedContent(
+            text=text,
+            redacted=redacted,
+            truncated=truncated,
+            trunc_msg=trunc_msg,
+            was_redacted=was_redacted,
+            text_sha256=text_sha256,
+            text_bytes=len(text_bytes),
+            redacted_sha256=redacted_sha256,
+            redacted_bytes=redacted_len,
+        )
+
+    def _store(self, key: Tuple[str, int], staged: StagedContent) -> None:
+        # Sizes are estimated from UTF-8 lengths; the redacted copy only costs
+        # memory when redaction actually changed the text.
+        cost = staged.text_bytes
+        if staged.was_redacted:
+            cost += staged.redacted_bytes
+        if self._resident_bytes + cost <= self._budget:
+            self._entries[key] = staged
+            self._resident_bytes += cost
+            return
+        self._entries[key] = self._spill_entry(staged)
+
+    def _spill_entry(self, staged: StagedContent) -> _SpilledContent:
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(prefix="repoground-content-stage-")
+        text_span = self._append(staged.text.encode("utf-8"))
+        redacted_span = (
+            self._append(staged.redacted.encode("utf-8")) if staged.was_redacted else None
+        )
+        self.counters["spilled_entries"] += 1
+        return _SpilledContent(
+            truncated=staged.truncated,
+            trunc_msg=staged.trunc_msg,
+            was_redacted=staged.was_redacted,
+            text_sha256=staged.text_sha256,
+            text_bytes=staged.text_bytes,
+            redacted_sha256=staged.redacted_sha256,
+            redacted_bytes=staged.redacted_bytes,
+            text_span=text_span,
+            redacted_span=redacted_span,
+        )
+
+    def _append(self, data: bytes) -> Tuple[int, int]:
+        assert self._spill is not None
+        start = self._spill_size
+        self._spill.seek(start)
+        self._spill.write(data)
+        self._spill_size += len(data)
+        self.counters["spilled_bytes"] += len(data)
+        return start, self._spill_size
+
+    def _slice(self, span: Tuple[int, int]) -> str:
+        start, end = span
+        if start == end:
+            return ""
+        if self._map is None or len(self._map) < end:
+            assert self._spill is not None
+            self._spill.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._spill.fileno(), self._spill_size, access=mmap.ACCESS_READ)
+        return self._map[start:end].decode("utf-8")
+
+    def _load_spilled(self, spilled: _SpilledContent) -> StagedContent:
+        self.counters["spill_reads"] += 1
+        text = self._slice(spilled.text_span)
+        redacted = (
+            self._slice(spilled.redacted_span)
+            if spilled.redacted_span is not None
+            else text
+        )
+        return StagedContent(
+            text=text,
+            redacted=redacted,
+            truncated=spilled.truncated,
+            trunc_msg=spilled.trunc_msg,
+            was_redacted=spilled.was_redacted,
+            text_sha256=spilled.text_sha256,
+            text_bytes=spilled.text_bytes,
+            redacted_sha256=spilled.redacted_sha256,
+            redacted_bytes=spilled.redacted_bytes,
+        )
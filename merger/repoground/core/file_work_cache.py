@@ -0,0 +1,180 @@
+"""Persistent per-file work cache for repeated builds of the same sources.
+
+``write_reports_v2`` reads, decodes, redacts and chunks every included text
+file. When a repo is dumped again with only a few files changed, most of that
+work is repeated for identical content. ``FileWorkCache`` keeps the staged
+content and chunk plan of each file on disk, keyed by the file's full-content
+MD5 (computed by ``scan_repo`` anyway), its size and identity, and every
+setting that shapes the result. A hit skips the source read entirely.
+
+Only inputs are cached, never run-dependent output: the report, chunk records
+and sidecar are still emitted for the new run, so their byte offsets and
+canonical ranges always match the new artifacts. Entries hold the decoded
+source text, so builds with ``redact_secrets`` bypass the cache entirely, and
+callers only store content they have checked against the scanned MD5.
+
+Entries are JSON files sharded by key prefix. The cache is bounded; the least
+recently used entries are pruned once it grows past ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .chunker import Chunk
+from .content_stage import StagedContent
+
+logger = logging.getLogger(__name__)
+
+# Bump when reading, redaction or chunking changes what a file stages to.
+FILE_WORK_CACHE_VERSION = 2
+DEFAULT_FILE_WORK_CACHE_BYTES = 512 * 1024 * 1024
+
+_READ_ERROR_PREFIX = "_Error reading file:"
+
+PlanParts = Tuple[Dict[str, Any], List[Chunk], Optional[str]]
+
+
+class FileWorkCache:
+    """On-disk cache of ``(StagedContent, chunk plan)`` per file content."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        salt: str = "",
+        max_bytes: int = DEFAULT_FILE_WORK_CACHE_BYTES,
+    ) -> None:
+        self.root = Path(root)
+        self.salt = salt
+        self.max_bytes = max(0, int(max_bytes))
+        self.counters: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "pruned": 0}
+
+    def _key(self, fi: Any, max_file_bytes: int, redact_secrets: bool) -> Optional[str]:
+        md5 = getattr(fi, "md5", "") or ""
+        if redact_secrets or not md5 or md5 == "ERROR":
+            # Redacting builds must not persist the unredacted text.
+            return None
+        ident = [
+            FILE_WORK_CACHE_VERSION,
+            self.salt,
+            md5,
+            int(fi.size),
+            fi.root_label,
+            Path(fi.rel_path).as_posix(),
+            int(max_file_bytes or 0),
+        ]
+        return hashlib.sha256(json.dumps(ident).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(
+        self,
+        fi: Any,
+        max_file_bytes: int,
+        redact_secrets: bool,
+        *,
+        with_chunks: bool,
+    ) -> Optional[Tuple[StagedContent, Optional[PlanParts]]]:
+        key = self._key(fi, max_file_bytes, redact_secrets)
+        if key is None:
+            return None
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if with_chunks and entry.get("plan") is None:
+                raise KeyError("plan")
+            staged_fields = entry["staged"]
+            staged_fields["redacted"] = staged_fields["text"]
+            staged = StagedContent(**staged_fields)
+            plan: Optional[PlanParts] = None
+            if with_chunks:
+                raw = entry["plan"]
+                plan = (
+                    raw["sem_meta"],
+                    [Chunk(**c) for c in raw["chunks"]],
+                    raw["source_git_blob_sha1"],
+                )
+        except FileNotFoundError:
+            self.counters["misses"] += 1
+            return None
+        except Exception as exc:
+            logger.debug("Ignoring unreadable file work cache entry %s: %s", path, exc)
+            self.counters["misses"] += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.counters["hits"] += 1
+        return staged, plan
+
+    def put(
+        self,
+        fi: Any,
+        max_file_bytes: int,
+        redact_secrets: bool,
+        staged: StagedContent,
+        plan: Optional[Sequence[Any]] = None,
+    ) -> None:
+        key = self._key(fi, max_file_bytes, redact_secrets)
+        if key is None or staged.text.startswith(_READ_ERROR_PREFIX):
+            return
+        staged_fields = dataclasses.asdict(staged)
+        # Without redaction ``redacted`` is ``text`` itself.
+        staged_fields["redacted"] = None
+        entry: Dict[str, Any] = {"staged": staged_fields, "plan": None}
+        if plan is not None:
+            sem_meta, chunks, source_git_blob_sha1 = plan
+            entry["plan"] = {
+                "sem_meta": sem_meta,
+                "chunks": [dataclasses.asdict(c) for c in chunks],
+                "source_git_blob_sha1": source_git_blob_sha1,
+            }
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp_", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, separators=(",", ":"))
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except Exception as exc:
+            logger.debug("Could not store file work cache entry %s: %s", path, exc)
+            return
+        self.counters["stores"] += 1
+
+    def prune(self) -> None:
+        """Drop least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+            total += st.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            self.counters["pruned"] += 1
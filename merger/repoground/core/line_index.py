@@ -0,0 +1,53 @@
+"""Byte-offset to line-number lookup for canonical artifacts.
+
+Chunk and citation producers map many byte ranges of the same canonical_md
+part to 1-based line numbers. Counting newlines from the start of the file for
+every lookup is O(size) per range; ``LineIndex`` records the newline offsets
+once and answers each lookup with a binary search.
+
+This module is a dependency-free leaf, like ``artifact_io``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Tuple
+
+
+class LineIndex:
+    """Sorted newline offsets of one immutable byte buffer."""
+
+    __slots__ = ("_newlines", "size")
+
+    def __init__(self, data: bytes) -> None:
+        newlines = array("Q")
+        find = data.find
+        pos = find(b"\n")
+        while pos != -1:
+            newlines.append(pos)
+            pos = find(b"\n", pos + 1)
+        self._newlines = newlines
+        self.size = len(data)
+
+    @property
+    def newline_count(self) -> int:
+        return len(self._newlines)
+
+    def line_for_byte(self, byte_offset: int) -> int:
+        """Return the 1-based line of the byte at ``byte_offset`` (>= 0).
+
+        Equals ``data.count(b"\\n", 0, byte_offset) + 1``: a newline byte
+        belongs to the line it terminates.
+        """
+        return bisect_left(self._newlines, byte_offset) + 1
+
+    def line_range(self, start_byte: int, end_byte: int) -> Tuple[int, int]:
+        """Return the lines of the first and last byte of ``[start_byte, end_byte)``.
+
+        Empty ranges map to the line of ``start_byte`` for both ends.
+        """
+        return (
+            self.line_for_byte(start_byte),
+            self.line_for_byte(max(start_byte, end_byte - 1)),
+        )
@@ -17,27 +17,37 @@ import unicodedata
 import concurrent.futures
 import functools
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any, Iterator, NamedTuple, Set
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Any, Iterator, NamedTuple, Set
 from dataclasses import dataclass, asdict
 
 from . import bundle_sidecars, lenses
 from .artifact_io import (
+    HashingWriter,
+    active_digest_registry,
     append_unique_path as _append_unique_path,
     compute_file_sha256 as _compute_file_sha256,
     json_safe as _json_safe,
+    with_digest_registry,
     write_text_atomic as _write_text_atomic,
+    write_text_hashed as _write_text_hashed,
 )
 from .constants import (
     ArtifactRole,
     CLAIM_EVIDENCE_MAP_ABSENCE_REASON_LINK_KEY,
 )
 from . import clock
-from .chunker import Chunker
+from .chunker import Chunk, Chunker
+from .content_stage import ContentStage, StagedContent
+from .file_work_cache import FileWorkCache
+from .line_index import LineIndex
 from .redactor import Redactor
 from .range_resolver import build_explicit_range_ref
 from .yaml_compat import ensure_pyyaml_collections_abc_compat
 from . import __core_version__ as CORE_VERSION
 
+if TYPE_CHECKING:
+    from ..architecture.ast_facts_cache import AstFactsCache
+
 try:
     import yaml  # PyYAML
 except Exception:  # pragma: no cover
@@ -528,15 +538,6 @@ def resolve_canonical_md(md_parts: List[Path]) -> Optional[Path]:  # lenskit:req
     return md_parts[0] if md_parts else None
 
 
-def _line_for_byte(data: bytes, byte_offset: int) -> int:
-    """Return the 1-based line number of the byte at byte_offset in data.
-
-    Counts the number of newlines in data before byte_offset and adds 1.
-    For an exclusive end_byte, pass max(start_byte, end_byte - 1) to get
-    the line of the last byte in the range without underflowing empty chunks.
-    """
-    return data.count(b"\n", 0, byte_offset) + 1
-
 def _validate_agent_json_dict(d: Dict[str, Any], allow_empty_primary: bool = False) -> None:
     """
     Minimal, dependency-free validation. Purpose: prevent "success but nothing usable".
@@ -2070,12 +2071,16 @@ def human_size(n: float) -> str:
     return f"{size:.2f} GB"
 
 
+# Files above this size are not sniffed for null bytes and count as binary.
+TEXT_DETECTION_MAX_BYTES = 20 * 1024 * 1024  # 20 MiB
+
+
 def is_probably_text(path: Path, size: int) -> bool:
     name = path.name.lower()
     base, ext = os.path.splitext(name)
     if ext in TEXT_EXTENSIONS or name in TEXT_EXTENSIONS:
         return True
-    if size > 20 * 1024 * 1024:  # 20 MiB
+    if size > TEXT_DETECTION_MAX_BYTES:
         return False
     try:
         with path.open("rb") as f:
@@ -2119,13 +2124,17 @@ def _compute_git_blob_sha1(path: Path) -> str | None:
     return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
 
 
-def compute_md5(path: Path, limit_bytes: Optional[int] = None) -> str:
+def _new_md5():
     # MD5 is used for file integrity checking, not cryptographic security
     try:
-        h = hashlib.md5(usedforsecurity=False)
+        return hashlib.md5(usedforsecurity=False)
     except TypeError:
         # Fallback for Python < 3.9
-        h = hashlib.md5()  # nosec B303
+        return hashlib.md5()  # nosec B303
+
+
+def compute_md5(path: Path, limit_bytes: Optional[int] = None) -> str:
+    h = _new_md5()
     try:
         with path.open("rb") as f:
             remaining = limit_bytes
@@ -3148,11 +3157,57 @@ def read_smart_content(fi: FileInfo, max_bytes: int, encoding="utf-8") -> Tuple[
     Truncation is disabled in v2.3+ per user request (files are split across parts if needed).
     max_bytes is ignored here, effectively reading the full file.
     """
+    text, _ = _read_source_text(fi, encoding)
+    return text, False, ""
+
+
+def _read_source_text(
+    fi: FileInfo, encoding: str = "utf-8", *, with_md5: bool = False
+) -> Tuple[str, Optional[str]]:
+    """Read ``fi`` once and decode it like a text-mode ``open(errors="replace")``
+    (universal newlines). With ``with_md5`` the MD5 of the raw bytes comes
+    along, so callers can check them against the scan without a second read;
+    it is ``None`` otherwise and when the file cannot be read.
+    """
     try:
-        with fi.abs_path.open("r", encoding=encoding, errors="replace") as f:
-            return f.read(), False, ""
+        raw = fi.abs_path.read_bytes()
     except OSError as e:
-        return f"_Error reading file: {e}_", False, ""
+        return f"_Error reading file: {e}_", None
+    digest = None
+    if with_md5:
+        h = _new_md5()
+        h.update(raw)
+        digest = h.hexdigest()
+    text = raw.decode(encoding, errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    return text, digest
+
+def _new_content_stage(redact_secrets: bool, *, retain: bool = True) -> ContentStage:
+    """Create the content stage that feeds the report, chunk and sidecar emitters.
+
+    The reader resolves ``read_smart_content`` at call time so the module-level
+    function stays the single patch point for content reads. Both it and the
+    MD5-checking reader of ``_prepare_file_worker`` go through
+    ``_read_source_text``.
+    """
+    return ContentStage(
+        lambda fi, max_bytes: read_smart_content(fi, max_bytes),
+        redactor=Redactor() if redact_secrets else None,
+        retain=retain,
+    )
+
+
+def _resolve_content_stage(
+    content_stage: Optional[ContentStage], redact_secrets: bool
+) -> ContentStage:
+    """Return the shared stage, or a non-retaining one for standalone calls."""
+    if content_stage is None:
+        return _new_content_stage(redact_secrets, retain=False)
+    if content_stage.redacts != bool(redact_secrets):
+        raise ValueError(
+            "content_stage redaction setting does not match redact_secrets"
+        )
+    return content_stage
+
 
 def is_priority_file(fi: FileInfo) -> bool:
     if "ai-context" in fi.tags: return True
@@ -3602,11 +3657,12 @@ def iter_report_blocks(
     meta_density: str = "auto",
     meta_none: bool = False,
     redact_secrets: bool = False,
+    content_stage: Optional[ContentStage] = None,
 ) -> Iterator[str]:
     if extras is None:
         extras = ExtrasConfig.none()
 
-    redactor = Redactor() if redact_secrets else None
+    stage = _resolve_content_stage(content_stage, redact_secrets)
 
     # --- hard safety defaults (prevents UnboundLocalError even under refactors) ---
     content_present = False
@@ -4518,13 +4574,13 @@ def iter_report_blocks(
             current_root = fi.root_label
 
         # Read content early to get byte count for marker
-        content, truncated, trunc_msg = read_smart_content(fi, max_file_bytes)
-        if redactor:
-            content, _ = redactor.redact(content)
+        staged = stage.get(fi, max_file_bytes)
+        content = staged.redacted
+        truncated = staged.truncated
 
-        # Calculate SHA256 of content for marker
-        content_sha256 = hashlib.sha256(content.encode("utf-8")).hexdigest()
-        content_bytes = len(content.encode("utf-8"))
+        # SHA256 and byte count of the emitted (redacted) content for the marker
+        content_sha256 = staged.redacted_sha256
+        content_bytes = staged.redacted_bytes
 
         block = ["---"]
 
@@ -4859,11 +4915,15 @@ def generate_json_sidecar(
     redact_secrets: bool = False,
     split_size_bytes: int = 0,
     include_hidden: bool = True,
+    content_stage: Optional[ContentStage] = None,
 ) -> Dict[str, Any]:
     """
     Generate a JSON sidecar structure for machine consumption.
     Contains meta, files array, and minimal verification guards.
+    Content facts describe the unredacted source text, so only
+    ``StagedContent.text`` is consumed from a shared ``content_stage``.
     """
+    stage = content_stage or _new_content_stage(False, retain=False)
     now = clock.now_utc()
     requested_flags = requested_flags or {"plan_only": plan_only, "code_only": code_only, "meta_none": meta_none}
     plan_only, code_only, meta_none, normalized_requested = _normalize_mode_flags(
@@ -5045,7 +5105,8 @@ def generate_json_sidecar(
 
         if evidence in ("full", "snippet"):
              # Read content to get truthful char count (Task T-Fix1)
-             content, _, _ = read_smart_content(fi, max_file_bytes)
+             staged = stage.get(fi, max_file_bytes)
+             content = staged.text
              chars_seen = len(content)
              contact_entry["chars_seen"] = chars_seen
 
@@ -5055,7 +5116,7 @@ def generate_json_sidecar(
              file_obj.update(retrieval_meta)
 
              # SHA256 (computed from content)
-             file_obj["sha256"] = hashlib.sha256(content.encode("utf-8")).hexdigest()
+             file_obj["sha256"] = staged.text_sha256
              file_obj["language"] = lang
 
         contact_list.append(contact_entry)
@@ -5153,7 +5214,7 @@ def generate_derived_manifest(base_name_func, run_id, dump_sha256, artifacts_map
         "repos": repo_names,
         "artifacts": dict(sorted(artifacts_block.items()))
     }
-    out_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    _write_text_hashed(out_path, json.dumps(data, indent=2, sort_keys=True))
     return out_path
 
 
@@ -5169,7 +5230,7 @@ def _handle_snapshot_retrieval_measurement_error(exc, *, debug: bool) -> None:
         )
 
 
-def build_derived_artifacts(dump_index_path, chunk_path, base_name_func, run_id, hub_path, generator_info, repo_names, debug, repo_summaries=None) -> List[Path]:
+def build_derived_artifacts(dump_index_path, chunk_path, base_name_func, run_id, hub_path, generator_info, repo_names, debug, repo_summaries=None, ast_facts_cache=None) -> List[Path]:
     derived_paths = []
     sqlite_index_path = None
     eval_json_path = None
@@ -5255,6 +5316,7 @@ def build_derived_artifacts(dump_index_path, chunk_path, base_name_func, run_id,
             run_id=run_id,
             canonical_dump_index_sha256=dump_sha256,
             generated_at=clock.now_utc().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            facts_cache=ast_facts_cache,
         )
         architecture_graph_path = source_result.graph_path
         entrypoints_path = source_result.entrypoints_path
@@ -5443,7 +5505,7 @@ def generate_dump_index(base_name_func, run_id, artifacts_map, generator_info, r
         "artifacts": dict(sorted(artifacts_block.items())),
     }
 
-    out_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    _write_text_hashed(out_path, json.dumps(data, indent=2, sort_keys=True))
     return out_path
 
 
@@ -5470,6 +5532,7 @@ class _ReportRunConfig:
     output_mode: str
     redact_secrets: bool
     debug: bool
+    jobs: int = 1
 
 
 def _chunk_record(
@@ -5532,12 +5595,15 @@ def _attach_canonical_range(
     md_file_name: str,
     md_start_byte: int,
     canonical_md_bytes: Optional[bytes],
+    canonical_line_index: Optional[LineIndex] = None,
 ) -> None:
     """Point the chunk at its canonical Markdown byte range.
 
     V2.4 Range Ref Propagation: refs address the canonical_md bytes directly.
     The resolver only accepts the primary canonical_md artifact defined in the
     manifest, so full bundle-backed refs stay limited to the first part.
+    Pass the part's ``canonical_line_index`` when attaching many chunks; it is
+    built on demand otherwise.
     """
     abs_start = md_start_byte + d["start_byte"]
     abs_end = md_start_byte + d["end_byte"]
@@ -5547,8 +5613,9 @@ def _attach_canonical_range(
         # can_sha256 is the exact range hash for canonical_md_bytes[abs_start:abs_end].
         can_chunk = canonical_md_bytes[abs_start:abs_end]
         can_sha256 = hashlib.sha256(can_chunk).hexdigest()
-        can_start_line = _line_for_byte(canonical_md_bytes, abs_start)
-        can_end_line = _line_for_byte(canonical_md_bytes, max(abs_start, abs_end - 1))
+        if canonical_line_index is None:
+            canonical_line_index = LineIndex(canonical_md_bytes)
+        can_start_line, can_end_line = canonical_line_index.line_range(abs_start, abs_end)
     else:
         # Fall back to source-local values when canonical bytes unavailable.
         can_sha256 = d["sha256"]
@@ -5616,37 +5683,58 @@ def _attach_source_range(
         d["source_range"]["git_blob_sha1_basis"] = "source_worktree_file_content"
 
 
+class _FileChunkPlan(NamedTuple):
+    """Per-file chunking results that do not depend on the rendered report."""
+
+    sem_meta: Dict[str, Any]
+    chunks: List[Chunk]
+    source_git_blob_sha1: Optional[str]
+
+
+def _plan_file_chunks(
+    fi: "FileInfo", staged: StagedContent, chunker: "Chunker"
+) -> _FileChunkPlan:
+    """Chunk one file's emitted text; free of run state so workers can run it."""
+    content = staged.redacted
+    source_git_blob_sha1 = (
+        _compute_git_blob_sha1(fi.abs_path)
+        if not staged.was_redacted and not staged.truncated
+        else None
+    )
+    sem_meta = get_semantic_metadata(fi.rel_path.as_posix(), content)
+    # Pass file_path for deterministic chunk ID
+    chunks = chunker.chunk_file(_stable_file_id(fi), content, file_path=fi.rel_path.as_posix())
+    return _FileChunkPlan(sem_meta, chunks, source_git_blob_sha1)
+
+
 def _file_chunk_records(
     fi: "FileInfo",
     *,
     config: "_ReportRunConfig",
     chunker: "Chunker",
-    redactor: Optional["Redactor"],
+    content_stage: ContentStage,
     status: str,
     md_offsets: Dict[str, Tuple[str, int]],
     canonical_md_name: Optional[str],
     canonical_md_bytes: Optional[bytes],
+    plan: Optional[_FileChunkPlan] = None,
+    canonical_line_index: Optional[LineIndex] = None,
 ) -> List[Dict[str, Any]]:
     """Chunk one included text file into fully annotated chunk rows."""
     # Read content for chunking using the same limit as report to ensure coherence
-    content, truncated, trunc_msg = read_smart_content(fi, config.max_file_bytes)
-
-    was_redacted = False
-    if redactor:
-        content, _redacted_items = redactor.redact(content)
-        was_redacted = bool(_redacted_items)
+    staged = content_stage.get(fi, config.max_file_bytes)
+    content = staged.redacted
+    truncated = staged.truncated
+    trunc_msg = staged.trunc_msg
+    was_redacted = staged.was_redacted
 
     content_bytes = content.encode("utf-8")
-    source_git_blob_sha1 = (
-        _compute_git_blob_sha1(fi.abs_path)
-        if not was_redacted and not truncated
-        else None
-    )
-
-    sem_meta = get_semantic_metadata(fi.rel_path.as_posix(), content)
+    if plan is None:
+        plan = _plan_file_chunks(fi, staged, chunker)
+    sem_meta = plan.sem_meta
+    chunks = plan.chunks
+    source_git_blob_sha1 = plan.source_git_blob_sha1
     fid = _stable_file_id(fi)
-    # Pass file_path for deterministic chunk ID
-    chunks = chunker.chunk_file(fid, content, file_path=fi.rel_path.as_posix())
     lang = lang_for(fi.ext)
 
     records: List[Dict[str, Any]] = []
@@ -5668,6 +5756,7 @@ def _file_chunk_records(
                 md_file_name=offset[0],
                 md_start_byte=offset[1],
                 canonical_md_bytes=canonical_md_bytes,
+                canonical_line_index=canonical_line_index,
             )
 
         # Retrieval-only and noncanonical split chunks must carry
@@ -5689,19 +5778,27 @@ def generate_chunk_artifacts(
     target_files,
     output_filename_base_func,
     md_paths: Optional[List[Path]] = None,
+    content_stage: Optional[ContentStage] = None,
+    chunk_plans: Optional[Dict[str, _FileChunkPlan]] = None,
 ):
-    """Emit the chunk index for retrieval-capable output modes."""
+    """Emit the chunk index for retrieval-capable output modes.
+
+    ``chunk_plans`` carries per-file chunking already computed by
+    ``_prepare_file_work``; files without a plan are chunked inline.
+    """
     if config.output_mode not in ("retrieval", "dual"):
         return None
 
     chunker = Chunker()
-    redactor = Redactor() if config.redact_secrets else None
+    stage = _resolve_content_stage(content_stage, config.redact_secrets)
 
     # Build offset map from all generated markdown parts
     md_offsets = extract_file_offsets(md_paths, config.debug) if md_paths else {}
     can_md = resolve_canonical_md(md_paths) if md_paths else None
     canonical_md_name = can_md.name if can_md else None
     canonical_md_bytes = can_md.read_bytes() if (can_md and can_md.exists()) else None
+    # Built once per canonical part; every chunk's line lookup bisects it.
+    canonical_line_index = LineIndex(canonical_md_bytes) if canonical_md_bytes is not None else None
 
     all_chunks: List[Dict[str, Any]] = []
 
@@ -5718,11 +5815,13 @@ def generate_chunk_artifacts(
                 fi,
                 config=config,
                 chunker=chunker,
-                redactor=redactor,
+                content_stage=stage,
                 status=status,
                 md_offsets=md_offsets,
                 canonical_md_name=canonical_md_name,
                 canonical_md_bytes=canonical_md_bytes,
+                plan=(chunk_plans or {}).get(str(fi.abs_path)),
+                canonical_line_index=canonical_line_index,
             )
         )
 
@@ -5731,7 +5830,7 @@ def generate_chunk_artifacts(
 
     out_path = output_filename_base_func(part_suffix="").with_suffix(".chunk_index.jsonl")
     try:
-        with out_path.open("w", encoding="utf-8") as f:
+        with HashingWriter(out_path) as f:
             for c in all_chunks:
                 f.write(json.dumps(c) + "\n")
         return out_path
@@ -5741,6 +5840,134 @@ def generate_chunk_artifacts(
         return None
 
 
+def _prepare_file_worker(
+    fi: "FileInfo", max_file_bytes: int, redact_secrets: bool, with_chunks: bool, check_md5: bool = False
+) -> Tuple[StagedContent, Optional[_FileChunkPlan], bool]:
+    """Process-pool unit: read, redact, hash and optionally chunk one file.
+
+    The last item tells whether the bytes the stage read still hash to the
+    scanned ``fi.md5`` (only checked with ``check_md5``), i.e. whether the
+    staged content may be cached under that MD5. The check hashes the same
+    read, so every file is still read once.
+    """
+    if not check_md5:
+        staged = _new_content_stage(redact_secrets, retain=False).get(fi, max_file_bytes)
+        plan = _plan_file_chunks(fi, staged, Chunker()) if with_chunks else None
+        return staged, plan, False
+
+    read_md5: List[Optional[str]] = []
+
+    def read_and_hash(fi: "FileInfo", max_bytes: int) -> Tuple[str, bool, str]:
+        text, digest = _read_source_text(fi, with_md5=True)
+        read_md5.append(digest)
+        return text, False, ""
+
+    stage = ContentStage(read_and_hash, redactor=Redactor() if redact_secrets else None, retain=False)
+    staged = stage.get(fi, max_file_bytes)
+    plan = _plan_file_chunks(fi, staged, Chunker()) if with_chunks else None
+    return staged, plan, read_md5 == [fi.md5]
+
+
+def _run_process_pool(func, arg_lists: List[List[Any]], jobs: int) -> List[Any]:
+    """Apply ``func`` over ``arg_lists`` in a process pool, preserving order.
+
+    Where process pools are unavailable (e.g. Pythonista on iOS) the work runs
+    in-process; the result is the same either way.
+    """
+    count = len(arg_lists[0]) if arg_lists else 0
+    if jobs > 1 and count > 1:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+                chunksize = max(1, count // (jobs * 4))
+                return list(pool.map(func, *arg_lists, chunksize=chunksize))
+        except (ImportError, NotImplementedError, OSError, concurrent.futures.BrokenExecutor) as exc:
+            logger.warning("Process pool unavailable (%s); processing files serially.", exc)
+    return [func(*args) for args in zip(*arg_lists)]
+
+
+def _take_cached_file_work(
+    config: "_ReportRunConfig",
+    pending: List["FileInfo"],
+    content_stage: ContentStage,
+    file_work_cache: FileWorkCache,
+    with_chunks: bool,
+    plans: Dict[str, _FileChunkPlan],
+) -> List["FileInfo"]:
+    """Stage the cached work of ``pending`` files and return the misses."""
+    misses = []
+    for fi in pending:
+        hit = file_work_cache.get(
+            fi, config.max_file_bytes, config.redact_secrets, with_chunks=with_chunks
+        )
+        if hit is None:
+            misses.append(fi)
+            continue
+        staged, plan = hit
+        content_stage.put(fi, config.max_file_bytes, staged, from_cache=True)
+        if plan is not None:
+            plans[str(fi.abs_path)] = _FileChunkPlan(*plan)
+    return misses
+
+
+def _prepare_file_work(
+    config: "_ReportRunConfig",
+    files: List["FileInfo"],
+    content_stage: ContentStage,
+    file_work_cache: Optional[FileWorkCache] = None,
+) -> Dict[str, _FileChunkPlan]:
+    """Fan per-file work out to ``config.jobs`` processes before emission.
+
+    Included text files are read, redacted and hashed into ``content_stage``
+    and, for retrieval output, chunked. The emitters then run in their usual
+    deterministic order against the prepared results, so the artifacts are
+    byte-identical to the serial path. Returns chunk plans keyed by absolute
+    path; empty when ``config.jobs <= 1`` and no ``file_work_cache`` is given.
+
+    With a ``file_work_cache``, files whose content was prepared by an earlier
+    build are taken from the cache, and the rest is prepared (serially when
+    ``config.jobs <= 1``) and stored for the next build, unless the file no
+    longer matches its scanned MD5. Redacting builds do not use the cache.
+    """
+    if config.redact_secrets:
+        # Cache entries hold the unredacted text; see ``FileWorkCache``.
+        file_work_cache = None
+    if config.jobs <= 1 and file_work_cache is None:
+        return {}
+    with_chunks = config.output_mode in ("retrieval", "dual")
+    pending = [
+        fi for fi in files
+        if fi.is_text
+        and not content_stage.contains(fi, config.max_file_bytes)
+        and determine_inclusion_status(fi, config.detail, config.max_file_bytes) in ("full", "truncated")
+    ]
+    plans: Dict[str, _FileChunkPlan] = {}
+    if file_work_cache is not None:
+        pending = _take_cached_file_work(
+            config, pending, content_stage, file_work_cache, with_chunks, plans
+        )
+    if not pending:
+        return plans
+
+    results = _run_process_pool(
+        _prepare_file_worker,
+        [
+            pending,
+            [config.max_file_bytes] * len(pending),
+            [config.redact_secrets] * len(pending),
+            [with_chunks] * len(pending),
+            [file_work_cache is not None] * len(pending),
+        ],
+        config.jobs,
+    )
+    for fi, (staged, plan, unchanged) in zip(pending, results):
+        content_stage.put(fi, config.max_file_bytes, staged)
+        if plan is not None:
+            plans[str(fi.abs_path)] = plan
+        if unchanged:
+            file_work_cache.put(fi, config.max_file_bytes, config.redact_secrets, staged, plan)
+    return plans
+
+
 # --- Split-Mode Contract ---
 # By architectural mandate (Phase 1, Schwerpunkt D), only the FIRST part of a split
 # bundle is considered fully `bundle-backed` and canonically referenceable.
@@ -5787,7 +6014,7 @@ class _SplitReportBuffer:
         # Temporärer Name während der Generierung
         # Wir nutzen _tmp_partX, um es später sauber umzubenennen
         out_path = self._base_name(part_suffix=f"_tmp_part{self._part_num}")
-        out_path.write_text("".join(self._lines), encoding="utf-8")
+        _write_text_hashed(out_path, "".join(self._lines))
         self.part_paths.append(out_path)
 
         self._part_num += 1
@@ -5884,7 +6111,7 @@ def _finalize_split_parts(
         new_path = output_filename_base_func(part_suffix=new_suffix)
 
         if text is not None:
-            new_path.write_text(text, encoding="utf-8")
+            _write_text_hashed(new_path, text)
             # Delete old tmp file
             try:
                 path.unlink()
@@ -5930,6 +6157,7 @@ def _iter_configured_report_blocks(
     target_files,
     target_sources,
     artifact_refs: Dict[str, str],
+    content_stage: Optional[ContentStage] = None,
 ) -> Iterator[str]:
     return iter_report_blocks(
         target_files,
@@ -5947,6 +6175,7 @@ def _iter_configured_report_blocks(
         meta_density=config.meta_density,
         meta_none=config.meta_none,
         redact_secrets=config.redact_secrets,
+        content_stage=content_stage,
     )
 
 
@@ -5957,12 +6186,13 @@ def _write_split_report(
     output_filename_base_func,
     validator: "ReportValidator",
     artifact_refs: Dict[str, str],
+    content_stage: Optional[ContentStage] = None,
 ) -> List[Path]:
     """Stream the report into size-bounded parts and finalize their names."""
     buffer = _SplitReportBuffer(output_filename_base_func)
 
     for block in _iter_configured_report_blocks(
-        config, target_files, target_sources, artifact_refs
+        config, target_files, target_sources, artifact_refs, content_stage
     ):
         # Validate the block before writing
         validator.feed(block)
@@ -6003,16 +6233,17 @@ def _write_single_report(
     output_filename_base_func,
     validator: "ReportValidator",
     artifact_refs: Dict[str, str],
+    content_stage: Optional[ContentStage] = None,
 ) -> Path:
     """Stream the whole report into one file."""
     out_path = output_filename_base_func(part_suffix="")
 
-    with out_path.open("w", encoding="utf-8") as f:
+    with HashingWriter(out_path) as f:
         if config.plan_only:
             f.write("<!-- MODE:PLAN_ONLY -->\n")
 
         iterator = _iter_configured_report_blocks(
-            config, target_files, target_sources, artifact_refs
+            config, target_files, target_sources, artifact_refs, content_stage
         )
         for i, block in enumerate(iterator):
             if i == 0:
@@ -6030,6 +6261,7 @@ def process_and_write(
     target_sources,
     output_filename_base_func,
     out_paths: List[Path],
+    content_stage: Optional[ContentStage] = None,
 ) -> List[Path]:
     """Render the canonical report, honouring the configured split size."""
     artifact_refs = _report_artifact_refs(config, target_sources, output_filename_base_func)
@@ -6044,13 +6276,13 @@ def process_and_write(
     if config.split_size > 0:
         generated_paths = _write_split_report(
             config, target_files, target_sources, output_filename_base_func,
-            validator, artifact_refs,
+            validator, artifact_refs, content_stage,
         )
     else:
         generated_paths = [
             _write_single_report(
                 config, target_files, target_sources, output_filename_base_func,
-                validator, artifact_refs,
+                validator, artifact_refs, content_stage,
             )
         ]
 
@@ -6138,6 +6370,128 @@ def _write_architecture_summary(
     return arch_path
 
 
+
+def _safe_generator_info(generator_info: Any) -> Dict[str, Any]:
+    """Return ``generator_info`` as a dict, or the default identity if it is not one."""
+    if isinstance(generator_info, dict):
+        return generator_info
+    if generator_info is not None:
+        try:
+            return dict(generator_info)
+        except Exception:
+            pass
+    return {
+        "name": "repoground",
+        "platform": "unknown",
+        "version": os.getenv("REPOGROUND_VERSION", CORE_VERSION)
+    }
+
+
+def _extras_payload(extras: Optional[ExtrasConfig]) -> Any:
+    """JSON-safe form of ``extras`` for the config hash."""
+    extras_dict = None
+    if extras:
+        try:
+            extras_dict = asdict(extras)
+        except (TypeError, ValueError):
+            # Fallback if extras is not a dataclass instance (e.g. mocked object or type)
+            extras_dict = getattr(extras, "__dict__", None)
+            if extras_dict is None:
+                extras_dict = str(extras)
+    return _json_safe(extras_dict)
+
+
+def _verified_md_outputs(md_paths: List[Path]) -> List[Path]:
+    """Reported .md outputs that really exist and are non-empty.
+
+    This prevents "generated" messages when the file did not land where expected.
+    """
+    verified_md: List[Path] = []
+    for p in md_paths:
+        try:
+            if p.exists() and p.is_file() and p.stat().st_size > 0:
+                verified_md.append(p)
+        except Exception as exc:
+            logger.warning("Failed to verify reported markdown artifact %s: %s", p, exc)
+
+    if md_paths and not verified_md:
+        # We *expected* at least one markdown output, but none is actually usable.
+        # Make this a hard error so callers don't display a success message.
+        raise RuntimeError(
+            "RepoGround: Report was announced as written, but no non-empty .md output exists on disk. "
+            "Check merges_dir / permissions / rename logic."
+        )
+    return verified_md
+
+
+def _verified_json_outputs(json_paths: List[Path]) -> List[Path]:
+    """With json_sidecar, JSON is the primary artifact: verify it exists, is non-empty and valid."""
+    verified_json: List[Path] = []
+    for p in json_paths:
+        try:
+            if p.exists() and p.is_file() and p.stat().st_size > 0:
+                # sanity: load + minimal validate
+                d = json.loads(p.read_text(encoding="utf-8"))
+                _validate_agent_json_dict(d)
+                verified_json.append(p)
+        except Exception as exc:
+            logger.warning("Failed to verify reported JSON artifact %s: %s", p, exc)
+    if json_paths and not verified_json:
+        raise RuntimeError(
+            "RepoGround: JSON primary artifact was announced as written, but no valid non-empty .json exists on disk."
+        )
+    return verified_json
+
+
+def _write_python_analysis_artifacts(
+    bundle_manifest_path: Path,
+    repo_summaries: List[Dict],
+    final_dump_index: Optional[Path],
+    run_id: str,
+    *,
+    ast_facts_cache: Optional["AstFactsCache"],
+    jobs: int,
+    debug: bool,
+    out_paths: List[Path],
+    other_paths: List[Path],
+    add_artifact: Any,
+) -> Tuple[Optional[Path], Optional[Path]]:
+    """Write and register the symbol index and call graph sidecars.
+
+    Both share one walk and one parse per file.
+    """
+    (
+        python_symbol_index_json,
+        python_call_graph_json,
+        python_analysis_timings,
+    ) = bundle_sidecars.write_python_analysis_sidecars(
+        base_manifest_path=bundle_manifest_path,
+        repo_summaries=repo_summaries,
+        final_dump_index=final_dump_index,
+        run_id=run_id,
+        facts_cache=ast_facts_cache,
+        max_workers=jobs,
+    )
+    if debug and python_analysis_timings is not None:
+        print("DEBUG: python analysis ms:", python_analysis_timings, file=sys.stderr)
+
+    registered = []
+    for path, role in (
+        (python_symbol_index_json, ArtifactRole.PYTHON_SYMBOL_INDEX_JSON),
+        (python_call_graph_json, ArtifactRole.PYTHON_CALL_GRAPH_JSON),
+    ):
+        registered.append(_register_optional_artifact(
+            path,
+            role=role,
+            content_type="application/json",
+            out_paths=out_paths,
+            other_paths=other_paths,
+            add_artifact=add_artifact,
+        ))
+    return registered[0], registered[1]
+
+
+@with_digest_registry
 def write_reports_v2(
     merges_dir: Path,
     hub: Path,
@@ -6160,7 +6514,18 @@ def write_reports_v2(
     include_hidden: bool = True,
     generator_info: Optional[Dict[str, Any]] = None,
     publish_generation: bool = True,
+    jobs: int = 1,
+    file_work_cache: Optional[FileWorkCache] = None,
+    ast_facts_cache: Optional["AstFactsCache"] = None,
 ) -> MergeArtifacts:
+    """Render and publish the bundle for ``repo_summaries``.
+
+    ``jobs > 1`` prepares per-file content and chunking, and parses Python
+    for the architecture sidecars, in process pools; the emitted artifacts
+    are byte-identical to the serial run. ``file_work_cache`` reuses that per-file preparation across builds, and
+    ``ast_facts_cache`` the per-file facts of the Python architecture
+    artifacts.
+    """
     out_paths = []
 
     plan_only, code_only, meta_none, requested_flags = _normalize_mode_flags(plan_only, code_only, meta_none)
@@ -6181,36 +6546,10 @@ def write_reports_v2(
     # max_bytes is a per-file read limit (historical naming).
     max_file_bytes = max_bytes
 
-    # Ensure generator_info is safe
-    if generator_info is None:
-        generator_info = {
-            "name": "repoground",
-            "platform": "unknown",
-            "version": os.getenv("REPOGROUND_VERSION", CORE_VERSION)
-        }
-    elif not isinstance(generator_info, dict):
-        try:
-            generator_info = dict(generator_info)
-        except Exception:
-            generator_info = {
-                "name": "repoground",
-                "platform": "unknown",
-                "version": os.getenv("REPOGROUND_VERSION", CORE_VERSION)
-            }
+    generator_info = _safe_generator_info(generator_info)
 
     # Calculate config_sha256 for parity checks and bundle manifest provenance
-    extras_dict = None
-    if extras:
-        try:
-            extras_dict = asdict(extras)
-        except (TypeError, ValueError):
-            # Fallback if extras is not a dataclass instance (e.g. mocked object or type)
-            extras_dict = getattr(extras, "__dict__", None)
-            if extras_dict is None:
-                 extras_dict = str(extras)
-
-    # Ensure extras_dict is JSON safe
-    extras_dict = _json_safe(extras_dict)
+    extras_dict = _extras_payload(extras)
 
     config_payload = {
         "detail": detail,
@@ -6251,160 +6590,43 @@ def write_reports_v2(
         output_mode=output_mode,
         redact_secrets=redact_secrets,
         debug=debug,
+        jobs=max(1, int(jobs or 1)),
     )
 
 
     last_chunk_index_path = None
     last_dump_index_path = None
 
-    if mode == "gesamt":
-        all_files = []
-        repo_names = []
-        sources = []
-        for s in repo_summaries:
-            all_files.extend(s["files"])
-            repo_names.append(s["name"])
-            sources.append(s["root"])
-
-        # Create base filename lambda
-        base_name_func = lambda part_suffix="": make_output_filename(
-            merges_dir,
-            repo_names,
-            detail,
-            part_suffix,
-            path_filter,
-            ext_filter_str,
-            run_id,
-            plan_only=plan_only,
-            code_only=code_only,
-            timestamp=global_ts,
-            meta_none=meta_none,
+    # One read/decode/redact/hash pass per file, shared by the report,
+    # chunk index and JSON sidecar emitters of this run. The stage may spill
+    # to a memory-mapped file, so it is closed even when an emitter fails.
+    content_stage = _new_content_stage(redact_secrets)
+    try:
+        chunk_plans = _prepare_file_work(
+            run_config,
+            [fi for s in repo_summaries for fi in s["files"]],
+            content_stage,
+            file_work_cache,
         )
 
-        generated_paths = []
-        arch_path = None
-        if output_mode in ("archive", "dual"):
-            generated_paths = process_and_write(
-                run_config, all_files, sources, base_name_func, out_paths
-            )
-
-            arch_path = _write_architecture_summary(
-                all_files,
+        if mode == "gesamt":
+            all_files = []
+            repo_names = []
+            sources = []
+            for s in repo_summaries:
+                all_files.extend(s["files"])
+                repo_names.append(s["name"])
+                sources.append(s["root"])
+
+            # Create base filename lambda
+            base_name_func = lambda part_suffix="": make_output_filename(
                 merges_dir,
                 repo_names,
                 detail,
-                path_filter,
-                ext_filter_str,
-                run_id,
-                plan_only,
-                code_only,
-                global_ts,
-                meta_none,
-                out_paths
-            )
-
-        chunk_path = None
-        if output_mode in ("retrieval", "dual"):
-            # Pass all generated MD parts to support split_size > 0
-            md_parts = [p for p in generated_paths if p.suffix.lower() == ".md"]
-            chunk_path = generate_chunk_artifacts(
-                run_config, all_files, base_name_func, md_paths=md_parts
-            )
-            if chunk_path:
-                out_paths.append(chunk_path)
-                last_chunk_index_path = chunk_path
-
-        # Write JSON sidecar if enabled (agent-first: also for plan_only)
-        # JSON must be written when json_sidecar is active - no conditions like "and not plan_only"
-        json_path = None
-        if extras and extras.json_sidecar:
-            total_size = sum(
-                f.size for f in all_files if (not code_only or f.category in DEBUG_CONFIG.code_only_categories)
-            )
-            json_data = generate_json_sidecar(
-                all_files,
-                detail,
-                max_bytes,
-                sources,
-                plan_only,
-                code_only,
-                path_filter,
-                ext_filter,
-                total_size,
-                delta_meta,
-                requested_flags=requested_flags,
-                requested_meta_density=meta_density,
-                meta_none=meta_none,
-                generator_info=generator_info,
-                output_mode=output_mode,
-                    redact_secrets=redact_secrets,
-                    split_size_bytes=split_size,
-                    include_hidden=include_hidden,
-                )
-            # Generate JSON filename using deterministic base name (via base_name_func)
-            md_parts = [p for p in generated_paths if p.suffix.lower() == ".md"]  # lenskit:authority=derived_projection
-
-            json_path = base_name_func(part_suffix="").with_suffix('.json')
-
-            json_data["artifacts"]["index_json"] = str(json_path)
-            json_data["artifacts"]["index_json_basename"] = json_path.name
-
-            json_data["artifacts"]["md_parts"] = [str(p) for p in md_parts]
-            json_data["artifacts"]["md_parts_basenames"] = [p.name for p in md_parts]
-
-            can_md = resolve_canonical_md(md_parts)
-            json_data["artifacts"]["canonical_md"] = str(can_md) if can_md else None
-            json_data["artifacts"]["canonical_md_basename"] = can_md.name if can_md else None
-
-            if chunk_path:
-                json_data["artifacts"]["chunk_index"] = str(chunk_path)
-                json_data["artifacts"]["chunk_index_basename"] = chunk_path.name
-
-            _validate_agent_json_dict(json_data)
-            json_path.write_text(json.dumps(json_data, indent=2, ensure_ascii=False), encoding="utf-8")
-            out_paths.append(json_path)
-
-        # Generate Dump Index
-        md_parts = [p for p in generated_paths if p.suffix.lower() == ".md"]
-        artifacts_map = {
-            ArtifactRole.CANONICAL_MD.value: resolve_canonical_md(md_parts),
-            ArtifactRole.INDEX_SIDECAR_JSON.value: json_path,
-            ArtifactRole.CHUNK_INDEX_JSONL.value: chunk_path,
-            ArtifactRole.ARCHITECTURE_SUMMARY.value: arch_path
-        }
-        dump_index_path = generate_dump_index(base_name_func, run_id, artifacts_map, generator_info, repo_names)
-        out_paths.append(dump_index_path)
-        last_dump_index_path = dump_index_path
-
-        if output_mode in ("retrieval", "dual") and chunk_path:
-            # Build derived/transient retrieval artifacts AFTER dump_index is finalized
-            derived_paths = build_derived_artifacts(
-                dump_index_path, chunk_path, base_name_func, run_id, hub, generator_info, repo_names, debug, repo_summaries=repo_summaries
-            )
-            out_paths.extend(derived_paths)
-
-    else:
-        for s in repo_summaries:
-            s_name = s["name"]
-            s_files = s["files"]
-            s_root = s["root"]
-
-            # Generate per-repo run_id for deterministic naming
-            repo_run_id = _generate_run_id(
-                [s_name], detail, path_filter, ext_filter_str,
-                plan_only=plan_only, code_only=code_only, timestamp=global_ts
-            )
-
-            # Fix: Explicitly capture loop variables (s_name, repo_run_id) as default args
-            # to avoid lazy binding issues in the lambda.
-            base_name_func = lambda part_suffix="", _name=s_name, _rid=repo_run_id: make_output_filename(
-                merges_dir,
-                [_name],
-                detail,
                 part_suffix,
                 path_filter,
                 ext_filter_str,
-                _rid,
+                run_id,
                 plan_only=plan_only,
                 code_only=code_only,
                 timestamp=global_ts,
@@ -6415,17 +6637,18 @@ def write_reports_v2(
             arch_path = None
             if output_mode in ("archive", "dual"):
                 generated_paths = process_and_write(
-                    run_config, s_files, [s_root], base_name_func, out_paths
+                    run_config, all_files, sources, base_name_func, out_paths,
+                    content_stage=content_stage,
                 )
 
                 arch_path = _write_architecture_summary(
-                    s_files,
+                    all_files,
                     merges_dir,
-                    [s_name],
+                    repo_names,
                     detail,
                     path_filter,
                     ext_filter_str,
-                    repo_run_id,
+                    run_id,
                     plan_only,
                     code_only,
                     global_ts,
@@ -6435,9 +6658,11 @@ def write_reports_v2(
 
             chunk_path = None
             if output_mode in ("retrieval", "dual"):
+                # Pass all generated MD parts to support split_size > 0
                 md_parts = [p for p in generated_paths if p.suffix.lower() == ".md"]
                 chunk_path = generate_chunk_artifacts(
-                    run_config, s_files, base_name_func, md_paths=md_parts
+                    run_config, all_files, base_name_func, md_paths=md_parts,
+                    content_stage=content_stage, chunk_plans=chunk_plans,
                 )
                 if chunk_path:
                     out_paths.append(chunk_path)
@@ -6448,13 +6673,13 @@ def write_reports_v2(
             json_path = None
             if extras and extras.json_sidecar:
                 total_size = sum(
-                    f.size for f in s_files if (not code_only or f.category in DEBUG_CONFIG.code_only_categories)
+                    f.size for f in all_files if (not code_only or f.category in DEBUG_CONFIG.code_only_categories)
                 )
                 json_data = generate_json_sidecar(
-                    s_files,
+                    all_files,
                     detail,
                     max_bytes,
-                    [s_root],
+                    sources,
                     plan_only,
                     code_only,
                     path_filter,
@@ -6466,12 +6691,13 @@ def write_reports_v2(
                     meta_none=meta_none,
                     generator_info=generator_info,
                     output_mode=output_mode,
-                    redact_secrets=redact_secrets,
-                    split_size_bytes=split_size,
-                    include_hidden=include_hidden,
-                )
+                        redact_secrets=redact_secrets,
+                        split_size_bytes=split_size,
+                        include_hidden=include_hidden,
+                        content_stage=content_stage,
+                    )
                 # Generate JSON filename using deterministic base name (via base_name_func)
-                md_parts = [p for p in generated_paths if p.suffix.lower() == ".md"]
+                md_parts = [p for p in generated_paths if p.suffix.lower() == ".md"]  # lenskit:authority=derived_projection
 
                 json_path = base_name_func(part_suffix="").with_suffix('.json')
 
@@ -6482,19 +6708,15 @@ def write_reports_v2(
                 json_data["artifacts"]["md_parts_basenames"] = [p.name for p in md_parts]
 
                 can_md = resolve_canonical_md(md_parts)
-                if can_md:
-                    json_data["artifacts"]["canonical_md"] = str(can_md)
-                    json_data["artifacts"]["canonical_md_basename"] = can_md.name
-                else:
-                    json_data["artifacts"]["canonical_md"] = None
-                    json_data["artifacts"]["canonical_md_basename"] = None
+                json_data["artifacts"]["canonical_md"] = str(can_md) if can_md else None
+                json_data["artifacts"]["canonical_md_basename"] = can_md.name if can_md else None
 
                 if chunk_path:
                     json_data["artifacts"]["chunk_index"] = str(chunk_path)
                     json_data["artifacts"]["chunk_index_basename"] = chunk_path.name
 
                 _validate_agent_json_dict(json_data)
-                json_path.write_text(json.dumps(json_data, indent=2, ensure_ascii=False), encoding="utf-8")
+                _write_text_hashed(json_path, json.dumps(json_data, indent=2, ensure_ascii=False))
                 out_paths.append(json_path)
 
             # Generate Dump Index
@@ -6505,18 +6727,163 @@ def write_reports_v2(
                 ArtifactRole.CHUNK_INDEX_JSONL.value: chunk_path,
                 ArtifactRole.ARCHITECTURE_SUMMARY.value: arch_path
             }
-            dump_index_path = generate_dump_index(base_name_func, repo_run_id, artifacts_map, generator_info, [s_name])
+            dump_index_path = generate_dump_index(base_name_func, run_id, artifacts_map, generator_info, repo_names)
             out_paths.append(dump_index_path)
             last_dump_index_path = dump_index_path
 
             if output_mode in ("retrieval", "dual") and chunk_path:
                 # Build derived/transient retrieval artifacts AFTER dump_index is finalized
                 derived_paths = build_derived_artifacts(
-                    dump_index_path, chunk_path, base_name_func, repo_run_id, hub, generator_info, [s_name], debug,
-                    repo_summaries=[s] if len(repo_summaries) == 1 else None,
+                    dump_index_path, chunk_path, base_name_func, run_id, hub, generator_info, repo_names, debug, repo_summaries=repo_summaries,
+                    ast_facts_cache=ast_facts_cache,
                 )
                 out_paths.extend(derived_paths)
 
+        else:
+            for s in repo_summaries:
+                s_name = s["name"]
+                s_files = s["files"]
+                s_root = s["root"]
+
+                # Generate per-repo run_id for deterministic naming
+                repo_run_id = _generate_run_id(
+                    [s_name], detail, path_filter, ext_filter_str,
+                    plan_only=plan_only, code_only=code_only, timestamp=global_ts
+                )
+
+                # Fix: Explicitly capture loop variables (s_name, repo_run_id) as default args
+                # to avoid lazy binding issues in the lambda.
+                base_name_func = lambda part_suffix="", _name=s_name, _rid=repo_run_id: make_output_filename(
+                    merges_dir,
+                    [_name],
+                    detail,
+                    part_suffix,
+                    path_filter,
+                    ext_filter_str,
+                    _rid,
+                    plan_only=plan_only,
+                    code_only=code_only,
+                    timestamp=global_ts,
+                    meta_none=meta_none,
+                )
+
+                generated_paths = []
+                arch_path = None
+                if output_mode in ("archive", "dual"):
+                    generated_paths = process_and_write(
+                        run_config, s_files, [s_root], base_name_func, out_paths,
+                        content_stage=content_stage,
+                    )
+
+                    arch_path = _write_architecture_summary(
+                        s_files,
+                        merges_dir,
+                        [s_name],
+                        detail,
+                        path_filter,
+                        ext_filter_str,
+                        repo_run_id,
+                        plan_only,
+                        code_only,
+                        global_ts,
+                        meta_none,
+                        out_paths
+                    )
+
+                chunk_path = None
+                if output_mode in ("retrieval", "dual"):
+                    md_parts = [p for p in generated_paths if p.suffix.lower() == ".md"]
+                    chunk_path = generate_chunk_artifacts(
+                        run_config, s_files, base_name_func, md_paths=md_parts,
+                        content_stage=content_stage, chunk_plans=chunk_plans,
+                    )
+                    if chunk_path:
+                        out_paths.append(chunk_path)
+                        last_chunk_index_path = chunk_path
+
+                # Write JSON sidecar if enabled (agent-first: also for plan_only)
+                # JSON must be written when json_sidecar is active - no conditions like "and not plan_only"
+                json_path = None
+                if extras and extras.json_sidecar:
+                    total_size = sum(
+                        f.size for f in s_files if (not code_only or f.category in DEBUG_CONFIG.code_only_categories)
+                    )
+                    json_data = generate_json_sidecar(
+                        s_files,
+                        detail,
+                        max_bytes,
+                        [s_root],
+                        plan_only,
+                        code_only,
+                        path_filter,
+                        ext_filter,
+                        total_size,
+                        delta_meta,
+                        requested_flags=requested_flags,
+                        requested_meta_density=meta_density,
+                        meta_none=meta_none,
+                        generator_info=generator_info,
+                        output_mode=output_mode,
+                        redact_secrets=redact_secrets,
+                        split_size_bytes=split_size,
+                        include_hidden=include_hidden,
+                        content_stage=content_stage,
+                    )
+                    # Generate JSON filename using deterministic base name (via base_name_func)
+                    md_parts = [p for p in generated_paths if p.suffix.lower() == ".md"]
+
+                    json_path = base_name_func(part_suffix="").with_suffix('.json')
+
+                    json_data["artifacts"]["index_json"] = str(json_path)
+                    json_data["artifacts"]["index_json_basename"] = json_path.name
+
+                    json_data["artifacts"]["md_parts"] = [str(p) for p in md_parts]
+                    json_data["artifacts"]["md_parts_basenames"] = [p.name for p in md_parts]
+
+                    can_md = resolve_canonical_md(md_parts)
+                    if can_md:
+                        json_data["artifacts"]["canonical_md"] = str(can_md)
+                        json_data["artifacts"]["canonical_md_basename"] = can_md.name
+                    else:
+                        json_data["artifacts"]["canonical_md"] = None
+                        json_data["artifacts"]["canonical_md_basename"] = None
+
+                    if chunk_path:
+                        json_data["artifacts"]["chunk_index"] = str(chunk_path)
+                        json_data["artifacts"]["chunk_index_basename"] = chunk_path.name
+
+                    _validate_agent_json_dict(json_data)
+                    _write_text_hashed(json_path, json.dumps(json_data, indent=2, ensure_ascii=False))
+                    out_paths.append(json_path)
+
+                # Generate Dump Index
+                md_parts = [p for p in generated_paths if p.suffix.lower() == ".md"]
+                artifacts_map = {
+                    ArtifactRole.CANONICAL_MD.value: resolve_canonical_md(md_parts),
+                    ArtifactRole.INDEX_SIDECAR_JSON.value: json_path,
+                    ArtifactRole.CHUNK_INDEX_JSONL.value: chunk_path,
+                    ArtifactRole.ARCHITECTURE_SUMMARY.value: arch_path
+                }
+                dump_index_path = generate_dump_index(base_name_func, repo_run_id, artifacts_map, generator_info, [s_name])
+                out_paths.append(dump_index_path)
+                last_dump_index_path = dump_index_path
+
+                if output_mode in ("retrieval", "dual") and chunk_path:
+                    # Build derived/transient retrieval artifacts AFTER dump_index is finalized
+                    derived_paths = build_derived_artifacts(
+                        dump_index_path, chunk_path, base_name_func, repo_run_id, hub, generator_info, [s_name], debug,
+                        repo_summaries=[s] if len(repo_summaries) == 1 else None,
+                        ast_facts_cache=ast_facts_cache,
+                    )
+                    out_paths.extend(derived_paths)
+
+        if debug:
+            print("DEBUG: content stage:", content_stage.counters, file=sys.stderr)
+    finally:
+        content_stage.close()
+    if file_work_cache is not None:
+        file_work_cache.prune()
+
     # --- Post-check & deterministic ordering (primary artifact first) ---
     md_paths = [p for p in out_paths if p.suffix.lower() == ".md"]
 
@@ -6554,40 +6921,10 @@ def write_reports_v2(
         and p not in derived_manifests
     ]
 
-    # Verify that reported .md outputs really exist and are non-empty.
-    # This prevents "generated" messages when the file did not land where expected.
-    verified_md: List[Path] = []
-    for p in md_paths:
-        try:
-            if p.exists() and p.is_file() and p.stat().st_size > 0:
-                verified_md.append(p)
-        except Exception as exc:
-            logger.warning("Failed to verify reported markdown artifact %s: %s", p, exc)
-
-    if md_paths and not verified_md:
-        # We *expected* at least one markdown output, but none is actually usable.
-        # Make this a hard error so callers don't display a success message.
-        raise RuntimeError(
-            "RepoGround: Report was announced as written, but no non-empty .md output exists on disk. "
-            "Check merges_dir / permissions / rename logic."
-        )
-
-    # If json_sidecar is enabled, JSON is the primary artifact: verify it exists & is non-empty.
+    verified_md = _verified_md_outputs(md_paths)
     verified_json: List[Path] = []
     if extras and extras.json_sidecar:
-        for p in json_paths:
-            try:
-                if p.exists() and p.is_file() and p.stat().st_size > 0:
-                    # sanity: load + minimal validate
-                    d = json.loads(p.read_text(encoding="utf-8"))
-                    _validate_agent_json_dict(d)
-                    verified_json.append(p)
-            except Exception as exc:
-                logger.warning("Failed to verify reported JSON artifact %s: %s", p, exc)
-        if json_paths and not verified_json:
-            raise RuntimeError(
-                "RepoGround: JSON primary artifact was announced as written, but no valid non-empty .json exists on disk."
-            )
+        verified_json = _verified_json_outputs(json_paths)
 
     # Primary ordering: JSON (if enabled) first, then Markdown, then other artifacts.
     # Return structured MergeArtifacts object instead of flat list
@@ -6655,29 +6992,14 @@ def write_reports_v2(
     if derived_manifests:
         _add_artifact(derived_manifests[-1], ArtifactRole.DERIVED_MANIFEST_JSON, "application/json")
 
-    python_symbol_index_path = _register_optional_artifact(
-        bundle_sidecars.write_python_symbol_index_json(
-            base_manifest_path=bundle_manifest_path,
-            repo_summaries=repo_summaries,
-            final_dump_index=final_dump_index,
-            run_id=run_id,
-        ),
-        role=ArtifactRole.PYTHON_SYMBOL_INDEX_JSON,
-        content_type="application/json",
-        out_paths=out_paths,
-        other_paths=other_paths,
-        add_artifact=_add_artifact,
-    )
-
-    python_call_graph_path = _register_optional_artifact(
-        bundle_sidecars.write_python_call_graph_json(
-            base_manifest_path=bundle_manifest_path,
-            repo_summaries=repo_summaries,
-            final_dump_index=final_dump_index,
-            run_id=run_id,
-        ),
-        role=ArtifactRole.PYTHON_CALL_GRAPH_JSON,
-        content_type="application/json",
+    python_symbol_index_path, python_call_graph_path = _write_python_analysis_artifacts(
+        bundle_manifest_path,
+        repo_summaries,
+        final_dump_index,
+        run_id,
+        ast_facts_cache=ast_facts_cache,
+        jobs=run_config.jobs,
+        debug=debug,
         out_paths=out_paths,
         other_paths=other_paths,
         add_artifact=_add_artifact,
@@ -7128,6 +7450,9 @@ def write_reports_v2(
         other=other_paths,
         legacy_bundle_manifest=bundle_manifest_path,
     )
+    registry = active_digest_registry()
+    if debug and registry is not None:
+        print("DEBUG: digest registry:", registry.counters, file=sys.stderr)
     if not publish_generation:
         return result
     return _publish_merge_artifact_generation(
@@ -15,7 +15,6 @@ Design contract:
 
 from __future__ import annotations
 
-import hashlib
 import importlib
 import json
 import logging
@@ -23,6 +22,7 @@ import sqlite3
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .artifact_io import sha256_file
 from .clock import now_utc
 
 from .dependency_diagnostics import jsonschema_dependency
@@ -43,15 +43,8 @@ logger = logging.getLogger(__name__)
 
 
 def _sha256_file(path: Path) -> Optional[str]:
-    h = hashlib.sha256()
     try:
-        with path.open("rb") as f:
-            while True:
-                chunk = f.read(65536)
-                if not chunk:
-                    break
-                h.update(chunk)
-        return h.hexdigest()
+        return sha256_file(path)
     except OSError:
         return None
 
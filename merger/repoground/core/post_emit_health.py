@@ -44,6 +44,7 @@ import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .artifact_io import sha256_file
 from .check_view import compact_check_projection
 from .clock import now_utc
 from .claim_evidence_diagnostics import (
@@ -127,12 +128,8 @@ _DEBUG_ROLES = frozenset(
 # ---------------------------------------------------------------------------
 
 def _sha256_file(path: Path) -> Optional[str]:
-    h = hashlib.sha256()
     try:
-        with path.open("rb") as f:
-            for buf in iter(lambda: f.read(65536), b""):
-                h.update(buf)
-        return h.hexdigest()
+        return sha256_file(path)
     except OSError:
         return None
 
@@ -3692,6 +3692,15 @@ def _is_headless_requested() -> bool:
     # 3) ui-Framework nicht verfügbar
     return ("--headless" in sys.argv) or (os.environ.get("REPOGROUND_HEADLESS") == "1") or (ui is None)
 
+def _jobs_arg(value: str) -> int:
+    import argparse
+
+    jobs = int(value)
+    if jobs < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return jobs
+
+
 def main_cli():
     import argparse
     parser = argparse.ArgumentParser(description="RepoGround build")
@@ -3738,6 +3747,12 @@ def main_cli():
     parser.add_argument("--meta-density", choices=["min", "standard", "full", "auto"], default="auto", help="Control metadata verbosity")
     parser.add_argument("--output-mode", choices=["archive", "retrieval", "dual"], default="dual", help="Output mode: archive (MD only), retrieval (Chunk Index), or dual (both)")
     parser.add_argument("--redact-secrets", action="store_true", help="Enable heuristic secret redaction")
+    parser.add_argument(
+        "--jobs",
+        type=_jobs_arg,
+        default=1,
+        help="Worker processes for per-file reading, redaction and chunking (default: 1 = serial; output is identical)",
+    )
     parser.add_argument(
         "--source-mode",
         choices=["local-current", "local-ff", "remote-snapshot"],
@@ -3984,6 +3999,7 @@ def main_cli():
         output_mode=args.output_mode,
         redact_secrets=args.redact_secrets,
         generator_info={"name": "repoground", "platform": "cli"},
+        jobs=args.jobs,
     )
 
     out_paths = artifacts.get_all_paths()
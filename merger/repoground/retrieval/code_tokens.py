@@ -0,0 +1,51 @@
+"""
+Subword splitting of code identifiers for the retrieval index.
+
+FTS5's default ``unicode61`` tokenizer splits ``snake_case`` at the underscore
+but keeps ``camelCase`` whole, so ``buildIndex`` is the single token
+``buildindex`` and neither ``build`` nor ``index`` finds it. Indexes built
+with ``code_tokens`` store the camelCase parts of every chunk in an extra
+``chunks_fts`` column, and the router turns identifier query terms into
+subword phrases that match both spellings.
+
+Consecutive identifiers are separated by ``IDENTIFIER_BREAK`` so a phrase
+cannot run from the tail of one identifier into the head of the next
+(``fooBuild indexBar`` must not match ``build index``). The token mixes
+letters and digits, which no subword ever does. ``CODE_TOKENS_FORMAT`` is
+recorded in ``index_meta`` and changes whenever the column text does, so an
+incremental build never mixes rows of two formats.
+"""
+
+import re
+from typing import List
+
+CODE_TOKENS_FORMAT = "2"
+IDENTIFIER_BREAK = "idbreak0"
+
+_ALNUM_RUN = re.compile(r"[A-Za-z0-9]+")
+# "HTTPServer" -> HTTP, Server; "parseV2Tokens" -> parse, V, 2, Tokens
+_SUBWORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def split_identifier(identifier: str) -> List[str]:
+    """Lower-cased snake_case and camelCase parts of ``identifier``."""
+    return [
+        part.lower()
+        for run in _ALNUM_RUN.findall(identifier)
+        for part in _SUBWORD.findall(run)
+    ]
+
+
+def code_subword_text(text: str) -> str:
+    """Space-separated camelCase parts of every identifier in ``text``,
+    one ``IDENTIFIER_BREAK`` between identifiers.
+
+    Only runs the default tokenizer keeps whole contribute, so snake_case
+    parts are not counted twice by bm25.
+    """
+    identifiers: List[str] = []
+    for run in _ALNUM_RUN.findall(text):
+        subwords = _SUBWORD.findall(run)
+        if len(subwords) > 1:
+            identifiers.append(" ".join(subword.lower() for subword in subwords))
+    return f" {IDENTIFIER_BREAK} ".join(identifiers)
@@ -1,8 +1,11 @@
+import collections
 import datetime
+import functools
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .query_core import execute_query
 from ..core.federation import FEDERATION_KIND, FEDERATION_VERSION
@@ -12,6 +15,9 @@ from ..core.path_security import resolve_secure_path
 
 logger = logging.getLogger(__name__)
 
+# Bundles queried in parallel by default; each query holds its own SQLite connection.
+DEFAULT_FEDERATION_CONCURRENCY = 8
+
 
 def _build_cross_repo_links(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -179,6 +185,261 @@ def _freshness_status(expected_fingerprint: Optional[str], observed_fingerprint:
     return "stale"
 
 
+def _read_bundle_fingerprint(db_path: Path) -> Optional[str]:
+    """The index's ``canonical_dump_index_sha256``, or ``None`` when unreadable.
+
+    Staleness detection is strictly best-effort and must never fail the
+    federated query.
+    """
+    import sqlite3
+
+    try:
+        db_uri = f"{db_path.resolve().as_uri()}?mode=ro&immutable=1"
+        with sqlite3.connect(db_uri, uri=True) as conn:  # lgtm[py/path-injection] codeql-boundary:federation-readonly-sqlite
+            cursor = conn.execute("SELECT value FROM index_meta WHERE key='canonical_dump_index_sha256'")
+            row = cursor.fetchone()
+            if row:
+                return row[0]
+    except sqlite3.Error:
+        # Broad catch to ensure handle leaks or generic db errors don't crash the fan-out
+        pass
+    return None
+
+
+def _tag_bundle_hits(
+    bundle_hits: List[Dict[str, Any]],
+    repo_id: str,
+    bundle_path_str: str,
+    status: str,
+    expected_fingerprint: Optional[str],
+    db_fingerprint: Optional[str],
+) -> List[Dict[str, Any]]:
+    """Hits with range provenance, tagged with bundle origin, availability and freshness."""
+    freshness = _freshness_status(expected_fingerprint, db_fingerprint, status)
+    tagged = []
+    for hit in bundle_hits:
+        # Require provenance: either range_ref or derived_range_ref must be present and truthy
+        if not hit.get("range_ref") and not hit.get("derived_range_ref"):
+            continue
+        hit["federation_bundle"] = repo_id
+        hit["federation_bundle_status"] = status
+        hit["federation_freshness_status"] = freshness
+        hit["federation_origin"] = {
+            "repo_id": repo_id,
+            "bundle_path": bundle_path_str,
+            "availability_status": status,
+            "freshness_status": freshness,
+            "expected_fingerprint": expected_fingerprint,
+            "observed_fingerprint": db_fingerprint,
+        }
+        tagged.append(hit)
+    return tagged
+
+
+def _query_federated_bundle(
+    b: Dict[str, Any],
+    federation_base_path: Path,
+    query_text: str,
+    k: int,
+    filters: Optional[Dict[str, Optional[str]]],
+    local_filters: Optional[Dict[str, Optional[str]]],
+    embedding_policy: Optional[Dict[str, Any]],
+    explain: bool,
+    trace: bool,
+    build_context: bool,
+    allow_external_bundle_paths: bool,
+) -> Dict[str, Any]:
+    """Query one federation bundle; never raises.
+
+    Returns the bundle's ``status`` (``None`` when it was queried cleanly),
+    ``error``, provenance-tagged ``hits``, ``trace``, whether it counted as
+    ``effective`` and its ``latency_ms``.
+    """
+    repo_id = b["repo_id"]
+    bundle_path_str = b["bundle_path"]
+    outcome: Dict[str, Any] = {
+        "status": None,
+        "error": None,
+        "hits": [],
+        "trace": None,
+        "effective": False,
+        "latency_ms": 0.0,
+    }
+    # Per-bundle processing latency, including validation and early exits;
+    # not a pure DB query benchmark.
+    bundle_start = time.perf_counter()
+
+    try:
+        if filters and filters.get("repo") and filters["repo"] != repo_id:
+            outcome["status"] = "filtered_out"
+            return outcome
+
+        if "://" in bundle_path_str:
+            outcome["status"] = "bundle_path_unsupported"
+            return outcome
+
+        try:
+            bundle_path = _resolve_persisted_bundle_path(
+                bundle_path_str,
+                federation_base_path,
+                allow_external=allow_external_bundle_paths,
+            )
+        except (ValueError, OSError, RuntimeError):
+            outcome["status"] = "bundle_path_rejected"
+            return outcome
+
+        db_path = _find_bundle_index(bundle_path)
+        if not db_path:
+            outcome["status"] = "index_missing"
+            return outcome
+
+        # Check for staleness using fingerprint (last_fingerprint from federation index vs DB)
+        expected_fingerprint = b.get("last_fingerprint")
+        db_fingerprint = None
+        if expected_fingerprint:
+            db_fingerprint = _read_bundle_fingerprint(db_path)
+            if db_fingerprint and db_fingerprint != expected_fingerprint:
+                outcome["status"] = "stale"
+                # We can still execute the query, but we mark it as stale in the trace
+
+        res = execute_query(
+            index_path=db_path,
+            query_text=query_text,
+            k=k,  # Fetch up to k from each bundle to ensure global top-k is accurate
+            filters=local_filters,
+            embedding_policy=embedding_policy,
+            explain=explain,
+            trace=trace,
+            build_context=build_context,
+            read_only=True,
+        )
+
+        # Score normalisation and integration per bundle
+        # Note: `execute_query` already calculates a semantically stable `final_score`
+        # (which is between 0 and 1.0, combining bm25_norm and potential graph/semantic boosts).
+        # BM25 raw scores are negative in SQLite, but `final_score` is properly inverted and normalized.
+        # We rely on this `final_score` for global federated ranking to preserve absolute magnitude
+        # (a weak match in Repo A shouldn't beat a strong match in Repo B just because it was the best locally).
+        outcome["hits"] = _tag_bundle_hits(
+            res.get("results", []),
+            repo_id,
+            bundle_path_str,
+            outcome["status"] or "ok",
+            expected_fingerprint,
+            db_fingerprint,
+        )
+
+        outcome["effective"] = True
+        if trace and "query_trace" in res:
+            outcome["trace"] = res["query_trace"]
+
+    except Exception as exc:
+        logger.warning(
+            "Federated bundle query failed for %s: %s",
+            repo_id,
+            type(exc).__name__,
+            exc_info=True,
+        )
+        outcome.update(status="query_error", error="bundle query failed", hits=[], trace=None, effective=False)
+    finally:
+        outcome["latency_ms"] = (time.perf_counter() - bundle_start) * 1000.0
+    return outcome
+
+
+class _BundleFanOut:
+    """Bundle tasks on daemon worker threads, each bounded by a deadline.
+
+    A running task's deadline counts from its own start, a queued task's from
+    the fan-out start, so a hanging bundle cannot hold the queue behind it
+    past the deadline. Workers are daemon threads: an abandoned bundle keeps
+    running but does not delay interpreter exit.
+    """
+
+    def __init__(self, tasks: List[Callable[[], Dict[str, Any]]], bundle_deadline_s: Optional[float]) -> None:
+        self._tasks = tasks
+        self._deadline_s = bundle_deadline_s
+        self._cond = threading.Condition()
+        self._queued = collections.deque(range(len(tasks)))
+        self._open = set(range(len(tasks)))
+        self._started: List[Optional[float]] = [None] * len(tasks)
+        self._results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        self._errors: Dict[int, BaseException] = {}
+        self._fan_out_start = time.perf_counter()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                if not self._queued:
+                    return
+                position = self._queued.popleft()
+                self._started[position] = time.perf_counter()
+            outcome: Optional[Dict[str, Any]] = None
+            error: Optional[BaseException] = None
+            try:
+                outcome = self._tasks[position]()
+            except Exception as exc:
+                error = exc
+            with self._cond:
+                if position in self._open:
+                    self._open.discard(position)
+                    self._results[position] = outcome
+                    if error is not None:
+                        self._errors[position] = error
+                    self._cond.notify_all()
+
+    def _deadline(self, position: int) -> float:
+        started = self._started[position]
+        return (self._fan_out_start if started is None else started) + self._deadline_s
+
+    def _expire(self) -> Optional[float]:
+        """Give up on open tasks past their deadline; seconds until the next one."""
+        now = time.perf_counter()
+        expired = {position for position in self._open if self._deadline(position) <= now}
+        if expired:
+            self._open -= expired
+            self._queued = collections.deque(p for p in self._queued if p not in expired)
+        if not self._open:
+            return None
+        return min(self._deadline(position) for position in self._open) - now
+
+    def run(self, max_workers: int) -> List[Optional[Dict[str, Any]]]:
+        for number in range(max_workers):
+            threading.Thread(
+                target=self._worker,
+                name=f"federation-bundle-{number}",
+                daemon=True,
+            ).start()
+        with self._cond:
+            while self._open:
+                timeout = None
+                if self._deadline_s is not None:
+                    timeout = self._expire()
+                    if not self._open:
+                        break
+                self._cond.wait(timeout)
+            if self._errors:
+                raise self._errors[min(self._errors)]
+            return list(self._results)
+
+
+def _fan_out_bundles(
+    tasks: List[Callable[[], Dict[str, Any]]],
+    max_concurrency: int,
+    bundle_deadline_s: Optional[float],
+) -> List[Optional[Dict[str, Any]]]:
+    """Run bundle tasks on at most ``max_concurrency`` threads.
+
+    Results keep the task order. A task still running ``bundle_deadline_s``
+    after it started, or still queued ``bundle_deadline_s`` after the fan-out
+    started, yields ``None``; a running task's thread is abandoned, not killed.
+    """
+    if bundle_deadline_s is None and (max_concurrency <= 1 or len(tasks) <= 1):
+        return [task() for task in tasks]
+    if not tasks:
+        return []
+    return _BundleFanOut(tasks, bundle_deadline_s).run(max(1, min(max_concurrency, len(tasks))))
+
+
 def _execute_federated_query_data(
     fed_data: Dict[str, Any],
     federation_base_path: Path,
@@ -190,9 +451,22 @@ def _execute_federated_query_data(
     trace: bool = False,
     build_context: bool = False,
     allow_external_bundle_paths: bool = True,
+    *,
+    max_concurrency: int = DEFAULT_FEDERATION_CONCURRENCY,
+    bundle_deadline_s: Optional[float] = None,
 ) -> Dict[str, Any]:
-    """Executes federated query aggregation over a validated federation object."""
+    """Executes federated query aggregation over a validated federation object.
+
+    Bundles are queried concurrently on up to ``max_concurrency`` threads and
+    merged in federation order, so the result equals a sequential run. A
+    bundle that runs longer than ``bundle_deadline_s`` is reported as
+    ``deadline_exceeded`` and contributes no hits.
+    """
     validate_federation_data(fed_data)
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if bundle_deadline_s is not None and bundle_deadline_s <= 0:
+        raise ValueError("bundle_deadline_s must be positive")
 
     bundles = fed_data.get("bundles", [])
 
@@ -212,116 +486,47 @@ def _execute_federated_query_data(
     if filters:
         local_filters = {k: v for k, v in filters.items() if k != "repo"}
 
-    for b in bundles:
-        repo_id = b["repo_id"]
-        bundle_path_str = b["bundle_path"]
-        # Per-bundle processing latency, including validation and early exits;
-        # not a pure DB query benchmark.
-        bundle_start = time.perf_counter()
-
-        try:
-            if filters and filters.get("repo") and filters["repo"] != repo_id:
-                bundle_status[repo_id] = "filtered_out"
-                continue
-
-            if "://" in bundle_path_str:
-                bundle_status[repo_id] = "bundle_path_unsupported"
-                continue
-
-            try:
-                bundle_path = _resolve_persisted_bundle_path(
-                    bundle_path_str,
-                    federation_base_path,
-                    allow_external=allow_external_bundle_paths,
-                )
-            except (ValueError, OSError, RuntimeError):
-                bundle_status[repo_id] = "bundle_path_rejected"
-                continue
-
-            db_path = _find_bundle_index(bundle_path)
-            if not db_path:
-                bundle_status[repo_id] = "index_missing"
-                continue
-
-            import sqlite3
-            # Check for staleness using fingerprint (last_fingerprint from federation index vs DB)
-            # Note: staleness detection is strictly best-effort and must never fail the federated query.
-            expected_fingerprint = b.get("last_fingerprint")
-            db_fingerprint = None
-            if expected_fingerprint:
-                try:
-                    db_uri = f"{db_path.resolve().as_uri()}?mode=ro&immutable=1"
-                    with sqlite3.connect(db_uri, uri=True) as conn:  # lgtm[py/path-injection] codeql-boundary:federation-readonly-sqlite
-                        cursor = conn.execute("SELECT value FROM index_meta WHERE key='canonical_dump_index_sha256'")
-                        row = cursor.fetchone()
-                        if row:
-                            db_fingerprint = row[0]
-                except sqlite3.Error:
-                    # Broad catch to ensure handle leaks or generic db errors don't crash the fan-out
-                    pass
-
-                if db_fingerprint and db_fingerprint != expected_fingerprint:
-                    bundle_status[repo_id] = "stale"
-                    # We can still execute the query, but we mark it as stale in the trace
-
-            res = execute_query(
-                index_path=db_path,
-                query_text=query_text,
-                k=k,  # Fetch up to k from each bundle to ensure global top-k is accurate
-                filters=local_filters,
-                embedding_policy=embedding_policy,
-                explain=explain,
-                trace=trace,
-                build_context=build_context,
-                read_only=True,
-            )
+    tasks = [
+        functools.partial(
+            _query_federated_bundle,
+            b,
+            federation_base_path,
+            query_text,
+            k,
+            filters,
+            local_filters,
+            embedding_policy,
+            explain,
+            trace,
+            build_context,
+            allow_external_bundle_paths,
+        )
+        for b in bundles
+    ]
+    fan_out_start = time.perf_counter()
+    outcomes = _fan_out_bundles(tasks, max_concurrency, bundle_deadline_s)
+    total_latency_ms = (time.perf_counter() - fan_out_start) * 1000.0
 
-            # Score normalisation and integration per bundle
-            # Note: `execute_query` already calculates a semantically stable `final_score`
-            # (which is between 0 and 1.0, combining bm25_norm and potential graph/semantic boosts).
-            # BM25 raw scores are negative in SQLite, but `final_score` is properly inverted and normalized.
-            # We rely on this `final_score` for global federated ranking to preserve absolute magnitude
-            # (a weak match in Repo A shouldn't beat a strong match in Repo B just because it was the best locally).
-            bundle_hits = res.get("results", [])
-            if bundle_hits:
-                for hit in bundle_hits:
-                    # Require provenance: either range_ref or derived_range_ref must be present and truthy
-                    if not hit.get("range_ref") and not hit.get("derived_range_ref"):
-                        continue
-
-                    # Tag results with bundle origin, availability and freshness provenance.
-                    status = bundle_status.get(repo_id, "ok")
-                    freshness = _freshness_status(expected_fingerprint, db_fingerprint, status)
-                    hit["federation_bundle"] = repo_id
-                    hit["federation_bundle_status"] = status
-                    hit["federation_freshness_status"] = freshness
-                    hit["federation_origin"] = {
-                        "repo_id": repo_id,
-                        "bundle_path": bundle_path_str,
-                        "availability_status": status,
-                        "freshness_status": freshness,
-                        "expected_fingerprint": expected_fingerprint,
-                        "observed_fingerprint": db_fingerprint,
-                    }
-                    all_results.append(hit)
-
-            if repo_id not in bundle_status:
-                bundle_status[repo_id] = "ok"
-            queried_bundles_effective += 1
-            if trace and "query_trace" in res:
-                bundle_traces[repo_id] = res["query_trace"]
-
-        except Exception as exc:
-            logger.warning(
-                "Federated bundle query failed for %s: %s",
-                repo_id,
-                type(exc).__name__,
-                exc_info=True,
-            )
-            bundle_status[repo_id] = "query_error"
-            bundle_errors[repo_id] = "bundle query failed"
-        finally:
-            bundle_latency_ms[repo_id] = (time.perf_counter() - bundle_start) * 1000.0
+    for b, outcome in zip(bundles, outcomes):
+        repo_id = b["repo_id"]
+        if outcome is None:
+            bundle_status[repo_id] = "deadline_exceeded"
+            bundle_errors[repo_id] = "bundle query exceeded deadline"
+            bundle_latency_ms[repo_id] = bundle_deadline_s * 1000.0
+            continue
+        bundle_latency_ms[repo_id] = outcome["latency_ms"]
+        if outcome["error"]:
+            bundle_errors[repo_id] = outcome["error"]
+        if outcome["status"]:
+            bundle_status[repo_id] = outcome["status"]
+        if not outcome["effective"]:
+            continue
+        all_results.extend(outcome["hits"])
+        if repo_id not in bundle_status:
+            bundle_status[repo_id] = "ok"
+        queried_bundles_effective += 1
+        if outcome["trace"] is not None:
+            bundle_traces[repo_id] = outcome["trace"]
 
     # Conflict Detection Heuristic (Minimal)
     # Group results by filename (`Path.name`) as a primitive heuristic.
@@ -420,6 +625,11 @@ def _execute_federated_query_data(
             "bundle_errors": bundle_errors,
             "bundle_traces": bundle_traces,
             "bundle_latency_ms": bundle_latency_ms,
+            # Wall-clock time of the fan-out vs. the slowest single bundle.
+            "total_latency_ms": total_latency_ms,
+            "critical_path_latency_ms": max(bundle_latency_ms.values(), default=0.0),
+            "bundle_latency_sum_ms": sum(bundle_latency_ms.values()),
+            "max_concurrency": max_concurrency,
         }
 
     return out
@@ -435,6 +645,8 @@ def execute_federated_query(
     build_context: bool = False,
     *,
     allow_external_bundle_paths: bool = True,
+    max_concurrency: int = DEFAULT_FEDERATION_CONCURRENCY,
+    bundle_deadline_s: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Executes a minimal federated query aggregation across local bundles referenced by a federation index.
@@ -456,6 +668,8 @@ def execute_federated_query(
         trace=trace,
         build_context=build_context,
         allow_external_bundle_paths=allow_external_bundle_paths,
+        max_concurrency=max_concurrency,
+        bundle_deadline_s=bundle_deadline_s,
     )
 
 
@@ -470,6 +684,9 @@ def execute_federated_query_from_bundles(
     build_context: bool = False,
     federation_id: str = "inline-bundle-set",
     base_path: Optional[Path] = None,
+    *,
+    max_concurrency: int = DEFAULT_FEDERATION_CONCURRENCY,
+    bundle_deadline_s: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Executes the same read-only federation query over an explicit list of bundle roots.
@@ -495,4 +712,6 @@ def execute_federated_query_from_bundles(
         trace=trace,
         build_context=build_context,
         allow_external_bundle_paths=True,
+        max_concurrency=max_concurrency,
+        bundle_deadline_s=bundle_deadline_s,
     )
@@ -210,6 +210,16 @@ class IncrementalRetrievalSnapshot:
                 verify_full_build=verify_full_build,
             )
 
+    def _previous_index(self, previous: Optional[Mapping[str, Any]], config_fingerprint: str) -> Optional[Path]:
+        """Index of the published generation when its config still applies.
+
+        build_index copies it into staging and updates the copy in place; the
+        published generation is never touched.
+        """
+        if previous and previous.get("config_fingerprint") == config_fingerprint:
+            return self.storage_root / _GENERATION_DIR / previous["generation_id"] / "chunks.index.sqlite"
+        return None
+
     def _build_unlocked(
         self,
         *,
@@ -269,7 +279,7 @@ class IncrementalRetrievalSnapshot:
             index_db.build_index(dump_path, chunk_path, index_path, {
                 "config_sha256": config_fingerprint,
                 "snapshot_schema": SNAPSHOT_SCHEMA,
-            })
+            }, previous_db=self._previous_index(previous, config_fingerprint))
             _fsync_file(index_path)
             receipt = {
                 "schema": SNAPSHOT_SCHEMA,
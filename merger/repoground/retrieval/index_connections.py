@@ -0,0 +1,170 @@
+"""Process-wide reuse of SQLite index connections for ``execute_query``.
+
+Opening an index, sniffing its ``chunks`` columns and reading ``index_meta``
+costs more than many of the queries run against it. The pool keeps idle
+connections and those per-index facts keyed by index path and read mode.
+
+Every entry is bound to the file identity ``(device, inode, mtime_ns, size)``
+observed when it was created. A replaced or rewritten index no longer
+matches, so its entry is dropped and a fresh connection is opened.
+
+Callers open connections with ``check_same_thread=False``: a connection is
+either idle in the pool or checked out by exactly one caller, so it may be
+handed from the thread that opened it to any other. Short-lived worker
+threads, such as a federated query's fan-out, therefore reuse the
+connections earlier threads released.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+FileIdentity = Tuple[int, int, int, int]
+
+DEFAULT_MAX_POOLED_INDEXES = 32
+DEFAULT_MAX_IDLE_PER_INDEX = 8
+
+
+def _file_identity(path: Path) -> Optional[FileIdentity]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except sqlite3.Error:
+        # Opened by a caller without check_same_thread=False; dropping the
+        # last reference closes it.
+        pass
+
+
+class PooledIndex:
+    """One index file identity: idle connections plus cached per-index facts."""
+
+    __slots__ = ("key", "identity", "idle", "_facts", "_facts_lock")
+
+    def __init__(self, key: Tuple[str, bool], identity: FileIdentity) -> None:
+        self.key = key
+        self.identity = identity
+        self.idle: List[sqlite3.Connection] = []
+        self._facts: Dict[str, Any] = {}
+        self._facts_lock = threading.Lock()
+
+    def fact(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return the cached fact ``name``, computing it on first use.
+
+        ``compute`` runs outside the lock; if two threads race, the first
+        stored value wins and both return it.
+        """
+        with self._facts_lock:
+            if name in self._facts:
+                return self._facts[name]
+        value = compute()
+        with self._facts_lock:
+            return self._facts.setdefault(name, value)
+
+
+class IndexConnectionPool:
+    """Thread-safe pool of SQLite connections keyed by index path and mode."""
+
+    def __init__(
+        self,
+        *,
+        max_indexes: int = DEFAULT_MAX_POOLED_INDEXES,
+        max_idle_per_index: int = DEFAULT_MAX_IDLE_PER_INDEX,
+    ) -> None:
+        self._max_indexes = max(1, int(max_indexes))
+        self._max_idle = max(0, int(max_idle_per_index))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, bool], PooledIndex]" = OrderedDict()
+        self.counters: Dict[str, int] = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def acquire(
+        self,
+        index_path: Path,
+        read_only: bool,
+        connect: Callable[[], sqlite3.Connection],
+    ) -> Tuple[sqlite3.Connection, Optional[PooledIndex], bool]:
+        """Return ``(connection, entry, hit)`` for ``index_path``.
+
+        ``entry`` is ``None`` when the file cannot be stat'ed; such
+        connections are not pooled and callers get the historic behaviour.
+        """
+        identity = _file_identity(index_path)
+        if identity is None:
+            return connect(), None, False
+
+        key = (os.path.abspath(index_path), bool(read_only))
+        stale: List[sqlite3.Connection] = []
+        conn: Optional[sqlite3.Connection] = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.identity != identity:
+                stale.extend(entry.idle)
+                del self._entries[key]
+                self.counters["invalidations"] += 1
+                entry = None
+            if entry is None:
+                entry = PooledIndex(key, identity)
+                self._entries[key] = entry
+                while len(self._entries) > self._max_indexes:
+                    _, evicted = self._entries.popitem(last=False)
+                    stale.extend(evicted.idle)
+            else:
+                self._entries.move_to_end(key)
+                if entry.idle:
+                    conn = entry.idle.pop()
+            self.counters["hits" if conn is not None else "misses"] += 1
+
+        for old in stale:
+            _close_quietly(old)
+        if conn is not None:
+            return conn, entry, True
+        return connect(), entry, False
+
+    def release(
+        self,
+        entry: Optional[PooledIndex],
+        conn: sqlite3.Connection,
+        *,
+        reusable: bool,
+    ) -> None:
+        """Return ``conn`` to the pool, or close it if it must not be reused."""
+        evicted: Optional[sqlite3.Connection] = conn
+        if entry is not None and reusable and self._max_idle:
+            with self._lock:
+                if self._entries.get(entry.key) is entry:
+                    entry.idle.append(conn)
+                    evicted = entry.idle.pop(0) if len(entry.idle) > self._max_idle else None
+        if evicted is not None:
+            _close_quietly(evicted)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters, indexes=len(self._entries))
+
+    def clear(self) -> None:
+        """Close idle connections and forget all cached index facts."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            for conn in entry.idle:
+                _close_quietly(conn)
+
+
+_POOL = IndexConnectionPool()
+
+
+def index_connection_pool() -> IndexConnectionPool:
+    """Return the process-wide pool used by ``query_core.execute_query``."""
+    return _POOL
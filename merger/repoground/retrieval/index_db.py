@@ -7,9 +7,17 @@ import json
 import hashlib
 import datetime
 import logging
+import mmap
+import os
 import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
+
+from ..core.artifact_io import compute_file_sha256
+from .code_tokens import CODE_TOKENS_FORMAT, code_subword_text
 
 logger = logging.getLogger(__name__)
 
@@ -98,65 +106,139 @@ def _resolve_dump_artifact_path(
     return target_path
 
 
-def _hydrate_text_from_range_like_ref(
-    dump_path: Path,
-    dump_manifest: Dict[str, Any],
-    raw_ref: Any,
-    *,
-    field_name: str,
-    chunk_id: str,
-) -> str:
-    """Extract UTF-8 text for a byte range and verify its declared SHA256."""
-    ref = _parse_range_like_ref(raw_ref, field_name=field_name, chunk_id=chunk_id)
-    target_path = _resolve_dump_artifact_path(dump_path, dump_manifest, ref)
-    if not target_path.exists():
-        raise RuntimeError(
-            f"FTS hydration failed for chunk '{chunk_id}': resolved artifact file not found: {target_path}"
-        )
+class _PendingRange(NamedTuple):
+    chunk_id: str
+    expected_sha256: str
+    view: memoryview
 
-    start_byte = ref.get("start_byte")
-    end_byte = ref.get("end_byte")
-    expected_sha256 = ref.get("content_sha256")
-    if (
-        not isinstance(start_byte, int)
-        or isinstance(start_byte, bool)
-        or not isinstance(end_byte, int)
-        or isinstance(end_byte, bool)
-    ):
-        raise RuntimeError(
-            f"FTS hydration failed for chunk '{chunk_id}': {field_name} must include integer start_byte/end_byte"
-        )
-    if not isinstance(expected_sha256, str) or not expected_sha256:
-        raise RuntimeError(
-            f"FTS hydration failed for chunk '{chunk_id}': {field_name} must include content_sha256"
-        )
 
-    file_size = target_path.stat().st_size
-    if start_byte < 0 or end_byte > file_size or start_byte > end_byte:
-        raise RuntimeError(
-            f"FTS hydration failed for chunk '{chunk_id}': range [{start_byte}:{end_byte}] is out of bounds for file size {file_size}"
-        )
-    if start_byte == end_byte:
-        raise RuntimeError(
-            f"FTS hydration failed for chunk '{chunk_id}': empty range [{start_byte}:{end_byte}] — a citation range must cover at least one byte"
-        )
+def _sha256_hex(data: memoryview) -> str:
+    return hashlib.sha256(data).hexdigest()
 
-    with target_path.open("rb") as f:
-        f.seek(start_byte)
-        content_bytes = f.read(end_byte - start_byte)
 
-    actual_sha256 = hashlib.sha256(content_bytes).hexdigest()
-    if actual_sha256 != expected_sha256:
-        raise RuntimeError(
-            f"FTS hydration failed for chunk '{chunk_id}': hash mismatch. Expected: {expected_sha256}, Actual: {actual_sha256}"
-        )
+class _RangeHydrator:
+    """Hash-verified text for the range refs of one index build.
 
-    try:
-        return content_bytes.decode("utf-8")
-    except UnicodeDecodeError as e:
-        raise RuntimeError(
-            f"FTS hydration failed for chunk '{chunk_id}': extracted range could not be decoded as UTF-8: {e}"
-        ) from e
+    Each dump artifact is resolved and memory-mapped once per build and every
+    range is sliced from the map as a memoryview, without a per-chunk open,
+    seek or copy. ``resolve`` verifies the SHA-256 digests of a batch in a
+    thread pool (hashlib releases the GIL on large buffers) and fails on the
+    first bad chunk in input order, as sequential hydration did.
+    """
+
+    def __init__(
+        self,
+        dump_path: Path,
+        dump_manifest: Dict[str, Any],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.dump_path = dump_path
+        self.dump_manifest = dump_manifest
+        self._max_workers = max_workers if max_workers is not None else min(4, os.cpu_count() or 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._paths: Dict[Tuple[Any, Any], Path] = {}
+        self._maps: Dict[Path, Any] = {}
+
+    def view(self, raw_ref: Any, *, field_name: str, chunk_id: str) -> _PendingRange:
+        """Validate a range ref and return its unverified byte slice."""
+        ref = _parse_range_like_ref(raw_ref, field_name=field_name, chunk_id=chunk_id)
+        key = (ref.get("artifact_role"), ref.get("file_path"))
+        target_path = self._paths.get(key)
+        if target_path is None:
+            target_path = _resolve_dump_artifact_path(self.dump_path, self.dump_manifest, ref)
+            self._paths[key] = target_path
+        data = self._maps.get(target_path)
+        if data is None:
+            if not target_path.exists():
+                raise RuntimeError(
+                    f"FTS hydration failed for chunk '{chunk_id}': resolved artifact file not found: {target_path}"
+                )
+            data = self._map(target_path)
+
+        start_byte = ref.get("start_byte")
+        end_byte = ref.get("end_byte")
+        expected_sha256 = ref.get("content_sha256")
+        if (
+            not isinstance(start_byte, int)
+            or isinstance(start_byte, bool)
+            or not isinstance(end_byte, int)
+            or isinstance(end_byte, bool)
+        ):
+            raise RuntimeError(
+                f"FTS hydration failed for chunk '{chunk_id}': {field_name} must include integer start_byte/end_byte"
+            )
+        if not isinstance(expected_sha256, str) or not expected_sha256:
+            raise RuntimeError(
+                f"FTS hydration failed for chunk '{chunk_id}': {field_name} must include content_sha256"
+            )
+
+        file_size = len(data)
+        if start_byte < 0 or end_byte > file_size or start_byte > end_byte:
+            raise RuntimeError(
+                f"FTS hydration failed for chunk '{chunk_id}': range [{start_byte}:{end_byte}] is out of bounds for file size {file_size}"
+            )
+        if start_byte == end_byte:
+            raise RuntimeError(
+                f"FTS hydration failed for chunk '{chunk_id}': empty range [{start_byte}:{end_byte}] — a citation range must cover at least one byte"
+            )
+        return _PendingRange(chunk_id, expected_sha256, memoryview(data)[start_byte:end_byte])
+
+    def resolve(self, pending: List[_PendingRange]) -> List[str]:
+        """Verify and decode ``pending`` in order."""
+        if len(pending) > 1 and self._max_workers > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            digests = list(self._executor.map(_sha256_hex, [item.view for item in pending]))
+        else:
+            digests = [_sha256_hex(item.view) for item in pending]
+
+        texts = []
+        for item, actual_sha256 in zip(pending, digests):
+            if actual_sha256 != item.expected_sha256:
+                raise RuntimeError(
+                    f"FTS hydration failed for chunk '{item.chunk_id}': hash mismatch. Expected: {item.expected_sha256}, Actual: {actual_sha256}"
+                )
+            try:
+                texts.append(str(item.view, "utf-8"))
+            except UnicodeDecodeError as e:
+                raise RuntimeError(
+                    f"FTS hydration failed for chunk '{item.chunk_id}': extracted range could not be decoded as UTF-8: {e}"
+                ) from e
+            item.view.release()
+        return texts
+
+    def resolve_rows(self, fts_rows: List[Tuple[str, Any, str]]) -> List[Tuple[str, str, str]]:
+        """Replace pending ranges in ``chunks_fts`` rows by their verified text."""
+        pending = [row[1] for row in fts_rows if isinstance(row[1], _PendingRange)]
+        if not pending:
+            return fts_rows
+        texts = iter(self.resolve(pending))
+        return [
+            (cid, next(texts) if isinstance(content, _PendingRange) else content, tokens)
+            for cid, content, tokens in fts_rows
+        ]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for data in self._maps.values():
+            if isinstance(data, mmap.mmap):
+                try:
+                    data.close()
+                except BufferError:
+                    # Views of a failed batch are still referenced; the map is
+                    # released once they are collected.
+                    pass
+        self._maps.clear()
+
+    def _map(self, path: Path) -> Any:
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._maps[path] = data
+        return data
 
 
 def _hydrate_text_from_legacy_source_file_ref(
@@ -180,20 +262,43 @@ def _hydrate_text_from_legacy_source_file_ref(
 
 def _compute_file_sha256(path: Path) -> str:
     """Compute SHA256 of a file."""
-    h = hashlib.sha256()
-    try:
-        with path.open("rb") as f:
-            while True:
-                chunk = f.read(65536)
-                if not chunk:
-                    break
-                h.update(chunk)
-        return h.hexdigest()
-    except OSError:
-        return "ERROR"
+    return compute_file_sha256(path)
+
+# Staging-only settings for index builds. A failed build deletes the target
+# file, so the rollback journal and fsyncs are not needed while ingesting;
+# journal_mode is not persisted, readers see the default afterwards.
+_BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _create_secondary_indexes(c: sqlite3.Cursor) -> None:
+    c.execute("CREATE INDEX IF NOT EXISTS idx_chunks_repo ON chunks(repo_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_chunks_path ON chunks(path_norm)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_chunks_layer ON chunks(layer)")
+
 
-def create_schema(conn: sqlite3.Connection) -> None:
-    """Create the SQLite schema for retrieval."""
+def create_schema(
+    conn: sqlite3.Connection,
+    *,
+    defer_indexes: bool = False,
+    code_tokens: bool = False,
+    trigram: bool = False,
+) -> None:
+    """Create the SQLite schema for retrieval.
+
+    ``defer_indexes`` leaves out the secondary ``idx_chunks_*`` indexes so a
+    bulk load can build them once after ingest.
+
+    ``code_tokens`` adds a ``code_tokens`` column to ``chunks_fts`` holding
+    the camelCase subwords of the content (see ``code_tokens.py``).
+    ``trigram`` adds ``chunks_trigram``, a trigram FTS5 index over
+    ``chunks_fts.content`` (external content, same rowids) for substring
+    queries. Both are off by default and recorded in ``index_meta``.
+    """
     c = conn.cursor()
 
     # 1. Meta Table
@@ -227,24 +332,382 @@ def create_schema(conn: sqlite3.Connection) -> None:
 
     # 3. FTS Table (Full Text Search)
     # Using separate content table pattern (manual sync)
-    c.execute("""
+    code_tokens_column = ",\n            code_tokens" if code_tokens else ""
+    c.execute(f"""
         CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
             chunk_id UNINDEXED,
             content,
-            path_tokens
+            path_tokens{code_tokens_column}
         )
     """)
+    if trigram:
+        c.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS chunks_trigram USING fts5(
+                content,
+                content='chunks_fts',
+                tokenize='trigram'
+            )
+        """)
 
     # Indices
-    c.execute("CREATE INDEX IF NOT EXISTS idx_chunks_repo ON chunks(repo_id)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_chunks_path ON chunks(path_norm)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_chunks_layer ON chunks(layer)")
+    if not defer_indexes:
+        _create_secondary_indexes(c)
 
     conn.commit()
 
-def build_index(dump_path: Path, chunk_path: Path, db_path: Path, config_payload: Optional[Dict[str, Any]] = None) -> None:
+_CHUNK_COLUMNS = (
+    "chunk_id", "repo_id", "path", "path_norm", "layer", "artifact_type",
+    "start_byte", "end_byte", "start_line", "end_line", "content_sha256", "size_bytes",
+    "language", "content_range_ref", "source_file",
+)
+
+_INSERT_CHUNK_SQL = (
+    f"INSERT INTO chunks ({', '.join(_CHUNK_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _CHUNK_COLUMNS)})"
+)
+_INSERT_FTS_SQL = "INSERT INTO chunks_fts (chunk_id, content, path_tokens) VALUES (?, ?, ?)"
+_INSERT_CODE_FTS_SQL = (
+    "INSERT INTO chunks_fts (chunk_id, content, path_tokens, code_tokens) VALUES (?, ?, ?, ?)"
+)
+
+_BATCH_SIZE = 500
+
+
+def _new_ingest_stats() -> Dict[str, int]:
+    return {
+        "total_lines": 0,
+        "empty_lines": 0,
+        "invalid_json_lines": 0,
+        "missing_chunk_id_lines": 0,
+        "ingested_chunks_count": 0,
+        "fts_hydrated_from_canonical_range": 0,
+        "fts_hydrated_from_range_ref": 0,
+        "ingested_content_bytes": 0,
+    }
+
+
+def _iter_chunk_rows(chunk_path: Path, stats: Dict[str, int]) -> Iterator[Tuple[Tuple[Any, ...], Dict[str, Any]]]:
+    """Yield ``(chunks row, raw chunk)`` per valid chunk_index line."""
+    with chunk_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            stats["total_lines"] += 1
+            if not line.strip():
+                stats["empty_lines"] += 1
+                continue
+            try:
+                chunk = json.loads(line)
+            except json.JSONDecodeError:
+                stats["invalid_json_lines"] += 1
+                continue
+
+            cid = chunk.get("chunk_id")
+            if not cid:
+                stats["missing_chunk_id_lines"] += 1
+                continue
+
+            path = chunk.get("path", "")
+            yield (
+                cid,
+                chunk.get("repo") or chunk.get("repo_id") or "unknown",
+                path,
+                path.lower().replace("\\", "/"),
+                chunk.get("layer", "unknown"),
+                chunk.get("artifact_type", "unknown"),
+                chunk.get("start_byte", 0),
+                chunk.get("end_byte", 0),
+                chunk.get("start_line", 0),
+                chunk.get("end_line", 0),
+                chunk.get("sha256") or chunk.get("content_sha256") or "",
+                chunk.get("size") or chunk.get("size_bytes") or 0,
+                chunk.get("language", ""),
+                json.dumps(chunk.get("content_range_ref")) if chunk.get("content_range_ref") else None,
+                chunk.get("source_file", path),
+            ), chunk
+
+
+def _fts_row(
+    row: Tuple[Any, ...],
+    chunk: Dict[str, Any],
+    hydrator: _RangeHydrator,
+    stats: Dict[str, int],
+) -> Tuple[str, Any, str]:
+    """Return the ``chunks_fts`` row for one chunk.
+
+    Range-backed content is returned as a ``_PendingRange`` that
+    ``_RangeHydrator.resolve_rows`` verifies and decodes.
+    """
+    cid = row[0]
+    # FTS Content: prefer inline content, otherwise hydrate from canonical bundle ranges.
+    content_text = chunk.get("content") or ""
+    if not content_text:
+        # canonical_range is authoritative when present: it is a hash-verified pointer
+        # into canonical_md and will raise hard on any error.
+        # content_range_ref is used only as a backward-compatible fallback when
+        # canonical_range is absent — never as a silent alternative to a broken one.
+        raw_canonical_range = chunk.get("canonical_range")
+        if raw_canonical_range is not None:
+            try:
+                content_text = hydrator.view(
+                    raw_canonical_range,
+                    field_name="canonical_range",
+                    chunk_id=cid,
+                )
+            except RuntimeError as e:
+                msg = str(e)
+                if msg.startswith("FTS hydration failed for chunk "):
+                    raise RuntimeError(msg) from e
+                raise RuntimeError(
+                    f"FTS hydration failed for chunk '{cid}' via canonical_range: {msg}"
+                ) from e
+            stats["fts_hydrated_from_canonical_range"] += 1
+        else:
+            raw_content_range_ref = chunk.get("content_range_ref")
+            if raw_content_range_ref is not None:
+                try:
+                    parsed_ref = _parse_range_like_ref(
+                        raw_content_range_ref,
+                        field_name="content_range_ref",
+                        chunk_id=cid,
+                    )
+                    if parsed_ref.get("artifact_role") == "source_file":
+                        content_text = _hydrate_text_from_legacy_source_file_ref(
+                            hydrator.dump_path,
+                            parsed_ref,
+                            field_name="content_range_ref",
+                            chunk_id=cid,
+                        )
+                    else:
+                        content_text = hydrator.view(
+                            parsed_ref,
+                            field_name="content_range_ref",
+                            chunk_id=cid,
+                        )
+                except (RuntimeError, ValueError, FileNotFoundError) as e:
+                    msg = str(e)
+                    if msg.startswith("FTS hydration failed for chunk "):
+                        raise RuntimeError(msg) from e
+                    raise RuntimeError(
+                        f"FTS hydration failed for chunk '{cid}' via content_range_ref: {msg}"
+                    ) from e
+                stats["fts_hydrated_from_range_ref"] += 1
+        if isinstance(content_text, str) and not content_text:
+            logger.debug(
+                "Chunk '%s' has no inline content and no canonical/content range ref; FTS content will be empty.",
+                cid,
+            )
+
+    # Path tokens: split by common delimiters
+    path_norm = row[3]
+    path_tokens = path_norm.replace("/", " ").replace(".", " ").replace("_", " ").replace("-", " ")
+    return cid, content_text, path_tokens
+
+
+def _insert_batch(
+    c: sqlite3.Cursor,
+    batch_chunks: List[Tuple[Any, ...]],
+    batch_fts: List[Tuple[str, Any, str]],
+    hydrator: _RangeHydrator,
+    stats: Dict[str, int],
+    code_tokens: bool = False,
+) -> None:
+    fts_rows = hydrator.resolve_rows(batch_fts)
+    stats["ingested_content_bytes"] += sum(len(row[1].encode("utf-8")) for row in fts_rows)
+    c.executemany(_INSERT_CHUNK_SQL, batch_chunks)
+    if code_tokens:
+        c.executemany(_INSERT_CODE_FTS_SQL, [(*row, code_subword_text(row[1])) for row in fts_rows])
+    else:
+        c.executemany(_INSERT_FTS_SQL, fts_rows)
+
+
+def _append_fts_row(
+    batch_fts: List[Tuple[str, Any, str]],
+    row: Tuple[Any, ...],
+    chunk: Dict[str, Any],
+    hydrator: _RangeHydrator,
+    stats: Dict[str, int],
+) -> None:
+    try:
+        batch_fts.append(_fts_row(row, chunk, hydrator, stats))
+    except Exception:
+        # Earlier chunks of the batch are still unverified; report their
+        # failure first, exactly as a sequential build would have.
+        hydrator.resolve_rows(batch_fts)
+        raise
+
+
+def _ingest_full(
+    c: sqlite3.Cursor,
+    chunk_path: Path,
+    hydrator: _RangeHydrator,
+    stats: Dict[str, int],
+    *,
+    code_tokens: bool = False,
+    trigram: bool = False,
+) -> None:
+    batch_chunks = []
+    batch_fts = []
+    for row, chunk in _iter_chunk_rows(chunk_path, stats):
+        batch_chunks.append(row)
+        _append_fts_row(batch_fts, row, chunk, hydrator, stats)
+        stats["ingested_chunks_count"] += 1
+
+        if len(batch_chunks) >= _BATCH_SIZE:
+            _insert_batch(c, batch_chunks, batch_fts, hydrator, stats, code_tokens)
+            batch_chunks = []
+            batch_fts = []
+
+    # Final batch
+    if batch_chunks:
+        _insert_batch(c, batch_chunks, batch_fts, hydrator, stats, code_tokens)
+    if trigram:
+        # 'rebuild' cannot read an FTS5 content table; copy the rows instead.
+        c.execute("INSERT INTO chunks_trigram(rowid, content) SELECT rowid, content FROM chunks_fts")
+
+
+def _ingest_incremental(
+    c: sqlite3.Cursor,
+    chunk_path: Path,
+    hydrator: _RangeHydrator,
+    stats: Dict[str, int],
+    *,
+    code_tokens: bool = False,
+    trigram: bool = False,
+) -> None:
+    """Apply the difference between the copied index and ``chunk_path``.
+
+    A chunk is kept when its whole ``chunks`` row, including a non-empty
+    content hash, is unchanged; its FTS text is then the same as well and is
+    neither re-hydrated nor re-tokenized. All other rows are replaced.
+
+    ``chunks_trigram`` reads its text from ``chunks_fts``, so replaced rows
+    are removed from it while their old content is still there, and rows
+    inserted past the highest remaining rowid are added afterwards.
+    """
+    previous = {
+        row[0]: tuple(row)
+        for row in c.execute(f"SELECT {', '.join(_CHUNK_COLUMNS)} FROM chunks")
+    }
+    fts_rowids: Dict[str, List[int]] = {}
+    for rowid, cid in c.execute("SELECT rowid, chunk_id FROM chunks_fts"):
+        fts_rowids.setdefault(cid, []).append(rowid)
+
+    seen = set()
+    stale: List[str] = []
+    batch_chunks = []
+    batch_fts = []
+    for row, chunk in _iter_chunk_rows(chunk_path, stats):
+        cid = row[0]
+        if cid in seen:
+            raise sqlite3.IntegrityError("UNIQUE constraint failed: chunks.chunk_id")
+        seen.add(cid)
+        stats["ingested_chunks_count"] += 1
+        old = previous.get(cid)
+        if old is not None and row[10] and old == row:
+            stats["reused_chunks"] += 1
+            continue
+        if old is not None:
+            stale.append(cid)
+        batch_chunks.append(row)
+        _append_fts_row(batch_fts, row, chunk, hydrator, stats)
+        stats["inserted_chunks"] += 1
+
+    removed = [cid for cid in previous if cid not in seen]
+    stats["deleted_chunks"] = len(removed)
+    stale.extend(removed)
+    stale_rowids = [(rowid,) for cid in stale for rowid in fts_rowids.get(cid, ())]
+    c.executemany("DELETE FROM chunks WHERE chunk_id = ?", [(cid,) for cid in stale])
+    if trigram:
+        c.executemany(
+            "INSERT INTO chunks_trigram(chunks_trigram, rowid, content)"
+            " SELECT 'delete', rowid, content FROM chunks_fts WHERE rowid = ?",
+            stale_rowids,
+        )
+    c.executemany("DELETE FROM chunks_fts WHERE rowid = ?", stale_rowids)
+    (last_rowid,) = c.execute("SELECT coalesce(max(rowid), 0) FROM chunks_fts").fetchone()
+    for start in range(0, len(batch_chunks), _BATCH_SIZE):
+        _insert_batch(
+            c,
+            batch_chunks[start:start + _BATCH_SIZE],
+            batch_fts[start:start + _BATCH_SIZE],
+            hydrator,
+            stats,
+            code_tokens,
+        )
+    if trigram:
+        c.execute(
+            "INSERT INTO chunks_trigram(rowid, content)"
+            " SELECT rowid, content FROM chunks_fts WHERE rowid > ?",
+            (last_rowid,),
+        )
+
+
+def _fts_meta_items(code_tokens: bool, trigram: bool) -> List[Tuple[str, str]]:
+    return [
+        ("fts.code_tokens", CODE_TOKENS_FORMAT if code_tokens else "0"),
+        ("fts.trigram", "1" if trigram else "0"),
+    ]
+
+
+def _open_reusable_index(
+    previous_db: Path,
+    db_path: Path,
+    config_payload: Optional[Dict[str, Any]],
+    fts_meta: List[Tuple[str, str]],
+) -> Optional[sqlite3.Connection]:
+    """Copy ``previous_db`` to ``db_path`` and open it if it can be updated in place.
+
+    The previous index is only read; a copy that was built with another schema
+    version, config or FTS options, or is not a readable index, is removed
+    again and ``None`` is returned so the caller falls back to a full build.
+    """
+    try:
+        shutil.copyfile(previous_db, db_path)
+    except OSError:
+        return None
+    conn = sqlite3.connect(str(db_path))
+    try:
+        meta = dict(conn.execute(
+            "SELECT key, value FROM index_meta WHERE key IN"
+            " ('schema_version', 'config_json', 'fts.code_tokens', 'fts.trigram')"
+        ).fetchall())
+        columns = tuple(row[1] for row in conn.execute("PRAGMA table_info(chunks)"))
+        conn.execute("SELECT rowid FROM chunks_fts LIMIT 0")
+    except sqlite3.DatabaseError:
+        meta, columns = {}, ()
+    if (
+        meta.get("schema_version") == INDEX_SCHEMA_VERSION
+        and meta.get("config_json") == json.dumps(config_payload or {})
+        and columns == _CHUNK_COLUMNS
+        # Indexes from before these options were recorded have neither.
+        and all(meta.get(key, "0") == value for key, value in fts_meta)
+    ):
+        return conn
+    conn.close()
+    db_path.unlink()
+    return None
+
+
+def build_index(
+    dump_path: Path,
+    chunk_path: Path,
+    db_path: Path,
+    config_payload: Optional[Dict[str, Any]] = None,
+    *,
+    previous_db: Optional[Path] = None,
+    code_tokens: bool = False,
+    trigram: bool = False,
+) -> None:
     """
     Builds the SQLite index from artifacts.
+
+    With ``previous_db`` the index starts as a copy of that earlier generation
+    and only chunks whose row changed are deleted and re-inserted. The
+    previous database is never modified, so a published generation stays
+    intact. Without a compatible previous index this is a full build.
+
+    ``code_tokens`` and ``trigram`` select the optional subword column and
+    trigram side-index (see ``create_schema``); the choice is stored as
+    ``fts.code_tokens`` / ``fts.trigram`` in ``index_meta`` for the query side.
     """
     if db_path.exists():
         try:
@@ -253,167 +716,40 @@ def build_index(dump_path: Path, chunk_path: Path, db_path: Path, config_payload
             raise RuntimeError(f"Could not remove existing DB {db_path}: {e}")
 
     dump_manifest = json.loads(dump_path.read_text(encoding="utf-8"))
-    conn = sqlite3.connect(str(db_path))
+    fts_meta = _fts_meta_items(code_tokens, trigram)
+    conn = None
+    if previous_db is not None and previous_db.exists():
+        conn = _open_reusable_index(previous_db, db_path, config_payload, fts_meta)
+    incremental = conn is not None
+    if conn is None:
+        conn = sqlite3.connect(str(db_path))
+    hydrator = _RangeHydrator(dump_path, dump_manifest)
     build_succeeded = False
     try:
-        create_schema(conn)
+        for pragma in _BULK_LOAD_PRAGMAS:
+            conn.execute(pragma)
+        create_schema(conn, defer_indexes=not incremental, code_tokens=code_tokens, trigram=trigram)
         c = conn.cursor()
 
         # Diagnostics counters
-        stats = {
-            "total_lines": 0,
-            "empty_lines": 0,
-            "invalid_json_lines": 0,
-            "missing_chunk_id_lines": 0,
-            "ingested_chunks_count": 0,
-            "fts_hydrated_from_canonical_range": 0,
-            "fts_hydrated_from_range_ref": 0,
-        }
+        stats = _new_ingest_stats()
 
         # 2. Ingest Chunks
-        batch_size = 500
-        batch_chunks = []
-        batch_fts = []
-
-        with chunk_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                stats["total_lines"] += 1
-                if not line.strip():
-                    stats["empty_lines"] += 1
-                    continue
-                try:
-                    chunk = json.loads(line)
-                except json.JSONDecodeError:
-                    stats["invalid_json_lines"] += 1
-                    continue
-
-                cid = chunk.get("chunk_id")
-                if not cid:
-                    stats["missing_chunk_id_lines"] += 1
-                    continue
-
-                repo = chunk.get("repo") or chunk.get("repo_id") or "unknown"
-                path = chunk.get("path", "")
-                path_norm = path.lower().replace("\\", "/")
-
-                layer = chunk.get("layer", "unknown")
-                atype = chunk.get("artifact_type", "unknown")
-
-                sb = chunk.get("start_byte", 0)
-                eb = chunk.get("end_byte", 0)
-                sl = chunk.get("start_line", 0)
-                el = chunk.get("end_line", 0)
-
-                sha = chunk.get("sha256") or chunk.get("content_sha256") or ""
-                size = chunk.get("size") or chunk.get("size_bytes") or 0
-                lang = chunk.get("language", "")
-
-                # FTS Content: prefer inline content, otherwise hydrate from canonical bundle ranges.
-                content_text = chunk.get("content") or ""
-                if not content_text:
-                    # canonical_range is authoritative when present: it is a hash-verified pointer
-                    # into canonical_md and will raise hard on any error.
-                    # content_range_ref is used only as a backward-compatible fallback when
-                    # canonical_range is absent — never as a silent alternative to a broken one.
-                    raw_canonical_range = chunk.get("canonical_range")
-                    if raw_canonical_range is not None:
-                        try:
-                            content_text = _hydrate_text_from_range_like_ref(
-                                dump_path,
-                                dump_manifest,
-                                raw_canonical_range,
-                                field_name="canonical_range",
-                                chunk_id=cid,
-                            )
-                        except RuntimeError as e:
-                            msg = str(e)
-                            if msg.startswith("FTS hydration failed for chunk "):
-                                raise RuntimeError(msg) from e
-                            raise RuntimeError(
-                                f"FTS hydration failed for chunk '{cid}' via canonical_range: {msg}"
-                            ) from e
-                        stats["fts_hydrated_from_canonical_range"] += 1
-                    else:
-                        raw_content_range_ref = chunk.get("content_range_ref")
-                        if raw_content_range_ref is not None:
-                            try:
-                                parsed_ref = _parse_range_like_ref(
-                                    raw_content_range_ref,
-                                    field_name="content_range_ref",
-                                    chunk_id=cid,
-                                )
-                                if parsed_ref.get("artifact_role") == "source_file":
-                                    content_text = _hydrate_text_from_legacy_source_file_ref(
-                                        dump_path,
-                                        parsed_ref,
-                                        field_name="content_range_ref",
-                                        chunk_id=cid,
-                                    )
-                                else:
-                                    content_text = _hydrate_text_from_range_like_ref(
-                                        dump_path,
-                                        dump_manifest,
-                                        parsed_ref,
-                                        field_name="content_range_ref",
-                                        chunk_id=cid,
-                                    )
-                            except (RuntimeError, ValueError, FileNotFoundError) as e:
-                                msg = str(e)
-                                if msg.startswith("FTS hydration failed for chunk "):
-                                    raise RuntimeError(msg) from e
-                                raise RuntimeError(
-                                    f"FTS hydration failed for chunk '{cid}' via content_range_ref: {msg}"
-                                ) from e
-                            stats["fts_hydrated_from_range_ref"] += 1
-                    if not content_text:
-                        logger.debug(
-                            "Chunk '%s' has no inline content and no canonical/content range ref; FTS content will be empty.",
-                            cid,
-                        )
-
-                # Path tokens: split by common delimiters
-                path_tokens = path_norm.replace("/", " ").replace(".", " ").replace("_", " ").replace("-", " ")
-
-                batch_chunks.append((
-                    cid, repo, path, path_norm, layer, atype,
-                    sb, eb, sl, el, sha, size, lang,
-                    json.dumps(chunk.get("content_range_ref")) if chunk.get("content_range_ref") else None,
-                    chunk.get("source_file", path)
-                ))
-
-                batch_fts.append((
-                    cid, content_text, path_tokens
-                ))
-
-                stats["ingested_chunks_count"] += 1
-
-                if len(batch_chunks) >= batch_size:
-                    c.executemany("""
-                        INSERT INTO chunks (chunk_id, repo_id, path, path_norm, layer, artifact_type,
-                                          start_byte, end_byte, start_line, end_line, content_sha256, size_bytes, language, content_range_ref, source_file)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, batch_chunks)
-
-                    c.executemany("""
-                        INSERT INTO chunks_fts (chunk_id, content, path_tokens)
-                        VALUES (?, ?, ?)
-                    """, batch_fts)
-
-                    batch_chunks = []
-                    batch_fts = []
-
-        # Final batch
-        if batch_chunks:
-            c.executemany("""
-                INSERT INTO chunks (chunk_id, repo_id, path, path_norm, layer, artifact_type,
-                                  start_byte, end_byte, start_line, end_line, content_sha256, size_bytes, language, content_range_ref, source_file)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, batch_chunks)
-
-            c.executemany("""
-                INSERT INTO chunks_fts (chunk_id, content, path_tokens)
-                VALUES (?, ?, ?)
-            """, batch_fts)
+        ingest_started = time.perf_counter()
+        if incremental:
+            stats.update(reused_chunks=0, inserted_chunks=0, deleted_chunks=0)
+            _ingest_incremental(c, chunk_path, hydrator, stats, code_tokens=code_tokens, trigram=trigram)
+        else:
+            _ingest_full(c, chunk_path, hydrator, stats, code_tokens=code_tokens, trigram=trigram)
+            _create_secondary_indexes(c)
+            # Merge the FTS5 b-tree segments written by the batches into one.
+            # Incremental builds skip this full rewrite and leave their few
+            # new segments to FTS5's automerge.
+            c.execute("INSERT INTO chunks_fts(chunks_fts) VALUES ('optimize')")
+            if trigram:
+                c.execute("INSERT INTO chunks_trigram(chunks_trigram) VALUES ('optimize')")
+        ingest_seconds = time.perf_counter() - ingest_started
+        written_chunks = stats["inserted_chunks"] if incremental else stats["ingested_chunks_count"]
 
         # 1. Metadata (written last to include stats)
         dump_sha = _compute_file_sha256(dump_path)
@@ -436,18 +772,27 @@ def build_index(dump_path: Path, chunk_path: Path, db_path: Path, config_payload
             ("created_at", now_utc),
             ("config_json", json.dumps(config_payload or {})),
             ("config_sha256", config_sha256),
-            ("lenskit_version", lenskit_version)
+            ("lenskit_version", lenskit_version),
+            ("ingest.mode", "incremental" if incremental else "full"),
+            *fts_meta,
         ]
 
         # Add stats to meta
         for k, v in stats.items():
             meta_items.append((f"ingest.{k}", str(v)))
+        meta_items.extend([
+            ("ingest.seconds", f"{ingest_seconds:.6f}"),
+            ("ingest.chunks_per_second", f"{written_chunks / ingest_seconds:.1f}" if ingest_seconds > 0 else "0"),
+            ("ingest.bytes_per_second", f"{stats['ingested_content_bytes'] / ingest_seconds:.1f}" if ingest_seconds > 0 else "0"),
+        ])
 
+        c.execute("DELETE FROM index_meta WHERE key LIKE 'ingest.%'")
         c.executemany("INSERT OR REPLACE INTO index_meta (key, value) VALUES (?, ?)", meta_items)
 
         conn.commit()
         build_succeeded = True
     finally:
+        hydrator.close()
         conn.close()
         if not build_succeeded and db_path.exists():
             try:
@@ -464,10 +809,20 @@ def build_index(dump_path: Path, chunk_path: Path, db_path: Path, config_payload
             stats["total_lines"],
         )
 
-def verify_index(db_path: Path, dump_path: Path, chunk_path: Path) -> bool:
+def verify_index(
+    db_path: Path,
+    dump_path: Path,
+    chunk_path: Path,
+    *,
+    code_tokens: Optional[bool] = None,
+    trigram: Optional[bool] = None,
+) -> bool:
     """
     Verifies if the index is fresh and matches the artifacts.
     Returns True if valid, False if stale/invalid.
+
+    When ``code_tokens`` or ``trigram`` is given, an index built with other
+    FTS options (``fts.*`` in ``index_meta``) counts as stale too.
     """
     if not db_path.exists():
         return False
@@ -482,11 +837,17 @@ def verify_index(db_path: Path, dump_path: Path, chunk_path: Path) -> bool:
                 row_dump = c.execute("SELECT value FROM index_meta WHERE key='dump_sha256'").fetchone()
 
             row_chunk = c.execute("SELECT value FROM index_meta WHERE key='chunk_index_sha256'").fetchone()
+            fts_meta = dict(c.execute("SELECT key, value FROM index_meta WHERE key LIKE 'fts.%'").fetchall())
         finally:
             conn.close()
 
         if not row_dump or not row_chunk:
             return False
+        if code_tokens is not None or trigram is not None:
+            requested = _fts_meta_items(bool(code_tokens), bool(trigram))
+            # Indexes from before these options were recorded have neither.
+            if any(fts_meta.get(key, "0") != value for key, value in requested):
+                return False
 
         stored_dump = row_dump[0]
         stored_chunk = row_chunk[0]
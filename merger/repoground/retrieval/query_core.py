@@ -3,12 +3,17 @@ import sqlite3
 from pathlib import Path, PurePosixPath
 import json
 import time
-from typing import Dict, Any, Optional, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .router import route_query
+from .index_connections import PooledIndex, index_connection_pool
+from .router import route_query, substring_query
 from ..core.range_resolver import build_derived_range_ref
 from ..core.graph_degradation import graph_load_degradation
-from ..architecture.graph_index import load_graph_index
+from ..architecture.graph_index import (
+    graph_index_cache_stats,
+    graph_proximity_scores,
+    load_graph_index,
+)
 
 WHY_ZERO_TOKENS = "tokens too restrictive"
 WHY_ZERO_FILTERS = "filters too restrictive"
@@ -39,6 +44,114 @@ _SEMANTIC_FALLBACK_ENCODING_ERROR = "semantic_fallback_encoding_error"
 logger = logging.getLogger(__name__)
 
 
+def _index_fact(pooled_index: Optional[PooledIndex], name: str, compute: Callable[[], Any]) -> Any:
+    """``compute()``, cached per pooled index file when the connection is pooled."""
+    if pooled_index is None:
+        return compute()
+    return pooled_index.fact(name, compute)
+
+
+def _has_source_file_column(conn: sqlite3.Connection, pooled_index: Optional[PooledIndex]) -> bool:
+    """Whether ``chunks`` has ``source_file``; cached per pooled index file."""
+    def compute() -> bool:
+        # Check if source_file exists in schema to support backwards compatibility
+        # If not, we don't query it.
+        cursor = conn.execute("PRAGMA table_info(chunks)")
+        columns = [row["name"] for row in cursor.fetchall()]
+        return "source_file" in columns
+
+    return _index_fact(pooled_index, "has_source_file", compute)
+
+
+def _fts_options(conn: sqlite3.Connection, pooled_index: Optional[PooledIndex]) -> Dict[str, bool]:
+    """FTS options the index was built with (``index_db.build_index``); cached per pooled index file."""
+    def compute() -> Dict[str, bool]:
+        try:
+            meta = dict(conn.execute(
+                "SELECT key, value FROM index_meta WHERE key IN ('fts.code_tokens', 'fts.trigram')"
+            ).fetchall())
+        except sqlite3.OperationalError:
+            meta = {}
+        return {
+            # The value is the subword column format; every format supports phrases.
+            "code_tokens": meta.get("fts.code_tokens", "0") != "0",
+            "trigram": meta.get("fts.trigram") == "1",
+        }
+
+    return _index_fact(pooled_index, "fts_options", compute)
+
+
+def _read_expected_graph_sha256(db_conn: sqlite3.Connection) -> Optional[str]:
+    try:
+        # The canonical table is index_meta
+        cursor = db_conn.execute("SELECT value FROM index_meta WHERE key='canonical_dump_index_sha256'")
+        row = cursor.fetchone()
+        if row:
+            return row["value"]
+
+        # Legacy fallback
+        cursor = db_conn.execute("SELECT value FROM index_meta WHERE key='dump_sha256'")
+        row = cursor.fetchone()
+        if row:
+            return row["value"]
+    except sqlite3.OperationalError:
+        pass
+    return None
+
+
+def _index_connector(index_path: Path, read_only: bool) -> Tuple[Path, Callable[[], sqlite3.Connection]]:
+    """Validate ``index_path`` and return it with a ``connect()`` for the pool.
+
+    Connections are opened with ``check_same_thread=False`` so the pool can
+    hand an idle one to whichever thread queries the index next.
+    """
+    raw_index_path = str(index_path)
+    if "\x00" in raw_index_path:
+        raise ValueError("Invalid index path: NUL bytes are not allowed.")
+    resolved_index_path = Path(index_path)
+    if read_only and not resolved_index_path.name.endswith(_REQUIRED_READ_ONLY_SQLITE_INDEX_SUFFIX):
+        raise ValueError("Invalid index path: expected canonical read-only index file.")
+    if not read_only and not any(
+        resolved_index_path.name.endswith(suffix)
+        for suffix in _ALLOWED_SQLITE_INDEX_SUFFIXES
+    ):
+        raise ValueError(
+            "Invalid index path: expected a SQLite index file "
+            f"ending with one of {_ALLOWED_SQLITE_INDEX_SUFFIXES!r}."
+        )
+    if read_only:
+        if not resolved_index_path.is_absolute():
+            raise ValueError("Invalid index path: expected an absolute read-only index path.")
+        db_uri = f"{resolved_index_path.as_uri()}?mode=ro&immutable=1"
+
+        def connect() -> sqlite3.Connection:
+            # Callers validate and confine the index path before read-only execution.
+            conn = sqlite3.connect(db_uri, uri=True, check_same_thread=False)  # lgtm[py/path-injection] codeql-boundary:query-readonly-index
+            return conn
+    else:
+        def connect() -> sqlite3.Connection:
+            return sqlite3.connect(str(resolved_index_path), check_same_thread=False)
+    return resolved_index_path, connect
+
+
+def _fts_select_sql(has_source_file: bool, table: str = "chunks_fts") -> str:
+    """Candidate SELECT matching ``table``; ``chunks_trigram`` shares rowids with ``chunks_fts``."""
+    source_file = " c.source_file," if has_source_file else ""
+    if table == "chunks_fts":
+        source = "FROM chunks_fts"
+    else:
+        source = f"FROM {table} JOIN chunks_fts ON chunks_fts.rowid = {table}.rowid"
+    return f"""
+        SELECT
+            c.chunk_id, c.repo_id, c.path, c.start_line, c.end_line, c.start_byte, c.end_byte, c.content_sha256,
+            c.layer, c.artifact_type, c.content_range_ref,{source_file} chunks_fts.content,
+            bm25({table}) as score
+        {source}
+        JOIN chunks c ON c.chunk_id = chunks_fts.chunk_id
+        WHERE {table} MATCH ?
+    """
+
+
 def normalize_excluded_paths(excluded_paths: Optional[List[str]]) -> List[str]:
     """Validate and normalize exact repository-relative POSIX path exclusions."""
     if excluded_paths is None:
@@ -476,29 +589,13 @@ def execute_query(
             trace_data["excluded_paths"] = normalized_excluded_paths
 
     conn = None
+    pool = index_connection_pool()
+    pooled_index = None
+    pool_hit = False
+    reusable = False
     try:
-        raw_index_path = str(index_path)
-        if "\x00" in raw_index_path:
-            raise ValueError("Invalid index path: NUL bytes are not allowed.")
-        resolved_index_path = Path(index_path)
-        if read_only and not resolved_index_path.name.endswith(_REQUIRED_READ_ONLY_SQLITE_INDEX_SUFFIX):
-            raise ValueError("Invalid index path: expected canonical read-only index file.")
-        if not read_only and not any(
-            resolved_index_path.name.endswith(suffix)
-            for suffix in _ALLOWED_SQLITE_INDEX_SUFFIXES
-        ):
-            raise ValueError(
-                "Invalid index path: expected a SQLite index file "
-                f"ending with one of {_ALLOWED_SQLITE_INDEX_SUFFIXES!r}."
-            )
-        if read_only:
-            if not resolved_index_path.is_absolute():
-                raise ValueError("Invalid index path: expected an absolute read-only index path.")
-            db_uri = f"{resolved_index_path.as_uri()}?mode=ro&immutable=1"
-            # Callers validate and confine the index path before read-only execution.
-            conn = sqlite3.connect(db_uri, uri=True)  # lgtm[py/path-injection] codeql-boundary:query-readonly-index
-        else:
-            conn = sqlite3.connect(str(resolved_index_path))
+        resolved_index_path, connect = _index_connector(index_path, read_only)
+        conn, pooled_index, pool_hit = pool.acquire(resolved_index_path, read_only, connect)
         conn.row_factory = sqlite3.Row
 
         where_clauses = []
@@ -509,6 +606,7 @@ def execute_query(
         fts_query_str = None
         router_output = None
         routed_query_raw = query_text
+        fts_options = _fts_options(conn, pooled_index)
 
         if query_text:
             engine_type = "fts5"
@@ -522,7 +620,9 @@ def execute_query(
             else:
                 # Route query (synonym expansion, stop-verbs, intent)
                 router_output = route_query(
-                    query_text, overmatch_guard=overmatch_guard
+                    query_text,
+                    overmatch_guard=overmatch_guard,
+                    code_tokens=fts_options["code_tokens"],
                 )
 
                 # Use routed fts_query if available, fallback to original query
@@ -536,44 +636,18 @@ def execute_query(
             # FTS Query: Escape double quotes
             cleaned_q = routed_query.replace('"', '""')
 
-            # Check if source_file exists in schema to support backwards compatibility
-            # If not, we don't query it.
-            cursor = conn.execute("PRAGMA table_info(chunks)")
-            columns = [row["name"] for row in cursor.fetchall()]
-            has_source_file = "source_file" in columns
-
-            if has_source_file:
-                base_sql = """
-                    SELECT
-                        c.chunk_id, c.repo_id, c.path, c.start_line, c.end_line, c.start_byte, c.end_byte, c.content_sha256,
-                        c.layer, c.artifact_type, c.content_range_ref, c.source_file, chunks_fts.content,
-                        bm25(chunks_fts) as score
-                    FROM chunks_fts
-                    JOIN chunks c ON c.chunk_id = chunks_fts.chunk_id
-                    WHERE chunks_fts MATCH ?
-                """
-            else:
-                base_sql = """
-                    SELECT
-                        c.chunk_id, c.repo_id, c.path, c.start_line, c.end_line, c.start_byte, c.end_byte, c.content_sha256,
-                        c.layer, c.artifact_type, c.content_range_ref, chunks_fts.content,
-                        bm25(chunks_fts) as score
-                    FROM chunks_fts
-                    JOIN chunks c ON c.chunk_id = chunks_fts.chunk_id
-                    WHERE chunks_fts MATCH ?
-                """
+            has_source_file = _has_source_file_column(conn, pooled_index)
+            select_sql = _fts_select_sql(has_source_file)
 
             params.append(cleaned_q)
             fts_query_str = cleaned_q
             where_clauses.append("1=1") # Placeholder for appending ANDs easily
         else:
             # Metadata only query
-            cursor = conn.execute("PRAGMA table_info(chunks)")
-            columns = [row["name"] for row in cursor.fetchall()]
-            has_source_file = "source_file" in columns
+            has_source_file = _has_source_file_column(conn, pooled_index)
 
             if has_source_file:
-                base_sql = """
+                select_sql = """
                     SELECT
                         c.chunk_id, c.repo_id, c.path, c.start_line, c.end_line, c.start_byte, c.end_byte, c.content_sha256,
                         c.layer, c.artifact_type, c.content_range_ref, c.source_file, '' as content,
@@ -581,7 +655,7 @@ def execute_query(
                     FROM chunks c
                 """
             else:
-                base_sql = """
+                select_sql = """
                     SELECT
                         c.chunk_id, c.repo_id, c.path, c.start_line, c.end_line, c.start_byte, c.end_byte, c.content_sha256,
                         c.layer, c.artifact_type, c.content_range_ref, '' as content,
@@ -619,15 +693,14 @@ def execute_query(
             where_clauses.append(f"c.path NOT IN ({placeholders})")
             params.extend(normalized_excluded_paths)
 
-        # Combine clauses
+        # Combine clauses into the WHERE/ORDER/LIMIT suffix shared by every SELECT
         if query_text:
             # Skip the first placeholder "1=1" if we are appending to existing WHERE
             extras = [c for c in where_clauses if c != "1=1"]
-            if extras:
-                base_sql += " AND " + " AND ".join(extras)
+            filter_sql = " AND " + " AND ".join(extras) if extras else ""
         else:
             # For metadata query, we have `FROM chunks c`. We need to start WHERE clause.
-            base_sql += " WHERE " + " AND ".join(where_clauses)
+            filter_sql = " WHERE " + " AND ".join(where_clauses)
 
         if trace_data:
             trace_data["timings"]["parse_validate_end"] = time.perf_counter()
@@ -640,15 +713,27 @@ def execute_query(
         # Append ordering and limit
         if query_text:
             # BM25: lower is better
-            base_sql += " ORDER BY score ASC, c.repo_id ASC, c.path ASC, c.start_line ASC LIMIT ?"
+            filter_sql += " ORDER BY score ASC, c.repo_id ASC, c.path ASC, c.start_line ASC LIMIT ?"
         else:
-            base_sql += " ORDER BY c.repo_id, c.path, c.start_line LIMIT ?"
+            filter_sql += " ORDER BY c.repo_id, c.path, c.start_line LIMIT ?"
 
         params.append(fetch_k)
 
-        cursor = conn.execute(base_sql, params)
+        cursor = conn.execute(select_sql + filter_sql, params)
         rows = cursor.fetchall()
 
+        # Identifier fragments ("xecute_qu") match no whole token; an index
+        # with the trigram side-table answers them as substrings instead.
+        trigram_query = substring_query(query_text) if query_text and fts_options["trigram"] else ""
+        if not rows and trigram_query:
+            trigram_sql = _fts_select_sql(has_source_file, "chunks_trigram") + filter_sql
+            rows = conn.execute(trigram_sql, [trigram_query, *params[1:]]).fetchall()
+            if rows:
+                engine_type += "+trigram"
+                fts_query_str = trigram_query
+                if trace_data:
+                    trace_data["fallback_markers"].append("trigram_substring")
+
         if trace_data:
             trace_data["timings"]["candidate_retrieval_end"] = time.perf_counter()
             trace_data["candidate_count"] = len(rows)
@@ -744,26 +829,12 @@ def execute_query(
                     }
 
         graph_index = None
+        graph_scores = {}
         graph_status = "not_found"
 
-        def _read_expected_graph_sha256(db_conn) -> Optional[str]:
-            try:
-                # The canonical table is index_meta
-                cursor = db_conn.execute("SELECT value FROM index_meta WHERE key='canonical_dump_index_sha256'")
-                row = cursor.fetchone()
-                if row:
-                    return row["value"]
-
-                # Legacy fallback
-                cursor = db_conn.execute("SELECT value FROM index_meta WHERE key='dump_sha256'")
-                row = cursor.fetchone()
-                if row:
-                    return row["value"]
-            except sqlite3.OperationalError:
-                pass
-            return None
-
-        expected_sha256 = _read_expected_graph_sha256(conn)
+        expected_sha256 = _index_fact(
+            pooled_index, "expected_graph_sha256", lambda: _read_expected_graph_sha256(conn)
+        )
 
         if graph_index_path:
             graph_root = index_path.parent
@@ -792,8 +863,16 @@ def execute_query(
             graph_status = res["status"]
             if graph_status == "ok":
                 graph_index = res["graph"]
+                graph_scores = res.get("proximity_scores")
+                if graph_scores is None:
+                    graph_scores = graph_proximity_scores(graph_index or {})
             else:
                 graph_index = None
+            if trace_data:
+                trace_data["graph_index_cache"] = dict(
+                    graph_index_cache_stats(),
+                    hit=bool(res.get("cache_hit")),
+                )
 
         if not graph_weights:
             graph_weights = {"w_bm25": 0.65, "w_graph": 0.20, "w_entry": 0.15}
@@ -849,13 +928,11 @@ def execute_query(
                 graph_bonus = 0.0
 
                 if graph_used and graph_index:
-                    dist = graph_index.get("distances", {}).get(node_id, -1)
-                    if dist == 0:
-                        graph_proximity = 1.0
-                        entrypoint_boost = 1.0
+                    dist, graph_proximity, entrypoint_boost = graph_scores.get(
+                        node_id, (-1, 0.0, 0.0)
+                    )
+                    if entrypoint_boost:
                         why_list.append("entrypoint_boost")
-                    elif dist > 0:
-                        graph_proximity = 1.0 / (dist + 1.0)
 
                     if graph_proximity > 0:
                         why_list.append("near_entry")
@@ -1090,8 +1167,14 @@ def execute_query(
         if trace_data:
             trace_data["timings"]["context_explain_end"] = time.perf_counter()
             trace_data["timings"]["end"] = time.perf_counter()
+            trace_data["connection_pool"] = dict(
+                pool.stats(),
+                hit=pool_hit,
+                pooled=pooled_index is not None,
+            )
             out["query_trace"] = trace_data
 
+        reusable = True
         return out
 
     except sqlite3.Error as e:
@@ -1109,7 +1192,7 @@ def execute_query(
             raise RuntimeError("Database error executing query.") from e
     finally:
         if conn:
-            conn.close()
+            pool.release(pooled_index, conn, reusable=reusable)
 
 def _expand_context(db_conn: sqlite3.Connection, chunk_id: str, file_path: str, start_line: int, end_line: int, context_mode: str, context_window_lines: int) -> Optional[str]:
     """Expands context based on the requested mode."""
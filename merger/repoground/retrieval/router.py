@@ -1,5 +1,7 @@
 import re
-from typing import Dict, Any
+from typing import Any, Dict, List, Tuple
+
+from .code_tokens import split_identifier
 
 STOPWORDS = {
     "show", "find", "get", "where", "how", "what", "is", "are", "does", "do",
@@ -27,13 +29,56 @@ SYNONYMS = {
     "authentication": ["auth", "login", "credentials", "security"]
 }
 
-def route_query(query_text: str, overmatch_guard: bool = False) -> Dict[str, Any]:
+FTS_RESERVED = {"and", "or", "not", "near"}
+
+
+def _safe_token(t: str) -> str:
+    if t.lower() in FTS_RESERVED:
+        return f'"{t}"'
+    return t
+
+
+def _detect_intent(tokens: List[str]) -> str:
+    """Intent of the earliest token that triggers one, else ``unknown``."""
+    detected_intent = "unknown"
+    best_pos = len(tokens) + 1
+
+    for intent, triggers in INTENT_TRIGGERS.items():
+        for idx, token in enumerate(tokens):
+            if token in triggers and idx < best_pos:
+                best_pos = idx
+                detected_intent = intent
+    return detected_intent
+
+
+def _synonym_group(token: str, code_tokens: bool) -> Tuple[str, List[str]]:
+    """OR group of ``token`` and its synonyms, e.g. ``(index OR indexing OR build_index)``."""
+    synonyms = SYNONYMS[token]
+    if code_tokens:
+        synonyms = [s for s in synonyms if "_" not in s]
+    expansions = [token] + synonyms
+    safe_expansions = [_safe_token(e) for e in expansions]
+    return "(" + " OR ".join(safe_expansions) + ")", synonyms
+
+
+def route_query(
+    query_text: str,
+    overmatch_guard: bool = False,
+    *,
+    code_tokens: bool = False,
+) -> Dict[str, Any]:
     r"""
     Parses the query text and extracts intents, removes stopwords,
     and performs synonym OR-expansion if overmatch_guard is False.
 
     Note on tokenization: Uses `\b\w+\b`, intentionally dropping characters
     like `-` or `+` to maintain robust behavior in SQLite FTS matching.
+
+    With ``code_tokens`` (the index was built with camelCase subwords, see
+    ``index_db.create_schema``) identifier terms such as ``buildIndex`` or
+    ``execute_query`` become the phrase ``build + index``, which matches
+    either spelling, and synonyms that are themselves identifiers are
+    dropped since the subword index already covers them.
     """
     if not query_text:
         return {
@@ -43,17 +88,17 @@ def route_query(query_text: str, overmatch_guard: bool = False) -> Dict[str, Any
         }
 
     # Normalize query
-    tokens = re.findall(r'\b\w+\b', query_text.lower())
+    if code_tokens:
+        # camelCase boundaries are only visible before lower-casing.
+        raw_tokens = re.findall(r'\b\w+\b', query_text)
+        tokens = [t.lower() for t in raw_tokens]
+        subwords = {t.lower(): split_identifier(t) for t in raw_tokens if t.isascii()}
+    else:
+        tokens = re.findall(r'\b\w+\b', query_text.lower())
+        subwords = {}
 
     # 1. Intent Extraction
-    detected_intent = "unknown"
-    best_pos = len(tokens) + 1
-
-    for intent, triggers in INTENT_TRIGGERS.items():
-        for idx, token in enumerate(tokens):
-            if token in triggers and idx < best_pos:
-                best_pos = idx
-                detected_intent = intent
+    detected_intent = _detect_intent(tokens)
 
     # 2. Stopword Removal
     filtered_tokens = [t for t in tokens if t not in STOPWORDS]
@@ -64,30 +109,38 @@ def route_query(query_text: str, overmatch_guard: bool = False) -> Dict[str, Any
     # 3. Synonym OR-Expansion
     fts_parts = []
     synonyms_used = set()
-
-    FTS_RESERVED = {"and", "or", "not", "near"}
-
-    def safe_token(t: str) -> str:
-        if t.lower() in FTS_RESERVED:
-            return f'"{t}"'
-        return t
+    subword_phrases = set()
 
     for token in filtered_tokens:
-        if not overmatch_guard and token in SYNONYMS:
-            expansions = [token] + SYNONYMS[token]
-            synonyms_used.update(SYNONYMS[token])
-            # Construct OR group, e.g., (index OR indexing OR build_index)
-            safe_expansions = [safe_token(e) for e in expansions]
-            or_group = " OR ".join(safe_expansions)
-            fts_parts.append(f"({or_group})")
+        parts = subwords.get(token, ())
+        if len(parts) > 1:
+            # FTS5 phrase without quotes, which execute_query escapes.
+            fts_parts.append(" + ".join(parts))
+            subword_phrases.add(" ".join(parts))
+        elif not overmatch_guard and token in SYNONYMS:
+            or_group, synonyms = _synonym_group(token, code_tokens)
+            synonyms_used.update(synonyms)
+            fts_parts.append(or_group)
         else:
-            fts_parts.append(safe_token(token))
+            fts_parts.append(_safe_token(token))
 
     # Join the FTS parts
     fts_query = " AND ".join(fts_parts)
 
-    return {
+    routed = {
         "intent": detected_intent,
         "fts_query": fts_query,
         "synonyms_used": sorted(list(synonyms_used))
     }
+    if code_tokens:
+        routed["subword_phrases"] = sorted(subword_phrases)
+    return routed
+
+
+def substring_query(query_text: str) -> str:
+    """FTS5 query for the trigram side-index: every non-stopword term of at
+    least three characters must occur as a substring, e.g. ``"xecut" AND "uer"``.
+    Returns ``""`` when no term is long enough for a trigram match.
+    """
+    terms = [t for t in re.findall(r'\w+', query_text) if len(t) >= 3 and t.lower() not in STOPWORDS]
+    return " AND ".join(f'"{t}"' for t in terms)
@@ -3,7 +3,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, StreamingResponse, HTMLResponse, RedirectResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.concurrency import run_in_threadpool
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Tuple, Union
 from pathlib import Path
 import os
 import asyncio
@@ -21,7 +21,7 @@ from datetime import datetime, timezone
 from .models import JobRequest, Job, Artifact, AtlasRequest, AtlasArtifact, AtlasEffective, calculate_job_hash, PrescanRequest, PrescanResponse, FSRoot, FSRootsResponse, FederationQueryRequest, QueryRequest, ArtifactLookupRequest, TraceLookupRequest, ContextLookupRequest
 from .jobstore import JobStore
 from .query_artifact_store import QueryArtifactStore
-from .runner import JobRunner
+from .runner import JobRunner, local_source_fingerprint
 from .source_acquisition import resolve_effective_source_mode
 from .logging_provider import LogProvider, FileLogProvider
 from .auth import verify_token
@@ -136,10 +136,7 @@ def _mark_persisted_active_jobs_terminal(job_store: JobStore) -> int:
     )
 
     reconciled = 0
-    for job in job_store.get_all_jobs():
-        if job.status not in ACTIVE_JOB_STATUSES:
-            continue
-
+    for job in job_store.get_jobs(ACTIVE_JOB_STATUSES):
         job.status = "failed"
         job.error = interrupted_error
         job.finished_at = now
@@ -155,7 +152,7 @@ def _mark_persisted_active_jobs_terminal(job_store: JobStore) -> int:
 def _count_active_jobs() -> int:
     if not state.job_store:
         return 0
-    return sum(1 for job in state.job_store.get_all_jobs() if job.status in ACTIVE_JOB_STATUSES)
+    return len(state.job_store.get_jobs(ACTIVE_JOB_STATUSES))
 
 
 def _service_restart_feature_flag_enabled() -> bool:
@@ -645,6 +642,8 @@ def health():
         "merges_dir": str(state.merges_dir) if state.merges_dir else None,
         "auth_enabled": bool(get_security_config().token),
         "running_jobs": _count_active_jobs(),
+        # Lane occupancy, queue depth and wait times of the job scheduler.
+        "scheduler": state.runner.metrics() if state.runner else None,
     }
 
 
@@ -1115,6 +1114,49 @@ def _cleanup_source_snapshots_after_gc() -> None:
         logger.warning("Source snapshot cleanup blocked: %s", snapshot_cleanup)
 
 
+def _succeeded_job_reuse(
+    request: JobRequest, req_hub: Path, content_hash: str, existing: Optional[Job]
+) -> Tuple[Optional[Job], Optional[str]]:
+    """Return the succeeded job that can stand in for ``request`` (if any) and
+    the source fingerprint a new job records.
+
+    A succeeded job is only reusable when the new request does NOT ask for an
+    *effective* pre-pull. effective_pre_pull = pre_pull and not plan_only:
+    a plan-only job never mutates repos, so its cached result is still valid;
+    but a real pre_pull=True request wants a fresh repo-sync check the cached
+    result cannot provide, so we run a new job. (force_new bypasses reuse.)
+    A succeeded remote_snapshot job is likewise never reused: moving ref
+    names are not content-stable, so the cached result may no longer match
+    the current remote. (See rlens-source-acquisition-blueprint.md.)
+    Otherwise the cache key is (parameter hash, source fingerprint): the
+    result is reused only if it was built from the sources as they are now.
+    """
+    effective_source_mode = resolve_effective_source_mode(request)
+    source_fingerprint = None
+    if effective_source_mode == "local_current":
+        source_fingerprint = local_source_fingerprint(req_hub, request.repos)
+    if not existing or request.force_new:
+        return None, source_fingerprint
+    if effective_source_mode in ("local_ff", "remote_snapshot"):
+        if existing.status == "succeeded":
+            reason = (
+                "local_ff requires a fresh repo-sync check"
+                if effective_source_mode == "local_ff"
+                else "remote_snapshot requires fresh remote resolution"
+            )
+            logger.info("Not reusing succeeded job %s because %s.", existing.id, reason)
+        return None, source_fingerprint
+    if not source_fingerprint:
+        return None, source_fingerprint
+    reusable = state.job_store.find_reusable_job(content_hash, source_fingerprint)
+    if reusable:
+        logger.info("Reusing existing succeeded job %s", reusable.id)
+        return reusable, source_fingerprint
+    if existing.status == "succeeded":
+        logger.info("Not reusing succeeded job %s because its sources changed.", existing.id)
+    return None, source_fingerprint
+
+
 @app.post("/api/jobs", response_model=Job, dependencies=[Depends(verify_token)])
 def create_job(request: JobRequest):
     # Validate Hub in request
@@ -1158,44 +1200,23 @@ def create_job(request: JobRequest):
             logger.info("Reusing existing active job %s", existing.id)
             return existing
 
-        # A succeeded job is only reusable when the new request does NOT ask for an
-        # *effective* pre-pull. effective_pre_pull = pre_pull and not plan_only:
-        # a plan-only job never mutates repos, so its cached result is still valid;
-        # but a real pre_pull=True request wants a fresh repo-sync check the cached
-        # result cannot provide, so we run a new job. (force_new bypasses reuse.)
-        # A succeeded remote_snapshot job is likewise never reused: moving ref
-        # names are not content-stable, so the cached result may no longer match
-        # the current remote. (See rlens-source-acquisition-blueprint.md.)
-        if existing.status == "succeeded":
-            effective_source_mode = resolve_effective_source_mode(request)
-            effective_local_ff = effective_source_mode == "local_ff"
-            effective_remote_snapshot = effective_source_mode == "remote_snapshot"
-            if effective_local_ff:
-                logger.info(
-                    "Not reusing succeeded job %s because local_ff requires a fresh repo-sync check.",
-                    existing.id,
-                )
-            elif effective_remote_snapshot:
-                logger.info(
-                    "Not reusing succeeded job %s because remote_snapshot requires fresh remote resolution.",
-                    existing.id,
-                )
-            else:
-                logger.info("Reusing existing succeeded job %s", existing.id)
-                return existing
+    reusable, source_fingerprint = _succeeded_job_reuse(request, req_hub, content_hash, existing)
+    if reusable is not None:
+        return reusable
 
     job = Job.create(request, content_hash=content_hash)
     job.hub_resolved = resolved_hub_str
+    job.source_fingerprint = source_fingerprint
     state.job_store.add_job(job)
     state.runner.submit_job(job.id)
     return job
 
 @app.get("/api/jobs", response_model=List[Job], dependencies=[Depends(verify_token)])
 def get_jobs(status: Optional[str] = None, limit: int = 20):
-    jobs = state.job_store.get_all_jobs()
-    if status:
-        jobs = [j for j in jobs if j.status == status]
-    return jobs[:limit]
+    statuses = [status] if status else None
+    if limit >= 0:
+        return state.job_store.get_jobs(statuses, limit=limit)
+    return state.job_store.get_jobs(statuses)[:limit]
 
 @app.get("/api/jobs/{job_id}", response_model=Job, dependencies=[Depends(verify_token)])
 def get_job(job_id: str):
@@ -1265,7 +1286,7 @@ async def stream_logs(request: Request, job_id: str, last_id: Optional[int] = Qu
 
                 # Read logs from file (async safe)
                 # Use abstracted provider to allow deterministic mocking in tests
-                # Optimized: read chunks using line skip (O(1) memory, preserves line-based semantics)
+                # Seeks via the per-job line offset index; concurrent subscribers share recent lines in memory
                 chunk_data = await run_in_threadpool(state.log_provider.read_log_chunk, job_id, last_idx)
 
                 if chunk_data:
@@ -1,13 +1,14 @@
+import heapq
 import json
 import threading
-import itertools
 import collections
 import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import os
-from typing import List, Optional, Dict, Tuple, Callable
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from .models import Job, Artifact
+from .log_index import LogLineIndex
 
 from merger.repoground.core.merge import MERGES_DIR_NAME, get_merges_dir
 from .source_acquisition import prune_source_snapshots, remove_source_snapshot
@@ -15,20 +16,44 @@ from .source_acquisition import prune_source_snapshots, remove_source_snapshot
 logger = logging.getLogger(__name__)
 
 
+# Journal records past this count (or past the number of live records,
+# whichever is larger) trigger a compaction into jobs.json/artifacts.json.
+JOURNAL_COMPACT_MIN_RECORDS = 256
+
+
 class JobStore:
+    """Job/artifact state: JSON snapshots plus an append-only journal.
+
+    ``jobs.json`` and ``artifacts.json`` hold the state as of the last
+    compaction (written via tmp file + rename, as before). Every later change
+    appends one full-state record to ``journal.jsonl``, so a status change
+    costs one small append instead of rewriting both maps. Loading replays
+    the journal over the snapshots; a torn trailing record from a crash is
+    dropped. Records are idempotent upserts/deletes, so replaying a journal
+    whose compaction was interrupted after the snapshot rename still yields
+    the same state.
+    """
+
     def __init__(self, hub_path: Path):
         self.hub_path = hub_path
         self.storage_dir = self.hub_path / MERGES_DIR_NAME / ".repoground-service"
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.jobs_file = self.storage_dir / "jobs.json"
         self.artifacts_file = self.storage_dir / "artifacts.json"
+        self.journal_file = self.storage_dir / "journal.jsonl"
         self.logs_dir = self.storage_dir / "logs"
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self._lock = threading.RLock()
 
         self._jobs_cache: Dict[str, Job] = {}
         self._artifacts_cache: Dict[str, Artifact] = {}
+        # Secondary indexes, keyed by the values a job was last stored with.
+        self._job_ids_by_hash: Dict[str, Set[str]] = collections.defaultdict(set)
+        self._job_ids_by_status: Dict[str, Set[str]] = collections.defaultdict(set)
+        self._job_index_keys: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._journal_records = 0
         self._log_subscribers: Dict[str, List[Callable[[], None]]] = collections.defaultdict(list)
+        self._log_indexes: Dict[str, LogLineIndex] = {}
         self._snapshot_cleanup_lock = threading.Lock()
 
         self._load()
@@ -39,8 +64,7 @@ class JobStore:
                 try:
                     data = json.loads(self.jobs_file.read_text(encoding="utf-8"))
                     for j in data:
-                        job = Job(**j)
-                        self._jobs_cache[job.id] = job
+                        self._put_job(Job(**j))
                 except Exception as e:
                     logger.error("Error loading jobs: %s", e)
 
@@ -53,6 +77,102 @@ class JobStore:
                 except Exception as e:
                     logger.error("Error loading artifacts: %s", e)
 
+            if self._replay_journal():
+                self._compact()
+
+    def _replay_journal(self) -> bool:
+        """Apply journal records over the loaded snapshots.
+
+        Returns True if the journal had any content, i.e. a compaction is due.
+        """
+        try:
+            raw = self.journal_file.read_bytes()
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error("Error reading job journal: %s", e)
+            return False
+
+        for n, line in enumerate(raw.splitlines(keepends=True), start=1):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("record not terminated")
+                self._apply_record(json.loads(line))
+            except Exception as e:
+                # Only the last record can be torn by a crash mid-append;
+                # anything after an unreadable record is not trusted either.
+                logger.warning("Dropping job journal from record %d on: %s", n, e)
+                break
+        return bool(raw)
+
+    def _apply_record(self, record: dict) -> None:
+        op = record["op"]
+        if op == "put_job":
+            self._put_job(Job(**record["job"]))
+        elif op == "del_job":
+            self._drop_job(record["id"])
+        elif op == "put_artifact":
+            art = Artifact(**record["artifact"])
+            self._artifacts_cache[art.id] = art
+        elif op == "del_artifact":
+            self._artifacts_cache.pop(record["id"], None)
+        else:
+            raise ValueError(f"unknown journal op {op!r}")
+
+    def _put_job(self, job: Job) -> None:
+        self._jobs_cache[job.id] = job
+        keys = (job.status, job.content_hash)
+        old = self._job_index_keys.get(job.id)
+        if old == keys:
+            return
+        if old is not None:
+            self._unindex_job(job.id, old)
+        self._job_index_keys[job.id] = keys
+        self._job_ids_by_status[job.status].add(job.id)
+        if job.content_hash:
+            self._job_ids_by_hash[job.content_hash].add(job.id)
+
+    def _drop_job(self, job_id: str) -> None:
+        self._jobs_cache.pop(job_id, None)
+        old = self._job_index_keys.pop(job_id, None)
+        if old is not None:
+            self._unindex_job(job_id, old)
+
+    def _unindex_job(self, job_id: str, keys: Tuple[str, Optional[str]]) -> None:
+        status, content_hash = keys
+        self._job_ids_by_status[status].discard(job_id)
+        if not self._job_ids_by_status[status]:
+            del self._job_ids_by_status[status]
+        if content_hash:
+            self._job_ids_by_hash[content_hash].discard(job_id)
+            if not self._job_ids_by_hash[content_hash]:
+                del self._job_ids_by_hash[content_hash]
+
+    def _journal(self, records: List[dict]) -> None:
+        if not records:
+            return
+        if not self.journal_file.exists():
+            # No journal means no snapshot it applies to (fresh store, or
+            # the state directory was removed underneath us): write one.
+            self._compact()
+            return
+        payload = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+        with self.journal_file.open("a", encoding="utf-8") as f:
+            f.write(payload)
+        self._journal_records += len(records)
+        live = len(self._jobs_cache) + len(self._artifacts_cache)
+        if self._journal_records > max(JOURNAL_COMPACT_MIN_RECORDS, live):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Fold the journal into the snapshots, then start an empty journal."""
+        self._save_jobs()
+        self._save_artifacts()
+        tmp_file = self.journal_file.with_suffix(".tmp")
+        tmp_file.write_text("", encoding="utf-8")
+        tmp_file.rename(self.journal_file)
+        self._journal_records = 0
+
     def _save_jobs(self) -> None:
         tmp_file = self.jobs_file.with_suffix(".tmp")
         tmp_file.parent.mkdir(parents=True, exist_ok=True)
@@ -69,12 +189,14 @@ class JobStore:
 
     def add_job(self, job: Job):
         with self._lock:
-            self._jobs_cache[job.id] = job
-            self._save_jobs()
+            self._put_job(job)
+            self._journal([{"op": "put_job", "job": job.model_dump()}])
 
     def subscribe_to_logs(self, job_id: str, callback: Callable[[], None]):
         with self._lock:
             self._log_subscribers[job_id].append(callback)
+            # Subscribers of one job share its recent lines from memory.
+            self._log_index(job_id).enable_ring()
 
     def log_subscriber_count(self, job_id: str) -> int:
         with self._lock:
@@ -89,6 +211,9 @@ class JobStore:
                     pass
                 if not self._log_subscribers[job_id]:
                     del self._log_subscribers[job_id]
+                    index = self._log_indexes.get(job_id)
+                    if index is not None:
+                        index.disable_ring()
 
     def _notify_log_subscribers(self, job_id: str):
         # Obtain a copy of callbacks under the lock to avoid modifying during iteration
@@ -104,8 +229,8 @@ class JobStore:
 
     def update_job(self, job: Job):
         with self._lock:
-            self._jobs_cache[job.id] = job
-            self._save_jobs()
+            self._put_job(job)
+            self._journal([{"op": "put_job", "job": job.model_dump()}])
         self._notify_log_subscribers(job.id)
 
     def append_log_line(self, job_id: str, line: str):
@@ -126,32 +251,19 @@ class JobStore:
             except FileNotFoundError:
                 return []
 
+    def _log_index(self, job_id: str) -> LogLineIndex:
+        index = self._log_indexes.get(job_id)
+        if index is None:
+            index = LogLineIndex(self.logs_dir / f"{job_id}.log")
+            self._log_indexes[job_id] = index
+        return index
+
     def read_log_chunk(self, job_id: str, last_line_id: int) -> List[Tuple[str, int]]:
         with self._lock:
-            p = self.logs_dir / f"{job_id}.log"
-            if not p.exists():
-                return []
-
             try:
-                with p.open("r", encoding="utf-8", errors="replace") as f:
-                    # Defensive clamp to guarantee non-negative progression
-                    skip_count = max(0, last_line_id)
-
-                    if skip_count > 0:
-                        collections.deque(
-                            itertools.islice(f, skip_count),
-                            maxlen=0
-                        )
-
-                    new_lines: List[Tuple[str, int]] = []
-                    current_id = skip_count  # current_id is last_sent_line_id (1-based); next line gets +1
-
-                    for line in f:
-                        current_id += 1
-                        new_lines.append((line.rstrip("\r\n"), current_id))
-
-                    return new_lines
-
+                # Seeks to the tail (or nearest checkpoint) instead of
+                # skipping last_line_id lines from the start.
+                return self._log_index(job_id).read_after(last_line_id)
             except FileNotFoundError:
                 return []
             except Exception as e:
@@ -165,14 +277,14 @@ class JobStore:
 
     def remove_job(self, job_id: str):
         with self._lock:
-            self._remove_job_internal(job_id)
-            self._save_jobs()
-            self._save_artifacts()
+            self._journal(self._remove_job_internal(job_id))
 
-    def _remove_job_internal(self, job_id: str):
+    def _remove_job_internal(self, job_id: str) -> List[dict]:
+        """Drop a job with its files; return the journal records to write."""
         job = self._jobs_cache.get(job_id)
         if not job:
-            return
+            return []
+        records: List[dict] = []
 
         def _safe_unlink(base: Path, rel: str) -> None:
             if not rel or os.path.isabs(rel):
@@ -200,6 +312,7 @@ class JobStore:
                 except Exception as exc:
                     logger.warning("Failed to clean up artifact %s for job %s: %s", art_id, job_id, exc)
                 del self._artifacts_cache[art_id]
+                records.append({"op": "del_artifact", "id": art_id})
 
         self._remove_source_snapshot_for_job(job_id)
 
@@ -216,7 +329,10 @@ class JobStore:
         with self._lock:
             # Cleanup subscribers to prevent memory leaks if streams don't exit.
             self._log_subscribers.pop(job_id, None)
-            self._jobs_cache.pop(job_id, None)
+            self._log_indexes.pop(job_id, None)
+            self._drop_job(job_id)
+        records.append({"op": "del_job", "id": job_id})
+        return records
 
     def _remove_source_snapshot_for_job(self, job_id: str) -> None:
         try:
@@ -237,11 +353,37 @@ class JobStore:
                 reverse=True,
             )
 
+    def get_jobs(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Job]:
+        """Jobs newest first, optionally restricted to ``statuses``.
+
+        Uses the status index, so listing active jobs does not walk the
+        retained history.
+        """
+        with self._lock:
+            if statuses is None:
+                jobs: Iterable[Job] = self._jobs_cache.values()
+            else:
+                wanted = set(statuses)
+                jobs = [
+                    self._jobs_cache[job_id]
+                    for status in wanted
+                    for job_id in self._job_ids_by_status.get(status, ())
+                ]
+                # Jobs mutated in place but not yet passed to update_job.
+                jobs = [j for j in jobs if j.status in wanted]
+            if limit is not None:
+                return heapq.nlargest(limit, jobs, key=lambda x: x.created_at)
+            return sorted(jobs, key=lambda x: x.created_at, reverse=True)
+
     def find_job_by_hash(self, content_hash: str) -> Optional[Job]:
         with self._lock:
             candidates = [
-                j for j in self._jobs_cache.values()
-                if j.content_hash == content_hash
+                self._jobs_cache[job_id]
+                for job_id in self._job_ids_by_hash.get(content_hash, ())
             ]
             if not candidates:
                 return None
@@ -255,6 +397,19 @@ class JobStore:
 
             return max(candidates, key=lambda x: x.created_at)
 
+    def find_reusable_job(self, content_hash: str, source_fingerprint: str) -> Optional[Job]:
+        """Newest succeeded job with this parameter hash built from these sources."""
+        with self._lock:
+            candidates = [
+                self._jobs_cache[job_id]
+                for job_id in self._job_ids_by_hash.get(content_hash, ())
+            ]
+            matches = [
+                j for j in candidates
+                if j.status == "succeeded" and j.source_fingerprint == source_fingerprint
+            ]
+            return max(matches, key=lambda x: x.created_at) if matches else None
+
     def cleanup_source_snapshots(
         self,
         *,
@@ -317,17 +472,15 @@ class JobStore:
             for j in finished[capacity:]:
                 to_remove.add(j.id)
 
+            records: List[dict] = []
             for job_id in to_remove:
-                self._remove_job_internal(job_id)
-
-            if to_remove:
-                self._save_jobs()
-                self._save_artifacts()
+                records.extend(self._remove_job_internal(job_id))
+            self._journal(records)
 
     def add_artifact(self, artifact: Artifact):
         with self._lock:
             self._artifacts_cache[artifact.id] = artifact
-            self._save_artifacts()
+            self._journal([{"op": "put_artifact", "artifact": artifact.model_dump()}])
 
     def get_artifact(self, artifact_id: str) -> Optional[Artifact]:
         with self._lock:
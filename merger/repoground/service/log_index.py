@@ -0,0 +1,139 @@
+"""Seekable line index over an append-only job log.
+
+``JobStore.read_log_chunk`` used to reopen the log and skip ``last_line_id``
+lines from the start on every SSE wakeup. ``LogLineIndex`` remembers where it
+stopped reading (the *frontier*) plus a sparse ``line id -> byte offset``
+checkpoint every ``checkpoint_every`` lines, so a tail read seeks straight to
+the frontier and a catch-up read seeks to the nearest checkpoint.
+
+While a job has SSE subscribers, the index also keeps a ring buffer of the
+most recent lines. Lines are read from disk once, and every other subscriber
+gets them from memory.
+
+Line ids keep the semantics of iterating the file in text mode with
+universal newlines: ``\\r\\n``, ``\\r`` and ``\\n`` all end a line. Only
+complete (newline-terminated) segments are indexed. A trailing partial line
+is returned but read again on the next call.
+"""
+
+from __future__ import annotations
+
+import bisect
+import collections
+import itertools
+import os
+import re
+from pathlib import Path
+from typing import Deque, List, Optional, Tuple
+
+DEFAULT_LOG_CHECKPOINT_LINES = 1024
+DEFAULT_LOG_RING_LINES = 2048
+
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+def _split_lines(text: str) -> List[str]:
+    parts = _LINE_BREAK.split(text)
+    if parts and parts[-1] == "":
+        parts.pop()
+    return parts
+
+
+class LogLineIndex:
+    """Line-id index, tail frontier and optional ring buffer for one log file."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        checkpoint_every: int = DEFAULT_LOG_CHECKPOINT_LINES,
+    ) -> None:
+        self.path = path
+        self.checkpoint_every = max(1, int(checkpoint_every))
+        self._ring: Optional[Deque[Tuple[int, str]]] = None
+        self.counters = {"ring_lines": 0, "disk_lines": 0, "reads": 0}
+        self._reset(None)
+
+    def _reset(self, identity: Optional[Tuple[int, int]]) -> None:
+        self._identity = identity
+        # Checkpoint i: the first _ckpt_lines[i] lines end at byte _ckpt_offsets[i].
+        self._ckpt_lines: List[int] = [0]
+        self._ckpt_offsets: List[int] = [0]
+        self._end_line = 0
+        self._end_offset = 0
+        if self._ring is not None:
+            self._ring.clear()
+
+    def enable_ring(self, maxlen: int = DEFAULT_LOG_RING_LINES) -> None:
+        if self._ring is None:
+            self._ring = collections.deque(maxlen=max(1, int(maxlen)))
+
+    def disable_ring(self) -> None:
+        self._ring = None
+
+    def read_after(self, last_line_id: int) -> List[Tuple[str, int]]:
+        """Return ``(line, line_id)`` for every line after ``last_line_id`` (1-based)."""
+        last = max(0, last_line_id)
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset(None)
+            return []
+        identity = (st.st_dev, st.st_ino)
+        if identity != self._identity or st.st_size < self._end_offset:
+            # Replaced or truncated: everything indexed so far is void.
+            self._reset(identity)
+
+        self.counters["reads"] += 1
+        out: List[Tuple[str, int]] = []
+        last = self._read_ring(last, out)
+
+        if last >= self._end_line:
+            line_no, offset = self._end_line, self._end_offset
+        else:
+            i = bisect.bisect_right(self._ckpt_lines, last) - 1
+            line_no, offset = self._ckpt_lines[i], self._ckpt_offsets[i]
+        if offset < st.st_size:
+            self._read_disk(line_no, offset, last, out)
+        return out
+
+    def _read_ring(self, last: int, out: List[Tuple[str, int]]) -> int:
+        """Serve lines after ``last`` from the ring if it reaches back far enough.
+
+        Returns the last line id now covered by ``out``.
+        """
+        ring = self._ring
+        if not (ring and last < self._end_line and ring[0][0] <= last + 1 and ring[-1][0] == self._end_line):
+            return last
+        for line_id, text in itertools.islice(ring, last + 1 - ring[0][0], None):
+            out.append((text, line_id))
+        self.counters["ring_lines"] += len(out)
+        return self._end_line
+
+    def _read_disk(self, line_no: int, offset: int, last: int, out: List[Tuple[str, int]]) -> None:
+        """Read from ``offset`` (the end of line ``line_no``), advancing the frontier."""
+        ring = self._ring
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for segment in f:
+                complete = segment.endswith(b"\n")
+                for text in _split_lines(segment.decode("utf-8", errors="replace")):
+                    line_no += 1
+                    if line_no > last:
+                        out.append((text, line_no))
+                        self.counters["disk_lines"] += 1
+                    if complete and line_no > self._end_line and ring is not None:
+                        ring.append((line_no, text))
+                if not complete:
+                    # A line still being written; report it, but index it
+                    # only once its newline has arrived.
+                    break
+                offset += len(segment)
+                if line_no > self._end_line:
+                    self._advance_frontier(line_no, offset)
+
+    def _advance_frontier(self, line_no: int, offset: int) -> None:
+        self._end_line, self._end_offset = line_no, offset
+        if line_no - self._ckpt_lines[-1] >= self.checkpoint_every:
+            self._ckpt_lines.append(line_no)
+            self._ckpt_offsets.append(offset)
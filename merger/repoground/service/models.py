@@ -247,6 +247,9 @@ class Job(BaseModel):
     request: JobRequest
     hub_resolved: Optional[str] = None
     content_hash: Optional[str] = None
+    # Fingerprint of the scanned source trees (local_current jobs only); a
+    # succeeded job is reused only while the sources still match it.
+    source_fingerprint: Optional[str] = None
     logs: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
     artifact_ids: List[str] = Field(default_factory=list)
@@ -1,4 +1,3 @@
-import concurrent.futures
 import sys
 import os
 import uuid
@@ -6,10 +5,12 @@ import logging
 import json
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List
+from typing import Callable, Dict, List, Optional
 
 from .models import Artifact, Job
 from .jobstore import JobStore
+from .scheduler import LANE_HEAVY, LANE_LIGHT, JobScheduler
+from .source_fingerprint import compute_source_fingerprint
 from .repo_sync import (
     plan_pre_pull_repos,
     apply_pre_pull_plans,
@@ -36,8 +37,11 @@ from ..core.merge import (
     ExtrasConfig,
     SKIP_ROOTS,
     MERGES_DIR_NAME,
+    SPEC_VERSION,
     parse_human_size,
 )
+from ..architecture.ast_facts_cache import AstFactsCache, hub_ast_facts_cache_path
+from ..core.file_work_cache import FileWorkCache
 from ..adapters.security import validate_source_dir, get_security_config, SecurityViolationError
 
 logger = logging.getLogger(__name__)
@@ -253,19 +257,91 @@ def _safe_text(value: object | None) -> str | None:
         return redacted[:4000] + " (truncated)"
     return redacted
 
+def local_source_fingerprint(hub: Path, repos: Optional[List[str]]) -> Optional[str]:
+    """Fingerprint the repos a local_current job would scan (all repos if none given)."""
+    try:
+        repo_names = list(repos) if repos else _find_repos(hub)
+    except Exception as exc:
+        logger.debug("Cannot list repos of %s for fingerprinting: %s", hub, exc)
+        return None
+    if not repo_names:
+        return None
+    return compute_source_fingerprint(hub, repo_names)
+
+
+
+def _record_source_fingerprint(
+    job: Job, effective_source_mode: str, hub: Path, repo_names: List[str]
+) -> None:
+    """Record the sources a local_current build reads; later identical requests
+    reuse the result only while this fingerprint still matches."""
+    if effective_source_mode == "local_current":
+        job.source_fingerprint = compute_source_fingerprint(hub, repo_names)
+
+
+def _log_cache_counters(
+    log: Callable[[str], None],
+    file_work_cache: Optional[FileWorkCache],
+    ast_facts_cache: AstFactsCache,
+) -> None:
+    if file_work_cache is not None:
+        log(f"File work cache: {file_work_cache.counters}")
+    log(f"AST facts cache: {ast_facts_cache.counters}")
+
+
+def _job_lane(job: Job) -> str:
+    """Overview/summary and plan-only jobs are cheap; everything else is heavy."""
+    req = job.request
+    if req.plan_only or req.level in ("overview", "summary"):
+        return LANE_LIGHT
+    return LANE_HEAVY
+
+
+def _job_source_locks(job: Job) -> frozenset:
+    """One lock per selected repo; no selection means every repo of the hub."""
+    hub = job.hub_resolved or job.request.hub or ""
+    if not job.request.repos:
+        return frozenset({(hub, None)})
+    return frozenset((hub, name) for name in job.request.repos)
+
+
 class JobRunner:
-    def __init__(self, job_store: JobStore, max_workers: int = 1):
+    def __init__(
+        self,
+        job_store: JobStore,
+        max_workers: Optional[int] = None,
+        *,
+        lane_limits: Optional[Dict[str, int]] = None,
+        budget: Optional[int] = None,
+    ):
         self.job_store = job_store
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
-        self.futures = {}
+        self.scheduler = JobScheduler(lane_limits=lane_limits, budget=budget, max_running=max_workers)
+        self.executor = self.scheduler.executor
 
     def submit_job(self, job_id: str) -> None:
         job = self.job_store.get_job(job_id)
         if not job or job.status != "queued":
             return
 
-        future = self.executor.submit(self._run_job, job_id)
-        self.futures[job_id] = future
+        self.scheduler.submit(
+            job_id,
+            lambda: self._run_job(job_id),
+            lane=_job_lane(job),
+            locks=_job_source_locks(job),
+        )
+
+    def metrics(self) -> dict:
+        return self.scheduler.metrics()
+
+    def _file_work_cache(self, generator_info: dict) -> Optional[FileWorkCache]:
+        """Per-file build cache shared by all jobs of this store, if it has storage."""
+        storage_dir = getattr(self.job_store, "storage_dir", None)
+        if storage_dir is None:
+            return None
+        return FileWorkCache(
+            Path(storage_dir) / "file-work-cache",
+            salt=f"{SPEC_VERSION}:{generator_info.get('version', '')}",
+        )
 
     def _cleanup_source_snapshots_after_job(
         self, job_id: str, merges_dir: Path | None
@@ -781,6 +857,8 @@ class JobRunner:
                 else:
                     log("Pre-pull disabled by request.")
 
+            _record_source_fingerprint(job, effective_source_mode, hub, repo_names)
+
             # 3. Scan Repos
             max_bytes = parse_human_size(req.max_bytes or "0")
             ext_list = _normalize_ext_list(",".join(req.extensions)) if req.extensions else None
@@ -877,25 +955,33 @@ class JobRunner:
                 "platform": "service"
             }
 
-            artifacts_obj = write_reports_v2(
-                merges_dir,
-                hub,
-                summaries,
-                req.level,
-                req.mode,
-                max_bytes,
-                req.plan_only,
-                req.code_only,
-                split_size,
-                debug=False,
-                path_filter=path_filter,
-                ext_filter=ext_list,
-                extras=extras,
-                meta_density=req.meta_density,
-                output_mode=req.output_mode,
-                redact_secrets=req.redact_secrets,
-                generator_info=generator_info,
-            )
+            file_work_cache = self._file_work_cache(generator_info)
+            ast_facts_cache = AstFactsCache(hub_ast_facts_cache_path(hub))
+            try:
+                artifacts_obj = write_reports_v2(
+                    merges_dir,
+                    hub,
+                    summaries,
+                    req.level,
+                    req.mode,
+                    max_bytes,
+                    req.plan_only,
+                    req.code_only,
+                    split_size,
+                    debug=False,
+                    path_filter=path_filter,
+                    ext_filter=ext_list,
+                    extras=extras,
+                    meta_density=req.meta_density,
+                    output_mode=req.output_mode,
+                    redact_secrets=req.redact_secrets,
+                    generator_info=generator_info,
+                    file_work_cache=file_work_cache,
+                    ast_facts_cache=ast_facts_cache,
+                )
+            finally:
+                ast_facts_cache.close()
+            _log_cache_counters(log, file_work_cache, ast_facts_cache)
 
             # 5. Register Artifacts
             out_paths = artifacts_obj.get_all_paths()
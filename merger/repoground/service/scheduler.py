@@ -0,0 +1,200 @@
+"""Lane-aware job scheduling for the service runner.
+
+Jobs are admitted from one FIFO queue under three independent limits:
+
+* **Lanes** — every job belongs to a lane with its own concurrency limit, so
+  cheap jobs (overview/summary, plan-only) are not stuck behind a long
+  max-level build.
+* **Resource locks** — a job holds ``(scope, name)`` locks while it runs; a
+  ``name`` of ``None`` covers the whole scope. The runner uses
+  ``(hub, repo)``, so two jobs never read or fast-forward the same source
+  tree at once. Jobs that share a lock also start in submission order.
+* **Budget** — each lane has a cost in abstract CPU/memory units and the sum
+  of running costs stays within a global budget. A job blocked only by the
+  budget stops the queue behind it, so heavy jobs are not starved by a
+  stream of cheap ones.
+
+Wait times and queue depth per lane are available via ``metrics()``.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LANE_LIGHT = "light"
+LANE_HEAVY = "heavy"
+
+DEFAULT_LANE_LIMITS: Dict[str, int] = {LANE_LIGHT: 2, LANE_HEAVY: 1}
+DEFAULT_LANE_COSTS: Dict[str, int] = {LANE_LIGHT: 1, LANE_HEAVY: 2}
+
+ResourceLock = Tuple[str, Optional[str]]
+
+
+def _locks_conflict(a: FrozenSet[ResourceLock], b: FrozenSet[ResourceLock]) -> bool:
+    for scope_a, name_a in a:
+        for scope_b, name_b in b:
+            if scope_a == scope_b and (name_a is None or name_b is None or name_a == name_b):
+                return True
+    return False
+
+
+@dataclass
+class _Entry:
+    key: str
+    lane: str
+    cost: int
+    locks: FrozenSet[ResourceLock]
+    run: Callable[[], None]
+    submitted_at: float
+
+
+class _LaneStats:
+    def __init__(self) -> None:
+        self.started = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.started += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.last_wait = wait
+
+
+class JobScheduler:
+    def __init__(
+        self,
+        lane_limits: Optional[Dict[str, int]] = None,
+        lane_costs: Optional[Dict[str, int]] = None,
+        budget: Optional[int] = None,
+        max_running: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.lane_limits = dict(lane_limits or DEFAULT_LANE_LIMITS)
+        costs = lane_costs or DEFAULT_LANE_COSTS
+        self.lane_costs = {lane: max(1, costs.get(lane, 1)) for lane in self.lane_limits}
+        if budget is None:
+            # Bounded by the CPU count, but always enough for one job of every
+            # lane at once, so a heavy job cannot lock the light lane out.
+            demand = sum(limit * self.lane_costs[lane] for lane, limit in self.lane_limits.items())
+            budget = max(sum(self.lane_costs.values()), min(demand, os.cpu_count() or 1))
+        self.budget = max(1, budget)
+        workers = sum(self.lane_limits.values())
+        self.max_running = max(1, min(max_running or workers, workers))
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._pending: List[_Entry] = []
+        self._running: Dict[str, _Entry] = {}
+        self._lane_running: Dict[str, int] = {lane: 0 for lane in self.lane_limits}
+        self._budget_used = 0
+        self._stats: Dict[str, _LaneStats] = {lane: _LaneStats() for lane in self.lane_limits}
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_running, thread_name_prefix="repoground-job"
+        )
+
+    def submit(
+        self,
+        key: str,
+        run: Callable[[], None],
+        *,
+        lane: str,
+        locks: FrozenSet[ResourceLock] = frozenset(),
+    ) -> None:
+        if lane not in self.lane_limits:
+            raise ValueError(f"Unknown scheduler lane: {lane!r}")
+        entry = _Entry(
+            key=key,
+            lane=lane,
+            # A job costlier than the whole budget would never start.
+            cost=min(self.lane_costs[lane], self.budget),
+            locks=frozenset(locks),
+            run=run,
+            submitted_at=self._clock(),
+        )
+        with self._lock:
+            if entry.key in self._running or any(e.key == key for e in self._pending):
+                return
+            self._pending.append(entry)
+            started = self._admit()
+        self._start(started)
+
+    def _admit(self) -> List[_Entry]:
+        """Move every admissible pending entry to running (lock held)."""
+        started: List[_Entry] = []
+        remaining: List[_Entry] = []
+        waiting_locks: List[FrozenSet[ResourceLock]] = []
+        budget_blocked = False
+        now = self._clock()
+        for entry in self._pending:
+            blocked = (
+                budget_blocked
+                or len(self._running) >= self.max_running
+                or self._lane_running[entry.lane] >= self.lane_limits[entry.lane]
+                or any(_locks_conflict(entry.locks, r.locks) for r in self._running.values())
+                or any(_locks_conflict(entry.locks, w) for w in waiting_locks)
+            )
+            if not blocked and self._budget_used + entry.cost > self.budget:
+                blocked = budget_blocked = True
+            if blocked:
+                remaining.append(entry)
+                waiting_locks.append(entry.locks)
+                continue
+            self._running[entry.key] = entry
+            self._lane_running[entry.lane] += 1
+            self._budget_used += entry.cost
+            self._stats[entry.lane].record(now - entry.submitted_at)
+            started.append(entry)
+        self._pending = remaining
+        return started
+
+    def _start(self, entries: List[_Entry]) -> None:
+        for entry in entries:
+            self.executor.submit(self._execute, entry)
+
+    def _execute(self, entry: _Entry) -> None:
+        try:
+            entry.run()
+        except Exception:
+            logger.exception("Scheduled job %s failed", entry.key)
+        finally:
+            with self._lock:
+                self._running.pop(entry.key, None)
+                self._lane_running[entry.lane] -= 1
+                self._budget_used -= entry.cost
+                started = self._admit()
+            self._start(started)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            now = self._clock()
+            lanes = {}
+            for lane, limit in self.lane_limits.items():
+                queued = [e for e in self._pending if e.lane == lane]
+                stats = self._stats[lane]
+                lanes[lane] = {
+                    "limit": limit,
+                    "cost": self.lane_costs[lane],
+                    "running": self._lane_running[lane],
+                    "queued": len(queued),
+                    "oldest_queued_seconds": round(max((now - e.submitted_at for e in queued), default=0.0), 3),
+                    "started": stats.started,
+                    "mean_wait_seconds": round(stats.total_wait / stats.started, 3) if stats.started else 0.0,
+                    "max_wait_seconds": round(stats.max_wait, 3),
+                    "last_wait_seconds": round(stats.last_wait, 3),
+                }
+            return {
+                "queue_depth": len(self._pending),
+                "running": len(self._running),
+                "max_running": self.max_running,
+                "budget": {"total": self.budget, "used": self._budget_used},
+                "lanes": lanes,
+            }
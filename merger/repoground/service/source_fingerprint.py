@@ -0,0 +1,77 @@
+"""Cheap fingerprint of the source trees a job reads.
+
+A succeeded job is only worth reusing if its sources are unchanged. The
+fingerprint hashes the ``lstat`` metadata (path, type, size, mtime, ctime,
+inode) of every file below the selected repos. ``scan_repo`` follows file
+symlinks, so a symlink also contributes the metadata of its target, which may
+live outside the repo or in a skipped dir. Directories contribute only their
+names, and the ones ``scan_repo`` never descends into (``.git``, build and
+cache dirs) are skipped, so tool runs touching those do not count.
+
+It costs a directory walk and no file reads, so it can run on every
+``POST /api/jobs``. Any content change, added or removed file, or rename
+changes it; a spurious change (e.g. a ``touch``) only costs a rebuild.
+Per-file reuse inside a build is keyed by content hashes instead, see
+``core/file_work_cache.py``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from ..core.merge import SKIP_DIRS
+
+logger = logging.getLogger(__name__)
+
+SOURCE_FINGERPRINT_VERSION = "srcfp-v2"
+
+
+def _walk_entries(root: Path):
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            rel = f"{prefix}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield rel + "/", None
+                    stack.append((Path(entry.path), rel + "/"))
+                continue
+            yield rel, entry.stat(follow_symlinks=False)
+            if entry.is_symlink():
+                try:
+                    target = entry.stat()
+                except OSError:
+                    # Dangling; the target appearing changes the fingerprint.
+                    target = None
+                yield rel + "\0->", target
+
+
+def _stat_line(rel: str, st: Optional[os.stat_result]) -> str:
+    if st is None:
+        return rel
+    return (
+        f"{rel}\0{st.st_mode}\0{st.st_size}\0{st.st_mtime_ns}\0"
+        f"{st.st_ctime_ns}\0{st.st_ino}"
+    )
+
+
+def compute_source_fingerprint(hub: Path, repos: List[str]) -> Optional[str]:
+    """Fingerprint ``repos`` under ``hub``; None if any of them cannot be walked."""
+    h = hashlib.sha256(SOURCE_FINGERPRINT_VERSION.encode("utf-8"))
+    for name in sorted(repos):
+        root = hub / name
+        h.update(f"\0repo\0{name}\0".encode("utf-8", "surrogateescape"))
+        try:
+            for rel, st in _walk_entries(root):
+                h.update(_stat_line(rel, st).encode("utf-8", "surrogateescape") + b"\n")
+        except OSError as exc:
+            logger.debug("Cannot fingerprint %s: %s", root, exc)
+            return None
+    return h.hexdigest()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+from merger.repoground.core import merge as merge_module
+from merger.repoground.core.artifact_io import (
+    HashingWriter,
+    active_digest_registry,
+    compute_file_sha256,
+    digest_registry_scope,
+    write_text_atomic,
+)
+from merger.repoground.core.merge import ExtrasConfig, scan_repo, write_reports_v2
+from merger.repoground.tests._test_constants import make_generator_info
+
+
+def test_hashing_writer_digest_matches_disk_and_is_registered(tmp_path: Path) -> None:
+    out = tmp_path / "part.md"
+    with digest_registry_scope() as registry:
+        with HashingWriter(out) as writer:
+            writer.write("héllo\n")
+            writer.write(b"world\n")
+
+        expected = hashlib.sha256(out.read_bytes()).hexdigest()
+        assert writer.sha256 == expected
+        assert writer.size == out.stat().st_size
+        assert compute_file_sha256(out) == expected
+        assert registry.counters["hits"] == 1
+
+
+def test_registry_rehashes_after_file_changes(tmp_path: Path) -> None:
+    out = tmp_path / "index.json"
+    with digest_registry_scope() as registry:
+        write_text_atomic(out, "{}")
+        assert compute_file_sha256(out) == hashlib.sha256(b"{}").hexdigest()
+
+        out.write_text('{"a": 1}', encoding="utf-8")
+        os.utime(out, ns=(1, 1))
+        assert compute_file_sha256(out) == hashlib.sha256(b'{"a": 1}').hexdigest()
+        assert registry.counters["misses"] == 1
+
+    assert active_digest_registry() is None
+    assert compute_file_sha256(tmp_path / "missing") == "ERROR"
+
+
+def test_write_reports_v2_hashes_written_artifacts_from_the_registry(tmp_path: Path, monkeypatch) -> None:
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "README.md").write_text("# Demo\n", encoding="utf-8")
+    (repo / "src" / "app.py").write_text("def main():\n    return 1\n", encoding="utf-8")
+    merges_dir = tmp_path / "merges"
+    merges_dir.mkdir()
+
+    registries = []
+    original = merge_module._compute_file_sha256
+
+    def spy(path):
+        registries.append(active_digest_registry())
+        return original(path)
+
+    monkeypatch.setattr(merge_module, "_compute_file_sha256", spy)
+
+    artifacts = write_reports_v2(
+        merges_dir=merges_dir,
+        hub=tmp_path,
+        repo_summaries=[scan_repo(repo)],
+        detail="max",
+        mode="gesamt",
+        max_bytes=0,
+        plan_only=False,
+        extras=ExtrasConfig(json_sidecar=True),
+        output_mode="dual",
+        generator_info=make_generator_info(),
+    )
+
+    registry = registries[0]
+    assert registry is not None and all(r is registry for r in registries)
+    assert registry.counters["hits"] > 0
+    assert active_digest_registry() is None
+    for path in [*artifacts.md_parts, artifacts.chunk_index, artifacts.index_json]:
+        assert compute_file_sha256(path) == hashlib.sha256(path.read_bytes()).hexdigest()
@@ -1,10 +1,10 @@
 import json
 import pytest
 import argparse
-from merger.repoground.atlas.diff import _compare_file_sets
+from merger.repoground.atlas.diff import _diff_inventories
 from merger.repoground.cli.cmd_atlas import run_atlas_analyze
 
-def test_compare_file_sets_semantics_for_backup_gap():
+def test_diff_inventories_semantics_for_backup_gap(tmp_path):
     """
     Strict semantic test proving that the file comparison logic
     maps correctly to the backup gap domains.
@@ -24,7 +24,20 @@ def test_compare_file_sets_semantics_for_backup_gap():
         "doc/both_changed.md": {"size_bytes": 400, "mtime": "2024-01-02", "is_symlink": False}, # Changed size and mtime
     }
 
-    new_files, removed_files, changed_files = _compare_file_sets(source_files, backup_files)
+    source_inv = tmp_path / "source.jsonl"
+    backup_inv = tmp_path / "backup.jsonl"
+    for inv_path, files in ((source_inv, source_files), (backup_inv, backup_files)):
+        inv_path.write_text(
+            "".join(json.dumps(dict(item, rel_path=rel_path)) + "\n" for rel_path, item in files.items()),
+            encoding="utf-8",
+        )
+    spool = _diff_inventories(source_inv, backup_inv, tmp_path)
+    try:
+        new_files, removed_files, changed_files = (
+            list(spool.paths(kind)) for kind in ("new_files", "removed_files", "changed_files")
+        )
+    finally:
+        spool.close()
 
     # Prove the mapping:
     # 1. missing_in_backup -> removed_files
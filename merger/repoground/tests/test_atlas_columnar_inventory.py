@@ -0,0 +1,148 @@
+import json
+import os
+from pathlib import Path
+
+from merger.repoground.adapters.atlas import AtlasScanner
+from merger.repoground.atlas.columnar import (
+    ColumnarInventory,
+    ColumnarInventoryWriter,
+    columnar_sidecar_path,
+    format_mtime_us,
+    parse_mtime_us,
+)
+from merger.repoground.atlas.diff import compute_snapshot_comparison
+from merger.repoground.atlas.registry import AtlasRegistry
+from merger.repoground.atlas.search import AtlasSearch
+
+
+def _scan(root: Path, inv: Path, snapshot_id: str) -> dict:
+    inv.parent.mkdir(parents=True, exist_ok=True)
+    scanner = AtlasScanner(root=root, snapshot_id=snapshot_id, enable_content_stats=True, columnar_inventory=True)
+    return scanner.scan(inventory_file=inv)["stats"]
+
+
+def _make_tree(root: Path) -> None:
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "docs").mkdir()
+    for n in range(6):
+        (root / "src" / "pkg" / f"m{n}.py").write_text("x = 1\n" * (n * 40 + 1))
+    (root / "docs" / "readme.md").write_text("# docs\n")
+    (root / "docs" / "notes.txt").write_text("notes\n" * 300)
+    (root / "blob.bin").write_bytes(b"\x00\x01" * 600)
+    os.utime(root / "docs" / "readme.md", (1_600_000_000, 1_600_000_000))
+    os.symlink(root / "docs" / "readme.md", root / "readme_link.md")
+
+
+def _jsonl_rows(inv: Path):
+    return [json.loads(line) for line in inv.read_text(encoding="utf-8").splitlines()]
+
+
+def test_scanner_sidecar_mirrors_jsonl(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _make_tree(root)
+    inv = tmp_path / "out" / "inventory.jsonl"
+    stats = _scan(root, inv, "s1")
+
+    assert stats["columnar_inventory_file"] == str(columnar_sidecar_path(inv).resolve())
+    rows = _jsonl_rows(inv)
+    with ColumnarInventory.open(inv) as cols:
+        assert cols.rows == len(rows)
+        for i, row in enumerate(rows):
+            assert cols.rel_path(i) == row["rel_path"]
+            assert cols.size[i] == row["size_bytes"]
+            assert format_mtime_us(cols.mtime_us[i]) == row["mtime"]
+            assert cols.exts[cols.ext[i]] == row["ext"]
+            assert cols.is_symlink(i) is row["is_symlink"]
+            assert cols.is_text(i) is row.get("is_text")
+        assert [item for _, item in cols.iter_records(iter(range(cols.rows)))] == rows
+
+
+def test_stale_or_lossy_sidecar_is_never_used(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _make_tree(root)
+    inv = tmp_path / "out" / "inventory.jsonl"
+    _scan(root, inv, "s1")
+
+    with open(inv, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"rel_path": "late.txt", "size_bytes": 1}) + "\n")
+    assert ColumnarInventory.open(inv) is None
+
+    writer = ColumnarInventoryWriter()
+    line = json.dumps({"rel_path": "a.txt", "size_bytes": 1, "mtime": "2024-01-01T00:00:00+00:00"}) + "\n"
+    inv.write_text(line, encoding="utf-8")
+    writer.add(json.loads(line), len(line))
+    assert writer.finish(inv) is None
+    assert not columnar_sidecar_path(inv).exists()
+
+
+def test_mtime_round_trip_is_exact():
+    for value in ("2024-05-06T07:08:09Z", "2024-05-06T07:08:09.000123Z", "1969-12-31T23:59:59.999999Z"):
+        assert format_mtime_us(parse_mtime_us(value)) == value
+    assert parse_mtime_us("2024-05-06T07:08:09") is None
+    assert parse_mtime_us("2024-05-06T07:08:09+00:00") is None
+
+
+def _registry_with_scans(tmp_path):
+    registry_path = tmp_path / "atlas" / "registry" / "atlas_registry.sqlite"
+    atlas_base = registry_path.parent.parent
+    root = tmp_path / "root"
+    root.mkdir()
+    _make_tree(root)
+    with AtlasRegistry(registry_path) as reg:
+        reg.register_machine("m1", "host")
+        reg.register_root("r1", "m1", "abs_path", str(root))
+        _scan(root, atlas_base / "s1" / "inventory.jsonl", "s1")
+        reg.create_snapshot("s1", "m1", "r1", "h1", "complete")
+        reg.update_snapshot_artifacts("s1", {"inventory": "s1/inventory.jsonl"})
+
+        (root / "src" / "pkg" / "m0.py").write_text("changed = True\n")
+        (root / "docs" / "notes.txt").unlink()
+        (root / "docs" / "new.md").write_text("# new\n")
+        _scan(root, atlas_base / "s2" / "inventory.jsonl", "s2")
+        reg.create_snapshot("s2", "m1", "r1", "h2", "complete")
+        reg.update_snapshot_artifacts("s2", {"inventory": "s2/inventory.jsonl"})
+    return registry_path, atlas_base
+
+
+def test_search_and_diff_match_with_and_without_sidecar(tmp_path, monkeypatch):
+    registry_path, atlas_base = _registry_with_scans(tmp_path)
+    opened = []
+    real_open = ColumnarInventory.open.__func__
+
+    def recording_open(cls, inv_path):
+        cols = real_open(cls, inv_path)
+        opened.append(cols is not None)
+        return cols
+
+    monkeypatch.setattr(ColumnarInventory, "open", classmethod(recording_open))
+    searcher = AtlasSearch(registry_path)
+    queries = [
+        {},
+        {"ext": "py", "min_size": 100},
+        {"max_size": 50},
+        {"date_before": "2021-01-01T00:00:00Z"},
+        {"date_after": "2021-01-01T00:00:00+00:00", "name_pattern": "*.md"},
+        {"content_query": "changed"},
+    ]
+
+    def run():
+        with AtlasRegistry(registry_path) as reg:
+            comparison = compute_snapshot_comparison(reg, "s1", "s2")
+        searches = [searcher.search(use_index=False, all_snapshots=True, **q) for q in queries]
+        return (comparison["new_files"], comparison["removed_files"], comparison["changed_files"]), searches
+
+    with_sidecar = run()
+    assert opened and all(opened)
+    opened.clear()
+    for snap in ("s1", "s2"):
+        columnar_sidecar_path(atlas_base / snap / "inventory.jsonl").unlink()
+    without_sidecar = run()
+    assert opened and not any(opened)
+
+    assert with_sidecar == without_sidecar
+    diff, searches = with_sidecar
+    assert diff == (["docs/new.md"], ["docs/notes.txt"], ["src/pkg/m0.py"])
+    assert {r["rel_path"] for r in searches[3]} == {"docs/readme.md", "readme_link.md"}
+    assert sorted((r["snapshot_id"], r["rel_path"]) for r in searches[5]) == [("s1", "src/pkg/m0.py"), ("s2", "src/pkg/m0.py")]
@@ -309,3 +309,40 @@ def test_atlas_is_huge_serialization(tmp_path: Path):
 
     assert results["huge.txt"].get("is_huge") is True
     assert "is_huge" not in results["small.txt"]
+
+def test_content_stats_open_each_file_once(tmp_path: Path):
+    """
+    The unified probe derives every content field from a single open per file
+    and agrees with the standalone detection helpers.
+    """
+    from merger.repoground.adapters.atlas import detect_encoding, detect_mime_type, is_probably_text
+
+    test_dir = tmp_path / "test_probe"
+    test_dir.mkdir()
+    (test_dir / "small.txt").write_text("a\nb\r\nc\rd")
+    (test_dir / "medium.txt").write_text("x" * 3000 + "\n" + "y" * 3000 + "\n")
+    (test_dir / "large.log").write_text("line\n" * 5000)
+    (test_dir / "blob").write_bytes(b"\x00\x01" * 3000)
+    (test_dir / "utf16.txt").write_bytes(("row\n" * 2000).encode("utf-16"))
+
+    inv_file = tmp_path / "inventory.jsonl"
+    scanner = AtlasScanner(root=test_dir, snapshot_id="test_snap", enable_content_stats=True)
+    scanner.scan(inventory_file=inv_file)
+
+    probe_stats = scanner.stats["probe"]
+    assert probe_stats["files_opened"] == 5
+    assert probe_stats["files_streamed"] == 2  # large.log, utf16.txt
+
+    with inv_file.open("r", encoding="utf-8") as f:
+        entries = {e["name"]: e for e in map(json.loads, f)}
+    for name, entry in entries.items():
+        path = test_dir / name
+        size = path.stat().st_size
+        assert entry["mime_type"] == detect_mime_type(path)
+        assert entry["is_text"] == (is_probably_text(path, size) and entry["mime_type"].startswith("text/"))
+        if entry["is_text"]:
+            assert entry["encoding"] == detect_encoding(path)
+            assert entry["line_count"] == count_lines(path, size, encoding=entry["encoding"])
+    assert entries["small.txt"]["line_count"] == 4
+    assert entries["large.log"]["line_count"] == 5000
+    assert entries["blob"]["is_text"] is False
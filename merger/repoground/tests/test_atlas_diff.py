@@ -1,5 +1,6 @@
 import json
 import os
+import random
 import tempfile
 import pytest
 from pathlib import Path
@@ -7,11 +8,11 @@ from typing import Optional, Dict, Any
 from merger.repoground.atlas.registry import AtlasRegistry
 from merger.repoground.atlas.diff import (
     compute_snapshot_delta,
-    _compare_file_sets,
+    _diff_inventories,
     _load_inventory_index,
     compute_snapshot_comparison
 )
-from merger.repoground.atlas.paths import resolve_artifact_ref
+from merger.repoground.atlas.paths import resolve_artifact_ref, resolve_atlas_base_dir
 
 @pytest.fixture
 def temp_workspace(tmp_path):
@@ -255,27 +256,45 @@ def test_cli_diff_routing(temp_workspace, populated_registry, capsys):
     finally:
         os.chdir(old_cwd)
 
-# --- Unit Tests for _compare_file_sets and _load_inventory_index ---
+# --- Unit Tests for _diff_inventories and _load_inventory_index ---
+
+def _diff_file_sets(tmp_path, from_files, to_files):
+    """Runs `_diff_inventories` over two `rel_path -> record` maps written as inventories."""
+    inventories = []
+    for name, files in (("from", from_files), ("to", to_files)):
+        inv_path = tmp_path / f"{name}.jsonl"
+        inv_path.write_text(
+            "".join(json.dumps(dict(item, rel_path=rel_path)) + "\n" for rel_path, item in files.items()),
+            encoding="utf-8",
+        )
+        inventories.append(inv_path)
+    spool_dir = tmp_path / "spool"
+    spool_dir.mkdir(exist_ok=True)
+    spool = _diff_inventories(inventories[0], inventories[1], spool_dir)
+    try:
+        return tuple(list(spool.paths(kind)) for kind in ("new_files", "removed_files", "changed_files"))
+    finally:
+        spool.close()
 
-def test_compare_file_sets_empty():
+def test_diff_inventories_empty(tmp_path):
     from_files = {}
     to_files = {}
-    new, removed, changed = _compare_file_sets(from_files, to_files)
+    new, removed, changed = _diff_file_sets(tmp_path, from_files, to_files)
     assert new == []
     assert removed == []
     assert changed == []
 
-def test_compare_file_sets_identical():
+def test_diff_inventories_identical(tmp_path):
     files = {
         "file1.txt": {"size_bytes": 100, "mtime": "2023-01-01T00:00:00Z", "is_symlink": False},
         "dir/file2.txt": {"size_bytes": 200, "mtime": "2023-01-01T00:00:00Z", "is_symlink": False}
     }
-    new, removed, changed = _compare_file_sets(files, files)
+    new, removed, changed = _diff_file_sets(tmp_path, files, files)
     assert new == []
     assert removed == []
     assert changed == []
 
-def test_compare_file_sets_added_removed():
+def test_diff_inventories_added_removed(tmp_path):
     from_files = {
         "removed.txt": {"size_bytes": 100, "mtime": "2023-01-01T00:00:00Z", "is_symlink": False},
         "stay.txt": {"size_bytes": 50, "mtime": "2023-01-01T00:00:00Z", "is_symlink": False}
@@ -284,12 +303,12 @@ def test_compare_file_sets_added_removed():
         "new.txt": {"size_bytes": 150, "mtime": "2023-01-02T00:00:00Z", "is_symlink": False},
         "stay.txt": {"size_bytes": 50, "mtime": "2023-01-01T00:00:00Z", "is_symlink": False}
     }
-    new, removed, changed = _compare_file_sets(from_files, to_files)
+    new, removed, changed = _diff_file_sets(tmp_path, from_files, to_files)
     assert new == ["new.txt"]
     assert removed == ["removed.txt"]
     assert changed == []
 
-def test_compare_file_sets_changed():
+def test_diff_inventories_changed(tmp_path):
     from_files = {
         "size_change.txt": {"size_bytes": 100, "mtime": "2023-01-01T00:00:00Z", "is_symlink": False},
         "mtime_change.txt": {"size_bytes": 100, "mtime": "2023-01-01T00:00:00Z", "is_symlink": False},
@@ -300,13 +319,13 @@ def test_compare_file_sets_changed():
         "mtime_change.txt": {"size_bytes": 100, "mtime": "2023-01-01T00:00:01Z", "is_symlink": False},
         "symlink_change.txt": {"size_bytes": 100, "mtime": "2023-01-01T00:00:00Z", "is_symlink": True}
     }
-    new, removed, changed = _compare_file_sets(from_files, to_files)
+    new, removed, changed = _diff_file_sets(tmp_path, from_files, to_files)
     assert new == []
     assert removed == []
     # Verify deterministic sorting of changed_files
     assert changed == ["mtime_change.txt", "size_change.txt", "symlink_change.txt"]
 
-def test_compare_file_sets_sorting():
+def test_diff_inventories_sorting(tmp_path):
     """Verify that new, removed, and changed lists are all deterministically sorted."""
     from_files = {
         "r2.txt": {}, "r1.txt": {},
@@ -316,12 +335,12 @@ def test_compare_file_sets_sorting():
         "n2.txt": {}, "n1.txt": {},
         "c2.txt": {"size_bytes": 20}, "c1.txt": {"size_bytes": 20}
     }
-    new, removed, changed = _compare_file_sets(from_files, to_files)
+    new, removed, changed = _diff_file_sets(tmp_path, from_files, to_files)
     assert new == ["n1.txt", "n2.txt"]
     assert removed == ["r1.txt", "r2.txt"]
     assert changed == ["c1.txt", "c2.txt"]
 
-def test_compare_file_sets_missing_fields():
+def test_diff_inventories_missing_fields(tmp_path):
     """
     Verify behavior when comparison fields are missing.
     The implementation uses .get(), so missing fields are treated as None.
@@ -334,7 +353,7 @@ def test_compare_file_sets_missing_fields():
         "both_missing.txt": {"mtime": "X"},
         "one_missing.txt": {}
     }
-    new, removed, changed = _compare_file_sets(from_files, to_files)
+    new, removed, changed = _diff_file_sets(tmp_path, from_files, to_files)
     assert "both_missing.txt" not in changed
     assert "one_missing.txt" in changed
 
@@ -438,3 +457,67 @@ def test_compute_snapshot_comparison_public_entry_point(tmp_path):
     assert result["new_files"] == ["new.txt"]
     assert result["removed_files"] == ["removed.txt"]
     assert result["changed_files"] == ["shared.txt"]
+
+
+def test_streamed_delta_artifact_matches_json_dump(populated_registry):
+    delta = compute_snapshot_delta(populated_registry, "s1", "s2")
+    atlas_base = resolve_atlas_base_dir(populated_registry.db_path)
+    (row,) = populated_registry.list_deltas()
+    artifact = resolve_artifact_ref(atlas_base, row["delta_ref"]).read_text(encoding="utf-8")
+
+    assert artifact == json.dumps(delta, indent=2)
+    spool_dirs = list(resolve_artifact_ref(atlas_base, row["delta_ref"]).parent.glob(".delta_spool_*"))
+    assert spool_dirs == []
+
+
+def test_delta_without_lists_returns_preview(populated_registry):
+    delta = compute_snapshot_delta(populated_registry, "s1", "s2", include_lists=False)
+
+    assert "new_files" not in delta
+    assert delta["preview"] == {"new_files": ["c.txt"], "removed_files": ["d.txt"], "changed_files": ["b.txt"]}
+    assert delta["summary"] == {"new_count": 1, "removed_count": 1, "changed_count": 1}
+    stored = json.loads(resolve_artifact_ref(resolve_atlas_base_dir(populated_registry.db_path), delta["delta_ref"]).read_text(encoding="utf-8"))
+    assert stored["changed_files"] == ["b.txt"]
+
+
+def test_external_sort_merge_join_matches_in_memory_compare(tmp_path):
+    rng = random.Random(7)
+    paths = [f"d{n % 7}/f{n}.txt" for n in range(300)] + ["a.txt", "a/b.txt", "a-b.txt", "ä.txt"]
+
+    def write_inventory(path, drop, bump):
+        lines = []
+        for rel_path in paths:
+            if rng.random() < drop:
+                continue
+            size = 10 + (1 if rng.random() < bump else 0)
+            lines.append(json.dumps({"rel_path": rel_path, "size_bytes": size, "mtime": "2024-01-01T00:00:00Z"}))
+        lines += ["", "not json", json.dumps(["list"]), json.dumps({"size_bytes": 1})]
+        # duplicate rel_path: the later record wins
+        lines.append(json.dumps({"rel_path": paths[0], "size_bytes": 999}))
+        rng.shuffle(lines)
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    from_inv, to_inv = tmp_path / "from.jsonl", tmp_path / "to.jsonl"
+    write_inventory(from_inv, drop=0.1, bump=0.0)
+    write_inventory(to_inv, drop=0.1, bump=0.2)
+    from_files, to_files = _load_inventory_index(from_inv), _load_inventory_index(to_inv)
+
+    def signature(item):
+        return item.get("size_bytes"), item.get("mtime"), item.get("is_symlink")
+
+    expected = (
+        sorted(p for p in to_files if p not in from_files),
+        sorted(p for p in from_files if p not in to_files),
+        sorted(p for p in to_files if p in from_files and signature(from_files[p]) != signature(to_files[p])),
+    )
+
+    spool_dir = tmp_path / "spool"
+    spool_dir.mkdir()
+    spool = _diff_inventories(from_inv, to_inv, spool_dir, chunk_rows=16)
+    try:
+        got = tuple(list(spool.paths(kind)) for kind in ("new_files", "removed_files", "changed_files"))
+    finally:
+        spool.close()
+
+    assert got == expected
+    assert any(p.name.startswith("run_") for p in spool_dir.iterdir())
@@ -179,3 +179,105 @@ def test_heuristic_subtree_delimiter_collision(tmp_path: Path):
     # They MUST NOT match, because they are structurally different sets of files.
     # The JSON serialization prevents the injection attack.
     assert fp3 != fp4
+
+
+def _skip_tree(root: Path) -> None:
+    for name in ("alpha", "beta"):
+        deep = root / name / "src" / "pkg"
+        deep.mkdir(parents=True)
+        (root / name / "README.md").write_text(f"# {name}\n")
+        (root / name / "pyproject.toml").write_text("[project]\n")
+        (deep / "mod.py").write_text("x = 1\n")
+        (root / name / "src" / "notes.txt").write_text("notes\n")
+
+
+def _skip_scan(root: Path, out: Path, snapshot_id: str, previous=None, **kwargs):
+    inv = out / f"{snapshot_id}.inventory.jsonl"
+    dirs = out / f"{snapshot_id}.dirs.jsonl"
+    incremental = {}
+    if previous:
+        incremental = {
+            "incremental_inventory": previous[0],
+            "incremental_dirs_inventory": previous[1],
+            "previous_scan_config_hash": "hash1",
+            "current_scan_config_hash": "hash1",
+        }
+    scanner = AtlasScanner(root, snapshot_id=snapshot_id, enable_content_stats=True, **incremental, **kwargs)
+    stats = scanner.scan(inventory_file=inv, dirs_inventory_file=dirs)["stats"]
+    return stats, inv, dirs
+
+
+def _rows(path: Path):
+    rows = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        item = json.loads(line)
+        item.pop("snapshot_id", None)
+        rows[item["rel_path"]] = item
+    return rows
+
+
+def test_subtree_skip_reuses_unchanged_subtrees(tmp_path: Path):
+    root = tmp_path / "root"
+    root.mkdir()
+    out = tmp_path / "out"
+    out.mkdir()
+    _skip_tree(root)
+
+    stats1, inv1, dirs1 = _skip_scan(root, out, "snap1")
+    stats2, inv2, dirs2 = _skip_scan(root, out, "snap2", previous=(inv1, dirs1), subtree_skip=True)
+
+    # The unchanged root itself is skipped, so nothing below it is walked.
+    assert stats2["incremental"]["subtree_skips"] == 1
+    assert stats2["incremental"]["subtree_reused_files"] == stats1["total_files"] == 8
+    assert stats2["incremental"]["subtree_reused_dirs"] == stats1["total_dirs"] - 1
+    assert stats2["probe"]["files_opened"] == 0
+    assert _rows(inv2) == _rows(inv1)
+    assert _rows(dirs2) == _rows(dirs1)
+    for key in ("total_files", "total_dirs", "total_bytes", "extensions", "content"):
+        assert stats2[key] == stats1[key], key
+    # Equal-sized directories may tie in a different order.
+    assert sorted(stats2["top_dirs"], key=lambda d: d["path"]) == sorted(stats1["top_dirs"], key=lambda d: d["path"])
+    assert sorted(w["root_path"] for w in stats2["workspaces"]) == sorted(w["root_path"] for w in stats1["workspaces"])
+    assert sorted(stats2["topology"]["nodes"]) == sorted(stats1["topology"]["nodes"])
+
+
+def test_subtree_skip_rescans_changed_directories(tmp_path: Path):
+    root = tmp_path / "root"
+    root.mkdir()
+    out = tmp_path / "out"
+    out.mkdir()
+    _skip_tree(root)
+    _, inv1, dirs1 = _skip_scan(root, out, "snap1")
+
+    (root / "beta" / "src" / "pkg" / "new.py").write_text("y = 2\n")
+
+    stats2, inv2, _ = _skip_scan(root, out, "snap2", previous=(inv1, dirs1), subtree_skip=True)
+    rows = _rows(inv2)
+    assert "beta/src/pkg/new.py" in rows
+    assert stats2["total_files"] == 9
+    # root, beta, beta/src changed or contain a change; alpha is reused whole.
+    assert stats2["incremental"]["subtree_reused_files"] == 4
+
+
+def test_subtree_skip_verification_sample_catches_file_edits(tmp_path: Path):
+    import os
+
+    root = tmp_path / "root"
+    root.mkdir()
+    out = tmp_path / "out"
+    out.mkdir()
+    _skip_tree(root)
+    _, inv1, dirs1 = _skip_scan(root, out, "snap1")
+
+    # Editing a file in place leaves every directory mtime untouched.
+    target = root / "alpha" / "src" / "pkg" / "mod.py"
+    parent_stat = target.parent.stat()
+    target.write_text("x = 100000\n")
+    os.utime(target.parent, ns=(parent_stat.st_atime_ns, parent_stat.st_mtime_ns))
+
+    unverified, inv_skip, _ = _skip_scan(root, out, "snap2", previous=(inv1, dirs1), subtree_skip=True)
+    assert _rows(inv_skip)["alpha/src/pkg/mod.py"]["size_bytes"] == 6
+
+    verified, inv_verified, _ = _skip_scan(root, out, "snap3", previous=(inv1, dirs1), subtree_skip=True, subtree_verify_sample=100)
+    assert verified["incremental"]["subtree_verify_failures"] >= 1
+    assert _rows(inv_verified)["alpha/src/pkg/mod.py"]["size_bytes"] == 11
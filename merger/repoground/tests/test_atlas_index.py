@@ -1,5 +1,8 @@
 import json
+import os
+import time
 
+from merger.repoground.atlas import search as atlas_search
 from merger.repoground.atlas.registry import AtlasRegistry
 from merger.repoground.atlas.index import AtlasFTSIndex
 from merger.repoground.atlas.search import AtlasSearch
@@ -242,10 +245,11 @@ def test_content_search_via_index(tmp_path):
     assert len(res) == 0
 
 
-def _build_content_index(tmp_path, files):
+def _build_content_index(tmp_path, files, mtime=None):
     """Build a content-mode snapshot from {rel_path: text} and index it.
 
-    Returns (searcher, registry_path). All files are treated as text.
+    Returns (searcher, registry_path). All files are treated as text. Pass an
+    ``mtime`` in the past so the index records the files' stat as settled.
     """
     registry_path = _make_registry(tmp_path)
     registry = AtlasRegistry(registry_path)
@@ -258,6 +262,8 @@ def _build_content_index(tmp_path, files):
         fpath = root_dir / rel_path
         fpath.parent.mkdir(parents=True, exist_ok=True)
         fpath.write_text(text, encoding="utf-8")
+        if mtime is not None:
+            os.utime(fpath, (mtime, mtime))
         records.append({
             "rel_path": rel_path,
             "name": fpath.name,
@@ -409,6 +415,61 @@ def test_content_live_mutation_after_index_does_not_create_false_negative(tmp_pa
     assert _content_keys(via_index) == _content_keys(via_linear)
 
 
+def test_content_search_serves_unchanged_files_from_index(tmp_path, monkeypatch):
+    """Stat-unchanged candidates are answered from the index without opening
+    the live file; results stay identical to the linear path."""
+    files = {
+        "a.txt": "alpha beta gamma",
+        "b.txt": "delta epsilon",
+        "c.txt": "alpha beta again",
+    }
+    searcher, _ = _build_content_index(tmp_path, files, mtime=time.time() - 3600)
+    via_linear = searcher.search(use_index=False, content_query="alpha beta")
+
+    def no_live_reads(*args, **kwargs):
+        raise AssertionError("stat-unchanged file was live-scanned")
+
+    monkeypatch.setattr(atlas_search, "_content_match", no_live_reads)
+    via_index = searcher.search(use_index=True, content_query="alpha beta")
+
+    assert _content_keys(via_index) == _content_keys(via_linear)
+    assert _content_keys(via_index) == [("s1", "a.txt"), ("s1", "c.txt")]
+    assert via_index[0]["content_snippet"] == "alpha beta gamma"
+    stats = searcher.last_content_stats
+    assert stats["candidates"] == 3
+    assert stats["index_pruned"] == 1
+    assert stats["index_verified"] == 2
+    assert stats["live_scanned"] == 0
+
+
+def test_content_search_live_scans_only_stat_changed_files(tmp_path):
+    files = {"a.txt": "alpha beta", "b.txt": "delta epsilon"}
+    searcher, _ = _build_content_index(tmp_path, files, mtime=time.time() - 3600)
+    # Same size, new mtime: only the stat can reveal the change.
+    (tmp_path / "content_root" / "b.txt").write_text("alpha gamma!!", encoding="utf-8")
+
+    via_linear = searcher.search(use_index=False, content_query="alpha gamma")
+    via_index = searcher.search(use_index=True, content_query="alpha gamma")
+
+    assert _content_keys(via_index) == [("s1", "b.txt")]
+    assert _content_keys(via_index) == _content_keys(via_linear)
+    stats = searcher.last_content_stats
+    assert stats["live_scanned"] == 1
+    assert stats["index_pruned"] == 1
+
+
+def test_recently_modified_files_are_not_trusted_at_index_time(tmp_path):
+    """Files modified within the racy window keep no recorded stat."""
+    searcher, registry_path = _build_content_index(tmp_path, {"a.txt": "alpha beta"})
+    with AtlasFTSIndex(resolve_index_db_path(registry_path)) as idx:
+        (row,) = idx.query_metadata(["s1"])
+        assert row["content_size"] is None and row["content_mtime_ns"] is None
+        assert idx.stored_content(row["file_uid"]) == "alpha beta"
+
+    searcher.search(use_index=True, content_query="alpha beta")
+    assert searcher.last_content_stats["live_scanned"] == 1
+
+
 def test_index_path_does_not_fall_back_when_index_is_covered(tmp_path, monkeypatch):
     """The index path must actually be used when the index fully covers all snapshots.
 
@@ -0,0 +1,54 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from merger.repoground.adapters.atlas import AtlasScanner
+
+
+def _make_tree(root: Path) -> None:
+    for top in range(4):
+        for sub in range(3):
+            d = root / f"d{top}" / f"s{sub}" / "deep" / "deeper"
+            d.mkdir(parents=True)
+            (d / "leaf.txt").write_text(f"{top}-{sub}\n")
+            for n in range(5):
+                (root / f"d{top}" / f"s{sub}" / f"f{n}.py").write_text(f"x = {n}\n" * (n + 1))
+    (root / "node_modules" / "pkg").mkdir(parents=True)
+    (root / "node_modules" / "pkg" / "index.js").write_text("module.exports = 1\n")
+    (root / "repo" / ".git").mkdir(parents=True)
+    (root / "repo" / "README.md").write_text("# repo\n")
+    (root / "bin.dat").write_bytes(b"\x00\x01" * 10)
+    os.symlink(root / "d0", root / "link_to_d0")
+
+
+def _scan(root: Path, tmp_path: Path, workers: int, **kwargs):
+    out = tmp_path / f"w{workers}"
+    out.mkdir(exist_ok=True)
+    inv = out / "inventory.jsonl"
+    dirs_inv = out / "dirs.jsonl"
+    scanner = AtlasScanner(root=root, snapshot_id="snap", enable_content_stats=True, workers=workers, **kwargs)
+    result = scanner.scan(inventory_file=inv, dirs_inventory_file=dirs_inv)
+    return result["stats"], inv.read_text(encoding="utf-8"), dirs_inv.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"max_depth": 2}, {"max_entries": 17}])
+def test_parallel_scan_matches_serial_scan(tmp_path, kwargs):
+    root = tmp_path / "root"
+    root.mkdir()
+    _make_tree(root)
+
+    serial_stats, serial_inv, serial_dirs = _scan(root, tmp_path, 1, **kwargs)
+    parallel_stats, parallel_inv, parallel_dirs = _scan(root, tmp_path, 4, **kwargs)
+
+    assert parallel_inv == serial_inv
+    assert parallel_dirs == serial_dirs
+    for key in ("total_files", "total_dirs", "total_bytes", "extensions", "repo_nodes",
+                "workspaces", "truncated", "topology", "content", "probe"):
+        assert parallel_stats[key] == serial_stats[key], key
+    assert not any(p.startswith("link_to_d0/") for p in serial_stats["topology"]["nodes"])
+
+
+def test_workers_must_be_positive(tmp_path):
+    with pytest.raises(ValueError, match="workers"):
+        AtlasScanner(root=tmp_path, workers=0)
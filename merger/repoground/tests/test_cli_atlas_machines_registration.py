@@ -29,6 +29,10 @@ def test_atlas_scan_explicit_machine_and_hostname(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="test-machine-id-123",
         hostname="test-hostname-123"
     )
@@ -67,6 +71,10 @@ def test_atlas_scan_default_machine_and_hostname(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id=None,
         hostname=None
     )
@@ -105,6 +113,10 @@ def test_atlas_scan_machine_registration_conflict(tmp_path: Path, monkeypatch, c
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="m1",
         hostname="host-b"
     )
@@ -135,6 +147,10 @@ def test_atlas_scan_machine_registration_case_insensitivity(tmp_path: Path, monk
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="M1",
         hostname="HOST-A"
     )
@@ -160,6 +176,10 @@ def test_atlas_scan_env_var_fallback(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id=None,
         hostname=None
     )
@@ -194,6 +214,10 @@ def test_atlas_scan_explicit_overrides_env_var(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="explicit-machine-456",
         hostname=None
     )
@@ -229,6 +253,10 @@ def test_atlas_scan_empty_hostname_fails(tmp_path: Path, monkeypatch, capsys):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="m1",
         hostname="   "
     )
@@ -255,6 +283,10 @@ def test_atlas_scan_empty_machine_id_fails(tmp_path: Path, monkeypatch, capsys):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="",
         hostname="valid-hostname"
     )
@@ -280,6 +312,10 @@ def test_atlas_scan_empty_hostname_string_fails_without_fallback(tmp_path: Path,
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="valid-machine",
         hostname=""
     )
@@ -318,6 +354,10 @@ def test_atlas_scan_legacy_machine_id_propagation(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="legacy-prop-1",
         hostname="host-prop"
     )
@@ -355,6 +395,10 @@ def test_atlas_scan_explicit_root_identity(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="test-machine",
         hostname="test-host",
         root_id="explicit-root",
@@ -387,6 +431,10 @@ def test_atlas_scan_empty_explicit_root_id_fails(tmp_path: Path, monkeypatch, ca
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="test-machine",
         hostname="test-host",
         root_id="   ",
@@ -473,6 +521,10 @@ def test_atlas_scan_empty_explicit_root_label_fails(tmp_path: Path, monkeypatch,
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="test-machine",
         hostname="test-host",
         root_id="explicit-root",
@@ -533,6 +585,10 @@ def test_atlas_scan_explicit_root_identity_invalid_chars_fails(tmp_path: Path, m
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="test-machine",
         hostname="test-host",
         root_id=invalid_id,
@@ -564,6 +620,10 @@ def test_atlas_scan_root_identity_cross_machine_overwrite_fails(tmp_path: Path,
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="machine-1",
         hostname="host-1",
         root_id="shared-root-id",
@@ -584,6 +644,10 @@ def test_atlas_scan_root_identity_cross_machine_overwrite_fails(tmp_path: Path,
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="machine-2",
         hostname="host-2",
         root_id="shared-root-id",
@@ -619,6 +683,10 @@ def test_atlas_scan_default_root_label_generation(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="test-machine",
         hostname="test-host",
         root_id=None,
@@ -650,6 +718,10 @@ def test_atlas_scan_explicit_root_label_stripped(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="test-machine",
         hostname="test-host",
         root_id=None,
@@ -681,6 +753,10 @@ def test_atlas_scan_multiple_roots_same_label(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="machine-1",
         hostname="host-1",
         root_id=None,
@@ -704,6 +780,10 @@ def test_atlas_scan_multiple_roots_same_label(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="machine-2",
         hostname="host-2",
         root_id=None,
@@ -809,6 +889,10 @@ def test_atlas_scan_root_path_fallback(tmp_path: Path, monkeypatch):
         limit=200000,
         mode="inventory",
         incremental=False,
+        workers=1,
+        skip_unchanged_subtrees=False,
+        verify_sample=0,
+        columnar_inventory=False,
         machine_id="test-machine",
         hostname="test-host",
         root_id=None,
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from merger.repoground.core import clock
+from merger.repoground.core import merge as merge_module
+from merger.repoground.core.content_stage import ContentStage
+from merger.repoground.core.merge import ExtrasConfig, scan_repo, write_reports_v2
+from merger.repoground.core.redactor import Redactor
+from merger.repoground.tests._test_constants import make_generator_info
+
+
+def _reader(texts):
+    calls = Counter()
+
+    def read(fi, max_bytes):
+        calls[str(fi.abs_path)] += 1
+        return texts[str(fi.abs_path)], False, ""
+
+    return read, calls
+
+
+def test_stage_reads_each_file_once_and_counts_hits() -> None:
+    read, calls = _reader({"a": "alpha\n", "b": "beta\n"})
+    stage = ContentStage(read)
+    fa, fb = SimpleNamespace(abs_path="a"), SimpleNamespace(abs_path="b")
+
+    for _ in range(3):
+        assert stage.get(fa, 0).text == "alpha\n"
+        assert stage.get(fb, 0).text == "beta\n"
+
+    assert calls == {"a": 1, "b": 1}
+    assert stage.counters["source_reads"] == 2
+    assert stage.counters["cache_hits"] == 4
+    assert stage.get(fa, 0).text_sha256 == hashlib.sha256(b"alpha\n").hexdigest()
+
+
+def test_stage_counts_cache_served_entries_apart_from_reads() -> None:
+    read, calls = _reader({"a": "alpha\n", "b": "beta\n"})
+    source = ContentStage(read, retain=False)
+    fa, fb = SimpleNamespace(abs_path="a"), SimpleNamespace(abs_path="b")
+    stage = ContentStage(read)
+
+    stage.put(fa, 0, source.get(fa, 0))
+    stage.put(fb, 0, source.get(fb, 0), from_cache=True)
+
+    assert stage.get(fb, 0).text == "beta\n"
+    assert (stage.counters["source_reads"], stage.counters["cached_entries"]) == (1, 1)
+
+
+def test_read_smart_content_decodes_like_text_mode_open(tmp_path) -> None:
+    path = tmp_path / "mixed.txt"
+    path.write_bytes(b"a\r\nb\rc\n\xff\xfe end\r")
+    fi = SimpleNamespace(abs_path=path)
+
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        expected = f.read()
+    assert merge_module.read_smart_content(fi, 0) == (expected, False, "")
+
+
+def test_stage_spills_beyond_budget_and_round_trips() -> None:
+    secret = "api_key = " + "x" * 24 + "\n"
+    texts = {"a": "ä" * 40, "b": secret, "c": ""}
+    read, calls = _reader(texts)
+    stage = ContentStage(read, redactor=Redactor(), memory_budget_bytes=10)
+    files = [SimpleNamespace(abs_path=k) for k in texts]
+
+    first = [stage.get(fi, 0) for fi in files]
+    again = [stage.get(fi, 0) for fi in files]
+
+    assert first == again
+    assert stage.resident_bytes == 0
+    assert stage.counters["spilled_entries"] == 2
+    assert stage.counters["spill_reads"] == 2
+    assert sum(calls.values()) == 3
+    assert again[1].was_redacted and "[REDACTED]" in again[1].redacted
+    assert again[1].text == secret
+    stage.close()
+
+
+def test_write_reports_v2_reads_each_included_file_once(tmp_path: Path, monkeypatch) -> None:
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "README.md").write_text("# Demo\n", encoding="utf-8")
+    (repo / "src" / "app.py").write_text("def main():\n    return 1\n", encoding="utf-8")
+    merges_dir = tmp_path / "merges"
+    merges_dir.mkdir()
+
+    original = merge_module.read_smart_content
+    calls = Counter()
+
+    def counting_read(fi, max_bytes, encoding="utf-8"):
+        calls[fi.rel_path.as_posix()] += 1
+        return original(fi, max_bytes, encoding)
+
+    monkeypatch.setattr(merge_module, "read_smart_content", counting_read)
+
+    write_reports_v2(
+        merges_dir=merges_dir,
+        hub=tmp_path,
+        repo_summaries=[scan_repo(repo)],
+        detail="max",
+        mode="gesamt",
+        max_bytes=0,
+        plan_only=False,
+        extras=ExtrasConfig(json_sidecar=True),
+        output_mode="dual",
+        generator_info=make_generator_info(),
+    )
+
+    assert calls["README.md"] == 1
+    assert calls["src/app.py"] == 1
+
+
+def test_write_reports_v2_closes_stage_when_an_emitter_fails(tmp_path: Path, monkeypatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "README.md").write_text("# Demo\n", encoding="utf-8")
+    merges_dir = tmp_path / "merges"
+    merges_dir.mkdir()
+    closed = []
+    original_close = ContentStage.close
+
+    def recording_close(self):
+        closed.append(self)
+        original_close(self)
+
+    def failing_emitter(*args, **kwargs):
+        raise RuntimeError("emitter failed")
+
+    monkeypatch.setattr(ContentStage, "close", recording_close)
+    monkeypatch.setattr(merge_module, "generate_chunk_artifacts", failing_emitter)
+
+    with pytest.raises(RuntimeError, match="emitter failed"):
+        write_reports_v2(
+            merges_dir=merges_dir,
+            hub=tmp_path,
+            repo_summaries=[scan_repo(repo)],
+            detail="max",
+            mode="gesamt",
+            max_bytes=0,
+            plan_only=False,
+            output_mode="dual",
+            generator_info=make_generator_info(),
+        )
+
+    assert len(closed) == 1
+
+
+@pytest.mark.parametrize("redact_secrets", [False, True])
+def test_parallel_jobs_emit_byte_identical_artifacts(tmp_path: Path, redact_secrets: bool) -> None:
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "README.md").write_text("# Demo\n\n```py\nx = 1\n```\n", encoding="utf-8")
+    (repo / "pkg" / "settings.py").write_text("password = 'hunter2hunter2'\n", encoding="utf-8")
+    for i in range(6):
+        body = "".join(f"def f{i}_{n}():\n    return {n}\n\n" for n in range(300))
+        (repo / "pkg" / f"mod{i}.py").write_text(body, encoding="utf-8")
+
+    outputs = {}
+    for jobs in (1, 2):
+        merges_dir = tmp_path / f"merges-{jobs}"
+        merges_dir.mkdir()
+        with clock.frozen(datetime.datetime(2026, 1, 2, 3, 4, tzinfo=datetime.timezone.utc)):
+            artifacts = write_reports_v2(
+                merges_dir=merges_dir,
+                hub=tmp_path,
+                repo_summaries=[scan_repo(repo)],
+                detail="max",
+                mode="gesamt",
+                max_bytes=0,
+                plan_only=False,
+                extras=ExtrasConfig(json_sidecar=True),
+                output_mode="dual",
+                redact_secrets=redact_secrets,
+                generator_info=make_generator_info(),
+                jobs=jobs,
+            )
+        sidecar = json.loads(artifacts.index_json.read_text(encoding="utf-8"))
+        sidecar.pop("artifacts")  # absolute output paths differ per run directory
+        outputs[jobs] = [
+            [p.read_bytes() for p in artifacts.md_parts],
+            artifacts.chunk_index.read_bytes(),
+            sidecar,
+        ]
+
+    assert outputs[1] == outputs[2]
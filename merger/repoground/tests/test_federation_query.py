@@ -540,6 +540,78 @@ def test_execute_federated_query_handles_query_error(federated_setup, monkeypatc
     # Ein Bundle liefert Ergebnisse
     assert res["count"] > 0
 
+def test_execute_federated_query_concurrent_matches_serial(federated_setup):
+    serial = execute_federated_query(federated_setup, query_text="main", trace=True, max_concurrency=1)
+    parallel = execute_federated_query(federated_setup, query_text="main", trace=True, max_concurrency=4)
+
+    serial_trace = serial.pop("federation_trace")
+    parallel_trace = parallel.pop("federation_trace")
+    assert parallel == serial
+    assert list(parallel_trace["bundle_status"]) == list(serial_trace["bundle_status"]) == ["repo1", "repo2"]
+    assert parallel_trace["max_concurrency"] == 4
+    assert parallel_trace["critical_path_latency_ms"] == max(parallel_trace["bundle_latency_ms"].values())
+    assert parallel_trace["bundle_latency_sum_ms"] == pytest.approx(sum(parallel_trace["bundle_latency_ms"].values()))
+    assert parallel_trace["total_latency_ms"] >= parallel_trace["critical_path_latency_ms"]
+
+
+def test_execute_federated_query_bundle_deadline(federated_setup, monkeypatch):
+    import threading
+    from merger.repoground.retrieval import federation_query
+
+    original_execute_query = federation_query.execute_query
+    release = threading.Event()
+
+    def slow_execute_query(index_path, *args, **kwargs):
+        if "repo1" in str(index_path):
+            release.wait(5)
+        return original_execute_query(index_path, *args, **kwargs)
+
+    monkeypatch.setattr(federation_query, "execute_query", slow_execute_query)
+    try:
+        res = execute_federated_query(federated_setup, query_text="hello", trace=True, bundle_deadline_s=0.2)
+    finally:
+        release.set()
+
+    trace = res["federation_trace"]
+    assert trace["bundle_status"]["repo1"] == "deadline_exceeded"
+    assert trace["bundle_errors"]["repo1"] == "bundle query exceeded deadline"
+    assert trace["bundle_status"]["repo2"] == "ok"
+    assert trace["queried_bundles_effective"] == 1
+    assert {r["federation_bundle"] for r in res["results"]} == {"repo2"}
+
+
+def test_fan_out_deadline_covers_queued_bundles():
+    import threading
+    import time
+    from merger.repoground.retrieval.federation_query import _fan_out_bundles
+
+    release = threading.Event()
+    daemon = []
+
+    def slow():
+        daemon.append(threading.current_thread().daemon)
+        release.wait(8)
+        return {"bundle": "slow"}
+
+    def fast():
+        return {"bundle": "fast"}
+
+    start = time.perf_counter()
+    try:
+        outcomes = _fan_out_bundles([slow, fast], max_concurrency=1, bundle_deadline_s=0.2)
+    finally:
+        release.set()
+
+    assert time.perf_counter() - start < 2.0
+    assert outcomes == [None, None]
+    assert daemon == [True]
+
+
+def test_execute_federated_query_rejects_invalid_concurrency(federated_setup):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        execute_federated_query(federated_setup, query_text="hello", max_concurrency=0)
+
+
 def test_execute_federated_query_trace_behavior(federated_setup):
     from merger.repoground.retrieval.federation_query import execute_federated_query
 
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import datetime
+import json
+from collections import Counter
+from pathlib import Path
+
+from merger.repoground.core import clock
+from merger.repoground.core import merge as merge_module
+from merger.repoground.core.file_work_cache import FileWorkCache
+from merger.repoground.core.merge import ExtrasConfig, scan_repo, write_reports_v2
+from merger.repoground.tests._test_constants import make_generator_info
+
+
+def _make_repo(repo: Path) -> None:
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "README.md").write_text("# Demo\n", encoding="utf-8")
+    (repo / "pkg" / "settings.py").write_text("password = 'hunter2hunter2'\n", encoding="utf-8")
+    for i in range(3):
+        body = "".join(f"def f{i}_{n}():\n    return {n}\n\n" for n in range(200))
+        (repo / "pkg" / f"mod{i}.py").write_text(body, encoding="utf-8")
+
+
+def _build(repo: Path, merges_dir: Path, redact_secrets: bool, cache=None):
+    merges_dir.mkdir()
+    with clock.frozen(datetime.datetime(2026, 1, 2, 3, 4, tzinfo=datetime.timezone.utc)):
+        artifacts = write_reports_v2(
+            merges_dir=merges_dir,
+            hub=repo.parent,
+            repo_summaries=[scan_repo(repo)],
+            detail="max",
+            mode="gesamt",
+            max_bytes=0,
+            plan_only=False,
+            extras=ExtrasConfig(json_sidecar=True),
+            output_mode="dual",
+            redact_secrets=redact_secrets,
+            generator_info=make_generator_info(),
+            file_work_cache=cache,
+        )
+    sidecar = json.loads(artifacts.index_json.read_text(encoding="utf-8"))
+    sidecar.pop("artifacts")  # absolute output paths differ per run directory
+    return [[p.read_bytes() for p in artifacts.md_parts], artifacts.chunk_index.read_bytes(), sidecar]
+
+
+def test_cached_builds_are_byte_identical_and_skip_unchanged_reads(tmp_path: Path, monkeypatch) -> None:
+    repo = tmp_path / "hub" / "repo"
+    _make_repo(repo)
+    original = merge_module._read_source_text
+    reads = Counter()
+
+    def counting_read(fi, encoding="utf-8", **kwargs):
+        reads[fi.rel_path.as_posix()] += 1
+        return original(fi, encoding, **kwargs)
+
+    monkeypatch.setattr(merge_module, "_read_source_text", counting_read)
+    cache_dir = tmp_path / "cache"
+
+    baseline = _build(repo, tmp_path / "m0", False)
+    cold = FileWorkCache(cache_dir)
+    assert _build(repo, tmp_path / "m1", False, cold) == baseline
+    assert cold.counters["stores"] == 5
+
+    reads.clear()
+    warm = FileWorkCache(cache_dir)
+    assert _build(repo, tmp_path / "m2", False, warm) == baseline
+    assert warm.counters["hits"] == 5 and not reads
+
+    (repo / "pkg" / "mod1.py").write_text("def changed():\n    return 2\n", encoding="utf-8")
+    reads.clear()
+    partial = FileWorkCache(cache_dir)
+    changed = _build(repo, tmp_path / "m3", False, partial)
+    assert partial.counters["hits"] == 4 and partial.counters["misses"] == 1
+    assert reads["pkg/mod1.py"] == 1 and reads["pkg/mod0.py"] == 0
+    assert changed == _build(repo, tmp_path / "m4", False)
+
+
+def test_cache_is_bounded_and_skips_unhashed_files(tmp_path: Path) -> None:
+    repo = tmp_path / "hub" / "repo"
+    _make_repo(repo)
+    cache = FileWorkCache(tmp_path / "cache", max_bytes=1)
+    _build(repo, tmp_path / "m1", False, cache)
+    assert cache.counters["stores"] == 5 and cache.counters["pruned"] == 5
+    assert not list((tmp_path / "cache").glob("*/*.json"))
+
+    summary = scan_repo(repo, calculate_md5=False)
+    fi = summary["files"][0]
+    assert fi.md5 == ""
+    assert cache.get(fi, 0, False, with_chunks=False) is None
+
+
+def test_redacting_builds_do_not_store_source_text(tmp_path: Path) -> None:
+    repo = tmp_path / "hub" / "repo"
+    _make_repo(repo)
+    baseline = _build(repo, tmp_path / "m0", True)
+    cache = FileWorkCache(tmp_path / "cache")
+    assert _build(repo, tmp_path / "m1", True, cache) == baseline
+    assert cache.counters["stores"] == 0
+    assert not list((tmp_path / "cache").glob("*/*.json"))
+
+
+def test_content_changed_after_scan_is_not_cached(tmp_path: Path, monkeypatch) -> None:
+    repo = tmp_path / "hub" / "repo"
+    _make_repo(repo)
+    files = {fi.rel_path.as_posix(): fi for fi in scan_repo(repo)["files"]}
+    (repo / "pkg" / "mod1.py").write_text("def changed():\n    return 2\n", encoding="utf-8")
+
+    def second_read(*args, **kwargs):
+        raise AssertionError("the MD5 check must hash the staged read")
+
+    monkeypatch.setattr(merge_module, "compute_md5", second_read)
+
+    assert merge_module._prepare_file_worker(files["pkg/mod0.py"], 0, False, False, True)[2] is True
+    staged, _, unchanged = merge_module._prepare_file_worker(files["pkg/mod1.py"], 0, False, False, True)
+    assert "changed" in staged.text and unchanged is False
@@ -348,3 +348,45 @@ def test_graph_loader_rejects_absolute_path(tmp_path):
     result = load_graph_index(tmp_path, str(tmp_path / "graph.json"))
 
     assert result == {"status": "invalid_path", "graph": None}
+
+
+def test_graph_loader_serves_unchanged_file_from_cache(tmp_path, monkeypatch):
+    pytest.importorskip("jsonschema")
+    graph_index_module.clear_graph_index_cache()
+    data = _graph_index()
+    data["distances"] = {"file:main.py": 0, "file:lib.py": 2, "file:orphan.py": -1}
+    graph_path = tmp_path / "graph-index.json"
+    graph_path.write_text(json.dumps(data), encoding="utf-8")
+
+    first = load_graph_index(tmp_path, graph_path.name, expected_sha256=SHA_A)
+    monkeypatch.setattr(
+        graph_index_module.json, "load", lambda handle: pytest.fail("cached graph was re-parsed")
+    )
+    second = load_graph_index(tmp_path, graph_path.name, expected_sha256=SHA_B)
+
+    assert first["status"] == "ok" and first["cache_hit"] is False
+    assert second["status"] == "stale_or_mismatched" and second["cache_hit"] is True
+    assert second["graph"] is first["graph"]
+    assert second["proximity_scores"] == {
+        "file:main.py": (0, 1.0, 1.0),
+        "file:lib.py": (2, 1.0 / 3.0, 0.0),
+        "file:orphan.py": (-1, 0.0, 0.0),
+    }
+    stats = graph_index_module.graph_index_cache_stats()
+    assert stats["entries"] == 1
+    assert stats["approx_bytes"] == graph_path.stat().st_size
+
+
+def test_graph_loader_cache_misses_after_file_rewrite(tmp_path):
+    pytest.importorskip("jsonschema")
+    graph_index_module.clear_graph_index_cache()
+    graph_path = tmp_path / "graph-index.json"
+    graph_path.write_text(json.dumps(_graph_index(sha=SHA_A)), encoding="utf-8")
+    assert load_graph_index(tmp_path, graph_path.name, expected_sha256=SHA_A)["status"] == "ok"
+
+    graph_path.write_text(json.dumps(_graph_index(sha=SHA_B, run_id="run-22")), encoding="utf-8")
+    result = load_graph_index(tmp_path, graph_path.name, expected_sha256=SHA_B)
+
+    assert result["status"] == "ok"
+    assert result["cache_hit"] is False
+    assert result["graph"]["run_id"] == "run-22"
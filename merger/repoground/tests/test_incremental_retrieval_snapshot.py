@@ -2,6 +2,7 @@ import fcntl
 import json
 import os
 import signal
+import sqlite3
 import subprocess
 import sys
 import time
@@ -111,6 +112,12 @@ def test_change_reuses_unchanged_file_chunks(tmp_path: Path) -> None:
     assert result.receipt["files"]["reused"] == ["beta.py"]
     assert current_beta == original_beta
     assert snapshot.query("changed")["results"][0]["path"] == "alpha.py"
+    index_path = snapshot.storage_root / "generations" / result.generation_id / "chunks.index.sqlite"
+    with sqlite3.connect(str(index_path)) as conn:
+        meta = dict(conn.execute("SELECT key, value FROM index_meta WHERE key LIKE 'ingest.%'"))
+    assert meta["ingest.mode"] == "incremental"
+    assert meta["ingest.reused_chunks"] == "1"
+    assert meta["ingest.inserted_chunks"] == "1"
 
 
 def test_change_reuses_unchunked_empty_files(tmp_path: Path) -> None:
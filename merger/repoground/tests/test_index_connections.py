@@ -0,0 +1,78 @@
+import json
+import os
+import sqlite3
+import threading
+
+from merger.repoground.retrieval import index_db, query_core
+from merger.repoground.retrieval.index_connections import IndexConnectionPool
+
+
+def _build(tmp_path, token, name="chunks.index.sqlite"):
+    dump_path = tmp_path / "dump.json"
+    chunk_path = tmp_path / "chunks.jsonl"
+    dump_path.write_text(json.dumps({"dummy": token}), encoding="utf-8")
+    chunk_path.write_text(
+        json.dumps({"chunk_id": token, "repo_id": "r1", "path": f"src/{token}.py", "content": f"def {token}(): pass"}) + "\n",
+        encoding="utf-8",
+    )
+    db_path = (tmp_path / name).resolve()
+    index_db.build_index(dump_path, chunk_path, db_path)
+    return db_path
+
+
+def test_execute_query_reuses_connection_and_reports_pool_in_trace(tmp_path, monkeypatch):
+    db_path = _build(tmp_path, "alpha")
+    monkeypatch.setattr(query_core, "index_connection_pool", lambda pool=IndexConnectionPool(): pool)
+    connects = []
+    real_connect = sqlite3.connect
+
+    def recording_connect(database, *args, **kwargs):
+        connects.append(database)
+        return real_connect(database, *args, **kwargs)
+
+    monkeypatch.setattr(query_core.sqlite3, "connect", recording_connect)
+
+    first = query_core.execute_query(db_path, "alpha", read_only=True, trace=True)
+    second = query_core.execute_query(db_path, "alpha", read_only=True, trace=True)
+
+    assert first["results"] == second["results"]
+    assert len(connects) == 1
+    assert first["query_trace"]["connection_pool"]["hit"] is False
+    assert second["query_trace"]["connection_pool"]["hit"] is True
+    assert second["query_trace"]["connection_pool"]["hits"] == 1
+    assert second["query_trace"]["connection_pool"]["misses"] == 1
+
+
+def test_replaced_index_file_invalidates_pooled_connection(tmp_path, monkeypatch):
+    db_path = _build(tmp_path, "alpha")
+    pool = IndexConnectionPool()
+    monkeypatch.setattr(query_core, "index_connection_pool", lambda: pool)
+    assert query_core.execute_query(db_path, "alpha", read_only=True)["count"] == 1
+
+    rebuilt = _build(tmp_path, "beta", name="next.index.sqlite")
+    os.replace(rebuilt, db_path)
+
+    assert query_core.execute_query(db_path, "alpha", read_only=True)["count"] == 0
+    assert query_core.execute_query(db_path, "beta", read_only=True)["count"] == 1
+    assert pool.counters["invalidations"] == 1
+
+
+def test_idle_connections_are_handed_to_other_threads(tmp_path, monkeypatch):
+    db_path = _build(tmp_path, "alpha")
+    pool = IndexConnectionPool()
+    monkeypatch.setattr(query_core, "index_connection_pool", lambda: pool)
+    assert query_core.execute_query(db_path, "alpha", read_only=True)["count"] == 1
+    results = []
+
+    def worker():
+        out = query_core.execute_query(db_path, "alpha", read_only=True, trace=True)
+        results.append((out["count"], out["query_trace"]["connection_pool"]["hit"]))
+
+    for _ in range(2):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    assert results == [(1, True), (1, True)]
+    assert pool.counters["misses"] == 1
+    pool.clear()
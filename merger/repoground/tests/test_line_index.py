@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from merger.repoground.core.line_index import LineIndex
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"no newline", b"\n", b"a\nbb\n\nccc", b"\n\n\nx\n", "ä\nö\r\nü\n".encode("utf-8")],
+)
+def test_line_for_byte_matches_newline_count(data: bytes) -> None:
+    index = LineIndex(data)
+
+    assert index.newline_count == data.count(b"\n")
+    for offset in range(len(data) + 2):
+        assert index.line_for_byte(offset) == data.count(b"\n", 0, offset) + 1
+
+
+def test_line_range_uses_last_included_byte() -> None:
+    index = LineIndex(b"line1\nline2\nline3")
+
+    assert index.line_range(0, 6) == (1, 1)
+    assert index.line_range(6, 13) == (2, 3)
+    assert index.line_range(6, 6) == (2, 2)
@@ -6,6 +6,7 @@ from pathlib import Path
 from merger.repoground.architecture.module_reachability import (
     NON_DOCUMENTATION_EVIDENCE,
     PRODUCTION_EVIDENCE,
+    _Corpus,
     evaluate_reachability_policy,
     measure_module_reachability,
 )
@@ -357,6 +358,19 @@ def test_a_longer_dotted_name_does_not_credit_its_prefix(tmp_path: Path) -> None
     ]
 
 
+def test_corpus_token_index_matches_whole_names_and_odd_paths() -> None:
+    corpus = _Corpus()
+    corpus.add("python -m pkg.tool --flag\n")
+    corpus.add("run 'tools/my script.py' and pkg/other.py:12")
+
+    assert corpus.contains("pkg.tool")
+    assert corpus.contains("missing", "pkg/other.py")
+    assert not corpus.contains("pkg", "tool", "pkg.tool.extra")
+    # Needles with characters outside names and paths fall back to a search.
+    assert corpus.contains("tools/my script.py")
+    assert not corpus.contains("my script")
+
+
 def test_stale_allowlist_entries_are_rejected() -> None:
     measurement = {
         "unproven": [],
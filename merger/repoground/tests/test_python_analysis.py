@@ -0,0 +1,182 @@
+import ast
+import json
+from collections import Counter
+
+from merger.repoground.architecture.ast_facts_cache import (
+    AST_FACTS_CACHE_RELPATH,
+    AstFactsCache,
+)
+from merger.repoground.architecture.call_graph import (
+    CallGraphAnalyzer,
+    call_graph_document,
+    generate_call_graph_document,
+)
+from merger.repoground.architecture.import_graph import generate_import_graph_document
+from merger.repoground.architecture.python_analysis import run_python_analysis
+from merger.repoground.architecture.symbol_index import (
+    SymbolIndexAnalyzer,
+    generate_symbol_index_document,
+    symbol_index_document,
+)
+from merger.repoground.core import bundle_sidecars
+
+
+def _write_repo(root):
+    (root / "pkg").mkdir()
+    (root / "pkg" / "__init__.py").write_text("from .util import helper\n", encoding="utf-8")
+    (root / "pkg" / "util.py").write_text(
+        "def helper():\n    return 1\n\nclass Box:\n    def get(self):\n        return helper()\n",
+        encoding="utf-8",
+    )
+    (root / "pkg" / "broken.py").write_text("def nope(:\n", encoding="utf-8")
+    (root / "build").mkdir()
+    (root / "build" / "copy.py").write_text("def shadow():\n    pass\n", encoding="utf-8")
+
+
+def test_shared_pass_parses_once_and_matches_standalone_documents(tmp_path, monkeypatch):
+    _write_repo(tmp_path)
+    expected_symbols = generate_symbol_index_document(tmp_path, "run-1", "a" * 64)
+    expected_calls = generate_call_graph_document(tmp_path, "run-1", "a" * 64)
+
+    parsed = Counter()
+    original_parse = ast.parse
+
+    def counting_parse(source, filename="<unknown>", *args, **kwargs):
+        parsed[filename] += 1
+        return original_parse(source, filename, *args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    symbols = SymbolIndexAnalyzer()
+    calls = CallGraphAnalyzer()
+    report = run_python_analysis(tmp_path, [symbols, calls])
+
+    assert sorted(parsed.values()) == [1, 1, 1]
+    assert (report.files_seen, report.files_parsed, report.skipped_files_count) == (3, 2, 1)
+    assert report.skipped_errors[0].startswith("Failed to parse pkg/broken.py: SyntaxError")
+    assert set(report.timings) == {"walk", "parse", "symbol_index", "call_graph"}
+    assert symbol_index_document(symbols, report, "run-1", "a" * 64) == expected_symbols
+    assert call_graph_document(calls, report, "run-1", "a" * 64) == expected_calls
+
+
+def test_bundle_writes_both_python_sidecars_from_one_pass(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _write_repo(repo)
+    dump_index = tmp_path / "demo.dump_index.json"
+    dump_index.write_text("{}\n", encoding="utf-8")
+    manifest = tmp_path / "demo.bundle.manifest.json"
+
+    symbol_path, call_graph_path, timings = bundle_sidecars.write_python_analysis_sidecars(
+        base_manifest_path=manifest,
+        repo_summaries=[{"root": str(repo)}],
+        final_dump_index=dump_index,
+        run_id="run-1",
+    )
+
+    assert symbol_path.name == "demo.python_symbol_index.json"
+    assert call_graph_path.name == "demo.python_call_graph.json"
+    assert set(timings) == {"walk", "parse", "symbol_index", "call_graph"}
+    assert bundle_sidecars.write_python_analysis_sidecars(
+        base_manifest_path=manifest,
+        repo_summaries=[],
+        final_dump_index=dump_index,
+        run_id="run-1",
+    ) == (None, None, None)
+
+
+def _analyze(root, cache):
+    symbols = SymbolIndexAnalyzer()
+    calls = CallGraphAnalyzer()
+    report = run_python_analysis(root, [symbols, calls], facts_cache=cache)
+    return (
+        symbol_index_document(symbols, report, "run-1", "a" * 64),
+        call_graph_document(calls, report, "run-1", "a" * 64),
+        report,
+    )
+
+
+def test_facts_cache_reparses_only_changed_files(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _write_repo(repo)
+    (repo / "pkg" / "extra.py").write_text(
+        "from .util import Box\n\nclass Sub(Box):\n    def run(self, x):\n        return [self.get() for _ in x]\n",
+        encoding="utf-8",
+    )
+    cache_path = tmp_path / "hub" / AST_FACTS_CACHE_RELPATH
+    expected = _analyze(repo, None)
+
+    with AstFactsCache(cache_path) as cold:
+        first = _analyze(repo, cold)
+    assert first[:2] == expected[:2]
+    assert cold.counters["stores"] == 6 and first[2].files_parsed == 3
+
+    (repo / "pkg" / "util.py").write_text("def helper():\n    return 2\n", encoding="utf-8")
+    with AstFactsCache(cache_path) as warm:
+        second = _analyze(repo, warm)
+    assert (second[2].files_parsed, second[2].files_cached) == (1, 2)
+    assert warm.counters["hits"] == 4
+    assert second[:2] == _analyze(repo, None)[:2]
+
+
+def test_import_graph_uses_facts_cache_without_changing_output(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _write_repo(repo)
+    expected = generate_import_graph_document(repo, "run-1", "a" * 64)
+    with AstFactsCache(tmp_path / "facts.sqlite") as cold:
+        generate_import_graph_document(repo, "run-1", "a" * 64, facts_cache=cold)
+    with AstFactsCache(tmp_path / "facts.sqlite", max_entries=1) as warm:
+        cached = generate_import_graph_document(repo, "run-1", "a" * 64, facts_cache=warm)
+    assert warm.counters["hits"] == 3 and warm.counters["pruned"] == 2
+    cached.pop("generated_at", None)
+    expected.pop("generated_at", None)
+    assert cached == expected
+
+
+def test_process_pool_extraction_matches_serial_output(tmp_path):
+    _write_repo(tmp_path)
+    for index in range(6):
+        (tmp_path / "pkg" / f"mod{index}.py").write_text(
+            "from .util import helper, Box\n\n"
+            f"def run{index}(items):\n"
+            "    box = Box()\n"
+            "    return [helper() for _ in items] + [box.get(), len(items)]\n",
+            encoding="utf-8",
+        )
+
+    assert generate_symbol_index_document(
+        tmp_path, "run-1", "a" * 64, max_workers=2
+    ) == generate_symbol_index_document(tmp_path, "run-1", "a" * 64)
+    serial = generate_call_graph_document(tmp_path, "run-1", "a" * 64)
+    parallel = generate_call_graph_document(tmp_path, "run-1", "a" * 64, max_workers=2)
+    assert json.dumps(parallel, sort_keys=True) == json.dumps(serial, sort_keys=True)
+    assert parallel["skipped_files_count"] == 1
+    assert any(call["resolution_status"] == "resolved" for call in parallel["calls"])
+
+
+def test_pool_reuses_bytes_read_by_the_cache_probe(tmp_path, monkeypatch):
+    from merger.repoground.architecture import python_analysis
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _write_repo(repo)
+    shipped = []
+    extract_in_pool = python_analysis._extract_in_pool
+
+    def recording_pool(analyzers, pending, max_workers):
+        shipped.extend(pending)
+        return extract_in_pool(analyzers, pending, max_workers)
+
+    monkeypatch.setattr(python_analysis, "_extract_in_pool", recording_pool)
+    with AstFactsCache(tmp_path / "facts.sqlite") as cache:
+        analyzers = [SymbolIndexAnalyzer(), CallGraphAnalyzer()]
+        report = run_python_analysis(repo, analyzers, facts_cache=cache, max_workers=2)
+
+    assert sorted(source.rel_path for source, _ in shipped) == [
+        "pkg/__init__.py",
+        "pkg/broken.py",
+        "pkg/util.py",
+    ]
+    assert all(raw == source.path.read_bytes() for source, raw in shipped)
+    assert (report.files_parsed, report.skipped_files_count) == (2, 1)
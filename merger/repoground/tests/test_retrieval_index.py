@@ -892,3 +892,274 @@ def test_fts_content_hydration_empty_range_raises(tmp_path):
     with pytest.raises(RuntimeError, match="empty range"):
         index_db.build_index(dump_path, chunk_path, db_path)
     assert not db_path.exists()
+
+
+def _write_chunks(path, chunks):
+    path.write_text("".join(json.dumps(c) + "\n" for c in chunks), encoding="utf-8")
+
+
+def _index_contents(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        chunks = sorted(conn.execute("SELECT * FROM chunks").fetchall())
+        fts = sorted(conn.execute("SELECT chunk_id, content, path_tokens FROM chunks_fts").fetchall())
+        meta = dict(conn.execute("SELECT key, value FROM index_meta").fetchall())
+    finally:
+        conn.close()
+    return chunks, fts, meta
+
+
+def test_incremental_build_matches_full_build_and_keeps_previous_db(tmp_path):
+    dump_path = tmp_path / "dump.json"
+    dump_path.write_text("{}")
+    old_chunks = tmp_path / "old.jsonl"
+    new_chunks = tmp_path / "new.jsonl"
+    keep = {"chunk_id": "keep", "path": "a.py", "content": "alpha kept", "sha256": "s-keep"}
+    _write_chunks(old_chunks, [
+        keep,
+        {"chunk_id": "edit", "path": "b.py", "content": "beta old", "sha256": "s-old"},
+        {"chunk_id": "gone", "path": "c.py", "content": "gamma gone", "sha256": "s-gone"},
+    ])
+    _write_chunks(new_chunks, [
+        keep,
+        {"chunk_id": "edit", "path": "b.py", "content": "beta new", "sha256": "s-new"},
+        {"chunk_id": "added", "path": "d.py", "content": "delta added", "sha256": "s-add"},
+    ])
+    previous_db = tmp_path / "previous.sqlite"
+    index_db.build_index(dump_path, old_chunks, previous_db)
+    previous_bytes = previous_db.read_bytes()
+
+    incremental_db = tmp_path / "incremental.sqlite"
+    full_db = tmp_path / "full.sqlite"
+    index_db.build_index(dump_path, new_chunks, incremental_db, previous_db=previous_db)
+    index_db.build_index(dump_path, new_chunks, full_db)
+
+    inc_chunks, inc_fts, inc_meta = _index_contents(incremental_db)
+    full_chunks, full_fts, full_meta = _index_contents(full_db)
+    assert (inc_chunks, inc_fts) == (full_chunks, full_fts)
+    assert previous_db.read_bytes() == previous_bytes
+    assert inc_meta["ingest.mode"] == "incremental"
+    assert full_meta["ingest.mode"] == "full"
+    assert inc_meta["ingest.reused_chunks"] == "1"
+    assert inc_meta["ingest.inserted_chunks"] == "2"
+    assert inc_meta["ingest.deleted_chunks"] == "1"
+    assert inc_meta["ingest.ingested_chunks_count"] == "3"
+    assert index_db.verify_index(incremental_db, dump_path, new_chunks) is True
+
+
+def test_incremental_build_falls_back_to_full_build_on_config_change(tmp_path):
+    dump_path = tmp_path / "dump.json"
+    dump_path.write_text("{}")
+    chunk_path = tmp_path / "chunks.jsonl"
+    _write_chunks(chunk_path, [{"chunk_id": "c1", "path": "a.py", "content": "alpha", "sha256": "s1"}])
+    previous_db = tmp_path / "previous.sqlite"
+    index_db.build_index(dump_path, chunk_path, previous_db, {"config_sha256": "one"})
+
+    db_path = tmp_path / "index.sqlite"
+    index_db.build_index(dump_path, chunk_path, db_path, {"config_sha256": "two"}, previous_db=previous_db)
+
+    _, fts, meta = _index_contents(db_path)
+    assert meta["ingest.mode"] == "full"
+    assert "ingest.reused_chunks" not in meta
+    assert fts == [("c1", "alpha", "a py")]
+
+
+def test_bulk_load_records_throughput_and_builds_indexes(mini_artifacts, tmp_path):
+    dump_path, chunk_path = mini_artifacts
+    db_path = tmp_path / "index.sqlite"
+
+    index_db.build_index(dump_path, chunk_path, db_path)
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        meta = dict(conn.execute("SELECT key, value FROM index_meta").fetchall())
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    finally:
+        conn.close()
+
+    assert {"idx_chunks_repo", "idx_chunks_path", "idx_chunks_layer"} <= indexes
+    assert journal_mode == "delete"
+    assert meta["ingest.ingested_content_bytes"] == str(len("def main(): pass") + len("def test_main(): assert True"))
+    assert float(meta["ingest.seconds"]) >= 0
+    assert float(meta["ingest.chunks_per_second"]) >= 0
+    assert float(meta["ingest.bytes_per_second"]) >= 0
+
+
+def _canonical_range_chunks(tmp_path, count, *, corrupt=()):
+    import hashlib
+
+    dump_path, canonical_md, ref, _ = _make_range_ref_env(tmp_path)
+    lines = [f"line {i} token{i}\n".encode("utf-8") for i in range(count)]
+    canonical_md.write_bytes(b"".join(lines))
+    chunks = []
+    offset = 0
+    for i, data in enumerate(lines):
+        chunk_ref = dict(
+            ref,
+            start_byte=offset,
+            end_byte=offset + len(data),
+            content_sha256="0" * 64 if i in corrupt else hashlib.sha256(data).hexdigest(),
+        )
+        chunks.append({"chunk_id": f"c{i}", "path": "canonical.md", "canonical_range": chunk_ref})
+        offset += len(data)
+    chunk_path = tmp_path / "chunks.jsonl"
+    _write_chunks(chunk_path, chunks)
+    return dump_path, chunk_path
+
+
+def test_canonical_range_hydration_maps_artifact_once(tmp_path, monkeypatch):
+    dump_path, chunk_path = _canonical_range_chunks(tmp_path, 1200)
+    opened = []
+    original_map = index_db._RangeHydrator._map
+
+    def counting_map(self, path):
+        opened.append(path)
+        return original_map(self, path)
+
+    monkeypatch.setattr(index_db._RangeHydrator, "_map", counting_map)
+    db_path = tmp_path / "index.sqlite"
+    index_db.build_index(dump_path, chunk_path, db_path)
+
+    assert len(opened) == 1
+    conn = sqlite3.connect(str(db_path))
+    try:
+        rows = dict(conn.execute("SELECT chunk_id, content FROM chunks_fts").fetchall())
+    finally:
+        conn.close()
+    assert len(rows) == 1200
+    assert rows["c0"] == "line 0 token0\n"
+    assert rows["c1199"] == "line 1199 token1199\n"
+
+
+def test_canonical_range_hydration_fails_on_first_bad_chunk_in_order(tmp_path):
+    dump_path, chunk_path = _canonical_range_chunks(tmp_path, 40, corrupt={7, 31})
+    db_path = tmp_path / "index.sqlite"
+
+    with pytest.raises(RuntimeError, match="chunk 'c7': hash mismatch"):
+        index_db.build_index(dump_path, chunk_path, db_path)
+    assert not db_path.exists()
+
+
+def _code_chunks():
+    return [
+        {"chunk_id": "camel", "path": "src/a.py", "content": "def buildIndex(dumpPath): return HTTPServer()", "sha256": "s-a"},
+        {"chunk_id": "snake", "path": "src/b.py", "content": "def execute_query(index_path): pass", "sha256": "s-b"},
+    ]
+
+
+def test_code_tokens_and_trigram_are_recorded_and_queried(tmp_path):
+    from merger.repoground.retrieval import query_core
+
+    dump_path = tmp_path / "dump.json"
+    dump_path.write_text("{}")
+    chunk_path = tmp_path / "chunks.jsonl"
+    _write_chunks(chunk_path, _code_chunks())
+    plain_db = tmp_path / "plain.sqlite"
+    code_db = tmp_path / "code.sqlite"
+    index_db.build_index(dump_path, chunk_path, plain_db)
+    index_db.build_index(dump_path, chunk_path, code_db, code_tokens=True, trigram=True)
+
+    _, _, plain_meta = _index_contents(plain_db)
+    _, fts, code_meta = _index_contents(code_db)
+    assert (plain_meta["fts.code_tokens"], plain_meta["fts.trigram"]) == ("0", "0")
+    assert (code_meta["fts.code_tokens"], code_meta["fts.trigram"]) == ("2", "1")
+    assert [row[:2] for row in fts] == [(c["chunk_id"], c["content"]) for c in _code_chunks()]
+
+    def hits(db_path, query):
+        return [r["chunk_id"] for r in query_core.execute_query(db_path, query)["results"]]
+
+    assert hits(plain_db, "buildIndex") == ["camel"]
+    assert hits(plain_db, "build index") == []
+    assert hits(code_db, "build index") == ["camel"]
+    assert hits(code_db, "server") == ["camel"]
+    assert hits(code_db, "executeQuery") == ["snake"]
+    assert hits(plain_db, "xecute_qu") == []
+    fragment = query_core.execute_query(code_db, "xecute_qu")
+    assert [r["chunk_id"] for r in fragment["results"]] == ["snake"]
+    assert fragment["engine"] == "fts5+trigram"
+    miss = query_core.execute_query(code_db, "zzqzzq", trace=True)
+    assert miss["results"] == [] and miss["engine"] == "fts5"
+    assert "trigram_substring" not in miss["query_trace"]["fallback_markers"]
+
+
+def test_verify_index_treats_other_fts_options_as_stale(tmp_path):
+    dump_path = tmp_path / "dump.json"
+    dump_path.write_text("{}")
+    chunk_path = tmp_path / "chunks.jsonl"
+    _write_chunks(chunk_path, _code_chunks())
+    db_path = tmp_path / "index.sqlite"
+    index_db.build_index(dump_path, chunk_path, db_path, trigram=True)
+
+    assert index_db.verify_index(db_path, dump_path, chunk_path)
+    assert index_db.verify_index(db_path, dump_path, chunk_path, code_tokens=False, trigram=True)
+    assert not index_db.verify_index(db_path, dump_path, chunk_path, code_tokens=True, trigram=True)
+    assert not index_db.verify_index(db_path, dump_path, chunk_path, code_tokens=False, trigram=False)
+
+
+def test_code_token_phrases_do_not_span_identifiers(tmp_path):
+    from merger.repoground.retrieval import query_core
+
+    dump_path = tmp_path / "dump.json"
+    dump_path.write_text("{}")
+    chunk_path = tmp_path / "chunks.jsonl"
+    spanning = {"chunk_id": "spanning", "path": "src/c.py", "content": "x = fooBuild + indexBar", "sha256": "s-c"}
+    _write_chunks(chunk_path, [*_code_chunks(), spanning])
+    previous_db = tmp_path / "previous.sqlite"
+    index_db.build_index(dump_path, chunk_path, previous_db, code_tokens=True)
+
+    hits = query_core.execute_query(previous_db, "buildIndex")["results"]
+    assert [r["chunk_id"] for r in hits] == ["camel"]
+
+    # Rows written in the older, unseparated format are never carried over.
+    conn = sqlite3.connect(str(previous_db))
+    with conn:
+        conn.execute("UPDATE index_meta SET value = '1' WHERE key = 'fts.code_tokens'")
+    conn.close()
+    rebuilt_db = tmp_path / "rebuilt.sqlite"
+    index_db.build_index(dump_path, chunk_path, rebuilt_db, previous_db=previous_db, code_tokens=True)
+    assert _index_contents(rebuilt_db)[2]["ingest.mode"] == "full"
+
+
+def test_incremental_build_keeps_code_tokens_and_trigram_in_sync(tmp_path):
+    dump_path = tmp_path / "dump.json"
+    dump_path.write_text("{}")
+    old_chunks = tmp_path / "old.jsonl"
+    new_chunks = tmp_path / "new.jsonl"
+    camel, snake = _code_chunks()
+    _write_chunks(old_chunks, [camel, snake])
+    _write_chunks(new_chunks, [camel, dict(snake, content="def renderPage(): pass", sha256="s-c")])
+    previous_db = tmp_path / "previous.sqlite"
+    index_db.build_index(dump_path, old_chunks, previous_db, code_tokens=True, trigram=True)
+
+    plain_db = tmp_path / "plain.sqlite"
+    index_db.build_index(dump_path, new_chunks, plain_db, previous_db=previous_db)
+    assert _index_contents(plain_db)[2]["ingest.mode"] == "full"
+
+    incremental_db = tmp_path / "incremental.sqlite"
+    full_db = tmp_path / "full.sqlite"
+    index_db.build_index(dump_path, new_chunks, incremental_db, previous_db=previous_db, code_tokens=True, trigram=True)
+    index_db.build_index(dump_path, new_chunks, full_db, code_tokens=True, trigram=True)
+    assert _index_contents(incremental_db)[2]["ingest.mode"] == "incremental"
+
+    def searchable(db_path):
+        conn = sqlite3.connect(str(db_path))
+        try:
+            code_tokens = sorted(conn.execute("SELECT chunk_id, code_tokens FROM chunks_fts").fetchall())
+            substring_hits = {
+                query: [cid for (cid,) in conn.execute(
+                    "SELECT chunks_fts.chunk_id FROM chunks_trigram"
+                    " LEFT JOIN chunks_fts ON chunks_fts.rowid = chunks_trigram.rowid"
+                    " WHERE chunks_trigram MATCH ?",
+                    (query,),
+                )]
+                for query in ('"ender"', '"xecute"', '"ildInd"')
+            }
+        finally:
+            conn.close()
+        return code_tokens, substring_hits
+
+    assert searchable(incremental_db) == searchable(full_db) == (
+        [("camel", "build index idbreak0 dump path idbreak0 http server"), ("snake", "render page")],
+        {'"ender"': ["snake"], '"xecute"': [], '"ildInd"': ["camel"]},
+    )
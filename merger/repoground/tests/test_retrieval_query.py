@@ -272,7 +272,7 @@ def _make_mock_conn(err_msg: str):
     return MockConn()
 
 def test_query_no_fts_module_handling(mini_index, monkeypatch):
-    monkeypatch.setattr(query_core.sqlite3, "connect", lambda x: _make_mock_conn("no such module: fts5"))
+    monkeypatch.setattr(query_core.sqlite3, "connect", lambda x, **kwargs: _make_mock_conn("no such module: fts5"))
 
     with pytest.raises(RuntimeError) as excinfo:
         query_core.execute_query(mini_index, query_text="foo", k=10)
@@ -280,7 +280,7 @@ def test_query_no_fts_module_handling(mini_index, monkeypatch):
     assert "SQLite FTS5 extension missing" in str(excinfo.value)
 
 def test_query_no_fts_table_handling(mini_index, monkeypatch):
-    monkeypatch.setattr(query_core.sqlite3, "connect", lambda x: _make_mock_conn("no such table: chunks_fts"))
+    monkeypatch.setattr(query_core.sqlite3, "connect", lambda x, **kwargs: _make_mock_conn("no such table: chunks_fts"))
 
     with pytest.raises(RuntimeError) as excinfo:
         query_core.execute_query(mini_index, query_text="foo", k=10)
@@ -288,7 +288,7 @@ def test_query_no_fts_table_handling(mini_index, monkeypatch):
     assert "FTS table missing; likely old or corrupt index" in str(excinfo.value)
 
 def test_query_no_bm25_function_handling(mini_index, monkeypatch):
-    monkeypatch.setattr(query_core.sqlite3, "connect", lambda x: _make_mock_conn("no such function: bm25"))
+    monkeypatch.setattr(query_core.sqlite3, "connect", lambda x, **kwargs: _make_mock_conn("no such function: bm25"))
 
     with pytest.raises(RuntimeError) as excinfo:
         query_core.execute_query(mini_index, query_text="foo", k=10)
@@ -296,7 +296,7 @@ def test_query_no_bm25_function_handling(mini_index, monkeypatch):
     assert "SQLite FTS5 auxiliary function 'bm25' missing" in str(excinfo.value)
 
 def test_query_unable_to_use_bm25_handling(mini_index, monkeypatch):
-    monkeypatch.setattr(query_core.sqlite3, "connect", lambda x: _make_mock_conn("unable to use function bm25"))
+    monkeypatch.setattr(query_core.sqlite3, "connect", lambda x, **kwargs: _make_mock_conn("unable to use function bm25"))
 
     with pytest.raises(RuntimeError) as excinfo:
         query_core.execute_query(mini_index, query_text="foo", k=10)
@@ -61,6 +61,8 @@ def test_retrieval_stack_integration():
             out = str(index_path)
             rebuild = True
             verify = False
+            code_tokens = False
+            trigram = False
 
         ret = cmd_index.run_index(IndexArgs())
         assert ret == 0, "Index build failed"
@@ -67,3 +67,10 @@ def test_route_query_overmatch_guard():
     res = route_query("database settings", overmatch_guard=True)
     assert res["fts_query"] == "database AND settings"
     assert res["synonyms_used"] == []
+
+def test_route_query_code_tokens_splits_identifiers():
+    res = route_query("find buildIndex near execute_query index", code_tokens=True)
+    assert res["fts_query"] == 'build + index AND "near" AND execute + query AND (index OR indexing OR indexer)'
+    assert res["subword_phrases"] == ["build index", "execute query"]
+    assert "build_index" not in res["synonyms_used"]
+    assert "subword_phrases" not in route_query("find buildIndex")
@@ -0,0 +1,112 @@
+import json
+
+from merger.repoground.service import jobstore as jobstore_module
+from merger.repoground.service.jobstore import JobStore
+from merger.repoground.service.models import Artifact, Job, JobRequest
+
+
+def _job(job_id: str, created_at: str, status: str = "queued", content_hash=None) -> Job:
+    return Job(
+        id=job_id,
+        status=status,
+        created_at=created_at,
+        request=JobRequest(repos=["repo1"]),
+        content_hash=content_hash,
+    )
+
+
+def _artifact(art_id: str, job: Job) -> Artifact:
+    return Artifact(
+        id=art_id,
+        job_id=job.id,
+        hub="/hub",
+        repos=["repo1"],
+        created_at=job.created_at,
+        paths={},
+        params=job.request,
+    )
+
+
+def _state(store: JobStore):
+    return (
+        [j.model_dump() for j in store.get_all_jobs()],
+        [a.model_dump() for a in store.get_all_artifacts()],
+    )
+
+
+def _populate(store: JobStore) -> None:
+    for n in range(4):
+        store.add_job(_job(f"job-{n}", f"2026-01-0{n + 1}T00:00:00+00:00", content_hash=f"h{n % 2}"))
+    job = store.get_job("job-1")
+    store.add_artifact(_artifact("art-1", job))
+    job.artifact_ids.append("art-1")
+    job.status = "succeeded"
+    store.update_job(job)
+    store.remove_job("job-2")
+
+
+def test_updates_append_to_journal_and_reload(tmp_path):
+    store = JobStore(tmp_path)
+    store.add_job(_job("job-0", "2026-01-01T00:00:00+00:00"))
+    snapshot = store.jobs_file.read_text(encoding="utf-8")
+
+    _populate(store)
+    # Only the first write (no journal yet) produced a snapshot.
+    assert store.jobs_file.read_text(encoding="utf-8") == snapshot
+    ops = [json.loads(line)["op"] for line in store.journal_file.read_text(encoding="utf-8").splitlines()]
+    assert ops[-2:] == ["put_job", "del_job"]
+
+    reloaded = JobStore(tmp_path)
+    assert _state(reloaded) == _state(store)
+    assert reloaded.journal_file.read_text(encoding="utf-8") == ""
+    assert [j["id"] for j in json.loads(reloaded.jobs_file.read_text(encoding="utf-8"))] == ["job-0", "job-1", "job-3"]
+
+
+def test_torn_record_and_interrupted_compaction_recover(tmp_path):
+    store = JobStore(tmp_path)
+    _populate(store)
+    expected = _state(store)
+    journal = store.journal_file.read_bytes()
+
+    with open(store.journal_file, "ab") as f:
+        f.write(b'{"op":"del_job","id":"job-')
+    assert _state(JobStore(tmp_path)) == expected
+
+    # Crash after the snapshots were renamed but before the journal was reset:
+    # replaying the old journal over the new snapshots is a no-op.
+    store.journal_file.write_bytes(journal)
+    assert _state(JobStore(tmp_path)) == expected
+
+
+def test_journal_compacts_past_threshold(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobstore_module, "JOURNAL_COMPACT_MIN_RECORDS", 3)
+    store = JobStore(tmp_path)
+    job = _job("job-0", "2026-01-01T00:00:00+00:00")
+    store.add_job(job)
+    job.status = "running"
+    for _ in range(4):
+        store.update_job(job)
+    assert store.journal_file.read_text(encoding="utf-8") == ""
+    assert json.loads(store.jobs_file.read_text(encoding="utf-8"))[0]["status"] == "running"
+
+
+def test_indexed_lookups_follow_updates(tmp_path):
+    store = JobStore(tmp_path)
+    _populate(store)
+
+    assert [j.id for j in store.get_jobs(["queued"])] == ["job-3", "job-0"]
+    assert [j.id for j in store.get_jobs(["queued", "succeeded"], limit=2)] == ["job-3", "job-1"]
+    assert [j.id for j in store.get_jobs(limit=1)] == ["job-3"]
+    assert store.find_job_by_hash("h0").id == "job-0"
+
+    job = store.get_job("job-3")
+    job.status = "running"
+    assert store.get_jobs(["queued"]) == [store.get_job("job-0")]
+    store.update_job(job)
+    assert [j.id for j in store.get_jobs(["running"])] == ["job-3"]
+    # The active job wins over the finished one with the same hash.
+    assert store.find_job_by_hash("h1").id == "job-3"
+
+    store.remove_job("job-0")
+    assert store.find_job_by_hash("h0") is None
+    assert store.get_jobs(["queued"]) == []
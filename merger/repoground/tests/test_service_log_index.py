@@ -0,0 +1,95 @@
+import itertools
+import os
+
+from merger.repoground.service.jobstore import JobStore
+from merger.repoground.service.log_index import LogLineIndex
+
+
+def _line_skip_reference(path, last_line_id):
+    """The previous read_log_chunk: text mode, skip last_line_id lines."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return [
+            (line.rstrip("\n"), i)
+            for i, line in enumerate(itertools.islice(f, last_line_id, None), start=last_line_id + 1)
+        ]
+
+
+def test_matches_line_skip_semantics(tmp_path):
+    log = tmp_path / "job.log"
+    log.write_bytes(b"a\r\nb\rc\n\xff\xfe bad\n\nlast partial")
+    index = LogLineIndex(log, checkpoint_every=2)
+    for last in range(0, 8):
+        assert index.read_after(last) == _line_skip_reference(log, last)
+
+    with open(log, "ab") as f:
+        f.write(b" line\nnext\n")
+    for last in (7, 6, 3, 0):
+        assert index.read_after(last) == _line_skip_reference(log, last)
+
+
+def test_catch_up_reads_seek_to_checkpoints(tmp_path):
+    log = tmp_path / "job.log"
+    log.write_text("".join(f"line {n}\n" for n in range(1, 101)), encoding="utf-8")
+    index = LogLineIndex(log, checkpoint_every=10)
+    assert len(index.read_after(0)) == 100
+
+    index.counters["disk_lines"] = 0
+    assert index.read_after(95) == [(f"line {n}", n) for n in range(96, 101)]
+    # Line 95 sits between checkpoints 90 and 100; only that stretch is read.
+    assert index.counters["disk_lines"] == 5
+
+    assert index.read_after(100) == []
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("line 101\n")
+    assert index.read_after(100) == [("line 101", 101)]
+
+
+def test_ring_serves_concurrent_subscribers(tmp_path):
+    log = tmp_path / "job.log"
+    log.write_text("one\ntwo\n", encoding="utf-8")
+    index = LogLineIndex(log)
+    index.enable_ring(maxlen=4)
+
+    assert index.read_after(0) == [("one", 1), ("two", 2)]
+    assert index.read_after(0) == [("one", 1), ("two", 2)]
+    assert index.counters == {"ring_lines": 2, "disk_lines": 2, "reads": 2}
+
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("".join(f"l{n}\n" for n in range(3, 8)))
+    assert [i for _, i in index.read_after(2)] == [3, 4, 5, 6, 7]
+    # The ring now holds lines 4..7; a reader at line 1 falls back to disk.
+    assert [i for _, i in index.read_after(1)] == [2, 3, 4, 5, 6, 7]
+    assert [i for _, i in index.read_after(5)] == [6, 7]
+    assert index.counters["ring_lines"] == 4
+
+
+def test_truncated_or_replaced_log_resets_index(tmp_path):
+    log = tmp_path / "job.log"
+    log.write_text("a\nb\nc\n", encoding="utf-8")
+    index = LogLineIndex(log)
+    index.enable_ring()
+    assert len(index.read_after(0)) == 3
+
+    replacement = tmp_path / "replacement.log"
+    replacement.write_text("x\n", encoding="utf-8")
+    os.replace(replacement, log)
+    assert index.read_after(0) == [("x", 1)]
+
+    log.unlink()
+    assert index.read_after(0) == []
+
+
+def test_jobstore_read_log_chunk_uses_index(tmp_path):
+    store = JobStore(tmp_path)
+    for n in range(1, 6):
+        store.append_log_line("job-1", f"step {n}")
+
+    assert store.read_log_chunk("job-1", 0) == [(f"step {n}", n) for n in range(1, 6)]
+    assert store.read_log_chunk("job-1", 3) == [("step 4", 4), ("step 5", 5)]
+    assert store.read_log_chunk("missing", 0) == []
+
+    store.subscribe_to_logs("job-1", lambda: None)
+    store.append_log_line("job-1", "step 6")
+    assert store.read_log_chunk("job-1", 5) == [("step 6", 6)]
+    assert store.read_log_chunk("job-1", 5) == [("step 6", 6)]
+    assert store._log_indexes["job-1"].counters["ring_lines"] == 1
@@ -331,3 +331,40 @@ def test_source_mode_bare_local_current_is_accepted(service_client):
         headers=ctx.headers,
     )
     assert resp.status_code == 200, resp.text
+
+
+def test_succeeded_job_not_reused_after_source_change(service_client):
+    """Reuse is keyed by (parameter hash, source fingerprint)."""
+    ctx = service_client
+    req = {"repos": ["repo-test"], "level": "summary", "repo_source_mode": "local_current"}
+    resp1 = ctx.client.post("/api/jobs", json=req, headers=ctx.headers)
+    job1_id = resp1.json()["id"]
+    assert ctx.store.get_job(job1_id).source_fingerprint
+    _force_status(ctx, job1_id, "succeeded")
+
+    (ctx.hub_path / "repo-test" / "README.md").write_text("Changed Content")
+    resp2 = ctx.client.post("/api/jobs", json=req, headers=ctx.headers)
+    job2_id = resp2.json()["id"]
+    assert job2_id != job1_id
+    _force_status(ctx, job2_id, "succeeded")
+
+    # Unchanged sources again: the newest matching build is reused.
+    resp3 = ctx.client.post("/api/jobs", json=req, headers=ctx.headers)
+    assert resp3.json()["id"] == job2_id
+
+
+def test_source_fingerprint_follows_file_symlinks(tmp_path):
+    from merger.repoground.service.source_fingerprint import compute_source_fingerprint
+
+    repo = tmp_path / "hub" / "repo"
+    (repo / "build").mkdir(parents=True)
+    target = repo / "build" / "generated.py"
+    target.write_text("VALUE = 1\n")
+    try:
+        (repo / "generated.py").symlink_to(target)
+    except OSError:
+        pytest.skip("symlinks unavailable")
+
+    before = compute_source_fingerprint(tmp_path / "hub", ["repo"])
+    target.write_text("VALUE = 22\n")
+    assert compute_source_fingerprint(tmp_path / "hub", ["repo"]) != before
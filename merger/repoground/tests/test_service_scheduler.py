@@ -0,0 +1,112 @@
+import threading
+from unittest import mock
+
+from merger.repoground.service.models import Job, JobRequest
+from merger.repoground.service.runner import _job_lane, _job_source_locks
+from merger.repoground.service.scheduler import LANE_HEAVY, LANE_LIGHT, JobScheduler
+
+
+class _Gate:
+    """Blocking job body that records when it starts."""
+
+    def __init__(self, name: str, started: list):
+        self.name = name
+        self.started = started
+        self.running = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self) -> None:
+        self.started.append(self.name)
+        self.running.set()
+        assert self.release.wait(5)
+
+
+def _drain(scheduler: JobScheduler, gates) -> None:
+    for gate in gates:
+        gate.release.set()
+    scheduler.executor.shutdown(wait=True)
+
+
+def _submit(scheduler, started, name, lane, locks=()):
+    gate = _Gate(name, started)
+    scheduler.submit(name, gate, lane=lane, locks=frozenset(locks))
+    return gate
+
+
+def test_light_lane_is_not_blocked_by_heavy_job():
+    scheduler = JobScheduler(budget=4)
+    started: list = []
+    heavy = _submit(scheduler, started, "max-build", LANE_HEAVY, [("hub", "a")])
+    heavy_2 = _submit(scheduler, started, "max-build-2", LANE_HEAVY, [("hub", "b")])
+    light = _submit(scheduler, started, "overview", LANE_LIGHT, [("hub", "c")])
+    assert heavy.running.wait(5) and light.running.wait(5)
+
+    metrics = scheduler.metrics()
+    assert metrics["lanes"][LANE_HEAVY]["queued"] == 1
+    assert metrics["lanes"][LANE_LIGHT]["running"] == 1
+    assert metrics["budget"] == {"total": 4, "used": 3}
+
+    heavy.release.set()
+    assert heavy_2.running.wait(5)
+    _drain(scheduler, [heavy_2, light])
+    assert scheduler.metrics()["lanes"][LANE_HEAVY]["started"] == 2
+
+
+def test_default_budget_fits_a_heavy_and_a_light_job_on_two_cpus():
+    with mock.patch("os.cpu_count", return_value=2):
+        scheduler = JobScheduler()
+    started: list = []
+    heavy = _submit(scheduler, started, "max-build", LANE_HEAVY, [("hub", "a")])
+    light = _submit(scheduler, started, "overview", LANE_LIGHT, [("hub", "b")])
+    assert heavy.running.wait(5) and light.running.wait(5)
+    assert scheduler.metrics()["budget"] == {"total": 3, "used": 3}
+    _drain(scheduler, [heavy, light])
+
+
+def test_jobs_on_the_same_repo_run_one_at_a_time_in_order():
+    scheduler = JobScheduler(lane_limits={LANE_LIGHT: 3}, budget=3)
+    started: list = []
+    first = _submit(scheduler, started, "first", LANE_LIGHT, [("hub", "a")])
+    whole_hub = _submit(scheduler, started, "all-repos", LANE_LIGHT, [("hub", None)])
+    other = _submit(scheduler, started, "other-repo", LANE_LIGHT, [("hub", "b")])
+    second = _submit(scheduler, started, "second", LANE_LIGHT, [("hub", "a")])
+    assert first.running.wait(5)
+    # "other-repo" may not overtake the queued whole-hub job it conflicts with.
+    assert started == ["first"]
+
+    first.release.set()
+    assert whole_hub.running.wait(5)
+    assert started == ["first", "all-repos"]
+    whole_hub.release.set()
+    assert other.running.wait(5) and second.running.wait(5)
+    _drain(scheduler, [other, second])
+
+
+def test_budget_blocked_job_holds_back_later_jobs():
+    scheduler = JobScheduler(budget=2)
+    started: list = []
+    light = _submit(scheduler, started, "light-1", LANE_LIGHT)
+    heavy = _submit(scheduler, started, "heavy", LANE_HEAVY)
+    light_2 = _submit(scheduler, started, "light-2", LANE_LIGHT)
+    assert light.running.wait(5)
+    assert scheduler.metrics()["queue_depth"] == 2
+
+    light.release.set()
+    assert heavy.running.wait(5)
+    heavy.release.set()
+    assert light_2.running.wait(5)
+    _drain(scheduler, [light_2])
+    assert started == ["light-1", "heavy", "light-2"]
+
+
+def test_runner_job_classification():
+    light = Job.create(JobRequest(repos=["a", "b"], level="overview"))
+    light.hub_resolved = "/hub"
+    heavy = Job.create(JobRequest(level="max"))
+    heavy.hub_resolved = "/hub"
+
+    assert _job_lane(light) == LANE_LIGHT
+    assert _job_lane(heavy) == LANE_HEAVY
+    assert _job_lane(Job.create(JobRequest(level="max", plan_only=True))) == LANE_LIGHT
+    assert _job_source_locks(light) == {("/hub", "a"), ("/hub", "b")}
+    assert _job_source_locks(heavy) == {("/hub", None)}
@@ -8,6 +8,8 @@ synthetic repository so that two runs on the same host are comparable:
   * ``bundle_write_dual``      – ``write_reports_v2`` in dual mode (chunks, sidecars)
   * ``retrieval_index_build``  – ``index_db.build_index`` over the produced bundle
   * ``retrieval_query``        – ``query_core.execute_query`` against that index
+  * ``canonical_line_ranges``  – byte-to-line mapping of chunk-sized ranges over
+                                 a large synthetic canonical_md file
   * ``service_app_import``     – cold subprocess import of the service application
   * ``atlas_scan``             – optional Atlas observation subsystem scan
 
@@ -45,6 +47,8 @@ DEFAULT_SAMPLES = 5
 FIXTURE_PYTHON_FILES = 60
 FIXTURE_MARKDOWN_FILES = 20
 FIXTURE_FUNCTIONS_PER_FILE = 12
+CANONICAL_FIXTURE_BYTES = 20 * 1024 * 1024
+CANONICAL_FIXTURE_RANGES = 30000
 
 DOES_NOT_ESTABLISH = [
     "cross-host comparability of absolute timings",
@@ -267,6 +271,39 @@ def _retrieval_cases(
     return cases
 
 
+def build_canonical_fixture(root: Path) -> Path:
+    """Write a deterministic canonical-style Markdown file of ~CANONICAL_FIXTURE_BYTES."""
+
+    line = b"    total = value * 7  # deterministic canonical benchmark line\n"
+    path = root / "canonical" / "bench.canonical.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(line * (CANONICAL_FIXTURE_BYTES // len(line)))
+    return path
+
+
+def _canonical_line_case(root: Path, samples: int) -> dict[str, Any]:
+    """Map chunk-sized byte ranges to lines, one shared index per canonical part."""
+
+    from merger.repoground.core.citation_map import byte_range_to_line_range
+    from merger.repoground.core.line_index import LineIndex
+
+    canonical_path = build_canonical_fixture(root)
+    size = canonical_path.stat().st_size
+    step = size // CANONICAL_FIXTURE_RANGES
+    ranges = [(start, start + step) for start in range(0, size - step, step)][:CANONICAL_FIXTURE_RANGES]
+
+    def _map_ranges() -> None:
+        data = canonical_path.read_bytes()
+        line_index = LineIndex(data)
+        for start, end in ranges:
+            byte_range_to_line_range(data, start, end, line_index)
+
+    return _measure(_map_ranges, samples=samples) | {
+        "canonical_bytes": size,
+        "ranges": len(ranges),
+    }
+
+
 def _service_case(samples: int) -> dict[str, Any]:
     """Measure cold service-application import in a separate interpreter."""
 
@@ -349,6 +386,10 @@ def run(samples: int, include_atlas: bool) -> dict[str, Any]:
             cases.update(_retrieval_cases(root, dump_index, chunk_index, samples))
         except Exception as exc:
             failures.append(f"bundle_or_retrieval: {type(exc).__name__}: {exc}")
+        try:
+            cases["canonical_line_ranges"] = _canonical_line_case(root, samples)
+        except Exception as exc:
+            failures.append(f"canonical_line_ranges: {type(exc).__name__}: {exc}")
         cases["service_app_import"] = _service_case(samples)
         if include_atlas:
             try:
@@ -373,6 +414,8 @@ def run(samples: int, include_atlas: bool) -> dict[str, Any]:
             "fixture_python_files": FIXTURE_PYTHON_FILES,
             "fixture_markdown_files": FIXTURE_MARKDOWN_FILES,
             "fixture_functions_per_file": FIXTURE_FUNCTIONS_PER_FILE,
+            "canonical_fixture_bytes": CANONICAL_FIXTURE_BYTES,
+            "canonical_fixture_ranges": CANONICAL_FIXTURE_RANGES,
             "reported_statistic": "wall_seconds_min is the comparison figure",
             "timing_gate": "none",
         },